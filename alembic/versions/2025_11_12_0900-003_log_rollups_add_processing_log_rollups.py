@@ -0,0 +1,53 @@
+"""add_processing_log_rollups
+
+Revision ID: 003_log_rollups
+Revises: 002_data_constraints
+Create Date: 2025-11-12 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003_log_rollups"
+down_revision: str | None = "002_data_constraints"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create hourly processing-log rollups and backfill them from existing logs."""
+    op.create_table(
+        "processing_log_rollups",
+        sa.Column("app_id", sa.Integer(), nullable=False),
+        sa.Column("event_type", sa.String(length=50), nullable=False),
+        sa.Column("hour", sa.DateTime(), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.Column("succeeded", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["app_id"], ["managed_apps.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("app_id", "event_type", "hour"),
+    )
+
+    # Read through the partition view when monthly log partitions exist
+    bind = op.get_bind()
+    has_view = bind.execute(
+        sa.text("SELECT 1 FROM sqlite_master WHERE type = 'view' AND name = 'processing_logs_all'")
+    ).first()
+    source = "processing_logs_all" if has_view else "processing_logs"
+    # Bucket text matches SQLAlchemy's stored DateTime format
+    op.execute(
+        "INSERT INTO processing_log_rollups (app_id, event_type, hour, total, succeeded) "
+        "SELECT app_id, event_type, strftime('%Y-%m-%d %H:00:00.000000', created_at), "
+        "COUNT(*), SUM(success) "
+        f"FROM {source} "  # nosec B608
+        "GROUP BY app_id, event_type, strftime('%Y-%m-%d %H:00:00.000000', created_at)"
+    )
+
+
+def downgrade() -> None:
+    """Drop processing-log rollups."""
+    op.drop_table("processing_log_rollups")
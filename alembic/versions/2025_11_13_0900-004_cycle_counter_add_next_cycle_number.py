@@ -0,0 +1,38 @@
+"""add_next_cycle_number
+
+Revision ID: 004_cycle_counter
+Revises: 003_log_rollups
+Create Date: 2025-11-13 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004_cycle_counter"
+down_revision: str | None = "003_log_rollups"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the per-app cycle-number counter and seed it from existing cycles."""
+    op.add_column(
+        "managed_apps",
+        sa.Column("next_cycle_number", sa.Integer(), nullable=False, server_default=sa.text("1")),
+    )
+    op.execute(
+        "UPDATE managed_apps SET next_cycle_number = 1 + COALESCE("
+        "(SELECT MAX(cycle_number) FROM search_cycles "
+        "WHERE search_cycles.app_id = managed_apps.id), 0)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the per-app cycle-number counter."""
+    with op.batch_alter_table("managed_apps", schema=None) as batch_op:
+        batch_op.drop_column("next_cycle_number")
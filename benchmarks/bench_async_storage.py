@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Benchmark per-item persistence overhead from async pipeline stages.
+
+Pushes N items through a one-stage ``Pipeline`` whose stage writes a
+ProcessingLog row, comparing:
+
+* sync:  ``asyncio.to_thread`` + ``UnitOfWork`` (thread hop per item)
+* async: ``AsyncUnitOfWork`` on aiosqlite (no thread hop in the stage)
+
+Usage:
+    python benchmarks/bench_async_storage.py [--items 2000] [--concurrency 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from researcharr.async_pipeline import Pipeline
+from researcharr.repositories.async_uow import AsyncUnitOfWork
+from researcharr.repositories.uow import UnitOfWork
+from researcharr.storage.async_database import dispose_async_db, init_async_db
+from researcharr.storage.database import get_session, init_db
+from researcharr.storage.models import AppType, ManagedApp
+
+
+async def _drive(stage, items: int, concurrency: int) -> float:
+    p = Pipeline()
+    p.add_stage(stage, concurrency=concurrency)
+    await p.start()
+    start = time.perf_counter()
+    for i in range(items):
+        await p.push(i)
+    await p.shutdown(timeout=None)
+    return time.perf_counter() - start
+
+
+async def main_async(items: int, concurrency: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        init_db(db_path, use_migrations=False)
+        with get_session() as session:
+            app = ManagedApp(
+                app_type=AppType.RADARR, name="bench", base_url="http://x", api_key="k"
+            )
+            session.add(app)
+            session.flush()
+            app_id = app.id
+
+        def write_sync(item):
+            with UnitOfWork() as uow:
+                uow.logs.log_event(app_id, "search", f"item {item}")
+
+        async def sync_stage(item):
+            await asyncio.to_thread(write_sync, item)
+
+        async def async_stage(item):
+            async with AsyncUnitOfWork() as uow:
+                await uow.logs.log_event(app_id, "search", f"item {item}")
+
+        elapsed = await _drive(sync_stage, items, concurrency)
+        print(f" sync: {elapsed / items * 1e6:8.1f} us/item  ({items / elapsed:8.1f} items/s)")
+
+        await init_async_db(db_path)
+        try:
+            elapsed = await _drive(async_stage, items, concurrency)
+        finally:
+            await dispose_async_db()
+        print(f"async: {elapsed / items * 1e6:8.1f} us/item  ({items / elapsed:8.1f} items/s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.items, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
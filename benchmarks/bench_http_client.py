@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Benchmark request latency: per-call ``requests.get`` vs the pooled client.
+
+Starts a local keep-alive HTTP/1.1 stub server that answers every request
+with a small JSON body, then times N sequential GETs through the
+module-level ``requests.get`` (one new TCP connection per call) and through
+`HttpClientService` (one reused keep-alive connection per host). Only
+plain-HTTP connection setup is measured; a TLS handshake on a real *arr
+instance widens the gap further.
+
+Usage:
+    python benchmarks/bench_http_client.py [--requests 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import requests
+
+from researcharr.core.services import HttpClientService
+
+BODY = b'{"version": "5.0.0", "appName": "Radarr"}'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # body and headers are separate writes
+    connections: set = set()
+
+    def do_GET(self):
+        StubHandler.connections.add(self.client_address)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def _run(get, url: str, n: int) -> list[float]:
+    for _ in range(n // 10):  # warm up
+        get(url)
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        get(url).json()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2_000)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/v3/system/status"
+    client = HttpClientService()
+    try:
+        print(f"{'client':<26} {'mean us':>9} {'p95 us':>9} {'connections':>12}")
+        for label, get in (
+            ("requests.get (per call)", lambda u: requests.get(u, timeout=5)),
+            ("HttpClientService (pool)", client.get),
+        ):
+            StubHandler.connections = set()
+            samples = _run(get, url, args.requests)
+            p95 = statistics.quantiles(samples, n=20)[-1]
+            print(
+                f"{label:<26} {statistics.fmean(samples):9.1f} {p95:9.1f} "
+                f"{len(StubHandler.connections):12d}"
+            )
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark OFFSET vs keyset pagination at increasing page depths.
+
+Seeds N processing logs for one app, then times fetching a single page at
+several depths with ``paginate`` (OFFSET) and with ``get_by_app(after=...)``
+(keyset). Keyset latency should stay flat as depth grows.
+
+Usage:
+    python benchmarks/bench_keyset_pagination.py [--rows 200000] [--page-size 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import insert
+
+from researcharr.compat import UTC
+from researcharr.repositories.uow import UnitOfWork
+from researcharr.storage.database import get_session, init_db
+from researcharr.storage.models import AppType, ManagedApp, ProcessingLog
+
+
+def _time(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--page-size", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        init_db(Path(tmp) / "bench.db")  # migrations create the log indexes
+        with get_session() as session:
+            app = ManagedApp(
+                app_type=AppType.RADARR, name="bench", base_url="http://x", api_key="k"
+            )
+            session.add(app)
+            session.flush()
+            app_id = app.id
+            start = datetime(2024, 1, 1, tzinfo=UTC).replace(tzinfo=None)
+            session.execute(
+                insert(ProcessingLog),
+                [
+                    {
+                        "app_id": app_id,
+                        "event_type": "search",
+                        "message": f"log {i}",
+                        "success": True,
+                        "created_at": start + timedelta(seconds=i),
+                    }
+                    for i in range(args.rows)
+                ],
+            )
+
+        print(f"{'depth':>10} {'offset ms':>10} {'keyset ms':>10}")
+        with UnitOfWork(read_only=True) as uow:
+            for depth in (0, args.rows // 10, args.rows // 2, args.rows - args.page_size):
+                page = depth // args.page_size + 1
+                offset = _time(lambda p=page: uow.logs.paginate(ProcessingLog, p, args.page_size))
+                # Keyset key of the row just before this depth (newest first)
+                newest = start + timedelta(seconds=args.rows - depth)
+                after = (newest, args.rows - depth + 1)
+                keyset = _time(
+                    lambda a=after: uow.logs.get_by_app(app_id, limit=args.page_size, after=a)
+                )
+                print(f"{depth:>10} {offset * 1e3:>10.2f} {keyset * 1e3:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
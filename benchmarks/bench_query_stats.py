@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Benchmark the per-statement cost of SQL query instrumentation.
+
+Runs the same primary-key lookup N times through a read session with
+instrumentation disabled (no listeners registered) and enabled, and reports
+the mean time per statement of each.
+
+Usage:
+    python benchmarks/bench_query_stats.py [--queries 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import select
+
+from researcharr.storage import query_stats
+from researcharr.storage.database import get_read_session, get_session, init_db
+from researcharr.storage.models import GlobalSettings
+
+
+def _run(queries: int, repeat: int = 5) -> float:
+    stmt = select(GlobalSettings.items_per_cycle).where(GlobalSettings.id == 1)
+    best = float("inf")
+    for _ in range(repeat):
+        with get_read_session() as session:
+            start = time.perf_counter()
+            for _ in range(queries):
+                session.execute(stmt).scalar()
+            best = min(best, time.perf_counter() - start)
+    return best / queries * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=20_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        for enabled in (False, True):
+            init_db(db_path, use_migrations=False, query_stats=enabled)
+            with get_session() as session:
+                if session.get(GlobalSettings, 1) is None:
+                    session.add(GlobalSettings(id=1))
+            _run(args.queries // 10, repeat=1)  # warm statement caches and the pool
+            per_query = _run(args.queries)
+            label = "enabled " if enabled else "disabled"
+            print(f"instrumentation {label}: {per_query:7.2f} us/statement")
+        query_stats.disable()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Benchmark ORM entities vs slotted read models for large listings.
+
+Seeds N tracked items and N processing logs, then lists them through the
+ORM repositories and through `ReadModelRepository`, reporting the best
+wall time and the peak traced memory of each path (including JSON
+serialisation of the rows).
+
+Usage:
+    python benchmarks/bench_read_models.py [--rows 50000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import insert
+
+from researcharr.repositories.read_models import ProcessingLogView, TrackedItemView
+from researcharr.repositories.uow import UnitOfWork
+from researcharr.storage.database import get_session, init_db
+from researcharr.storage.models import AppType, ManagedApp, ProcessingLog, TrackedItem
+
+
+def _orm_json(rows, view):
+    names = list(view.__dataclass_fields__)
+    return [{name: getattr(row, name) for name in names} for row in rows]
+
+
+def _measure(fn, repeat: int = 3) -> tuple[float, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        init_db(Path(tmp) / "bench.db")
+        with get_session() as session:
+            app = ManagedApp(
+                app_type=AppType.RADARR, name="bench", base_url="http://x", api_key="k"
+            )
+            session.add(app)
+            session.flush()
+            app_id = app.id
+            session.execute(
+                insert(TrackedItem),
+                [{"app_id": app_id, "arr_id": i, "title": f"Item {i}"} for i in range(args.rows)],
+            )
+            session.execute(
+                insert(ProcessingLog),
+                [
+                    {"app_id": app_id, "event_type": "search", "message": f"log {i}"}
+                    for i in range(args.rows)
+                ],
+            )
+
+        def run(fetch, serialise):
+            with UnitOfWork(read_only=True) as uow:
+                return serialise(fetch(uow))
+
+        cases = [
+            (
+                "items orm",
+                lambda: run(
+                    lambda u: u.items.get_by_app(app_id), lambda r: _orm_json(r, TrackedItemView)
+                ),
+            ),
+            (
+                "items view",
+                lambda: run(
+                    lambda u: u.views.items_by_app(app_id), lambda r: [v.to_dict() for v in r]
+                ),
+            ),
+            (
+                "logs orm",
+                lambda: run(
+                    lambda u: u.logs.get_by_app(app_id, limit=args.rows),
+                    lambda r: _orm_json(r, ProcessingLogView),
+                ),
+            ),
+            (
+                "logs view",
+                lambda: run(
+                    lambda u: u.views.logs_by_app(app_id, limit=args.rows),
+                    lambda r: [v.to_dict() for v in r],
+                ),
+            ),
+        ]
+        print(f"{'path':<12} {'ms':>9} {'peak MiB':>9}")
+        for name, fn in cases:
+            elapsed, peak = _measure(fn)
+            print(f"{name:<12} {elapsed * 1e3:>9.1f} {peak:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark concurrent SQLite read/write throughput with and without tuning.
+
+Runs a mixed workload (writer threads inserting ProcessingLog rows, reader
+threads aggregating them) against a fresh database file, once with the
+default ``resolve_sqlite_pragmas()`` profile and once with tuning disabled.
+
+Usage:
+    python benchmarks/bench_sqlite_tuning.py [--seconds 5] [--readers 4] [--writers 2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import func
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from researcharr.storage.database import (
+    create_sqlite_engine,
+    resolve_sqlite_pragmas,
+)
+from researcharr.storage.models import (
+    AppType,
+    Base,
+    ManagedApp,
+    ProcessingLog,
+)
+
+
+def run(label: str, pragmas: dict, seconds: float, readers: int, writers: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_sqlite_engine(Path(tmp) / "bench.db", pragmas)
+        Base.metadata.create_all(engine)
+        factory = sessionmaker(bind=engine, expire_on_commit=False)
+        with factory.begin() as session:
+            app = ManagedApp(
+                app_type=AppType.RADARR, name="bench", base_url="http://x", api_key="k"
+            )
+            session.add(app)
+            session.flush()
+            app_id = app.id
+
+        counts = {"reads": 0, "writes": 0, "errors": 0}
+        lock = threading.Lock()
+        stop = time.perf_counter() + seconds
+
+        def writer() -> None:
+            done = errors = 0
+            while time.perf_counter() < stop:
+                try:
+                    with factory.begin() as session:
+                        session.add_all(
+                            ProcessingLog(
+                                app_id=app_id, event_type="search", message="m", success=True
+                            )
+                            for _ in range(10)
+                        )
+                    done += 1
+                except OperationalError:
+                    errors += 1
+            with lock:
+                counts["writes"] += done
+                counts["errors"] += errors
+
+        def reader() -> None:
+            done = errors = 0
+            while time.perf_counter() < stop:
+                try:
+                    with factory() as session:
+                        session.query(func.count(ProcessingLog.id)).filter(
+                            ProcessingLog.app_id == app_id
+                        ).scalar()
+                    done += 1
+                except OperationalError:
+                    errors += 1
+            with lock:
+                counts["reads"] += done
+                counts["errors"] += errors
+
+        threads = [threading.Thread(target=writer) for _ in range(writers)]
+        threads += [threading.Thread(target=reader) for _ in range(readers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        engine.dispose()
+
+    print(
+        f"{label:>8}: {counts['writes'] / seconds:9.1f} write txn/s  "
+        f"{counts['reads'] / seconds:9.1f} read/s  {counts['errors']} lock errors"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=2)
+    args = parser.parse_args()
+
+    run("default", {}, args.seconds, args.readers, args.writers)
+    run("tuned", resolve_sqlite_pragmas(), args.seconds, args.readers, args.writers)
+
+
+if __name__ == "__main__":
+    main()
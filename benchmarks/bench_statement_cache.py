@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Benchmark per-call overhead of the hot repository queries.
+
+Compares, for each hot lookup, the previous per-call ``session.query()``
+construction, a per-call ``lambda_stmt()``, and the prebuilt ``select()``
+statements now used by the repositories (`researcharr.repositories.statements`).
+Each variant runs against the same small seeded database, so the difference
+is ORM statement construction and compiled-cache lookup, not SQLite time.
+
+Usage:
+    python benchmarks/bench_statement_cache.py [--calls 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import and_, lambda_stmt, or_, select
+
+from researcharr.compat import UTC
+from researcharr.repositories import statements
+from researcharr.storage.database import get_read_session, get_session, init_db
+from researcharr.storage.models import (
+    AppType,
+    ManagedApp,
+    SearchCycle,
+    SortStrategy,
+    TrackedItem,
+)
+
+ITEMS = 200
+STRATEGY = SortStrategy.CUSTOM_FORMAT_SCORE_ASC
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)  # naive UTC, like the models
+
+
+# Before: legacy Query built on every call ---------------------------------
+def query_by_arr_id(session, app_id, arr_id):
+    return (
+        session.query(TrackedItem)
+        .filter(TrackedItem.app_id == app_id, TrackedItem.arr_id == arr_id)
+        .first()
+    )
+
+
+def query_items_for_search(session, app_id, limit):
+    return (
+        session.query(TrackedItem)
+        .filter(TrackedItem.app_id == app_id, TrackedItem.monitored, ~TrackedItem.has_file)
+        .filter(
+            or_(
+                TrackedItem.last_search_at.is_(None),
+                and_(
+                    TrackedItem.next_retry_at.isnot(None),
+                    TrackedItem.next_retry_at <= _utcnow(),
+                ),
+            )
+        )
+        .order_by(TrackedItem.custom_format_score.asc())
+        .limit(limit)
+        .all()
+    )
+
+
+def query_latest_cycle(session, app_id):
+    return (
+        session.query(SearchCycle)
+        .filter(SearchCycle.app_id == app_id)
+        .order_by(SearchCycle.cycle_number.desc())
+        .first()
+    )
+
+
+def query_active_cycle(session, app_id):
+    return (
+        session.query(SearchCycle)
+        .filter(SearchCycle.app_id == app_id, SearchCycle.completed_at.is_(None))
+        .first()
+    )
+
+
+# Lambda statements ------------------------------------------------------
+def lambda_by_arr_id(session, app_id, arr_id):
+    stmt = lambda_stmt(
+        lambda: select(TrackedItem)
+        .where(TrackedItem.app_id == app_id, TrackedItem.arr_id == arr_id)
+        .limit(1)
+    )
+    return session.scalars(stmt).first()
+
+
+def lambda_latest_cycle(session, app_id):
+    stmt = lambda_stmt(
+        lambda: select(SearchCycle)
+        .where(SearchCycle.app_id == app_id)
+        .order_by(SearchCycle.cycle_number.desc())
+        .limit(1)
+    )
+    return session.scalars(stmt).first()
+
+
+# After: prebuilt statements ---------------------------------------------
+def prebuilt_by_arr_id(session, app_id, arr_id):
+    params = {"app_id": app_id, "arr_id": arr_id}
+    return session.scalars(statements.ITEM_BY_ARR_ID, params).first()
+
+
+def prebuilt_items_for_search(session, app_id, limit):
+    stmt = statements.items_for_search(STRATEGY, True)
+    params = {"app_id": app_id, "limit": limit, "now": _utcnow()}
+    return session.scalars(stmt, params).all()
+
+
+def prebuilt_latest_cycle(session, app_id):
+    return session.scalars(statements.LATEST_CYCLE, {"app_id": app_id}).first()
+
+
+def prebuilt_active_cycle(session, app_id):
+    return session.scalars(statements.ACTIVE_CYCLE, {"app_id": app_id}).first()
+
+
+CASES = {
+    "get_by_arr_id": (
+        lambda fn, s, a, i: fn(s, a, i % ITEMS),
+        [query_by_arr_id, lambda_by_arr_id, prebuilt_by_arr_id],
+    ),
+    "get_items_for_search": (
+        lambda fn, s, a, i: fn(s, a, 5),
+        [query_items_for_search, prebuilt_items_for_search],
+    ),
+    "get_latest_cycle": (
+        lambda fn, s, a, i: fn(s, a),
+        [query_latest_cycle, lambda_latest_cycle, prebuilt_latest_cycle],
+    ),
+    "get_active_cycle": (
+        lambda fn, s, a, i: fn(s, a),
+        [query_active_cycle, prebuilt_active_cycle],
+    ),
+}
+
+
+def _per_call_us(call, fn, app_id: int, calls: int, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        with get_read_session() as session:
+            for i in range(calls // 10):  # warm the pool and compiled cache
+                call(fn, session, app_id, i)
+            start = time.perf_counter()
+            for i in range(calls):
+                call(fn, session, app_id, i)
+            best = min(best, time.perf_counter() - start)
+    return best / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=5_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        init_db(Path(tmp) / "bench.db")
+        with get_session() as session:
+            app = ManagedApp(
+                app_type=AppType.RADARR, name="bench", base_url="http://bench", api_key="k"
+            )
+            session.add(app)
+            session.flush()
+            app_id = app.id
+            session.add_all(
+                TrackedItem(app_id=app_id, arr_id=i, title=f"Item {i}", custom_format_score=i)
+                for i in range(ITEMS)
+            )
+            now = _utcnow()
+            session.add_all(
+                SearchCycle(app_id=app_id, cycle_number=n, started_at=now, completed_at=now)
+                for n in range(1, 20)
+            )
+            session.add(SearchCycle(app_id=app_id, cycle_number=20))
+
+        print(f"{'query':<22} {'variant':<28} {'us/call':>9}")
+        for name, (call, variants) in CASES.items():
+            baseline = None
+            for fn in variants:
+                us = _per_call_us(call, fn, app_id, args.calls)
+                baseline = baseline or us
+                print(f"{name:<22} {fn.__name__:<28} {us:9.1f}  ({baseline / us:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
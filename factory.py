@@ -1,5 +1,6 @@
 # ... code for factory.py ...
 
+import concurrent.futures
 import importlib.util
 import os
 import pathlib
@@ -859,7 +860,13 @@ def create_app() -> Flask:
         repo_plugins = os.path.abspath(os.path.join(pkg_dir, os.pardir, "plugins"))
         pkg_plugins = os.path.join(pkg_dir, "plugins")
         plugins_dir = repo_plugins if os.path.isdir(repo_plugins) else pkg_plugins
-        registry.discover_local(plugins_dir)
+        # Parse plugin files now and import each one when first used, so
+        # startup does not pay for unconfigured plugins' imports
+        registry.discover_local(
+            plugins_dir,
+            lazy=not os.getenv("RESEARCHARR_EAGER_PLUGINS"),
+            manifest_path=os.path.join(os.getenv("CONFIG_DIR", "/config"), "plugin-manifest.json"),
+        )
         # For tests we may want to instantiate configured plugin instances
         app.plugin_registry = registry
         # Load persisted plugin instance configs from disk (if available).
@@ -890,7 +897,9 @@ def create_app() -> Flask:
         try:
             for inst in app.config_data.get("sonarr", []):
                 try:
-                    pl = registry.create_instance("sonarr", inst)
+                    from researcharr.core.plugin_instances import acquire_instance
+
+                    pl = acquire_instance(registry, "sonarr", inst)
                     bp = pl.blueprint()
                     if bp is not None:
                         app.register_blueprint(bp)
@@ -1518,23 +1527,22 @@ def create_app() -> Flask:
     def plugins_settings():
         if not is_logged_in():
             return redirect(url_for("login"))
+        from researcharr.core.plugin_manifest import describe_plugin
+
         registry = getattr(app, "plugin_registry", None)
         # Build a mapping category -> list[plugin_entry]
         plugins_by_category = {}
         if registry is not None:
             for name in registry.list_plugins():
                 instances = app.config_data.get(name, [])
-                cls = registry.get(name)
-                # Prefer a class-level category attribute, default to 'plugins'
-                category = getattr(cls, "category", "plugins") if cls is not None else "plugins"
-                description = getattr(cls, "description", "") if cls is not None else ""
-                docs_url = getattr(cls, "docs_url", None) if cls is not None else None
-                plugins_by_category.setdefault(category, []).append(
+                # Read from the parsed spec: listing must not import every plugin
+                meta = describe_plugin(registry, name)
+                plugins_by_category.setdefault(meta["category"], []).append(
                     {
                         "name": name,
                         "instances": instances,
-                        "description": description,
-                        "docs_url": docs_url,
+                        "description": meta["description"],
+                        "docs_url": meta["docs_url"],
                     }
                 )
 
@@ -1651,8 +1659,13 @@ def create_app() -> Flask:
             pass
 
         try:
-            pl = registry.create_instance(plugin_name, inst_cfg)
-            result = pl.validate()
+            from researcharr.core.plugin_health import get_plugin_health_checker
+
+            # Runs on the shared checker pool so a stalled instance cannot
+            # hold the request past the checker's deadline
+            result = get_plugin_health_checker().check(
+                registry, plugin_name, inst_cfg, "validate", fresh=True
+            )
             # Treat falsy result as a validation failure to be surfaced in metrics
             if not result:
                 try:
@@ -1663,6 +1676,15 @@ def create_app() -> Flask:
                 except Exception:
                     pass
             return jsonify({"result": result})
+        except concurrent.futures.TimeoutError:  # not the builtin TimeoutError before 3.11
+            try:
+                if pmetrics is not None:
+                    pmetrics["validate_errors"] = pmetrics.get("validate_errors", 0) + 1
+                    pmetrics["last_error"] = int(time.time())
+                    pmetrics["last_error_msg"] = "validation timed out"
+            except Exception:
+                pass
+            return jsonify({"error": "validate_timeout"}), 504
         except Exception as e:
             # Record error in plugin metrics
             try:
@@ -1713,7 +1735,9 @@ def create_app() -> Flask:
             pass
 
         try:
-            pl = registry.create_instance(plugin_name, inst_cfg)
+            from researcharr.core.plugin_instances import acquire_instance
+
+            pl = acquire_instance(registry, plugin_name, inst_cfg)
             result = pl.sync()
             if not result:
                 try:
@@ -1784,6 +1808,7 @@ def create_app() -> Flask:
         - log and DB file size checks
         - example file existence check
         - simple resource usage (from /proc when available)
+        - per-instance circuit breaker state for managed apps
         """
         if not is_logged_in():
             return jsonify({"error": "unauthorized"}), 401
@@ -1967,6 +1992,28 @@ def create_app() -> Flask:
         except Exception:
             result["plugins"] = {}
 
+        # Managed app instances whose breaker is open are failing fast
+        try:
+            from researcharr.core.services import get_circuit_breakers
+
+            result["instances"] = get_circuit_breakers().snapshot()
+        except Exception:
+            result["instances"] = {}
+
+        # Health of every configured plugin instance, checked in parallel;
+        # instances slower than the checker's deadline are reported pending
+        try:
+            from researcharr.core.plugin_health import get_plugin_health_checker
+
+            registry = getattr(app, "plugin_registry", None)
+            result["plugin_health"] = (
+                get_plugin_health_checker().check_all(registry, app.config_data)
+                if registry is not None and hasattr(registry, "list_plugins")
+                else {}
+            )
+        except Exception:
+            result["plugin_health"] = {}
+
         return jsonify(result)
 
     @app.route("/api/plugins/<plugin_name>/instances", methods=["POST"])
@@ -2072,6 +2119,14 @@ def create_app() -> Flask:
         else:
             return jsonify({"error": "unknown_action"}), 400
 
+        # Tear down pooled instances built for configs that no longer exist
+        pool = getattr(registry, "instances", None)
+        if hasattr(pool, "retain"):
+            try:
+                pool.retain(plugin_name, instances)
+            except Exception:
+                app.logger.exception("Failed to release %s plugin instances", plugin_name)
+
         # Persist instances to disk under CONFIG_DIR/plugins/<plugin_name>.yml
         try:
             config_root = os.getenv("CONFIG_DIR", "/config")
@@ -2875,10 +2930,17 @@ def create_app() -> Flask:
                 if os.path.exists(restored_db):
                     try:
                         from researcharr.storage.migrations import (
+                            load_database_config,
                             migrate_database,
                         )
 
-                        migrate_database(restored_db, use_migrations=True)
+                        db_config = load_database_config(config_root)
+                        migrate_database(
+                            restored_db,
+                            use_migrations=True,
+                            sqlite_pragmas=db_config.get("sqlite"),
+                            query_stats=db_config.get("query_stats"),
+                        )
                     except Exception:
                         pass
             except Exception:
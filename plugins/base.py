@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 
 from flask import Blueprint
@@ -11,6 +12,9 @@ class BasePlugin:
     """
 
     name: str = "base"
+    # Status endpoint relative to the instance url (e.g. "/api/v3/system/status");
+    # when set, the default `async_health` probes it with `async_http`.
+    status_path: str | None = None
 
     def __init__(self, instance_config: dict[str, Any] | None = None):
         """Initialize plugin instance.
@@ -21,6 +25,38 @@ class BasePlugin:
         """
         self.config = instance_config or {}
 
+    @property
+    def http(self) -> Any:
+        """Shared pooled HTTP client (`researcharr.core.services.HttpClientService`).
+
+        Use it instead of module-level ``requests`` calls so connections to
+        the instance are reused across calls and plugins.
+        """
+        from researcharr.core.services import get_http_client
+
+        return get_http_client()
+
+    @property
+    def async_http(self) -> Any:
+        """Shared async HTTP client for the running event loop.
+
+        See `researcharr.core.async_http.AsyncHttpClientService`; requires
+        httpx. Only use it from coroutines.
+        """
+        from researcharr.core.async_http import get_async_http_client
+
+        return get_async_http_client()
+
+    def setup(self) -> None:
+        """Called once before a pooled instance is first used.
+
+        Instances from `PluginRegistry.get_instance` live across calls until
+        their config changes; open sessions or warm caches here.
+        """
+
+    def teardown(self) -> None:
+        """Called when a pooled instance is dropped; release what `setup` opened."""
+
     def validate(self) -> dict[str, Any]:
         """Validate instance configuration (connectivity, API keys).
 
@@ -39,6 +75,34 @@ class BasePlugin:
         """Lightweight health check for the instance."""
         return {"status": "ok"}
 
+    async def async_sync(self) -> dict[str, Any]:
+        """Async variant of `sync`, safe to await on the event loop.
+
+        The default runs `sync` in a worker thread. Plugins doing HTTP I/O
+        should override it using `async_http`.
+        """
+        return await asyncio.to_thread(self.sync)
+
+    async def async_health(self) -> dict[str, Any]:
+        """Async variant of `health`.
+
+        Plugins setting `status_path` get a non-blocking probe of that
+        endpoint; otherwise `health` runs in a worker thread.
+        """
+        if self.status_path is None:
+            return await asyncio.to_thread(self.health)
+        url = self.config.get("url")
+        api_key = self.config.get("api_key")
+        if not url or not api_key:
+            return {"status": "degraded", "msg": "not configured"}
+        try:
+            r = await self.async_http.get(f"{url}{self.status_path}?apikey={api_key}", timeout=5)
+            if r.status_code == 200:
+                return {"status": "ok"}
+        except Exception:
+            pass
+        return {"status": "degraded"}
+
     def blueprint(self) -> Blueprint | None:
         """Optional: return a Flask Blueprint for plugin UI routes."""
         return None
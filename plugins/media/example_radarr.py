@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from typing import Any
 
 from flask import Blueprint, jsonify, request
@@ -8,9 +9,12 @@ PLUGIN_NAME = "radarr"
 
 class Plugin(BasePlugin):
     name = PLUGIN_NAME
+    status_path = "/api/v3/system/status"
     category = "media"
     description = "Example Radarr plugin (test harness)"
     docs_url = "https://radarr.video/"
+    # Digest of the library body last returned by `library_if_changed`
+    _library_digest: str | None = None
 
     def validate(self) -> dict[str, Any]:
         url = self.config.get("url")
@@ -27,12 +31,10 @@ class Plugin(BasePlugin):
             return {"success": True, "movies": []}
 
         try:
-            import requests
-
             # Radarr commonly exposes /api/v3/movie
-            r = requests.get(f"{url}/api/v3/movie?apikey={api_key}", timeout=5)
+            r = self.http.get_json(f"{url}/api/v3/movie?apikey={api_key}", timeout=5)
             if r.status_code == 200:
-                return {"success": True, "movies": r.json()}
+                return {"success": True, "movies": r.json(), "changed": r.changed}
         except Exception:
             pass
 
@@ -50,15 +52,70 @@ class Plugin(BasePlugin):
             ],
         }
 
+    def iter_library(self, chunk_size: int | None = None) -> Iterator[list[dict[str, Any]]]:
+        """Stream the movie library as chunks of TrackedItem-shaped dicts.
+
+        Unlike `sync()`, the response body is decoded incrementally so memory
+        stays bounded by `chunk_size` regardless of library size. Feed the
+        result to `researcharr.ingest.ingest_library`.
+        """
+        url = self.config.get("url")
+        api_key = self.config.get("api_key")
+        if not url or not api_key:
+            return
+
+        from researcharr.ingest import DEFAULT_CHUNK_SIZE, stream_library
+        from researcharr.storage.models import AppType
+
+        with self.http.get(
+            f"{url}/api/v3/movie?apikey={api_key}",
+            stream=True,
+            timeout=self.config.get("timeout", 30),
+        ) as r:
+            r.raise_for_status()
+            yield from stream_library(r, AppType.RADARR, chunk_size or DEFAULT_CHUNK_SIZE)
+
+    def library_if_changed(self, force: bool = False) -> list[dict[str, Any]] | None:
+        """Return the library as TrackedItem-shaped dicts, or None if it is unchanged.
+
+        The response goes through the client's response cache
+        (`HttpClientService.get_json`). When the body is identical to the
+        one this instance last returned, it is not decoded and None is
+        returned, so a sync callback (see
+        `researcharr.scheduling.CycleOrchestrator`) can skip reconciliation.
+        The comparison is per instance rather than ``changed``, because
+        `sync` and the API fetch the same URL; a fresh instance (after a
+        restart or a config change) always returns the rows. Pass
+        ``force=True`` after a failed reconciliation to get the rows anyway.
+        Use `iter_library` for libraries too large to cache.
+        """
+        url = self.config.get("url")
+        api_key = self.config.get("api_key")
+        if not url or not api_key:
+            return []
+
+        from researcharr.ingest import project_tracked_item
+        from researcharr.storage.models import AppType
+
+        r = self.http.get_json(
+            f"{url}/api/v3/movie?apikey={api_key}", timeout=self.config.get("timeout", 30)
+        )
+        if r.status_code != 200:
+            raise RuntimeError(f"{self.name} library fetch failed with status {r.status_code}")
+        if r.digest == self._library_digest and not force:
+            return None
+        rows = (project_tracked_item(record, AppType.RADARR) for record in r.json())
+        library = [row for row in rows if row is not None]
+        self._library_digest = r.digest
+        return library
+
     def health(self) -> dict[str, Any]:
         url = self.config.get("url")
         api_key = self.config.get("api_key")
         if not url or not api_key:
             return {"status": "degraded", "msg": "not configured"}
         try:
-            import requests
-
-            r = requests.get(f"{url}/api/v3/system/status?apikey={api_key}", timeout=5)
+            r = self.http.get_json(f"{url}{self.status_path}?apikey={api_key}", timeout=5)
             if r.status_code == 200:
                 return {"status": "ok"}
         except Exception:
@@ -95,10 +152,8 @@ class Plugin(BasePlugin):
             url = self.config.get("url")
             api_key = self.config.get("api_key")
             try:
-                import requests
-
                 # Radarr supports POST /api/v3/movie/{id}/search
-                r = requests.post(
+                r = self.http.post(
                     f"{url}/api/v3/movie/{movie_id}/search?apikey={api_key}", timeout=10
                 )
                 return jsonify(
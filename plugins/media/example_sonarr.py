@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from typing import Any
 
 from flask import Blueprint, jsonify, request
@@ -8,9 +9,12 @@ PLUGIN_NAME = "sonarr"
 
 class Plugin(BasePlugin):
     name = PLUGIN_NAME
+    status_path = "/api/v3/system/status"
     category = "media"
     description = "Example Sonarr plugin (read/search test harness)"
     docs_url = "https://sonarr.video/"
+    # Digest of the library body last returned by `library_if_changed`
+    _library_digest: str | None = None
 
     def validate(self) -> dict[str, Any]:
         url = self.config.get("url")
@@ -27,11 +31,9 @@ class Plugin(BasePlugin):
             return {"success": True, "series": []}
 
         try:
-            import requests
-
-            r = requests.get(f"{url}/api/v3/series?apikey={api_key}", timeout=5)
+            r = self.http.get_json(f"{url}/api/v3/series?apikey={api_key}", timeout=5)
             if r.status_code == 200:
-                return {"success": True, "series": r.json()}
+                return {"success": True, "series": r.json(), "changed": r.changed}
         except Exception:
             pass
 
@@ -43,15 +45,128 @@ class Plugin(BasePlugin):
             ],
         }
 
+    def iter_library(self, chunk_size: int | None = None) -> Iterator[list[dict[str, Any]]]:
+        """Stream the series library as chunks of TrackedItem-shaped dicts.
+
+        Unlike `sync()`, the response body is decoded incrementally so memory
+        stays bounded by `chunk_size` regardless of library size. Feed the
+        result to `researcharr.ingest.ingest_library`.
+        """
+        url = self.config.get("url")
+        api_key = self.config.get("api_key")
+        if not url or not api_key:
+            return
+
+        from researcharr.ingest import DEFAULT_CHUNK_SIZE, stream_library
+        from researcharr.storage.models import AppType
+
+        with self.http.get(
+            f"{url}/api/v3/series?apikey={api_key}",
+            stream=True,
+            timeout=self.config.get("timeout", 30),
+        ) as r:
+            r.raise_for_status()
+            yield from stream_library(r, AppType.SONARR, chunk_size or DEFAULT_CHUNK_SIZE)
+
+    def iter_wanted(
+        self,
+        kinds: tuple[str, ...] = ("missing", "cutoff"),
+        chunk_size: int | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Stream the series with wanted episodes as chunks of TrackedItem-shaped dicts.
+
+        Reads the paged ``/api/v3/wanted/<kind>`` endpoints with up to
+        ``page_concurrency`` page requests in flight (instance config,
+        default 4) of ``page_size`` episodes each (default 250). Each series
+        is yielded once, from the first wanted episode seen for it. Feed the
+        result to `researcharr.ingest.ingest_library`.
+        """
+        url = self.config.get("url")
+        api_key = self.config.get("api_key")
+        if not url or not api_key:
+            return
+
+        from researcharr.ingest import (
+            DEFAULT_CHUNK_SIZE,
+            iter_chunks,
+            iter_pages,
+            project_wanted_episode,
+        )
+
+        page_size = self.config.get("page_size", 250)
+        concurrency = self.config.get("page_concurrency", 4)
+        timeout = self.config.get("timeout", 30)
+
+        def fetch(kind: str, page: int) -> dict[str, Any]:
+            r = self.http.get(
+                f"{url}/api/v3/wanted/{kind}",
+                params={
+                    "apikey": api_key,
+                    "page": page,
+                    "pageSize": page_size,
+                    "includeSeries": "true",
+                    "monitored": "true",
+                    "sortKey": "episodes.id",
+                    "sortDirection": "ascending",
+                },
+                timeout=timeout,
+            )
+            r.raise_for_status()
+            return r.json()
+
+        def series_rows() -> Iterator[dict[str, Any]]:
+            seen: set[int] = set()
+            for kind in kinds:
+                for records in iter_pages(lambda page, k=kind: fetch(k, page), concurrency):
+                    for record in records:
+                        row = project_wanted_episode(record)
+                        if row is not None and row["arr_id"] not in seen:
+                            seen.add(row["arr_id"])
+                            yield row
+
+        yield from iter_chunks(series_rows(), chunk_size or DEFAULT_CHUNK_SIZE)
+
+    def library_if_changed(self, force: bool = False) -> list[dict[str, Any]] | None:
+        """Return the library as TrackedItem-shaped dicts, or None if it is unchanged.
+
+        The response goes through the client's response cache
+        (`HttpClientService.get_json`). When the body is identical to the
+        one this instance last returned, it is not decoded and None is
+        returned, so a sync callback (see
+        `researcharr.scheduling.CycleOrchestrator`) can skip reconciliation.
+        The comparison is per instance rather than ``changed``, because
+        `sync` and the API fetch the same URL; a fresh instance (after a
+        restart or a config change) always returns the rows. Pass
+        ``force=True`` after a failed reconciliation to get the rows anyway.
+        Use `iter_library` for libraries too large to cache.
+        """
+        url = self.config.get("url")
+        api_key = self.config.get("api_key")
+        if not url or not api_key:
+            return []
+
+        from researcharr.ingest import project_tracked_item
+        from researcharr.storage.models import AppType
+
+        r = self.http.get_json(
+            f"{url}/api/v3/series?apikey={api_key}", timeout=self.config.get("timeout", 30)
+        )
+        if r.status_code != 200:
+            raise RuntimeError(f"{self.name} library fetch failed with status {r.status_code}")
+        if r.digest == self._library_digest and not force:
+            return None
+        rows = (project_tracked_item(record, AppType.SONARR) for record in r.json())
+        library = [row for row in rows if row is not None]
+        self._library_digest = r.digest
+        return library
+
     def health(self) -> dict[str, Any]:
         url = self.config.get("url")
         api_key = self.config.get("api_key")
         if not url or not api_key:
             return {"status": "degraded", "msg": "not configured"}
         try:
-            import requests
-
-            r = requests.get(f"{url}/api/v3/system/status?apikey={api_key}", timeout=5)
+            r = self.http.get_json(f"{url}{self.status_path}?apikey={api_key}", timeout=5)
             if r.status_code == 200:
                 return {"status": "ok"}
         except Exception:
@@ -91,11 +206,9 @@ class Plugin(BasePlugin):
             url = self.config.get("url")
             api_key = self.config.get("api_key")
             try:
-                import requests
-
                 # Try episode-level search first
                 if episode is not None:
-                    r = requests.post(
+                    r = self.http.post(
                         f"{url}/api/v3/episode/{episode}/search?apikey={api_key}",
                         timeout=10,
                     )
@@ -109,7 +222,7 @@ class Plugin(BasePlugin):
 
                 # Otherwise, try series-level command
                 payload_cmd = {"name": "SeriesSearch", "seriesId": series_id}
-                r = requests.post(
+                r = self.http.post(
                     f"{url}/api/v3/command?apikey={api_key}",
                     json=payload_cmd,
                     timeout=10,
@@ -1,7 +1,15 @@
-import importlib
-import importlib.util
 import os
+import threading
+from typing import Any
 
+from researcharr.core.plugin_instances import PluginInstanceManager
+from researcharr.core.plugin_manifest import (
+    PluginSpec,
+    iter_plugin_files,
+    load_plugin_file,
+    plugin_metadata,
+    scan_plugins,
+)
 from researcharr.plugins.base import BasePlugin
 
 
@@ -9,91 +17,87 @@ class PluginRegistry:
     def __init__(self):
         # mapping plugin_name -> plugin class
         self._plugins: dict[str, type[BasePlugin]] = {}
+        # plugin_name -> parsed but not yet imported module (lazy discovery)
+        self._lazy: dict[str, PluginSpec] = {}
+        self._load_lock = threading.RLock()
+        # long-lived, set-up instances for API calls and health checks
+        self.instances = PluginInstanceManager(self.create_instance)
 
     def register(self, name: str, cls: type[BasePlugin]):
+        self._lazy.pop(name, None)
         self._plugins[name] = cls
 
     def get(self, name: str):
-        return self._plugins.get(name)
+        cls = self._plugins.get(name)
+        if cls is None and name in self._lazy:
+            with self._load_lock:
+                spec = self._lazy.get(name)
+                if spec is not None:
+                    loaded = load_plugin_file(spec.path, spec.parent)
+                    if loaded is not None:
+                        self.register(*loaded)
+                    # Only after registering, so `describe` always finds one
+                    self._lazy.pop(name, None)
+            cls = self._plugins.get(name)
+        return cls
 
-    def discover_local(self, plugins_dir: str):
+    def describe(self, name: str) -> dict[str, Any] | None:
+        """Return ``category``, ``description`` and ``docs_url`` for a plugin.
+
+        A lazily discovered plugin is described from its parsed spec and
+        is not imported; None for unknown names.
+        """
+        spec = self._lazy.get(name)
+        if spec is not None:
+            return plugin_metadata(spec)
+        cls = self._plugins.get(name)
+        return plugin_metadata(cls) if cls is not None else None
+
+    def discover_local(
+        self, plugins_dir: str, lazy: bool = False, manifest_path: str | None = None
+    ):
         """Discover plugin modules in a local plugins directory.
 
         Each plugin module should define `PLUGIN_NAME` and `Plugin` class.
+        Plugins in an immediate subdirectory get the folder name as their
+        category (e.g. plugins/media/* -> 'media') unless the module or
+        class sets one.
+
+        With ``lazy=True`` the files are only parsed (see
+        `researcharr.core.plugin_manifest`), and each module is imported the
+        first time `get` asks for its class. ``manifest_path`` caches the
+        parse results between runs.
         """
         if not os.path.isdir(plugins_dir):
             return
 
-        # Walk plugins_dir and discover .py files. Prefer immediate
-        # subdirectory name as the plugin category (e.g. plugins/media/* ->
-        # category 'media') but allow module/class-level category to
-        # override.
-        for root, dirs, files in os.walk(plugins_dir):
-            # Limit discovery to top-level and one-level deep (category
-            # folders). Compute relative depth from plugins_dir.
-            rel = os.path.relpath(root, plugins_dir)
-            depth = 0 if rel == "." else len(rel.split(os.sep))
-            if depth > 1:
-                # skip deeper nested folders
-                continue
-
-            parent = None if rel == "." else rel
-
-            for fn in files:
-                if not fn.endswith(".py") or fn.startswith("_"):
-                    continue
-                path = os.path.join(root, fn)
-                name = os.path.splitext(fn)[0]
-                # Use a unique module name to avoid collisions with the
-                # repository's real 'plugins' package. Collisions can occur
-                # under test when loading from a temporary directory.
-                mod_name = f"_researcharr_local_plugin_{name}_{abs(hash(path))}"
-                spec = importlib.util.spec_from_file_location(mod_name, path)
-                if spec is None or spec.loader is None:
-                    # noisy debug when enabled via env for container diagnosis
-                    if os.getenv("RESEARCHARR_DEBUG_REGISTRY_SHIM"):
-                        print(f"[registry-discover] skip spec load path={path}")
-                    continue
-                mod = importlib.util.module_from_spec(spec)
-                loader = spec.loader
-                assert loader is not None
-                try:
-                    loader.exec_module(mod)
-                except Exception as e:
-                    # skip modules that fail to import during discovery
-                    if os.getenv("RESEARCHARR_DEBUG_REGISTRY_SHIM"):
-                        print(f"[registry-discover] import failed path={path} err={e}")
-                    continue
-
-                plugin_name = getattr(mod, "PLUGIN_NAME", None)
-                plugin_cls = getattr(mod, "Plugin", None)
-                if not plugin_name or not plugin_cls:
-                    if os.getenv("RESEARCHARR_DEBUG_REGISTRY_SHIM"):
-                        print(f"[registry-discover] missing PLUGIN_NAME/Plugin path={path}")
-                    continue
-
-                # Determine category: explicit module-level or class attr
-                explicit_cat = getattr(mod, "CATEGORY", None) or getattr(
-                    plugin_cls, "category", None
-                )
-                if explicit_cat:
-                    plugin_cls.category = explicit_cat
-                elif parent:
-                    plugin_cls.category = parent
-                else:
-                    plugin_cls.category = getattr(plugin_cls, "category", "plugins")
+        if not lazy:
+            for path, parent in iter_plugin_files(plugins_dir):
+                loaded = load_plugin_file(path, parent)
+                if loaded is not None:
+                    self.register(*loaded)
+            return
 
-                if os.getenv("RESEARCHARR_DEBUG_REGISTRY_SHIM"):
-                    print(
-                        f"[registry-discover] registered name={plugin_name} cat={getattr(plugin_cls, 'category', None)} path={path} mod={mod_name}"
-                    )
-                self.register(plugin_name, plugin_cls)
+        for spec in scan_plugins(plugins_dir, manifest_path):
+            if spec.name is None:
+                # Name is computed at import time; import it now
+                loaded = load_plugin_file(spec.path, spec.parent)
+                if loaded is not None:
+                    self.register(*loaded)
+            else:
+                self._plugins.pop(spec.name, None)
+                self._lazy[spec.name] = spec
 
     def create_instance(self, plugin_name: str, config: dict):
+        """Build a new, unpooled instance; see `get_instance` for the pooled one."""
         cls = self.get(plugin_name)
         if not cls:
             raise KeyError(f"Unknown plugin: {plugin_name}")
         return cls(config)
 
+    def get_instance(self, plugin_name: str, config: dict):
+        """Return the long-lived instance for ``config``, set up on first use."""
+        return self.instances.get(plugin_name, config)
+
     def list_plugins(self) -> list[str]:
-        return list(self._plugins.keys())
+        return list(dict.fromkeys([*self._plugins, *self._lazy]))
@@ -1,13 +1,14 @@
 from typing import Any
 
 from flask import Blueprint, jsonify
-from researcharr.plugins.base import BasePlugin
+from plugins.base import BasePlugin
 
 PLUGIN_NAME = "prowlarr"
 
 
 class Plugin(BasePlugin):
     name = PLUGIN_NAME
+    status_path = "/api/v1/status"
     category = "scrapers"
     description = "Example Prowlarr plugin (search indexer aggregator)"
     docs_url = "https://github.com/Prowlarr/Prowlarr"
@@ -27,13 +28,11 @@ class Plugin(BasePlugin):
             return {"success": True, "indexers": []}
 
         try:
-            import requests
-
-            r = requests.get(f"{url}/api/v1/status?apikey={api_key}", timeout=5)
+            r = self.http.get(f"{url}/api/v1/status?apikey={api_key}", timeout=5)
             if r.status_code == 200:
                 return {"success": True, "indexers": r.json()}
             # fallback to list indexers
-            r2 = requests.get(f"{url}/api/v1/indexer?apikey={api_key}", timeout=5)
+            r2 = self.http.get(f"{url}/api/v1/indexer?apikey={api_key}", timeout=5)
             if r2.status_code == 200:
                 return {"success": True, "indexers": r2.json()}
         except Exception:
@@ -54,9 +53,7 @@ class Plugin(BasePlugin):
         if not url or not api_key:
             return {"status": "degraded", "msg": "not configured"}
         try:
-            import requests
-
-            r = requests.get(f"{url}/api/v1/status?apikey={api_key}", timeout=5)
+            r = self.http.get_json(f"{url}{self.status_path}?apikey={api_key}", timeout=5)
             if r.status_code == 200:
                 return {"status": "ok"}
         except Exception:
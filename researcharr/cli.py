@@ -556,6 +556,10 @@ def cmd_db_stats(args: argparse.Namespace) -> int:
                 print(f"Total Rows: {stats['total_rows']:,}")
                 print()
 
+            queries = stats.get("queries")
+            if queries:
+                _print_query_stats(queries, getattr(args, "top", 10))
+
             if "error" in stats:
                 print(f"ERROR: {stats['error']}", file=sys.stderr)
 
@@ -566,6 +570,29 @@ def cmd_db_stats(args: argparse.Namespace) -> int:
         return 1
 
 
+def _print_query_stats(queries: dict, top: int) -> None:
+    """Print the top statements and recent slow queries from a query stats snapshot."""
+    statements = queries.get("statements", [])[:top]
+    print(f"Top Statements by Total Time ({len(statements)}):")
+    for entry in statements:
+        print(
+            f"  {entry['total_ms']:>10.1f}ms total  {entry['count']:>7,}x  "
+            f"p95 {entry['p95_ms']:.1f}ms  rows {entry['rows']:,}"
+        )
+        print(f"      {entry['fingerprint'][:120]}")
+    print()
+
+    slow = queries.get("slow_queries", [])[:top]
+    print(f"Slow Queries (>= {queries.get('slow_query_ms', 0):g}ms, newest first):")
+    if not slow:
+        print("  none")
+    for entry in slow:
+        at = datetime.fromtimestamp(entry["timestamp"], UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
+        print(f"  {at}  {entry['duration_ms']:.1f}ms  rows {entry['rows']:,}")
+        print(f"      {entry['fingerprint'][:120]}")
+    print()
+
+
 def cmd_db_integrity(args: argparse.Namespace) -> int:
     """Run comprehensive integrity check."""
     db_path = args.db_path or (get_config_dir() / "researcharr.db")
@@ -747,6 +774,12 @@ def main() -> int:
         action="store_true",
         help="Output in JSON format",
     )
+    db_stats_parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of statements and slow queries to show (default: 10)",
+    )
     db_stats_parser.set_defaults(func=cmd_db_stats)
 
     # db integrity
@@ -4,6 +4,7 @@ This module provides the core API functionality extracted from the main
 api.py file, integrated with the new core architecture components.
 """
 
+import concurrent.futures
 from functools import wraps
 
 from werkzeug.security import check_password_hash
@@ -18,6 +19,9 @@ from flask import (
 
 from .container import get_container
 from .events import Events, get_event_bus
+from .plugin_health import get_plugin_health_checker
+from .plugin_instances import acquire_instance
+from .plugin_manifest import describe_plugin
 
 # Create the API blueprint
 bp = Blueprint("api_v1", __name__)
@@ -136,15 +140,13 @@ def plugins():
     if registry is not None:
         for name in registry.list_plugins():
             instances = getattr(current_app, "config_data", {}).get(name, [])
-            cls = registry.get(name)
-            category = getattr(cls, "category", "plugins") if cls is not None else "plugins"
-            description = getattr(cls, "description", "") if cls is not None else ""
+            meta = describe_plugin(registry, name)
             data["plugins"].append(
                 {
                     "name": name,
                     "instances": instances,
-                    "category": category,
-                    "description": description,
+                    "category": meta["category"],
+                    "description": meta["description"],
                 }
             )
 
@@ -173,8 +175,9 @@ def plugin_validate(plugin_name: str, idx: int):
     inst_cfg = instances[idx]
 
     try:
-        pl = registry.create_instance(plugin_name, inst_cfg)
-        result = pl.validate()
+        result = get_plugin_health_checker().check(
+            registry, plugin_name, inst_cfg, "validate", fresh=True
+        )
 
         # Publish validation event
         get_event_bus().publish_simple(
@@ -185,6 +188,14 @@ def plugin_validate(plugin_name: str, idx: int):
 
         return jsonify({"result": result})
 
+    except concurrent.futures.TimeoutError:  # not the builtin TimeoutError before 3.11
+        get_event_bus().publish_simple(
+            Events.PLUGIN_ERROR,
+            data={"plugin": plugin_name, "instance": idx, "error": "validation timed out"},
+            source="core_api",
+        )
+        return jsonify({"error": "validate_timeout"}), 504
+
     except Exception as e:
         current_app.logger.exception("Plugin validate failed: %s", e)
 
@@ -213,7 +224,7 @@ def plugin_sync(plugin_name: str, idx: int):
     inst_cfg = instances[idx]
 
     try:
-        pl = registry.create_instance(plugin_name, inst_cfg)
+        pl = acquire_instance(registry, plugin_name, inst_cfg)
 
         # Publish job start event
         get_event_bus().publish_simple(
@@ -273,7 +284,7 @@ def notifications_send():
         return jsonify({"error": "no_apprise_instances"}), 404
 
     try:
-        pl = registry.create_instance("apprise", instances[0])
+        pl = acquire_instance(registry, "apprise", instances[0])
 
         # Expecting data to contain 'body' and optional 'title'
         title = data.get("title")
@@ -315,6 +326,75 @@ def notifications_send():
         return jsonify({"error": "send_failed", "msg": str(e)}), 500
 
 
+# Keyset-paginated listings ---------------------------------------------------
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 500
+
+
+def _page_args(cursor_size: int):
+    """Parse ``limit`` and the opaque ``cursor`` query parameters."""
+    from researcharr.repositories.base import decode_cursor
+
+    limit = request.args.get("limit", DEFAULT_PAGE_LIMIT, type=int)
+    limit = max(1, min(limit, MAX_PAGE_LIMIT))
+    cursor = request.args.get("cursor")
+    after = decode_cursor(cursor, cursor_size) if cursor else None
+    return limit, after
+
+
+def _paged(fetch, cursor_size: int, key):
+    """Run ``fetch(uow, limit, after)`` and return a cursor page response.
+
+    ``fetch`` returns read-model views (see `researcharr.repositories.read_models`).
+    """
+    from researcharr.repositories.base import encode_cursor
+    from researcharr.repositories.exceptions import ValidationError
+
+    try:
+        limit, after = _page_args(cursor_size)
+    except ValidationError:
+        return jsonify({"error": "invalid_cursor"}), 400
+    storage = get_container().resolve("storage_service")
+    with storage.create_unit_of_work(read_only=True) as uow:
+        rows = fetch(uow, limit, after)
+        items = [row.to_dict() for row in rows]
+        next_cursor = encode_cursor(key(rows[-1])) if len(rows) == limit else None
+    return jsonify({"items": items, "next_cursor": next_cursor})
+
+
+@bp.route("/apps")
+@require_api_key
+def list_apps():
+    """List managed apps by id, one keyset page at a time."""
+    return _paged(
+        lambda uow, limit, after: uow.views.apps_page(limit, after[0] if after else None),
+        1,
+        lambda app: (app.id,),
+    )
+
+
+@bp.route("/items")
+@require_api_key
+def list_items():
+    """List tracked items by id, one keyset page at a time."""
+    return _paged(
+        lambda uow, limit, after: uow.views.items_page(limit, after[0] if after else None),
+        1,
+        lambda item: (item.id,),
+    )
+
+
+@bp.route("/apps/<int:app_id>/logs")
+@require_api_key
+def list_app_logs(app_id: int):
+    """List an app's processing logs newest first, one keyset page at a time."""
+    return _paged(
+        lambda uow, limit, after: uow.views.logs_by_app(app_id, limit=limit, after=after),
+        2,
+        lambda log: (log.created_at, log.id),
+    )
+
+
 @bp.route("/openapi.json")
 def openapi():
     """Return a minimal OpenAPI v3 JSON description for the API."""
@@ -462,6 +542,124 @@ def openapi():
                     },
                 }
             },
+            "/apps": {
+                "get": {
+                    "summary": "List managed apps (cursor paginated)",
+                    "security": [{"ApiKeyAuth": []}],
+                    "parameters": [
+                        {
+                            "name": "limit",
+                            "in": "query",
+                            "schema": {"type": "integer", "default": 50, "maximum": 500},
+                            "description": "Page size",
+                        },
+                        {
+                            "name": "cursor",
+                            "in": "query",
+                            "schema": {"type": "string"},
+                            "description": "Opaque next_cursor from the previous page",
+                        },
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "One page of results",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "object",
+                                        "properties": {
+                                            "items": {"type": "array"},
+                                            "next_cursor": {"type": "string", "nullable": True},
+                                        },
+                                    }
+                                }
+                            },
+                        },
+                        "400": {"description": "Invalid cursor"},
+                    },
+                }
+            },
+            "/items": {
+                "get": {
+                    "summary": "List tracked items (cursor paginated)",
+                    "security": [{"ApiKeyAuth": []}],
+                    "parameters": [
+                        {
+                            "name": "limit",
+                            "in": "query",
+                            "schema": {"type": "integer", "default": 50, "maximum": 500},
+                            "description": "Page size",
+                        },
+                        {
+                            "name": "cursor",
+                            "in": "query",
+                            "schema": {"type": "string"},
+                            "description": "Opaque next_cursor from the previous page",
+                        },
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "One page of results",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "object",
+                                        "properties": {
+                                            "items": {"type": "array"},
+                                            "next_cursor": {"type": "string", "nullable": True},
+                                        },
+                                    }
+                                }
+                            },
+                        },
+                        "400": {"description": "Invalid cursor"},
+                    },
+                }
+            },
+            "/apps/{app_id}/logs": {
+                "get": {
+                    "summary": "List an app's processing logs, newest first (cursor paginated)",
+                    "security": [{"ApiKeyAuth": []}],
+                    "parameters": [
+                        {
+                            "name": "app_id",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "integer"},
+                            "description": "Managed app id",
+                        },
+                        {
+                            "name": "limit",
+                            "in": "query",
+                            "schema": {"type": "integer", "default": 50, "maximum": 500},
+                            "description": "Page size",
+                        },
+                        {
+                            "name": "cursor",
+                            "in": "query",
+                            "schema": {"type": "string"},
+                            "description": "Opaque next_cursor from the previous page",
+                        },
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "One page of results",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "object",
+                                        "properties": {
+                                            "items": {"type": "array"},
+                                            "next_cursor": {"type": "string", "nullable": True},
+                                        },
+                                    }
+                                }
+                            },
+                        },
+                        "400": {"description": "Invalid cursor"},
+                    },
+                }
+            },
             "/notifications/send": {
                 "post": {
                     "summary": "Send notification (apprise)",
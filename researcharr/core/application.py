@@ -16,10 +16,13 @@ from werkzeug.security import generate_password_hash
 
 from flask import Flask
 
+from .circuit_breaker import CircuitBreakerRegistry
 from .config import get_config_manager
 from .container import get_container
 from .events import Events, get_event_bus
 from .lifecycle import add_shutdown_hook, add_startup_hook, get_lifecycle
+from .plugin_health import PluginHealthChecker
+from .plugin_sandbox import PluginSandbox
 from .services import (
     ConnectivityService,
     DatabaseService,
@@ -66,7 +69,9 @@ class CoreApplicationFactory:
 
         # Register infrastructure services first (no dependencies)
         self.container.register_singleton("filesystem_service", FileSystemService())
-        self.container.register_singleton("http_client_service", HttpClientService())
+        self.container.register_singleton(
+            "http_client_service", HttpClientService(config.get("http"))
+        )
 
         # Register core services with injected dependencies
         self.container.register_singleton("database_service", DatabaseService(db_path))
@@ -74,9 +79,24 @@ class CoreApplicationFactory:
         self.container.register_singleton("health_service", HealthService())
         self.container.register_singleton("metrics_service", MetricsService())
 
-        # Register connectivity service with HTTP client
+        # Register connectivity service with HTTP client and per-instance breakers
+        http_config = config.get("http") or {}
         http_client = self.container.resolve("http_client_service")
-        self.container.register_singleton("connectivity_service", ConnectivityService(http_client))
+        breakers = CircuitBreakerRegistry(http_config.get("circuit_breaker"))
+        self.container.register_singleton("circuit_breakers", breakers)
+        self.container.register_singleton(
+            "connectivity_service",
+            ConnectivityService(http_client, breakers, http_config.get("hedge_after", 1.0)),
+        )
+
+        # Plugin health/validate checks share one pool with a global deadline
+        self.container.register_singleton(
+            "plugin_health_checker", PluginHealthChecker(http_config.get("health_checks"))
+        )
+        # Opt-in out-of-process execution of plugin sync/health calls
+        self.container.register_singleton(
+            "plugin_sandbox", PluginSandbox(http_config.get("plugin_sandbox"))
+        )
 
         # Register scheduler and monitoring services
         self.container.register_singleton("scheduler_service", SchedulerService(config))
@@ -301,7 +321,12 @@ class CoreApplicationFactory:
                 pkg_dir = os.path.dirname(__file__)
                 plugins_dir = os.path.join(pkg_dir, "..", "..", "plugins")
                 if os.path.exists(plugins_dir):
-                    registry.discover_local(plugins_dir)
+                    # Modules are imported when first used (see core.plugin_manifest)
+                    registry.discover_local(
+                        plugins_dir,
+                        lazy=not os.getenv("RESEARCHARR_EAGER_PLUGINS"),
+                        manifest_path=os.path.join(config_dir, "plugin-manifest.json"),
+                    )
 
                 # Register plugin registry as a service
                 self.container.register_singleton("plugin_registry", registry)
@@ -418,6 +443,18 @@ class CoreApplicationFactory:
 
         return user_config
 
+    def shutdown_plugins(self) -> None:
+        """Tear down pooled plugin instances and stop sandbox workers."""
+        try:
+            if self.container.has_service("plugin_registry"):
+                pool = getattr(self.container.resolve("plugin_registry"), "instances", None)
+                if pool is not None:
+                    pool.close()
+            if self.container.has_service("plugin_sandbox"):
+                self.container.resolve("plugin_sandbox").close()
+        except Exception:  # nosec B110 -- intentional broad except for resilience
+            pass  # Best effort
+
     def setup_lifecycle_hooks(self) -> None:
         """Setup application lifecycle hooks."""
 
@@ -504,6 +541,7 @@ class CoreApplicationFactory:
         add_startup_hook("core_logging", startup_logging, priority=20, critical=False)
         add_startup_hook("core_scheduler", startup_scheduler, priority=30, critical=False)
         add_shutdown_hook("core_scheduler", shutdown_scheduler, priority=10, critical=False)
+        add_shutdown_hook("core_plugins", self.shutdown_plugins, priority=20, critical=False)
         add_shutdown_hook("core_cleanup", shutdown_cleanup, priority=90, critical=False)
 
     def create_core_app(self, config_dir: str = "/config") -> Flask:
@@ -0,0 +1,135 @@
+"""Asyncio HTTP client for plugin and pipeline I/O.
+
+`AsyncHttpClientService` is the async counterpart of
+`researcharr.core.services.HttpClientService`. It is one pooled
+``httpx.AsyncClient`` with the same ``http`` settings (timeouts, retries,
+pool size), plus a cap on in-flight requests per host. Checking or syncing
+every configured instance can then be fanned out with ``asyncio.gather``.
+The fan-out takes about as long as the slowest instance, and no single
+*arr gets more than ``per_host_limit`` concurrent requests.
+
+httpx is an optional dependency. Importing this module works without it,
+and creating a client raises ``RuntimeError``.
+
+Example:
+    client = get_async_http_client()
+    statuses = await asyncio.gather(
+        *(client.get(f"{url}/api/v3/system/status") for url in urls)
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from typing import Any
+from urllib.parse import urlsplit
+
+from researcharr.core.services import HTTP_DEFAULTS, get_http_client
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+
+class AsyncHttpClientService:
+    """Async HTTP requests over one pooled ``httpx.AsyncClient``.
+
+    The client is bound to the event loop it is first used on; use
+    `get_async_http_client` to get the shared client for the running loop.
+    Per-call keywords (for example ``timeout=5``) override the defaults.
+
+    Args:
+        config: The ``http`` configuration section; keys default to
+            ``HTTP_DEFAULTS``
+    """
+
+    def __init__(self, config: dict[str, Any] | None = None):
+        if httpx is None:
+            raise RuntimeError("httpx is required for AsyncHttpClientService")
+        self.settings = {**HTTP_DEFAULTS, **(config or {})}
+        s = self.settings
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(s["read_timeout"], connect=s["connect_timeout"]),
+            limits=httpx.Limits(
+                max_connections=s["max_connections"],
+                max_keepalive_connections=s["max_connections"],
+            ),
+            # httpx retries connection failures only; status codes are returned as-is
+            transport=httpx.AsyncHTTPTransport(retries=s["retries"]),
+            follow_redirects=True,
+        )
+        self._host_limits: dict[tuple[str, str], asyncio.Semaphore] = {}
+
+    def _limit_for(self, url: str) -> asyncio.Semaphore:
+        parts = urlsplit(url)
+        key = (parts.scheme.lower(), parts.netloc.lower())
+        limit = self._host_limits.get(key)
+        if limit is None:
+            limit = self._host_limits[key] = asyncio.Semaphore(self.settings["per_host_limit"])
+        return limit
+
+    async def request(self, method: str, url: str, **kwargs) -> Any:
+        """Perform an HTTP request, waiting for a free per-host slot first."""
+        async with self._limit_for(url):
+            return await self._client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> Any:
+        """Perform a GET request."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> Any:
+        """Perform a POST request."""
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> Any:
+        """Perform a PUT request."""
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> Any:
+        """Perform a DELETE request."""
+        return await self.request("DELETE", url, **kwargs)
+
+    @property
+    def closed(self) -> bool:
+        return self._client.is_closed
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncHttpClientService:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+_loop_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncHttpClientService] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_http_client() -> AsyncHttpClientService:
+    """Return the shared async client for the running event loop.
+
+    Settings come from the shared sync client (see
+    `researcharr.core.services.get_http_client`), so both clients follow
+    the same ``http`` configuration.
+    """
+    loop = asyncio.get_running_loop()
+    client = _loop_clients.get(loop)
+    if client is None or client.closed:
+        client = _loop_clients[loop] = AsyncHttpClientService(get_http_client().settings)
+    return client
+
+
+async def close_async_http_client() -> None:
+    """Close the running loop's shared async client, if one was created."""
+    client = _loop_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+__all__ = ["AsyncHttpClientService", "close_async_http_client", "get_async_http_client"]
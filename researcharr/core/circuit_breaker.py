@@ -0,0 +1,274 @@
+"""Per-instance circuit breakers for managed *arr apps.
+
+A dead Radarr/Sonarr instance otherwise costs a full connect/read timeout
+on every health poll and every search cycle. A `CircuitBreaker` remembers
+recent outcomes for one instance as an exponentially decaying failure
+rate: each outcome's weight halves every ``half_life`` seconds.
+
+States:
+
+* **closed**: calls go through. Once at least ``min_calls`` outcomes
+  have been recorded and the decayed failure rate reaches
+  ``failure_threshold``, the breaker opens.
+* **open**: calls fail fast with `CircuitOpenError` (or ``allow()`` is
+  False) for ``open_seconds``. Each consecutive re-open doubles the wait,
+  up to ``max_open_seconds``.
+* **half_open**: once the wait is over, one probe call is let through.
+  Success closes the breaker and clears its history; failure re-opens it.
+
+Breakers live in memory in a `CircuitBreakerRegistry`, keyed by instance
+(for example ``"radarr:http://radarr:7878"``). ``/api/status`` reports
+their `snapshot`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from enum import Enum
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+BREAKER_DEFAULTS: dict[str, Any] = {
+    "failure_threshold": 0.5,
+    "min_calls": 3,
+    "half_life": 300.0,
+    "open_seconds": 30.0,
+    "max_open_seconds": 600.0,
+}
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised by `CircuitBreaker.call` while the breaker is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"circuit open for {name}; retry in {retry_in:.0f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker driven by a decaying failure rate.
+
+    Args:
+        name: Instance key, used in errors and snapshots
+        failure_threshold: Decayed failure rate (0-1) that opens the breaker
+        min_calls: Outcomes needed before the rate is trusted
+        half_life: Seconds for an outcome's weight to halve
+        open_seconds: First open period; doubles on each consecutive re-open
+        max_open_seconds: Cap on the open period
+        clock: Monotonic seconds (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: float = 0.5,
+        min_calls: int = 3,
+        half_life: float = 300.0,
+        open_seconds: float = 30.0,
+        max_open_seconds: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("failure_threshold must be in (0, 1]")
+        if half_life <= 0 or open_seconds <= 0:
+            raise ValueError("half_life and open_seconds must be > 0")
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.min_calls = min_calls
+        self.half_life = half_life
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max(max_open_seconds, open_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._calls = 0.0
+        self._failures = 0.0
+        self._samples = 0
+        self._decayed_at = clock()
+        self._opened_at = 0.0
+        self._open_for = 0.0
+        self._reopens = 0
+        self._probing = False
+        self._probe_started = 0.0
+        self.last_error: str | None = None
+
+    def _decay(self, now: float) -> None:
+        factor = 0.5 ** ((now - self._decayed_at) / self.half_life)
+        self._calls *= factor
+        self._failures *= factor
+        self._decayed_at = now
+
+    def _open(self, now: float) -> None:
+        self._open_for = min(self.open_seconds * 2**self._reopens, self.max_open_seconds)
+        self._state = CircuitState.OPEN
+        self._opened_at = now
+        self._reopens += 1
+        self._probing = False
+
+    def _current_state(self, now: float) -> CircuitState:
+        if self._state is CircuitState.OPEN and now - self._opened_at >= self._open_for:
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._current_state(self._clock())
+
+    @property
+    def failure_rate(self) -> float:
+        with self._lock:
+            self._decay(self._clock())
+            return self._failures / self._calls if self._calls else 0.0
+
+    def retry_in(self) -> float:
+        """Seconds until an open breaker lets a probe through (0 otherwise)."""
+        with self._lock:
+            now = self._clock()
+            if self._current_state(now) is not CircuitState.OPEN:
+                return 0.0
+            return self._open_for - (now - self._opened_at)
+
+    def allow(self) -> bool:
+        """Whether a call may proceed now; half-open admits a single probe."""
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            if state is CircuitState.CLOSED:
+                return True
+            # A probe whose outcome was never recorded must not wedge the breaker
+            if state is CircuitState.HALF_OPEN and (
+                not self._probing or now - self._probe_started >= self._open_for
+            ):
+                self._probing = True
+                self._probe_started = now
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            now = self._clock()
+            if self._current_state(now) is not CircuitState.CLOSED:
+                self._state = CircuitState.CLOSED
+                self._calls = self._failures = 0.0
+                self._samples = 0
+                self._reopens = 0
+                self._probing = False
+            self._decay(now)
+            self._calls += 1
+            self._samples += 1
+
+    def record_failure(self, error: BaseException | str | None = None) -> None:
+        with self._lock:
+            now = self._clock()
+            if error is not None:
+                self.last_error = str(error)
+            state = self._current_state(now)
+            if state is CircuitState.HALF_OPEN:
+                self._open(now)
+                return
+            if state is CircuitState.OPEN:
+                return
+            self._decay(now)
+            self._calls += 1
+            self._failures += 1
+            self._samples += 1
+            if (
+                self._samples >= self.min_calls
+                and self._failures / self._calls >= self.failure_threshold
+            ):
+                self._open(now)
+
+    def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``func`` through the breaker; exceptions count as failures."""
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.retry_in())
+        try:
+            result = func(*args, **kwargs)
+        except Exception as exc:
+            self.record_failure(exc)
+            raise
+        self.record_success()
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._calls = self._failures = 0.0
+            self._samples = 0
+            self._reopens = 0
+            self._probing = False
+            self.last_error = None
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            self._decay(now)
+            return {
+                "state": state.value,
+                "failure_rate": round(self._failures / self._calls, 3) if self._calls else 0.0,
+                "recent_calls": round(self._calls, 2),
+                "retry_in": (
+                    round(self._open_for - (now - self._opened_at), 1)
+                    if state is CircuitState.OPEN
+                    else 0.0
+                ),
+                "consecutive_opens": self._reopens,
+                "last_error": self.last_error,
+            }
+
+
+class CircuitBreakerRegistry:
+    """Breakers by instance key, created on first use with shared settings.
+
+    Args:
+        config: Breaker settings; keys default to ``BREAKER_DEFAULTS``
+        clock: Passed to every breaker (injectable for tests)
+    """
+
+    def __init__(
+        self, config: dict[str, Any] | None = None, clock: Callable[[], float] = time.monotonic
+    ):
+        self.settings = {**BREAKER_DEFAULTS, **(config or {})}
+        self._clock = clock
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CircuitBreaker:
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(key)
+                if breaker is None:
+                    breaker = self._breakers[key] = CircuitBreaker(
+                        key, clock=self._clock, **self.settings
+                    )
+        return breaker
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        return {key: breaker.snapshot() for key, breaker in sorted(self._breakers.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._breakers.clear()
+
+
+__all__ = [
+    "BREAKER_DEFAULTS",
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "CircuitOpenError",
+    "CircuitState",
+]
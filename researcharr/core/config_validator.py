@@ -121,6 +121,94 @@ class ConfigValidator:
                             "maximum": 1.0,
                             "description": "Fragmentation alert threshold (0-1)",
                         },
+                        "rollup_compaction_interval_minutes": {
+                            "type": "integer",
+                            "default": 60,
+                            "minimum": 1,
+                            "maximum": 1440,
+                            "description": "Processing-log rollup compaction interval in minutes",
+                        },
+                        "rollup_compaction_window_hours": {
+                            "type": "integer",
+                            "default": 2,
+                            "minimum": 1,
+                            "maximum": 168,
+                            "description": "Recent hours recomputed by each rollup compaction",
+                        },
+                    },
+                },
+                "sqlite": {
+                    "type": "object",
+                    "properties": {
+                        "enabled": {
+                            "type": "boolean",
+                            "default": True,
+                            "description": "Apply the SQLite connection tuning profile",
+                        },
+                        "journal_mode": {
+                            "type": "string",
+                            "enum": ["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF"],
+                            "default": "WAL",
+                            "description": "SQLite journal mode",
+                        },
+                        "synchronous": {
+                            "type": "string",
+                            "enum": ["OFF", "NORMAL", "FULL", "EXTRA"],
+                            "default": "NORMAL",
+                            "description": "SQLite synchronous level",
+                        },
+                        "busy_timeout": {
+                            "type": "integer",
+                            "default": 5000,
+                            "minimum": 0,
+                            "description": "Lock wait timeout in milliseconds",
+                        },
+                        "cache_size": {
+                            "type": "integer",
+                            "default": -64000,
+                            "description": "Page cache size (negative values are KiB)",
+                        },
+                        "mmap_size": {
+                            "type": "integer",
+                            "default": 268435456,
+                            "minimum": 0,
+                            "description": "Memory-mapped I/O size in bytes",
+                        },
+                        "temp_store": {
+                            "type": "string",
+                            "enum": ["DEFAULT", "FILE", "MEMORY"],
+                            "default": "MEMORY",
+                            "description": "Temporary storage location",
+                        },
+                        "foreign_keys": {
+                            "type": "string",
+                            "enum": ["ON", "OFF"],
+                            "default": "ON",
+                            "description": "Enforce foreign key constraints",
+                        },
+                    },
+                },
+                "query_stats": {
+                    "type": "object",
+                    "properties": {
+                        "enabled": {
+                            "type": "boolean",
+                            "default": False,
+                            "description": "Record per-statement SQL timings and a slow-query log",
+                        },
+                        "slow_query_ms": {
+                            "type": "number",
+                            "default": 100,
+                            "minimum": 0,
+                            "description": "Statements at or above this latency are logged as slow",
+                        },
+                        "slow_log_size": {
+                            "type": "integer",
+                            "default": 100,
+                            "minimum": 1,
+                            "maximum": 10000,
+                            "description": "Number of slow queries kept (oldest dropped first)",
+                        },
                     },
                 },
                 "path": {
@@ -130,6 +218,182 @@ class ConfigValidator:
             },
         }
 
+        # Outbound HTTP client (HttpClientService) schema
+        self._schemas["http"] = {
+            "type": "object",
+            "properties": {
+                "pool_maxsize": {
+                    "type": "integer",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 100,
+                    "description": "Keep-alive connections kept per host",
+                },
+                "connect_timeout": {
+                    "type": "number",
+                    "default": 3.05,
+                    "minimum": 0,
+                    "description": "Default seconds to wait for a connection",
+                },
+                "read_timeout": {
+                    "type": "number",
+                    "default": 30,
+                    "minimum": 0,
+                    "description": "Default seconds to wait for a response",
+                },
+                "retries": {
+                    "type": "integer",
+                    "default": 2,
+                    "minimum": 0,
+                    "maximum": 10,
+                    "description": "Retries for idempotent requests on connection errors or 502/503/504",
+                },
+                "backoff_factor": {
+                    "type": "number",
+                    "default": 0.5,
+                    "minimum": 0,
+                    "description": "Exponential backoff factor between retries in seconds",
+                },
+                "max_connections": {
+                    "type": "integer",
+                    "default": 100,
+                    "minimum": 1,
+                    "maximum": 1000,
+                    "description": "Connections kept open by the async client across all hosts",
+                },
+                "per_host_limit": {
+                    "type": "integer",
+                    "default": 4,
+                    "minimum": 1,
+                    "maximum": 100,
+                    "description": "Concurrent async requests allowed per host",
+                },
+                "hedge_after": {
+                    "type": "number",
+                    "default": 1.0,
+                    "minimum": 0,
+                    "description": "Seconds before a slow health probe is hedged with a second request",
+                },
+                "circuit_breaker": {
+                    "type": "object",
+                    "properties": {
+                        "failure_threshold": {
+                            "type": "number",
+                            "default": 0.5,
+                            "minimum": 0.01,
+                            "maximum": 1,
+                            "description": "Decayed failure rate that opens an instance's breaker",
+                        },
+                        "min_calls": {
+                            "type": "integer",
+                            "default": 3,
+                            "minimum": 1,
+                            "description": "Outcomes needed before the failure rate is trusted",
+                        },
+                        "half_life": {
+                            "type": "number",
+                            "default": 300,
+                            "minimum": 1,
+                            "description": "Seconds for a past outcome's weight to halve",
+                        },
+                        "open_seconds": {
+                            "type": "number",
+                            "default": 30,
+                            "minimum": 1,
+                            "description": "First fail-fast period; doubles on each re-open",
+                        },
+                        "max_open_seconds": {
+                            "type": "number",
+                            "default": 600,
+                            "minimum": 1,
+                            "description": "Longest fail-fast period",
+                        },
+                    },
+                },
+                "cache": {
+                    "type": "object",
+                    "properties": {
+                        "enabled": {
+                            "type": "boolean",
+                            "default": True,
+                            "description": "Cache *arr API responses for conditional requests",
+                        },
+                        "dir": {
+                            "type": "string",
+                            "default": "",
+                            "description": "Cache directory (default: $CONFIG_DIR/http-cache)",
+                        },
+                        "max_mb": {
+                            "type": "number",
+                            "default": 64,
+                            "minimum": 1,
+                            "maximum": 4096,
+                            "description": "Total size of cached response bodies in MB",
+                        },
+                    },
+                },
+                "health_checks": {
+                    "type": "object",
+                    "properties": {
+                        "deadline": {
+                            "type": "number",
+                            "default": 5.0,
+                            "minimum": 0.1,
+                            "description": "Seconds status endpoints wait for plugin health checks",
+                        },
+                        "cache_ttl": {
+                            "type": "number",
+                            "default": 15.0,
+                            "minimum": 0,
+                            "description": "Seconds a plugin health result is reused",
+                        },
+                        "max_workers": {
+                            "type": "integer",
+                            "default": 16,
+                            "minimum": 1,
+                            "maximum": 128,
+                            "description": "Plugin checks run at the same time",
+                        },
+                    },
+                },
+                "plugin_sandbox": {
+                    "type": "object",
+                    "properties": {
+                        "enabled": {
+                            "type": "boolean",
+                            "default": False,
+                            "description": "Run plugin sync/health calls in worker processes",
+                        },
+                        "workers": {
+                            "type": "integer",
+                            "default": 2,
+                            "minimum": 1,
+                            "maximum": 32,
+                            "description": "Plugin sandbox worker processes",
+                        },
+                        "call_timeout": {
+                            "type": "number",
+                            "default": 60.0,
+                            "minimum": 0.1,
+                            "description": "Seconds before a sandboxed call's worker is killed",
+                        },
+                        "max_calls": {
+                            "type": "integer",
+                            "default": 500,
+                            "minimum": 1,
+                            "description": "Calls a sandbox worker serves before it is replaced",
+                        },
+                        "max_rss_mb": {
+                            "type": "integer",
+                            "default": 512,
+                            "minimum": 16,
+                            "description": "Peak sandbox worker memory (MB) before it is replaced",
+                        },
+                    },
+                },
+            },
+        }
+
         # Storage configuration schema
         self._schemas["storage"] = {
             "type": "object",
@@ -0,0 +1,294 @@
+"""On-disk cache of *arr API responses with conditional revalidation.
+
+`HttpClientService.get_json` uses this cache. Each cached GET stores the
+response body, its SHA-256 and the upstream ``ETag`` / ``Last-Modified``
+validators. The next request for the same URL sends ``If-None-Match`` /
+``If-Modified-Since``. A ``304 Not Modified`` is answered from disk. A
+``200`` whose body hashes to the stored digest is also reported as
+unchanged, which matters because most *arr endpoints send no validators.
+Either way the caller can skip JSON decoding and downstream
+reconciliation.
+
+Entries live under ``$CONFIG_DIR/http-cache`` by default, one body file
+and one metadata file per URL. Files are named by a hash of the URL, so
+API keys in query strings never reach the disk in clear text. The cache
+is bounded by total size, and the least recently used entries are evicted
+first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+CACHE_DEFAULTS: dict[str, Any] = {
+    "enabled": True,
+    "dir": "",
+    "max_mb": 64,
+}
+
+
+def default_cache_dir() -> Path:
+    return Path(os.environ.get("CONFIG_DIR", "/config")) / "http-cache"
+
+
+class CachedJson:
+    """Result of `HttpClientService.get_json`.
+
+    Attributes:
+        status_code: Upstream status; a revalidated ``304`` is reported as 200
+        content: Raw response body
+        changed: False when the body is byte-identical to the cached copy
+        revalidated: True when the upstream answered ``304 Not Modified``
+
+    ``changed`` compares against whatever last went through the shared
+    cache for this URL, from any caller. A consumer that needs to know
+    whether the body changed since *it* last looked should keep `digest`
+    itself.
+    """
+
+    __slots__ = ("_data", "_digest", "changed", "content", "revalidated", "status_code")
+
+    _UNSET = object()
+
+    def __init__(
+        self, status_code: int, content: bytes, changed: bool = True, revalidated: bool = False
+    ):
+        self.status_code = status_code
+        self.content = content
+        self.changed = changed
+        self.revalidated = revalidated
+        self._data: Any = self._UNSET
+        self._digest: str | None = None
+
+    @property
+    def digest(self) -> str:
+        """SHA-256 hex digest of the body."""
+        if self._digest is None:
+            self._digest = hashlib.sha256(self.content).hexdigest()
+        return self._digest
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status_code < 300
+
+    def json(self) -> Any:
+        """Decode the body on first use."""
+        if self._data is self._UNSET:
+            self._data = json.loads(self.content)
+        return self._data
+
+    def __repr__(self) -> str:
+        return (
+            f"CachedJson(status_code={self.status_code}, changed={self.changed}, "
+            f"revalidated={self.revalidated}, size={len(self.content)})"
+        )
+
+
+class HttpResponseCache:
+    """Size-bounded LRU cache of response bodies and validators on disk.
+
+    Args:
+        directory: Cache directory (created on first write)
+        max_bytes: Upper bound on the total size of stored bodies; a single
+            body larger than a quarter of it is not cached
+    """
+
+    def __init__(self, directory: str | os.PathLike[str], max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # key -> (body size, last used); rebuilt from disk on first use
+        self._index: dict[str, tuple[int, float]] | None = None
+        self._total = 0
+        self.metrics = {"revalidated": 0, "unchanged": 0, "stored": 0, "evictions": 0}
+
+    @staticmethod
+    def key_for(url: str, params: Any = None) -> str:
+        if params:
+            items = sorted(params.items()) if isinstance(params, dict) else params
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(items, doseq=True)}"
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _meta_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _body_path(self, key: str) -> Path:
+        return self.directory / f"{key}.body"
+
+    def _load_index(self) -> dict[str, tuple[int, float]]:
+        if self._index is None:
+            self._index = {}
+            self._total = 0
+            if self.directory.is_dir():
+                for body in self.directory.glob("*.body"):
+                    try:
+                        stat = body.stat()
+                    except OSError:
+                        continue
+                    self._index[body.stem] = (stat.st_size, stat.st_mtime)
+                    self._total += stat.st_size
+        return self._index
+
+    def lookup(self, key: str) -> dict[str, Any] | None:
+        """Return the stored validators and digest for ``key``, if any."""
+        with self._lock:
+            if key not in self._load_index():
+                return None
+        try:
+            return json.loads(self._meta_path(key).read_text())
+        except (OSError, ValueError):
+            self.discard(key)
+            return None
+
+    def read_body(self, key: str) -> bytes | None:
+        try:
+            body = self._body_path(key).read_bytes()
+        except OSError:
+            self.discard(key)
+            return None
+        self.touch(key)
+        return body
+
+    def touch(self, key: str) -> None:
+        """Mark ``key`` as recently used."""
+        now = time.time()
+        with self._lock:
+            index = self._load_index()
+            if key in index:
+                index[key] = (index[key][0], now)
+        try:
+            os.utime(self._body_path(key), (now, now))
+        except OSError:
+            pass
+
+    def store(self, key: str, body: bytes, meta: dict[str, Any]) -> bool:
+        """Write ``body`` and ``meta`` for ``key``; returns False if it was too large."""
+        if len(body) > self.max_bytes // 4:
+            self.discard(key)
+            return False
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for path, data in (
+            (self._body_path(key), body),
+            (self._meta_path(key), json.dumps(meta).encode("utf-8")),
+        ):
+            tmp = path.with_suffix(path.suffix + ".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        with self._lock:
+            index = self._load_index()
+            old = index.get(key)
+            if old is not None:
+                self._total -= old[0]
+            index[key] = (len(body), time.time())
+            self._total += len(body)
+            self.metrics["stored"] += 1
+            victims = self._evict_locked()
+        for victim in victims:
+            self._unlink(victim)
+        return True
+
+    def _evict_locked(self) -> list[str]:
+        index = self._load_index()
+        victims = []
+        if self._total > self.max_bytes:
+            for key, (size, _) in sorted(index.items(), key=lambda kv: kv[1][1]):
+                if self._total <= self.max_bytes:
+                    break
+                del index[key]
+                self._total -= size
+                victims.append(key)
+        self.metrics["evictions"] += len(victims)
+        return victims
+
+    def _unlink(self, key: str) -> None:
+        for path in (self._body_path(key), self._meta_path(key)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            entry = self._load_index().pop(key, None)
+            if entry is not None:
+                self._total -= entry[0]
+        self._unlink(key)
+
+    @property
+    def size_bytes(self) -> int:
+        with self._lock:
+            self._load_index()
+            return self._total
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load_index())
+
+    def clear(self) -> None:
+        with self._lock:
+            keys = list(self._load_index())
+            self._index = {}
+            self._total = 0
+        for key in keys:
+            self._unlink(key)
+
+
+def get_json(client: Any, cache: HttpResponseCache | None, url: str, **kwargs) -> CachedJson:
+    """Conditional GET through ``client`` (see `HttpClientService.get_json`)."""
+    if cache is None:
+        r = client.get(url, **kwargs)
+        return CachedJson(r.status_code, r.content)
+
+    key = HttpResponseCache.key_for(url, kwargs.get("params"))
+    entry = cache.lookup(key)
+    headers = dict(kwargs.pop("headers", None) or {})
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    r = client.get(url, headers=headers, **kwargs)
+
+    if r.status_code == 304 and entry is not None:
+        body = cache.read_body(key)
+        if body is not None:
+            cache.metrics["revalidated"] += 1
+            return CachedJson(200, body, changed=False, revalidated=True)
+        # Body went missing: fetch it again unconditionally
+        headers.pop("If-None-Match", None)
+        headers.pop("If-Modified-Since", None)
+        r = client.get(url, headers=headers, **kwargs)
+
+    if r.status_code != 200:
+        return CachedJson(r.status_code, r.content)
+
+    body = r.content
+    meta = {
+        "sha256": hashlib.sha256(body).hexdigest(),
+        "etag": r.headers.get("ETag"),
+        "last_modified": r.headers.get("Last-Modified"),
+    }
+    unchanged = entry is not None and entry.get("sha256") == meta["sha256"]
+    if unchanged:
+        cache.metrics["unchanged"] += 1
+    if unchanged and entry == meta:
+        cache.touch(key)
+    else:
+        try:
+            cache.store(key, body, meta)
+        except OSError as exc:
+            logger.warning("HTTP cache write failed in %s: %s", cache.directory, exc)
+    return CachedJson(200, body, changed=not unchanged)
+
+
+__all__ = ["CACHE_DEFAULTS", "CachedJson", "HttpResponseCache", "default_cache_dir", "get_json"]
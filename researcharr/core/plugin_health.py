@@ -0,0 +1,241 @@
+"""Concurrent health and validation checks for plugin instances.
+
+Status endpoints used to call each configured instance's ``health()`` or
+``validate()`` in turn on the request thread, so one stalled *arr held up
+the whole response. `PluginHealthChecker` runs the checks in a shared
+thread pool and waits at most ``deadline`` seconds for all of them.
+Instances that have not answered by then are reported as ``pending``.
+Their checks keep running and the results are cached for ``cache_ttl``
+seconds, so the next status request answers from the cache.
+
+Results are keyed by plugin, check kind and instance config, so editing
+an instance never returns the result for its old settings. A check that
+is still running is shared by every caller rather than started again,
+so repeated polling of a dead instance does not pile up threads.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from .container import get_container
+from .plugin_instances import acquire_instance
+
+HEALTH_CHECK_DEFAULTS: dict[str, Any] = {
+    "deadline": 5.0,
+    "cache_ttl": 15.0,
+    "max_workers": 16,
+}
+
+CHECK_KINDS = ("health", "validate")
+
+
+class PluginHealthChecker:
+    """Fans plugin ``health()``/``validate()`` calls out with a global deadline.
+
+    Args:
+        config: Checker settings; keys default to ``HEALTH_CHECK_DEFAULTS``
+        clock: Monotonic seconds used for cache expiry (injectable for tests)
+    """
+
+    def __init__(
+        self, config: dict[str, Any] | None = None, clock: Callable[[], float] = time.monotonic
+    ):
+        self.settings = {**HEALTH_CHECK_DEFAULTS, **(config or {})}
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+        # key -> (expires at, succeeded, result or exception)
+        self._cache: dict[tuple[str, str, str], tuple[float, bool, Any]] = {}
+        self._inflight: dict[tuple[str, str, str], Future] = {}
+
+    @staticmethod
+    def _key(kind: str, name: str, config: Any) -> tuple[str, str, str]:
+        return kind, name, json.dumps(config, sort_keys=True, default=str)
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.settings["max_workers"], thread_name_prefix="plugin-health"
+            )
+        return self._pool
+
+    def _cached(self, key: tuple[str, str, str]) -> tuple[bool, Any] | None:
+        entry = self._cache.get(key)
+        if entry is None or entry[0] <= self._clock():
+            return None
+        return entry[1], entry[2]
+
+    def _store(self, key: tuple[str, str, str], future: Future) -> None:
+        if future.cancelled():
+            with self._lock:
+                self._inflight.pop(key, None)
+            return
+        exc = future.exception()
+        with self._lock:
+            self._inflight.pop(key, None)
+            # Results for edited or removed instances are never read again
+            now = self._clock()
+            for stale in [k for k, entry in self._cache.items() if entry[0] <= now]:
+                del self._cache[stale]
+            self._cache[key] = (
+                now + self.settings["cache_ttl"],
+                exc is None,
+                future.result() if exc is None else exc,
+            )
+
+    def _start(self, registry: Any, kind: str, name: str, config: Any) -> Future:
+        if kind not in CHECK_KINDS:
+            raise ValueError(f"unknown check kind {kind!r}")
+        key = self._key(kind, name, config)
+        with self._lock:
+            future = self._inflight.get(key)
+            started = future is None
+            if started:
+                future = self._inflight[key] = self._executor().submit(
+                    lambda: getattr(acquire_instance(registry, name, config), kind)()
+                )
+        # Outside the lock: the callback runs here if the check already finished
+        if started:
+            future.add_done_callback(lambda f: self._store(key, f))
+        return future
+
+    def check(
+        self,
+        registry: Any,
+        name: str,
+        config: Any,
+        kind: str = "health",
+        *,
+        deadline: float | None = None,
+        fresh: bool = False,
+    ) -> Any:
+        """Run one instance's check and return its result.
+
+        Exceptions from the plugin are re-raised. Raises
+        ``concurrent.futures.TimeoutError`` if the check has not finished
+        within ``deadline`` seconds; it keeps running and its result is
+        cached. ``fresh=True`` ignores the cache, for explicit user-triggered
+        checks.
+        """
+        if not fresh:
+            with self._lock:
+                hit = self._cached(self._key(kind, name, config))
+            if hit is not None:
+                ok, value = hit
+                if not ok:
+                    raise value
+                return value
+        future = self._start(registry, kind, name, config)
+        timeout = self.settings["deadline"] if deadline is None else deadline
+        return future.result(timeout=timeout)
+
+    def check_all(
+        self,
+        registry: Any,
+        instances: Mapping[str, Any],
+        kind: str = "health",
+        *,
+        deadline: float | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Check every enabled instance of every registered plugin in parallel.
+
+        Args:
+            registry: Plugin registry (``list_plugins``; instances come from
+                its pool, see `researcharr.core.plugin_instances`)
+            instances: Config mapping plugin name to its list of instance configs
+            kind: ``"health"`` or ``"validate"``
+            deadline: Seconds to wait for all checks together
+
+        Returns:
+            Per plugin, one entry per instance with its ``index``, ``name``,
+            ``state`` (``done``, ``error`` or ``pending``), ``result``,
+            ``error`` and whether it was ``cached``.
+        """
+        timeout = self.settings["deadline"] if deadline is None else deadline
+        report: dict[str, list[dict[str, Any]]] = {}
+        running: list[tuple[dict[str, Any], Future]] = []
+        for name in registry.list_plugins():
+            configs = instances.get(name)
+            if not isinstance(configs, list):
+                continue
+            entries = report[name] = []
+            for idx, config in enumerate(configs):
+                if not isinstance(config, dict) or config.get("enabled") is False:
+                    continue
+                entry: dict[str, Any] = {
+                    "index": idx,
+                    "name": config.get("name"),
+                    "state": "pending",
+                    "result": None,
+                    "error": None,
+                    "cached": False,
+                }
+                entries.append(entry)
+                with self._lock:
+                    hit = self._cached(self._key(kind, name, config))
+                if hit is not None:
+                    entry["cached"] = True
+                    self._fill(entry, *hit)
+                else:
+                    running.append((entry, self._start(registry, kind, name, config)))
+
+        if running:
+            wait([future for _, future in running], timeout=timeout)
+        for entry, future in running:
+            if future.done() and not future.cancelled():
+                exc = future.exception()
+                self._fill(entry, exc is None, future.result() if exc is None else exc)
+            else:
+                entry["error"] = f"no answer within {timeout:g}s"
+        return report
+
+    @staticmethod
+    def _fill(entry: dict[str, Any], ok: bool, value: Any) -> None:
+        if ok:
+            entry["state"] = "done"
+            entry["result"] = value
+        else:
+            entry["state"] = "error"
+            entry["error"] = str(value)
+
+    def invalidate(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._cache.clear()
+
+    def shutdown(self) -> None:
+        """Stop the worker threads without waiting for running checks."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+_shared_checker: PluginHealthChecker | None = None
+_shared_checker_lock = threading.Lock()
+
+
+def get_plugin_health_checker() -> PluginHealthChecker:
+    """Return the shared checker: the container's, or a process-wide default."""
+    global _shared_checker
+
+    container = get_container()
+    if container.has_service("plugin_health_checker"):
+        return container.resolve("plugin_health_checker")
+    with _shared_checker_lock:
+        if _shared_checker is None:
+            _shared_checker = PluginHealthChecker()
+        return _shared_checker
+
+
+__all__ = [
+    "HEALTH_CHECK_DEFAULTS",
+    "PluginHealthChecker",
+    "get_plugin_health_checker",
+]
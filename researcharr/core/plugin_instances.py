@@ -0,0 +1,163 @@
+"""Long-lived plugin instances keyed by their configuration.
+
+API routes and health checks used to build a new plugin object for every
+call with ``registry.create_instance``, and threw away whatever state it
+had built up. A `PluginInstanceManager` keeps one instance per plugin name
+and config hash. A call with the same config gets the same object back,
+and a changed config gets a new one. Instances are built and set up
+outside the manager's lock, so a slow ``setup()`` only blocks callers for
+the same plugin and config.
+
+Plugins opt into the lifecycle with `BasePlugin.setup`, which runs once
+before the instance is first handed out, and `BasePlugin.teardown`, which
+runs when the instance is dropped. Instances are dropped when they are
+evicted (least recently used first, beyond ``max_instances``), when
+`retain` is told their config is gone, or on `close`.
+
+Pooled instances are shared between request threads, so any state a
+plugin keeps on ``self`` must be safe to use concurrently.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from .container import get_container
+
+logger = logging.getLogger(__name__)
+
+InstanceKey = tuple[str, str]
+
+
+def config_hash(config: Any) -> str:
+    """Stable digest of an instance config."""
+    blob = json.dumps(config, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+
+class PluginInstanceManager:
+    """Pool of set-up plugin instances, one per (plugin name, config hash).
+
+    Args:
+        factory: ``factory(name, config)`` building a new instance, usually
+            ``registry.create_instance``
+        max_instances: Instances kept; the least recently used are torn down
+            beyond this
+    """
+
+    def __init__(self, factory: Callable[[str, Any], Any], max_instances: int = 64):
+        if max_instances < 1:
+            raise ValueError("max_instances must be >= 1")
+        self._factory = factory
+        self.max_instances = max_instances
+        self._lock = threading.Lock()
+        self._instances: OrderedDict[InstanceKey, Any] = OrderedDict()
+        self._building: dict[InstanceKey, threading.Lock] = {}
+        self.metrics = {"created": 0, "reused": 0, "torn_down": 0}
+
+    def get(self, name: str, config: Any) -> Any:
+        """Return the pooled instance for ``config``, building and setting it up on first use."""
+        key = (name, config_hash(config))
+        with self._lock:
+            instance = self._lookup(key)
+            if instance is not None:
+                return instance
+            build_lock = self._building.setdefault(key, threading.Lock())
+
+        with build_lock:
+            with self._lock:
+                # Another thread may have finished building it meanwhile
+                instance = self._lookup(key)
+                if instance is not None:
+                    return instance
+            try:
+                instance = self._factory(name, config)
+                setup = getattr(instance, "setup", None)
+                if callable(setup):
+                    setup()
+            except BaseException:
+                with self._lock:
+                    self._building.pop(key, None)
+                raise
+            with self._lock:
+                self._building.pop(key, None)
+                self._instances[key] = instance
+                self.metrics["created"] += 1
+                victims = self._evict_locked()
+        self._teardown(victims)
+        return instance
+
+    def _lookup(self, key: InstanceKey) -> Any:
+        instance = self._instances.get(key)
+        if instance is not None:
+            self._instances.move_to_end(key)
+            self.metrics["reused"] += 1
+        return instance
+
+    def _evict_locked(self) -> list[Any]:
+        victims = []
+        while len(self._instances) > self.max_instances:
+            victims.append(self._instances.popitem(last=False)[1])
+        return victims
+
+    def _teardown(self, instances: Iterable[Any]) -> None:
+        for instance in instances:
+            teardown = getattr(instance, "teardown", None)
+            if callable(teardown):
+                try:
+                    teardown()
+                except Exception:
+                    logger.exception("Teardown of plugin %r failed", instance)
+            self.metrics["torn_down"] += 1
+
+    def retain(self, name: str, configs: Iterable[Any]) -> int:
+        """Tear down ``name``'s instances whose config is not in ``configs``.
+
+        Call it after a plugin's instance list changes. Returns the number
+        of instances dropped.
+        """
+        keep = {config_hash(config) for config in configs}
+        with self._lock:
+            stale = [key for key in self._instances if key[0] == name and key[1] not in keep]
+            victims = [self._instances.pop(key) for key in stale]
+        self._teardown(victims)
+        return len(victims)
+
+    def close(self) -> None:
+        """Tear down every pooled instance."""
+        with self._lock:
+            victims = list(self._instances.values())
+            self._instances.clear()
+        self._teardown(victims)
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+
+def acquire_instance(registry: Any, name: str, config: Any) -> Any:
+    """Return a pooled instance from ``registry.instances``, or a new one if it has no pool.
+
+    When the container holds an enabled ``plugin_sandbox``, the instance
+    comes back wrapped so its ``sync()``/``health()`` run out of process
+    (see `researcharr.core.plugin_sandbox`).
+    """
+    pool = getattr(registry, "instances", None)
+    if isinstance(pool, PluginInstanceManager):
+        instance = pool.get(name, config)
+    else:
+        instance = registry.create_instance(name, config)
+    container = get_container()
+    if container.has_service("plugin_sandbox"):
+        sandbox = container.resolve("plugin_sandbox")
+        if getattr(sandbox, "enabled", False):
+            return sandbox.wrap(instance, config)
+    return instance
+
+
+__all__ = ["PluginInstanceManager", "acquire_instance", "config_hash"]
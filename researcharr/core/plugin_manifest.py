@@ -0,0 +1,281 @@
+"""Plugin discovery without importing every plugin.
+
+Eager discovery (``PluginRegistry.discover_local``) executes each plugin
+file to read its ``PLUGIN_NAME`` and ``Plugin`` class. Startup therefore
+pays for every installed plugin's imports, whether or not it is
+configured. `scan_plugins` reads the same facts from the file's syntax
+tree instead. A literal ``PLUGIN_NAME``, an optional literal ``CATEGORY``
+and a ``Plugin`` definition are enough. `load_plugin_file` then imports a
+plugin only when the registry first needs its class. Literal
+``description`` and ``docs_url`` class attributes are read too, so plugin
+listings (`describe_plugin`) need no import at all.
+
+Scan results can be kept in a JSON manifest keyed by path, mtime and size,
+so a restart with unchanged plugins does not re-parse anything. A file
+whose name is not a string literal cannot be described statically, so it
+is reported with ``name=None`` and the registry imports it right away.
+"""
+
+from __future__ import annotations
+
+import ast
+import importlib.util
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 2
+
+
+@dataclass(frozen=True, slots=True)
+class PluginSpec:
+    """What discovery knows about one plugin file before importing it."""
+
+    path: str
+    name: str | None
+    category: str | None
+    parent: str | None
+    mtime_ns: int
+    size: int
+    description: str | None = None
+    docs_url: str | None = None
+
+
+def iter_plugin_files(plugins_dir: str) -> list[tuple[str, str | None]]:
+    """Return ``(path, category folder)`` for candidate plugin files.
+
+    Top-level files and files one folder deep are considered; names
+    starting with ``_`` are skipped.
+    """
+    found = []
+    for root, _dirs, files in os.walk(plugins_dir):
+        rel = os.path.relpath(root, plugins_dir)
+        depth = 0 if rel == "." else len(rel.split(os.sep))
+        if depth > 1:
+            continue
+        parent = None if rel == "." else rel
+        for fn in sorted(files):
+            if fn.endswith(".py") and not fn.startswith("_"):
+                found.append((os.path.join(root, fn), parent))
+    return found
+
+
+def _literal(node: ast.AST | None) -> str | None:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def _assigned_names(stmt: ast.stmt) -> list[str]:
+    if isinstance(stmt, ast.Assign):
+        return [t.id for t in stmt.targets if isinstance(t, ast.Name)]
+    if isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name):
+        return [stmt.target.id]
+    return []
+
+
+def read_spec(path: str, parent: str | None) -> PluginSpec | None:
+    """Describe a plugin file from its syntax tree; None if it defines no plugin."""
+    st = os.stat(path)
+    with open(path, "rb") as fh:
+        tree = ast.parse(fh.read(), filename=path)
+
+    name: str | None = None
+    assigns_name = False
+    module_category: str | None = None
+    class_category: str | None = None
+    class_literals: dict[str, str | None] = {}
+    has_plugin = False
+    for stmt in tree.body:
+        targets = _assigned_names(stmt)
+        value = getattr(stmt, "value", None)
+        if "PLUGIN_NAME" in targets:
+            assigns_name = True
+            name = _literal(value)
+        if "CATEGORY" in targets:
+            module_category = _literal(value)
+        if "Plugin" in targets:
+            has_plugin = True
+        if isinstance(stmt, ast.ClassDef) and stmt.name == "Plugin":
+            has_plugin = True
+            for item in stmt.body:
+                for attr in _assigned_names(item):
+                    class_literals[attr] = _literal(getattr(item, "value", None))
+            class_category = class_literals.get("category")
+        if isinstance(stmt, ast.ImportFrom | ast.Import):
+            has_plugin = has_plugin or any(
+                (alias.asname or alias.name) == "Plugin" for alias in stmt.names
+            )
+
+    if not assigns_name or (name is not None and not has_plugin):
+        return None  # not a plugin module
+    return PluginSpec(
+        path=path,
+        name=name,
+        category=module_category or class_category,
+        parent=parent,
+        mtime_ns=st.st_mtime_ns,
+        size=st.st_size,
+        description=class_literals.get("description"),
+        docs_url=class_literals.get("docs_url"),
+    )
+
+
+def _load_manifest(manifest_path: str | None) -> dict[str, Any]:
+    if not manifest_path:
+        return {}
+    try:
+        with open(manifest_path, encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return {}
+    return data.get("files") or {}
+
+
+def _save_manifest(manifest_path: str, files: dict[str, Any]) -> None:
+    tmp = f"{manifest_path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(manifest_path) or ".", exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"version": MANIFEST_VERSION, "files": files}, fh)
+        os.replace(tmp, manifest_path)
+    except OSError as exc:
+        logger.debug("Could not write plugin manifest %s: %s", manifest_path, exc)
+
+
+def scan_plugins(plugins_dir: str, manifest_path: str | None = None) -> list[PluginSpec]:
+    """Describe every plugin file under ``plugins_dir`` without importing any.
+
+    Args:
+        plugins_dir: Directory laid out like the repository's ``plugins``
+        manifest_path: JSON file caching earlier scans; entries are reused
+            while a file's mtime and size are unchanged, and the file is
+            rewritten when anything changed
+
+    Files that fail to parse are skipped, like files that fail to import
+    in eager discovery.
+    """
+    if not os.path.isdir(plugins_dir):
+        return []
+    cached = _load_manifest(manifest_path)
+    files: dict[str, Any] = {}
+    specs = []
+    for path, parent in iter_plugin_files(plugins_dir):
+        entry = cached.get(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if (
+            entry is not None
+            and entry.get("mtime_ns") == st.st_mtime_ns
+            and entry.get("size") == st.st_size
+            and entry.get("parent") == parent
+        ):
+            spec = PluginSpec(**entry["spec"]) if entry.get("spec") else None
+        else:
+            try:
+                spec = read_spec(path, parent)
+            except (OSError, SyntaxError, ValueError) as exc:
+                # Remembered as "no plugin" until the file changes
+                logger.debug("Skipping plugin file %s: %s", path, exc)
+                spec = None
+        files[path] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "parent": parent,
+            "spec": asdict(spec) if spec is not None else None,
+        }
+        if spec is not None:
+            specs.append(spec)
+    if manifest_path and files != cached:
+        _save_manifest(manifest_path, files)
+    return specs
+
+
+def load_plugin_file(path: str, parent: str | None) -> tuple[str, type] | None:
+    """Import a plugin file and return ``(PLUGIN_NAME, Plugin)``, or None.
+
+    The class's ``category`` is set from the module's ``CATEGORY``, the
+    class's own ``category``, or the folder the file sits in, in that
+    order; top-level plugins default to ``"plugins"``.
+    """
+    # Use a unique module name to avoid collisions with the repository's
+    # real 'plugins' package, e.g. when loading from a temporary directory.
+    name = os.path.splitext(os.path.basename(path))[0]
+    mod_name = f"_researcharr_local_plugin_{name}_{abs(hash(path))}"
+    spec = importlib.util.spec_from_file_location(mod_name, path)
+    if spec is None or spec.loader is None:
+        return None
+    mod = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(mod)
+    except Exception as exc:
+        logger.debug("Plugin module %s failed to import: %s", path, exc)
+        return None
+
+    plugin_name = getattr(mod, "PLUGIN_NAME", None)
+    plugin_cls = getattr(mod, "Plugin", None)
+    if not plugin_name or not plugin_cls:
+        return None
+    explicit_cat = getattr(mod, "CATEGORY", None) or getattr(plugin_cls, "category", None)
+    if explicit_cat:
+        plugin_cls.category = explicit_cat
+    elif parent:
+        plugin_cls.category = parent
+    else:
+        plugin_cls.category = getattr(plugin_cls, "category", "plugins")
+    # Lets sandbox workers load the class again, see `researcharr.core.plugin_sandbox`
+    plugin_cls.source_file = path
+    return plugin_name, plugin_cls
+
+
+def plugin_metadata(plugin: type | PluginSpec) -> dict[str, Any]:
+    """Return the listing fields of a plugin class or a not yet imported spec.
+
+    ``category`` follows the same precedence as `load_plugin_file`.
+    """
+    if isinstance(plugin, PluginSpec):
+        return {
+            "category": plugin.category or plugin.parent or "plugins",
+            "description": plugin.description or "",
+            "docs_url": plugin.docs_url,
+        }
+    return {
+        "category": getattr(plugin, "category", "plugins"),
+        "description": getattr(plugin, "description", ""),
+        "docs_url": getattr(plugin, "docs_url", None),
+    }
+
+
+def describe_plugin(registry: Any, name: str) -> dict[str, Any]:
+    """Listing fields for ``name`` without importing a lazily discovered plugin.
+
+    Uses ``registry.describe`` (see ``PluginRegistry.describe``); registries
+    without it fall back to the loaded class. Unknown plugins get the
+    defaults.
+    """
+    describe = getattr(registry, "describe", None)
+    if describe is not None:
+        meta = describe(name)
+    else:
+        cls = registry.get(name)
+        meta = plugin_metadata(cls) if cls is not None else None
+    return meta or {"category": "plugins", "description": "", "docs_url": None}
+
+
+__all__ = [
+    "PluginSpec",
+    "describe_plugin",
+    "iter_plugin_files",
+    "load_plugin_file",
+    "plugin_metadata",
+    "read_spec",
+    "scan_plugins",
+]
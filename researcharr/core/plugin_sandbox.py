@@ -0,0 +1,406 @@
+"""Run plugin ``sync()`` and ``health()`` calls in subprocess workers.
+
+Plugin calls normally run in the web process. A plugin that hangs keeps
+a request thread forever, and one that leaks memory or crashes takes the
+whole application with it. With the sandbox enabled, `acquire_instance`
+hands out a `SandboxedPlugin`. Its ``sync()`` and ``health()`` calls are
+sent to a pool of long-lived worker processes; all other attributes
+(``validate``, ``blueprint``, ...) still use the local pooled instance.
+
+Workers speak length-prefixed msgpack over their stdin/stdout pipes, or
+JSON if msgpack is not installed. Each worker loads the plugin class, by
+file path for locally discovered plugins and by module otherwise, and
+keeps its own `PluginInstanceManager`. A plugin's ``setup()`` therefore
+runs once per worker rather than once per call.
+
+A call that does not answer within ``call_timeout`` seconds raises
+``TimeoutError`` and its worker is killed. A worker is replaced after
+``max_calls`` calls, and also once its peak resident memory passes
+``max_rss_mb``, so slow leaks are cleared out without a restart.
+Arguments and results must be plain data; anything else is sent as its
+``str()``.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import os
+import select
+import struct
+import subprocess  # nosec B404 -- workers run this module with the current interpreter
+import sys
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, BinaryIO
+
+from .plugin_instances import PluginInstanceManager
+from .plugin_manifest import load_plugin_file
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+SANDBOX_DEFAULTS: dict[str, Any] = {
+    "enabled": False,
+    "workers": 2,
+    "call_timeout": 60.0,
+    "max_calls": 500,
+    "max_rss_mb": 512,
+}
+
+SANDBOXED_METHODS = ("sync", "health")
+
+_HEADER = struct.Struct(">I")
+
+
+class SandboxError(RuntimeError):
+    """A sandbox worker died or sent something unreadable."""
+
+
+class PluginCallError(SandboxError):
+    """The plugin raised inside the worker.
+
+    Attributes:
+        error_type: Name of the exception class raised in the worker
+    """
+
+    def __init__(self, message: str, error_type: str | None = None):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+def default_codec() -> str:
+    """``"msgpack"`` when it is installed, else ``"json"``."""
+    return "msgpack" if msgpack is not None else "json"
+
+
+def _codec(name: str) -> tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+    if name == "msgpack":
+        if msgpack is None:
+            raise ValueError("msgpack codec requested but msgpack is not installed")
+        return (
+            lambda obj: msgpack.packb(obj, default=str, use_bin_type=True),
+            lambda raw: msgpack.unpackb(raw, raw=False),
+        )
+    if name == "json":
+        return (
+            lambda obj: json.dumps(obj, default=str).encode("utf-8"),
+            lambda raw: json.loads(raw.decode("utf-8")),
+        )
+    raise ValueError(f"unknown sandbox codec {name!r}")
+
+
+def _write_frame(stream: BinaryIO, payload: bytes) -> None:
+    stream.write(_HEADER.pack(len(payload)) + payload)
+    stream.flush()
+
+
+def _peak_rss_kb() -> int:
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # bytes on macOS
+
+
+def locate_plugin(plugin_cls: type) -> dict[str, Any]:
+    """Describe where a worker can load ``plugin_cls`` from."""
+    path = getattr(plugin_cls, "source_file", None)
+    if path:
+        return {"path": path}
+    return {"module": plugin_cls.__module__, "qualname": plugin_cls.__qualname__}
+
+
+def _load_class(location: dict[str, Any]) -> type:
+    if location.get("path"):
+        loaded = load_plugin_file(location["path"], None)
+        if loaded is None:
+            raise ImportError(f"no plugin in {location['path']}")
+        return loaded[1]
+    obj: Any = __import__(location["module"], fromlist=["_"])
+    for part in location["qualname"].split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def serve(stdin: BinaryIO, stdout: BinaryIO, codec: str) -> None:
+    """Answer call frames from ``stdin`` until it closes."""
+    dumps, loads = _codec(codec)
+    classes: dict[str, type] = {}
+    instances = PluginInstanceManager(lambda key, config: classes[key](config))
+    try:
+        while True:
+            header = stdin.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            request = loads(stdin.read(_HEADER.unpack(header)[0]))
+            reply: dict[str, Any] = {"id": request.get("id")}
+            try:
+                if request.get("method") not in SANDBOXED_METHODS:
+                    raise ValueError(f"method {request.get('method')!r} is not sandboxed")
+                location = request["plugin"]
+                key = json.dumps(location, sort_keys=True)
+                if key not in classes:
+                    classes[key] = _load_class(location)
+                instance = instances.get(key, request.get("config") or {})
+                reply.update(ok=True, result=getattr(instance, request["method"])())
+            except Exception as exc:
+                reply.update(ok=False, error=str(exc), error_type=type(exc).__name__)
+            reply["rss_kb"] = _peak_rss_kb()
+            try:
+                payload = dumps(reply)
+            except Exception as exc:
+                payload = dumps(
+                    {
+                        "id": reply["id"],
+                        "ok": False,
+                        "error": f"unserializable result: {exc}",
+                        "error_type": type(exc).__name__,
+                        "rss_kb": reply["rss_kb"],
+                    }
+                )
+            _write_frame(stdout, payload)
+    finally:
+        instances.close()
+
+
+def _main(argv: list[str]) -> int:
+    codec = argv[argv.index("--codec") + 1] if "--codec" in argv else default_codec()
+    # Frames own the real stdout; stray prints from plugins go to stderr
+    out = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+    serve(sys.stdin.buffer, out, codec)
+    return 0
+
+
+class _Worker:
+    """One worker process and its pipes."""
+
+    def __init__(self, codec: str):
+        self._dumps, self._loads = _codec(codec)
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(p for p in sys.path if p)}
+        self.proc = subprocess.Popen(  # nosec B603 -- fixed argv, no shell
+            [sys.executable, "-m", "researcharr.core.plugin_sandbox", "--codec", codec],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=env,
+        )
+        self._fd = self.proc.stdout.fileno()
+        self._buffer = b""
+        self._ids = itertools.count(1)
+        self.calls = 0
+        self.rss_kb = 0
+
+    @property
+    def pid(self) -> int:
+        return self.proc.pid
+
+    def _read(self, size: int, deadline: float) -> bytes:
+        while len(self._buffer) < size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError
+            ready, _, _ = select.select([self._fd], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(self._fd, max(65536, size - len(self._buffer)))
+            if not chunk:
+                raise SandboxError(f"sandbox worker {self.pid} exited ({self.proc.poll()})")
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def call(self, request: dict[str, Any], timeout: float) -> dict[str, Any]:
+        request = {**request, "id": next(self._ids)}
+        deadline = time.monotonic() + timeout
+        try:
+            _write_frame(self.proc.stdin, self._dumps(request))
+        except (BrokenPipeError, OSError) as exc:
+            raise SandboxError(f"sandbox worker {self.pid} is gone: {exc}") from exc
+        size = _HEADER.unpack(self._read(_HEADER.size, deadline))[0]
+        try:
+            reply = self._loads(self._read(size, deadline))
+        except (ValueError, TypeError) as exc:
+            raise SandboxError(f"unreadable reply from sandbox worker {self.pid}") from exc
+        if not isinstance(reply, dict) or reply.get("id") != request["id"]:
+            raise SandboxError(f"out-of-order reply from sandbox worker {self.pid}")
+        self.calls += 1
+        self.rss_kb = int(reply.get("rss_kb") or 0)
+        return reply
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Let the worker exit on end of input; kill it if it does not."""
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            self.kill()
+        finally:
+            self.proc.stdout.close()
+
+    def kill(self) -> None:
+        self.proc.kill()
+        self.proc.wait()
+        for stream in (self.proc.stdin, self.proc.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+class PluginSandbox:
+    """Pool of worker processes running plugin ``sync()``/``health()`` calls.
+
+    Args:
+        config: Sandbox settings; keys default to ``SANDBOX_DEFAULTS``
+        codec: ``"msgpack"`` or ``"json"`` (msgpack when installed if omitted)
+    """
+
+    def __init__(self, config: dict[str, Any] | None = None, *, codec: str | None = None):
+        self.settings = {**SANDBOX_DEFAULTS, **(config or {})}
+        if self.settings["workers"] < 1:
+            raise ValueError("workers must be >= 1")
+        self.enabled = bool(self.settings["enabled"])
+        self.codec = codec or default_codec()
+        _codec(self.codec)  # fail early on a bad or unavailable codec
+        self._lock = threading.Lock()
+        self._slots = threading.Semaphore(self.settings["workers"])
+        self._idle: list[_Worker] = []
+        self._closed = False
+        self.metrics = {"calls": 0, "spawned": 0, "recycled": 0, "timeouts": 0, "crashes": 0}
+
+    def _checkout(self, timeout: float) -> _Worker:
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"no sandbox worker free within {timeout:g}s")
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+            if self._closed:
+                self._slots.release()
+                raise SandboxError("plugin sandbox is closed")
+            self.metrics["spawned"] += 1
+        try:
+            return _Worker(self.codec)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _worn_out(self, worker: _Worker) -> bool:
+        return (
+            worker.calls >= self.settings["max_calls"]
+            or worker.rss_kb > self.settings["max_rss_mb"] * 1024
+        )
+
+    def _checkin(self, worker: _Worker, healthy: bool) -> None:
+        try:
+            if not healthy:
+                worker.kill()
+                return
+            with self._lock:
+                keep = not self._closed and not self._worn_out(worker)
+                if keep:
+                    self._idle.append(worker)
+                elif not self._closed:
+                    self.metrics["recycled"] += 1
+            if not keep:
+                worker.close()
+        finally:
+            self._slots.release()
+
+    def call(
+        self, plugin_cls: type, config: Any, method: str, *, timeout: float | None = None
+    ) -> Any:
+        """Run ``plugin_cls(config).<method>()`` in a worker and return its result.
+
+        Raises:
+            TimeoutError: No answer within ``timeout`` (default ``call_timeout``)
+                seconds; the worker is killed
+            PluginCallError: The plugin raised in the worker
+            SandboxError: The worker crashed or replied garbage
+        """
+        if method not in SANDBOXED_METHODS:
+            raise ValueError(f"method {method!r} is not sandboxed")
+        timeout = self.settings["call_timeout"] if timeout is None else timeout
+        request = {"plugin": locate_plugin(plugin_cls), "config": config, "method": method}
+        worker = self._checkout(timeout)
+        healthy = False
+        try:
+            reply = worker.call(request, timeout)
+            healthy = True
+        except TimeoutError:
+            self.metrics["timeouts"] += 1
+            logger.warning(
+                "Plugin %s.%s() gave no answer within %ss; killing sandbox worker %s",
+                plugin_cls.__name__,
+                method,
+                timeout,
+                worker.pid,
+            )
+            raise TimeoutError(f"{method}() gave no answer within {timeout:g}s") from None
+        except SandboxError:
+            self.metrics["crashes"] += 1
+            raise
+        finally:
+            self._checkin(worker, healthy)
+        self.metrics["calls"] += 1
+        if not reply.get("ok"):
+            raise PluginCallError(str(reply.get("error")), reply.get("error_type"))
+        return reply.get("result")
+
+    def wrap(self, instance: Any, config: Any) -> SandboxedPlugin:
+        """Proxy ``instance`` so its ``sync()``/``health()`` run in this sandbox."""
+        return SandboxedPlugin(self, instance, config)
+
+    def close(self) -> None:
+        """Stop idle workers; workers busy with a call stop when it returns."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.close()
+
+
+class SandboxedPlugin:
+    """A plugin instance whose ``sync()`` and ``health()`` run in a worker."""
+
+    def __init__(self, sandbox: PluginSandbox, instance: Any, config: Any):
+        self._sandbox = sandbox
+        self._instance = instance
+        self._config = config
+
+    def sync(self) -> Any:
+        return self._sandbox.call(type(self._instance), self._config, "sync")
+
+    def health(self) -> Any:
+        return self._sandbox.call(type(self._instance), self._config, "health")
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._instance, name)
+
+
+__all__ = [
+    "SANDBOXED_METHODS",
+    "SANDBOX_DEFAULTS",
+    "PluginCallError",
+    "PluginSandbox",
+    "SandboxError",
+    "SandboxedPlugin",
+    "default_codec",
+    "locate_plugin",
+    "serve",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
@@ -10,14 +10,21 @@ import logging
 import os
 import shutil
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from pathlib import Path
 from typing import Any, Protocol
+from urllib.parse import urlsplit
 
 from flask import Flask
 
+from .circuit_breaker import CircuitBreakerRegistry
 from .config import get_config_manager
 from .container import get_container
 from .events import Events, get_event_bus
+from .http_cache import CACHE_DEFAULTS, CachedJson, HttpResponseCache, default_cache_dir
+from .http_cache import get_json as _cached_get_json
 from .logging import get_logger as get_logger_from_factory
 
 # Global constants
@@ -264,18 +271,121 @@ class LoggingService:
         return self._loggers.get(name)
 
 
-class HttpClientService:
-    """Service for HTTP requests with testable interface.
+class _SessionPool:
+    """Per-host ``requests.Session`` objects behind the requests call API.
 
-    This service wraps the requests library to make HTTP calls testable
-    without patching at the module level.
+    Each scheme+host gets its own session, so its keep-alive connections are
+    reused across calls and one slow host cannot use up another host's
+    pool. Sessions are created on first use.
     """
 
-    def __init__(self):
-        """Initialize the HTTP client service."""
+    def __init__(self, settings: dict[str, Any]):
+        self._settings = settings
+        self._sessions: dict[tuple[str, str], Any] = {}
+        self._lock = threading.Lock()
+
+    def _new_session(self) -> Any:
         import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import Retry, make_headers
+
+        s = self._settings
+        retry = Retry(
+            total=s["retries"],
+            backoff_factor=s["backoff_factor"],
+            status_forcelist=(502, 503, 504),
+            # Retry.DEFAULT_ALLOWED_METHODS: idempotent only, never POST
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=s["pool_maxsize"], max_retries=retry)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # Advertise every encoding urllib3 can decode (gzip/deflate, plus br/zstd if installed)
+        session.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+        return session
+
+    def session_for(self, url: str) -> Any:
+        parts = urlsplit(url)
+        key = (parts.scheme.lower(), parts.netloc.lower())
+        session = self._sessions.get(key)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(key)
+                if session is None:
+                    session = self._sessions[key] = self._new_session()
+        return session
 
-        self._requests = requests
+    def request(self, method: str, url: str, **kwargs) -> Any:
+        kwargs.setdefault(
+            "timeout", (self._settings["connect_timeout"], self._settings["read_timeout"])
+        )
+        return self.session_for(url).request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> Any:
+        kwargs.setdefault("allow_redirects", True)
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Any:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> Any:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> Any:
+        return self.request("DELETE", url, **kwargs)
+
+    @property
+    def hosts(self) -> list[str]:
+        return sorted(f"{scheme}://{netloc}" for scheme, netloc in self._sessions)
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+
+HTTP_DEFAULTS: dict[str, Any] = {
+    "pool_maxsize": 10,
+    "connect_timeout": 3.05,
+    "read_timeout": 30.0,
+    "retries": 2,
+    "backoff_factor": 0.5,
+    # Async client only (researcharr.core.async_http)
+    "max_connections": 100,
+    "per_host_limit": 4,
+    # Response cache for get_json (researcharr.core.http_cache)
+    "cache": CACHE_DEFAULTS,
+}
+
+
+class HttpClientService:
+    """Service for HTTP requests over pooled keep-alive connections.
+
+    Calls go through one ``requests.Session`` per host (see `_SessionPool`),
+    with a bounded connection pool, a default ``(connect, read)`` timeout,
+    retries with backoff for idempotent methods on connection errors and
+    502/503/504 responses, and gzip negotiation. Callers can override any
+    per-call keyword (for example ``timeout=5``). Share one instance (see
+    `get_http_client`) so connections are reused across the app and
+    plugins.
+
+    `get_json` adds conditional requests and an on-disk response cache
+    (see `researcharr.core.http_cache`) for payloads that rarely change.
+
+    Args:
+        config: The ``http`` configuration section; keys default to
+            ``HTTP_DEFAULTS``
+    """
+
+    def __init__(self, config: dict[str, Any] | None = None):
+        """Initialize the HTTP client service."""
+        self.settings = {**HTTP_DEFAULTS, **(config or {})}
+        self.settings["cache"] = {**CACHE_DEFAULTS, **(self.settings.get("cache") or {})}
+        self._requests = _SessionPool(self.settings)
+        self._cache: HttpResponseCache | None = None
 
     def get(self, url: str, **kwargs) -> Any:
         """Perform a GET request."""
@@ -297,13 +407,104 @@ class HttpClientService:
         """Perform a generic HTTP request."""
         return self._requests.request(method, url, **kwargs)
 
+    @property
+    def cache(self) -> HttpResponseCache | None:
+        """The response cache used by `get_json`, or None when disabled."""
+        settings = self.settings["cache"]
+        if self._cache is None and settings["enabled"]:
+            self._cache = HttpResponseCache(
+                settings["dir"] or default_cache_dir(), int(settings["max_mb"] * 1024 * 1024)
+            )
+        return self._cache
+
+    def get_json(self, url: str, **kwargs) -> CachedJson:
+        """GET a JSON resource, revalidating against the response cache.
+
+        Sends ``If-None-Match`` / ``If-Modified-Since`` when the cached copy
+        has validators. The result's ``changed`` is False when the upstream
+        answered 304 or returned a byte-identical body, so callers can skip
+        decoding and reconciliation. The body is decoded lazily by
+        ``result.json()``.
+        """
+        return _cached_get_json(self, self.cache, url, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled connections; later requests open new ones."""
+        self._requests.close()
+
+
+_shared_http_client: HttpClientService | None = None
+_shared_http_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClientService:
+    """Return the shared HTTP client: the container's, or a process-wide default."""
+    global _shared_http_client
+
+    container = get_container()
+    if container.has_service("http_client_service"):
+        return container.resolve("http_client_service")
+    with _shared_http_lock:
+        if _shared_http_client is None:
+            _shared_http_client = HttpClientService()
+        return _shared_http_client
+
+
+_probe_pool: ThreadPoolExecutor | None = None
+_probe_pool_lock = threading.Lock()
+
+
+def _get_probe_pool() -> ThreadPoolExecutor:
+    global _probe_pool
+
+    with _probe_pool_lock:
+        if _probe_pool is None:
+            _probe_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="probe")
+        return _probe_pool
+
+
+_shared_breakers: CircuitBreakerRegistry | None = None
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Return the shared breaker registry: the container's, or a process-wide default."""
+    global _shared_breakers
+
+    container = get_container()
+    if container.has_service("circuit_breakers"):
+        return container.resolve("circuit_breakers")
+    with _probe_pool_lock:
+        if _shared_breakers is None:
+            _shared_breakers = CircuitBreakerRegistry()
+        return _shared_breakers
+
 
 class ConnectivityService:
-    """Service for checking external service connectivity."""
+    """Service for checking external service connectivity.
 
-    def __init__(self, http_client: HttpClientService | None = None):
+    Every instance (service + URL) has a circuit breaker (see
+    `researcharr.core.circuit_breaker`). While an instance's breaker is
+    open, checks fail fast without any network I/O. Probes are hedged:
+    if the first GET has not answered within ``hedge_after`` seconds, a
+    second one is sent and the first response wins. A single stalled
+    connection then does not cost the full read timeout.
+
+    Args:
+        http_client: Client used for probes (default: the shared client)
+        breakers: Breaker registry (default: a private one per service)
+        hedge_after: Seconds before a hedge request is sent; None disables
+    """
+
+    def __init__(
+        self,
+        http_client: HttpClientService | None = None,
+        breakers: CircuitBreakerRegistry | None = None,
+        hedge_after: float | None = 1.0,
+    ):
         """Initialize connectivity service with optional HTTP client injection."""
-        self.http_client = http_client or HttpClientService()
+        self.http_client = http_client or get_http_client()
+        self.breakers = breakers if breakers is not None else CircuitBreakerRegistry()
+        self.hedge_after = hedge_after
 
     def has_valid_url_and_key(self, instances: list[dict[str, Any]]) -> bool:
         """Check if all instances have valid URLs and API keys."""
@@ -314,73 +515,71 @@ class ConnectivityService:
 
     def check_radarr_connection(self, url: str, api_key: str, logger: logging.Logger) -> bool:
         """Check Radarr service connectivity."""
-        if not url or not api_key:
-            logger.warning("Missing Radarr URL or API key")
-            return False
-
-        try:
-            r = self.http_client.get(url)
-            if r.status_code == 200:
-                logger.info("Radarr connection successful.")
-
-                # Publish connectivity event
-                get_event_bus().publish_simple(
-                    "service.connection.success",
-                    data={"service": "radarr", "url": url},
-                    source="connectivity_service",
-                )
-                return True
-            else:
-                logger.error("Radarr connection failed with status %s", r.status_code)
-
-                # Publish connectivity failure event
-                get_event_bus().publish_simple(
-                    "service.connection.failed",
-                    data={
-                        "service": "radarr",
-                        "url": url,
-                        "status_code": r.status_code,
-                    },
-                    source="connectivity_service",
-                )
-                return False
-        except Exception as e:  # nosec B110 -- intentional broad except for resilience
-            logger.error("Radarr connection failed: %s", e)
-
-            # Publish connectivity error event
-            get_event_bus().publish_simple(
-                Events.ERROR_OCCURRED,
-                data={"service": "radarr", "url": url, "error": str(e)},
-                source="connectivity_service",
-            )
-            return False
+        return self._check_connection("radarr", "Radarr", url, api_key, logger)
 
     def check_sonarr_connection(self, url: str, api_key: str, logger: logging.Logger) -> bool:
         """Check Sonarr service connectivity."""
+        return self._check_connection("sonarr", "Sonarr", url, api_key, logger)
+
+    def _probe(self, url: str) -> Any:
+        """GET ``url``, sending a hedge request if the first one is slow."""
+        get = self.http_client.get
+        if self.hedge_after is None:
+            return get(url)
+        pool = _get_probe_pool()
+        first = pool.submit(get, url)
+        try:
+            return first.result(timeout=self.hedge_after)
+        except FuturesTimeoutError:
+            pass
+        error: Exception | None = None
+        for future in as_completed((first, pool.submit(get, url))):
+            try:
+                return future.result()
+            except Exception as exc:  # nosec B110 -- the other request may still succeed
+                error = exc
+        raise error if error is not None else RuntimeError(f"probe of {url} failed")
+
+    def _check_connection(
+        self, service: str, label: str, url: str, api_key: str, logger: logging.Logger
+    ) -> bool:
         if not url or not api_key:
-            logger.warning("Missing Sonarr URL or API key")
+            logger.warning("Missing %s URL or API key", label)
+            return False
+
+        breaker = self.breakers.get(f"{service}:{url}")
+        if not breaker.allow():
+            logger.warning(
+                "%s connection skipped: circuit open (retry in %.0fs)", label, breaker.retry_in()
+            )
             return False
 
         try:
-            r = self.http_client.get(url)
+            r = self._probe(url)
             if r.status_code == 200:
-                logger.info("Sonarr connection successful.")
+                breaker.record_success()
+                logger.info("%s connection successful.", label)
 
                 # Publish connectivity event
                 get_event_bus().publish_simple(
                     "service.connection.success",
-                    data={"service": "sonarr", "url": url},
+                    data={"service": service, "url": url},
                     source="connectivity_service",
                 )
                 return True
             else:
-                logger.error("Sonarr connection failed with status %s", r.status_code)
+                # Only server-side errors mean the instance is unhealthy
+                if r.status_code >= 500:
+                    breaker.record_failure(f"HTTP {r.status_code}")
+                else:
+                    breaker.record_success()
+                logger.error("%s connection failed with status %s", label, r.status_code)
 
                 # Publish connectivity failure event
                 get_event_bus().publish_simple(
                     "service.connection.failed",
                     data={
-                        "service": "sonarr",
+                        "service": service,
                         "url": url,
                         "status_code": r.status_code,
                     },
@@ -388,12 +587,13 @@ class ConnectivityService:
                 )
                 return False
         except Exception as e:  # nosec B110 -- intentional broad except for resilience
-            logger.error("Sonarr connection failed: %s", e)
+            breaker.record_failure(e)
+            logger.error("%s connection failed: %s", label, e)
 
             # Publish connectivity error event
             get_event_bus().publish_simple(
                 Events.ERROR_OCCURRED,
-                data={"service": "sonarr", "url": url, "error": str(e)},
+                data={"service": service, "url": url, "error": str(e)},
                 source="connectivity_service",
             )
             return False
@@ -730,6 +930,34 @@ class MonitoringService:
             results["database"] = {"status": "error", "error": str(e)}
             results["alerts"].append({"level": "error", "source": "database", "message": str(e)})
 
+        # Check enabled plugin instances in parallel, bounded by the checker's deadline
+        plugin_alerts = 0
+        try:
+            container = get_container()
+            if container.has_service("plugin_registry"):
+                from researcharr.core.plugin_health import get_plugin_health_checker
+
+                plugins = get_plugin_health_checker().check_all(
+                    container.resolve("plugin_registry"), self.config
+                )
+                results["plugins"] = plugins
+                for name, entries in plugins.items():
+                    for entry in entries:
+                        result = entry["result"]
+                        status = result.get("status") if isinstance(result, dict) else None
+                        if entry["state"] == "done" and status in (None, "ok"):
+                            continue
+                        plugin_alerts += 1
+                        results["alerts"].append(
+                            {
+                                "level": "warning",
+                                "source": "plugins",
+                                "message": f"{name}[{entry['index']}]: {entry['error'] or status}",
+                            }
+                        )
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Failed to check plugin health: {e}")
+
         # Determine overall status
         if (
             results["backups"].get("status") == "error"
@@ -739,6 +967,7 @@ class MonitoringService:
         elif (
             results["backups"].get("status") == "warning"
             or results["database"].get("status") == "warning"
+            or plugin_alerts
         ):
             results["status"] = "warning"
 
@@ -795,9 +1024,12 @@ class StorageService:
             logging.getLogger(__name__).warning(f"Failed to initialize storage: {e}")
             return False
 
-    def create_unit_of_work(self):
+    def create_unit_of_work(self, read_only: bool = False):
         """Create a new Unit of Work for transactional operations.
 
+        Args:
+            read_only: Use a read-only session from the reader pool
+
         Returns:
             UnitOfWork instance that can be used as a context manager
 
@@ -812,7 +1044,7 @@ class StorageService:
 
         from researcharr.repositories.uow import UnitOfWork
 
-        return UnitOfWork()
+        return UnitOfWork(read_only=read_only)
 
     def get_app(self, app_id: int):
         """Get a managed app by ID.
@@ -854,19 +1086,20 @@ class StorageService:
             TrackedItem instance or None if not found
         """
         with self.create_unit_of_work() as uow:
-            return uow.items.get_by_id(item_id)
+            # Returned detached, so load the app while the session is open
+            return uow.items.get_by_id(item_id, load="with_app")
 
     def get_processing_logs(self, limit: int = 100):
-        """Get recent processing logs.
+        """Get recent processing logs for the activity feed.
 
         Args:
             limit: Maximum number of logs to retrieve
 
         Returns:
-            List of ProcessingLog instances
+            List of ``ProcessingLogView`` rows, newest first
         """
-        with self.create_unit_of_work() as uow:
-            return uow.logs.get_recent(limit=limit)
+        with self.create_unit_of_work(read_only=True) as uow:
+            return uow.views.recent_logs(limit=limit)
 
     def get_search_cycle(self, cycle_id: int):
         """Get a search cycle by ID.
@@ -905,6 +1138,18 @@ class StorageService:
             uow.settings.set(key, value)
 
 
+def _merge_query_stats(data: dict[str, Any]) -> None:
+    """Add per-statement SQL stats and the slow-query log, when enabled."""
+    try:
+        from researcharr.storage import query_stats
+
+        queries = query_stats.snapshot(top=20)
+        if queries is not None:
+            data["db_queries"] = queries
+    except Exception:  # nosec B110 -- intentional broad except for resilience
+        pass
+
+
 def create_metrics_app() -> Flask:
     """Create a minimal Flask app with health and metrics endpoints.
 
@@ -1342,6 +1587,7 @@ def create_metrics_app() -> Flask:
                 data["cache_evictions"] = int(c.get("evictions", 0))
             except Exception:  # nosec B110 -- intentional broad except for resilience
                 pass
+            _merge_query_stats(data)
             return jsonify(data)
         except Exception:  # nosec B110 -- intentional broad except for resilience
             # Fallback if jsonify is not available
@@ -1358,6 +1604,7 @@ def create_metrics_app() -> Flask:
                 data["cache_evictions"] = int(c.get("evictions", 0))
             except Exception:  # nosec B110 -- intentional broad except for resilience
                 pass
+            _merge_query_stats(data)
             return data
 
     @app.route("/metrics.prom")
@@ -1937,13 +2184,11 @@ def has_valid_url_and_key(instances: list[dict[str, Any]]) -> bool:
 
 def check_radarr_connection(url: str, api_key: str, logger: logging.Logger) -> bool:
     """Check Radarr connection (backwards compatibility)."""
-    http_client = HttpClientService()
-    connectivity_service = ConnectivityService(http_client)
+    connectivity_service = ConnectivityService(get_http_client(), get_circuit_breakers())
     return connectivity_service.check_radarr_connection(url, api_key, logger)
 
 
 def check_sonarr_connection(url: str, api_key: str, logger: logging.Logger) -> bool:
     """Check Sonarr connection (backwards compatibility)."""
-    http_client = HttpClientService()
-    connectivity_service = ConnectivityService(http_client)
+    connectivity_service = ConnectivityService(get_http_client(), get_circuit_breakers())
     return connectivity_service.check_sonarr_connection(url, api_key, logger)
@@ -0,0 +1,321 @@
+"""Streaming ingestion of large *arr library responses.
+
+Radarr's ``/api/v3/movie`` and Sonarr's ``/api/v3/series`` return the whole
+library as a single JSON array. Calling ``response.json()`` on that body
+materialises every record (with all of its nested metadata) at once, which
+for large libraries means hundreds of MB of Python objects.
+
+This module decodes the array incrementally from the response body, keeps
+only the fields ``TrackedItem`` needs and hands them to the repository layer
+in fixed-size chunks, so peak memory is bounded by the chunk size rather
+than the size of the library.
+
+Usage:
+    r = requests.get(url, stream=True, timeout=30)
+    for chunk in stream_library(r, AppType.RADARR, chunk_size=500):
+        ...
+
+    # or, end to end into the database:
+    ingest_library(app_id, plugin.iter_library())
+
+Paged endpoints (Sonarr's ``/api/v3/wanted/missing`` and
+``/api/v3/wanted/cutoff``) are read with `iter_pages`. It keeps a bounded
+number of page requests in flight ahead of the consumer, so wall-clock
+time scales with the concurrency while memory stays bounded by
+``concurrency * pageSize`` records.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import math
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from researcharr.storage.models import AppType
+
+DEFAULT_CHUNK_SIZE = 500
+_READ_SIZE = 64 * 1024
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789.eE+-"
+
+
+def iter_json_array(chunks: Iterable[bytes | str]) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array as they are decoded.
+
+    Only the bytes of the element currently being decoded (plus one read
+    buffer) are held in memory.
+
+    Args:
+        chunks: Iterable of ``bytes`` or ``str`` fragments of the document,
+            e.g. ``response.iter_content(chunk_size=65536)``.
+
+    Raises:
+        ValueError: If the document is not a JSON array or is truncated.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    source = iter(chunks)
+    buf = ""
+    pos = 0
+    eof = False
+
+    def _fill() -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        for raw in source:
+            text = utf8.decode(raw) if isinstance(raw, bytes) else raw
+            if text:
+                # Drop the consumed prefix so the buffer never grows past
+                # the element being decoded plus one read.
+                buf = buf[pos:] + text
+                pos = 0
+                return True
+        tail = utf8.decode(b"", final=True)
+        buf = buf[pos:] + tail
+        pos = 0
+        eof = True
+        return bool(tail)
+
+    def _skip_ws() -> bool:
+        """Advance past whitespace; return False at end of input."""
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buf):
+                return True
+            if not _fill():
+                return False
+
+    if not _skip_ws() or buf[pos] != "[":
+        raise ValueError("Expected a JSON array")
+    pos += 1
+
+    expect_value = True
+    while True:
+        if not _skip_ws():
+            raise ValueError("Truncated JSON array")
+        ch = buf[pos]
+        if ch == "]":
+            return
+        if ch == ",":
+            if expect_value:
+                raise ValueError(f"Unexpected ',' at offset {pos}")
+            pos += 1
+            expect_value = True
+            continue
+        if not expect_value:
+            raise ValueError(f"Expected ',' or ']' at offset {pos}")
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if _fill():
+                    continue
+                raise ValueError("Truncated JSON array") from None
+            # A bare number cut by a read boundary decodes as a shorter
+            # valid number ("12" of "123", "-4" of "-4.5"); re-decode once
+            # more data is available.
+            if (
+                not eof
+                and isinstance(value, (int, float))
+                and (end == len(buf) or buf[end] in _NUMBER_CHARS)
+                and _fill()
+            ):
+                continue
+            break
+        pos = end
+        expect_value = False
+        yield value
+
+
+def project_tracked_item(record: dict[str, Any], app_type: AppType | str) -> dict[str, Any] | None:
+    """Reduce a raw Radarr movie / Sonarr series record to TrackedItem fields.
+
+    Returns:
+        Dict keyed by ``TrackedItem`` column names, or None when the record
+        has no usable id/title.
+    """
+    if not isinstance(record, dict):
+        return None
+    arr_id = record.get("id")
+    title = record.get("title")
+    if not isinstance(arr_id, int) or arr_id <= 0 or not title:
+        return None
+
+    app_type = AppType(app_type)
+    has_file = record.get("hasFile")
+    score = record.get("customFormatScore")
+    if app_type == AppType.RADARR:
+        movie_file = record.get("movieFile") or {}
+        if score is None:
+            score = movie_file.get("customFormatScore")
+    elif has_file is None:
+        # Sonarr series carry file state in their statistics block
+        stats = record.get("statistics") or {}
+        files = stats.get("episodeFileCount") or 0
+        total = stats.get("episodeCount") or 0
+        has_file = total > 0 and files >= total
+
+    return {
+        "arr_id": arr_id,
+        "title": str(title)[:255],
+        "year": record.get("year") or None,
+        "monitored": bool(record.get("monitored", True)),
+        "has_file": bool(has_file),
+        "tmdb_id": record.get("tmdbId") or None,
+        "tvdb_id": record.get("tvdbId") or None,
+        "imdb_id": record.get("imdbId") or None,
+        "custom_format_score": float(score or 0.0),
+    }
+
+
+def project_wanted_episode(record: dict[str, Any]) -> dict[str, Any] | None:
+    """Reduce a Sonarr wanted/missing or wanted/cutoff episode to its series' TrackedItem fields.
+
+    Sonarr items are tracked per series, so the episode maps to the series
+    it belongs to. The endpoint must be called with ``includeSeries=true``.
+
+    Every wanted series is projected with ``has_file=False`` so it stays
+    eligible for search. A cutoff-unmet episode has a file, but the series
+    still needs an upgrade search.
+    """
+    if not isinstance(record, dict):
+        return None
+    series = record.get("series") or {}
+    file_score = (record.get("episodeFile") or {}).get("customFormatScore")
+    return project_tracked_item(
+        {
+            "id": record.get("seriesId") or series.get("id"),
+            "title": series.get("title"),
+            "year": series.get("year"),
+            "monitored": series.get("monitored", True),
+            "hasFile": False,
+            "tvdbId": series.get("tvdbId"),
+            "imdbId": series.get("imdbId"),
+            "customFormatScore": file_score,
+        },
+        AppType.SONARR,
+    )
+
+
+def iter_pages(
+    fetch_page: Callable[[int], dict[str, Any]], concurrency: int = 4
+) -> Iterator[list[Any]]:
+    """Yield the records of a paged *arr endpoint page by page, in order.
+
+    Page 1 is fetched first to learn ``totalRecords`` and ``pageSize``.
+    After that, up to ``concurrency`` later pages are requested ahead of
+    the consumer on worker threads. A page's records are yielded as soon
+    as the page and every page before it have arrived. Fetching stops early at an
+    empty page, for example when the library shrank while it was being read.
+
+    Args:
+        fetch_page: Returns the decoded JSON envelope for a 1-based page
+            (``{"page", "pageSize", "totalRecords", "records"}``)
+        concurrency: Maximum page requests in flight at once
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    first = fetch_page(1)
+    records = first.get("records") or []
+    page_size = first.get("pageSize") or len(records)
+    pages = math.ceil((first.get("totalRecords") or 0) / page_size) if page_size else 1
+    if pages <= 1 or not records:
+        yield records
+        return
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="arr-page") as pool:
+        pending: deque = deque()
+        next_page = 2
+        try:
+            while next_page <= pages and len(pending) < concurrency:
+                pending.append(pool.submit(fetch_page, next_page))
+                next_page += 1
+            yield records
+            while pending:
+                records = pending.popleft().result().get("records") or []
+                if not records:
+                    return
+                if next_page <= pages:
+                    pending.append(pool.submit(fetch_page, next_page))
+                    next_page += 1
+                yield records
+        finally:
+            # Consumer stopped early or a page failed: drop queued requests
+            for future in pending:
+                future.cancel()
+
+
+def iter_chunks(iterable: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Group an iterable into lists of at most ``size`` elements."""
+    if size < 1:
+        raise ValueError("size must be >= 1")
+    chunk: list[Any] = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def stream_library(
+    response: Any,
+    app_type: AppType | str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[list[dict[str, Any]]]:
+    """Decode a streamed library response into chunks of projected records.
+
+    Args:
+        response: A ``requests`` response opened with ``stream=True`` (any
+            object exposing ``iter_content`` works).
+        app_type: RADARR or SONARR, selects the field projection.
+        chunk_size: Maximum number of records per yielded chunk.
+    """
+    records = iter_json_array(response.iter_content(chunk_size=_READ_SIZE))
+    projected = (
+        row for row in (project_tracked_item(r, app_type) for r in records) if row is not None
+    )
+    yield from iter_chunks(projected, chunk_size)
+
+
+def ingest_library(app_id: int, chunks: Iterable[list[dict[str, Any]]]) -> dict[str, int]:
+    """Feed projected chunks into ``TrackedItemRepository.sync_batch``.
+
+    Each chunk is written in its own unit of work so neither the session
+    identity map nor the transaction grows with the library size.
+
+    Returns:
+        Totals with ``created``, ``updated`` and ``chunks`` keys.
+    """
+    from researcharr.repositories.uow import UnitOfWork
+
+    totals = {"created": 0, "updated": 0, "chunks": 0}
+    for chunk in chunks:
+        if not chunk:
+            continue
+        with UnitOfWork() as uow:
+            result = uow.items.sync_batch(app_id, chunk)
+        totals["created"] += result["created"]
+        totals["updated"] += result["updated"]
+        totals["chunks"] += 1
+    return totals
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "iter_json_array",
+    "project_tracked_item",
+    "project_wanted_episode",
+    "iter_pages",
+    "iter_chunks",
+    "stream_library",
+    "ingest_library",
+]
@@ -497,9 +497,16 @@ class DatabaseHealthMonitor:
         """Get current database health metrics.
 
         Returns:
-            Dictionary with all tracked metrics
+            Dictionary with all tracked metrics; includes per-statement
+            ``queries`` stats while SQL instrumentation is enabled
         """
-        return self._metrics.copy()
+        metrics = self._metrics.copy()
+        from researcharr.storage import query_stats
+
+        queries = query_stats.snapshot(top=20)
+        if queries is not None:
+            metrics["queries"] = queries
+        return metrics
 
     def get_statistics(self) -> dict[str, Any]:
         """Get detailed database statistics.
@@ -541,6 +548,16 @@ class DatabaseHealthMonitor:
                     {"seq": row[0], "name": row[1], "file": row[2]} for row in db_info
                 ]
 
+                # Statement stats: live when instrumented in this process,
+                # otherwise the snapshot written by the running service
+                from researcharr.storage import query_stats
+
+                queries = query_stats.snapshot() or query_stats.read_snapshot(
+                    query_stats.snapshot_path(self.db_path)
+                )
+                if queries is not None:
+                    stats["queries"] = queries
+
                 return stats
 
             finally:
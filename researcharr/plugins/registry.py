@@ -29,7 +29,12 @@ if _os.getenv("RESEARCHARR_DISABLE_PLUGINS") in ("1", "true", "True"):
         def get(self, name: str):
             return None
 
-        def discover_local(self, plugins_dir: str) -> None:
+        def describe(self, name: str) -> None:
+            return None
+
+        def discover_local(
+            self, plugins_dir: str, lazy: bool = False, manifest_path: str | None = None
+        ) -> None:
             return
 
         def create_instance(self, plugin_name: str, config: dict):
@@ -117,56 +122,68 @@ else:
 
             class PluginRegistry:
                 def __init__(self) -> None:
+                    import threading as _threading
+
+                    from researcharr.core.plugin_instances import PluginInstanceManager
+
                     self._plugins: dict[str, type[Any]] = {}
+                    self._lazy: dict[str, Any] = {}
+                    self._load_lock = _threading.RLock()
+                    self.instances = PluginInstanceManager(self.create_instance)
 
                 def register(self, name: str, cls: type[Any]) -> None:
+                    self._lazy.pop(name, None)
                     self._plugins[name] = cls
 
                 def get(self, name: str) -> Any:
-                    return self._plugins.get(name)
-
-                def discover_local(self, plugins_dir: str) -> None:
-                    import importlib.util as _ilu
-                    import os as _os
+                    cls = self._plugins.get(name)
+                    if cls is None and name in self._lazy:
+                        from researcharr.core.plugin_manifest import load_plugin_file
+
+                        with self._load_lock:
+                            spec = self._lazy.get(name)
+                            if spec is not None:
+                                loaded = load_plugin_file(spec.path, spec.parent)
+                                if loaded is not None:
+                                    self.register(*loaded)
+                                self._lazy.pop(name, None)
+                        cls = self._plugins.get(name)
+                    return cls
+
+                def describe(self, name: str) -> dict[str, Any] | None:
+                    from researcharr.core.plugin_manifest import plugin_metadata
+
+                    spec = self._lazy.get(name)
+                    if spec is not None:
+                        return plugin_metadata(spec)
+                    cls = self._plugins.get(name)
+                    return plugin_metadata(cls) if cls is not None else None
+
+                def discover_local(
+                    self, plugins_dir: str, lazy: bool = False, manifest_path: str | None = None
+                ) -> None:
+                    from researcharr.core.plugin_manifest import (
+                        iter_plugin_files,
+                        load_plugin_file,
+                        scan_plugins,
+                    )
 
                     if not _os.path.isdir(plugins_dir):
                         return
-                    for root, _dirs, files in _os.walk(plugins_dir):
-                        rel = _os.path.relpath(root, plugins_dir)
-                        depth = 0 if rel == "." else len(rel.split(_os.sep))
-                        if depth > 1:
-                            continue
-                        parent = None if rel == "." else rel
-                        for fn in files:
-                            if not fn.endswith(".py") or fn.startswith("_"):
-                                continue
-                            path = _os.path.join(root, fn)
-                            name = _os.path.splitext(fn)[0]
-                            mod_name = f"_researcharr_local_plugin_{name}_{abs(hash(path))}"
-                            spec = _ilu.spec_from_file_location(mod_name, path)
-                            if spec is None or spec.loader is None:
-                                continue
-                            mod = _ilu.module_from_spec(spec)
-                            loader = spec.loader
-                            assert loader is not None
-                            try:
-                                loader.exec_module(mod)
-                            except Exception:
-                                continue
-                            plugin_name = getattr(mod, "PLUGIN_NAME", None)
-                            plugin_cls = getattr(mod, "Plugin", None)
-                            if not plugin_name or not plugin_cls:
-                                continue
-                            explicit_cat = getattr(mod, "CATEGORY", None) or getattr(
-                                plugin_cls, "category", None
-                            )
-                            if explicit_cat:
-                                plugin_cls.category = explicit_cat
-                            elif parent:
-                                plugin_cls.category = parent
-                            else:
-                                plugin_cls.category = getattr(plugin_cls, "category", "plugins")
-                            self.register(plugin_name, plugin_cls)
+                    if not lazy:
+                        for path, parent in iter_plugin_files(plugins_dir):
+                            loaded = load_plugin_file(path, parent)
+                            if loaded is not None:
+                                self.register(*loaded)
+                        return
+                    for spec in scan_plugins(plugins_dir, manifest_path):
+                        if spec.name is None:
+                            loaded = load_plugin_file(spec.path, spec.parent)
+                            if loaded is not None:
+                                self.register(*loaded)
+                        else:
+                            self._plugins.pop(spec.name, None)
+                            self._lazy[spec.name] = spec
 
                 def create_instance(self, plugin_name: str, config: dict) -> Any:
                     cls = self.get(plugin_name)
@@ -174,7 +191,10 @@ else:
                         return cls(config)
                     raise KeyError(f"Unknown plugin: {plugin_name}")
 
+                def get_instance(self, plugin_name: str, config: dict) -> Any:
+                    return self.instances.get(plugin_name, config)
+
                 def list_plugins(self) -> list[str]:
-                    return list(self._plugins.keys())
+                    return list(dict.fromkeys([*self._plugins, *self._lazy]))
 
         __all__ = ["PluginRegistry"]
@@ -1,11 +1,16 @@
 from typing import Any
 
 class PluginRegistry:
+    instances: Any
     def __init__(self) -> None: ...
     def register(self, name: str, cls: Any) -> None: ...
     def get(self, name: str) -> Any: ...
-    def discover_local(self, plugins_dir: str) -> None: ...
+    def describe(self, name: str) -> dict[str, Any] | None: ...
+    def discover_local(
+        self, plugins_dir: str, lazy: bool = False, manifest_path: str | None = None
+    ) -> None: ...
     def create_instance(self, plugin_name: str, config: dict) -> Any: ...
+    def get_instance(self, plugin_name: str, config: dict) -> Any: ...
     def list_plugins(self) -> list[str]: ...
 
 __all__ = ["PluginRegistry"]
@@ -1,5 +1,14 @@
 """Repository interfaces and implementations."""
 
+from .async_repositories import (
+    AsyncGlobalSettingsRepository,
+    AsyncManagedAppRepository,
+    AsyncProcessingLogRepository,
+    AsyncSearchCycleRepository,
+    AsyncTrackedItemRepository,
+)
+from .async_uow import AsyncUnitOfWork
+from .audit_log import AuditLogWriter, get_audit_log_writer
 from .base import BaseRepository
 from .exceptions import (
     ConflictError,
@@ -17,8 +26,15 @@ from .interfaces import (
     ITrackedItemRepository,
     SupportsSession,
 )
+from .loading import LoadProfile
 from .managed_app import ManagedAppRepository
 from .processing_log import ProcessingLogRepository
+from .read_models import (
+    ManagedAppView,
+    ProcessingLogView,
+    ReadModelRepository,
+    TrackedItemView,
+)
 from .search_cycle import SearchCycleRepository
 from .tracked_item import TrackedItemRepository
 from .uow import UnitOfWork
@@ -43,6 +59,23 @@ __all__ = [
     "TrackedItemRepository",
     "SearchCycleRepository",
     "ProcessingLogRepository",
+    # Loading profiles
+    "LoadProfile",
+    # Read models
+    "ReadModelRepository",
+    "ManagedAppView",
+    "TrackedItemView",
+    "ProcessingLogView",
     # Unit of Work
     "UnitOfWork",
+    # Async variants
+    "AsyncGlobalSettingsRepository",
+    "AsyncManagedAppRepository",
+    "AsyncTrackedItemRepository",
+    "AsyncSearchCycleRepository",
+    "AsyncProcessingLogRepository",
+    "AsyncUnitOfWork",
+    # Batched audit-log writes
+    "AuditLogWriter",
+    "get_audit_log_writer",
 ]
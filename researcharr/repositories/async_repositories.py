@@ -0,0 +1,471 @@
+"""Async repository implementations.
+
+These mirror the sync repositories (see `interfaces.py` for the surface
+area) on top of an ``AsyncSession``. Queries use 2.0-style ``select()``;
+relationships are only eager-loaded through an explicit load profile
+(see `loading.py`) because lazy loading is not available under asyncio.
+
+Writes invalidate the same `researcharr.cache` keys as the sync
+repositories so cached sync reads never go stale. Reads are not cached.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from sqlalchemy import func, select
+
+from researcharr.cache import invalidate as cache_invalidate
+from researcharr.cache import make_key
+from researcharr.repositories import statements
+from researcharr.repositories.exceptions import NotFoundError, ValidationError
+from researcharr.repositories.loading import LoadProfile, apply_profile
+from researcharr.repositories.processing_log import ProcessingLogRepository
+from researcharr.storage.models import (
+    AppType,
+    CyclePhase,
+    GlobalSettings,
+    ManagedApp,
+    ProcessingLog,
+    SearchCycle,
+    SortStrategy,
+    TrackedItem,
+)
+from researcharr.validators import (
+    validate_managed_app,
+    validate_search_cycle,
+    validate_tracked_item,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
+
+
+class AsyncBaseRepository(Generic[T]):
+    """Common CRUD helpers for async repositories."""
+
+    model: type[Any]
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize repository with an async database session.
+
+        Args:
+            session: SQLAlchemy AsyncSession for database operations
+        """
+        self.session = session
+
+    async def get_by_id(self, id: int) -> T | None:
+        """Get entity by ID."""
+        return await self.session.get(self.model, id)
+
+    async def get_all(self) -> list[T]:
+        """Get all entities."""
+        return list((await self.session.scalars(select(self.model))).all())
+
+    async def create(self, entity: T) -> T:
+        """Create new entity."""
+        self.session.add(entity)
+        await self.session.flush()
+        return entity
+
+    async def update(self, entity: T) -> T:
+        """Update existing entity."""
+        await self.session.merge(entity)
+        await self.session.flush()
+        return entity
+
+    async def delete(self, id: int) -> bool:
+        """Delete entity by ID."""
+        entity = await self.get_by_id(id)
+        if entity is None:
+            return False
+        await self.session.delete(entity)
+        await self.session.flush()
+        return True
+
+    async def bulk_create(self, entities: list[T]) -> list[T]:
+        """Persist a list of new entities with a single flush."""
+        if not entities:
+            return entities
+        self.session.add_all(entities)
+        await self.session.flush()
+        return entities
+
+
+class AsyncGlobalSettingsRepository(AsyncBaseRepository[GlobalSettings]):
+    """Async repository for global settings (singleton pattern)."""
+
+    model = GlobalSettings
+
+    async def update(self, entity: GlobalSettings) -> GlobalSettings:
+        """Update settings."""
+        await super().update(entity)
+        cache_invalidate("GlobalSettings:singleton")
+        return entity
+
+    async def get_or_create(self) -> GlobalSettings:
+        """Get existing settings or create with defaults."""
+        settings = await self.session.get(GlobalSettings, 1)
+        if settings is None:
+            settings = GlobalSettings(id=1)
+            self.session.add(settings)
+            await self.session.flush()
+        return settings
+
+
+class AsyncManagedAppRepository(AsyncBaseRepository[ManagedApp]):
+    """Async repository for Sonarr/Radarr app connections."""
+
+    model = ManagedApp
+
+    async def get_by_id(self, id: int, load: LoadProfile = "bare") -> ManagedApp | None:
+        """Get app by ID using a loading profile ("bare" or "with_items_count")."""
+        stmt = apply_profile(select(ManagedApp), ManagedApp, load).where(ManagedApp.id == id)
+        return (await self.session.scalars(stmt)).first()
+
+    async def create(self, entity: ManagedApp) -> ManagedApp:
+        """Create new app."""
+        try:
+            validate_managed_app(entity)
+        except ValidationError:
+            raise
+        await super().create(entity)
+        cache_invalidate("ManagedApp:")
+        return entity
+
+    async def update(self, entity: ManagedApp) -> ManagedApp:
+        """Update existing app."""
+        try:
+            validate_managed_app(entity)
+        except ValidationError:
+            raise
+        await super().update(entity)
+        cache_invalidate("ManagedApp:")
+        return entity
+
+    async def delete(self, id: int) -> bool:
+        """Delete app by ID."""
+        deleted = await super().delete(id)
+        if deleted:
+            cache_invalidate("ManagedApp:")
+        return deleted
+
+    async def get_active_apps(self) -> list[ManagedApp]:
+        """Get all active apps."""
+        stmt = select(ManagedApp).where(ManagedApp.is_active)
+        return list((await self.session.scalars(stmt)).all())
+
+    async def get_enabled(self) -> list[ManagedApp]:
+        """Alias for get_active_apps."""
+        return await self.get_active_apps()
+
+    async def get_by_type(self, app_type: AppType) -> list[ManagedApp]:
+        """Get all apps of a specific type."""
+        stmt = select(ManagedApp).where(ManagedApp.app_type == app_type)
+        return list((await self.session.scalars(stmt)).all())
+
+    async def get_by_url(self, base_url: str, app_type: AppType) -> ManagedApp | None:
+        """Get app by base URL and type."""
+        stmt = select(ManagedApp).where(
+            ManagedApp.base_url == base_url, ManagedApp.app_type == app_type
+        )
+        return (await self.session.scalars(stmt)).first()
+
+
+class AsyncTrackedItemRepository(AsyncBaseRepository[TrackedItem]):
+    """Async repository for tracked media items."""
+
+    model = TrackedItem
+
+    async def get_by_id(self, id: int, load: LoadProfile = "bare") -> TrackedItem | None:
+        """Get tracked item by ID using a loading profile ("bare" or "with_app")."""
+        stmt = apply_profile(select(TrackedItem), TrackedItem, load).where(TrackedItem.id == id)
+        return (await self.session.scalars(stmt)).first()
+
+    async def create(self, entity: TrackedItem) -> TrackedItem:
+        """Create new tracked item."""
+        try:
+            validate_tracked_item(entity)
+        except ValidationError:
+            raise
+        return await super().create(entity)
+
+    async def update(self, entity: TrackedItem) -> TrackedItem:
+        """Update existing tracked item."""
+        try:
+            validate_tracked_item(entity)
+        except ValidationError:
+            raise
+        return await super().update(entity)
+
+    async def get_by_app(self, app_id: int) -> list[TrackedItem]:
+        """Get all tracked items for a specific app."""
+        stmt = select(TrackedItem).where(TrackedItem.app_id == app_id)
+        return list((await self.session.scalars(stmt)).all())
+
+    async def get_by_arr_id(self, app_id: int, arr_id: int) -> TrackedItem | None:
+        """Get tracked item by app and Sonarr/Radarr ID."""
+        params = {"app_id": app_id, "arr_id": arr_id}
+        return (await self.session.scalars(statements.ITEM_BY_ARR_ID, params)).first()
+
+    async def sync_batch(self, app_id: int, records: list[dict]) -> dict[str, int]:
+        """Upsert a chunk of projected *arr records by ``arr_id``.
+
+        Same semantics as ``TrackedItemRepository.sync_batch``.
+        """
+        if not records:
+            return {"created": 0, "updated": 0}
+        by_arr_id = {int(r["arr_id"]): r for r in records}
+        stmt = select(TrackedItem).where(
+            TrackedItem.app_id == app_id, TrackedItem.arr_id.in_(list(by_arr_id))
+        )
+        existing = {item.arr_id: item for item in (await self.session.scalars(stmt)).all()}
+        now = datetime.utcnow()
+        created = updated = 0
+        for arr_id, fields in by_arr_id.items():
+            item = existing.get(arr_id)
+            if item is None:
+                item = TrackedItem(app_id=app_id, **fields)
+                self.session.add(item)
+                created += 1
+            else:
+                for key, value in fields.items():
+                    setattr(item, key, value)
+                updated += 1
+            item.last_synced_at = now
+            try:
+                validate_tracked_item(item)
+            except ValidationError:
+                raise
+        await self.session.flush()
+        return {"created": created, "updated": updated}
+
+    async def get_items_for_search(
+        self,
+        app_id: int,
+        sort_strategy: SortStrategy,
+        limit: int,
+        include_retries: bool = True,
+    ) -> list[TrackedItem]:
+        """Get items that need searching, sorted by strategy."""
+        params: dict = {"app_id": app_id, "limit": limit}
+        if include_retries:
+            params["now"] = datetime.utcnow()
+        stmt = statements.items_for_search(sort_strategy, include_retries)
+        return list((await self.session.scalars(stmt, params)).all())
+
+    async def get_retry_queue_size(self, app_id: int) -> int:
+        """Get count of items currently in retry queue."""
+        stmt = select(func.count(TrackedItem.id)).where(
+            TrackedItem.app_id == app_id,
+            TrackedItem.next_retry_at.isnot(None),
+            TrackedItem.next_retry_at <= datetime.utcnow(),
+        )
+        return int(await self.session.scalar(stmt) or 0)
+
+    async def get_retry_schedule(self) -> list[tuple[int, int, datetime]]:
+        """Get ``(item_id, app_id, next_retry_at)`` for every searchable item awaiting a retry."""
+        stmt = select(TrackedItem.id, TrackedItem.app_id, TrackedItem.next_retry_at).where(
+            TrackedItem.next_retry_at.isnot(None), TrackedItem.monitored, ~TrackedItem.has_file
+        )
+        return [tuple(row) for row in (await self.session.execute(stmt)).all()]
+
+    async def get_retry_items(self, app_id: int, item_ids: list[int]) -> list[TrackedItem]:
+        """Get the given items of an app that are still searchable and awaiting a retry."""
+        stmt = select(TrackedItem).where(
+            TrackedItem.app_id == app_id,
+            TrackedItem.id.in_(item_ids),
+            TrackedItem.next_retry_at.isnot(None),
+            TrackedItem.monitored,
+            ~TrackedItem.has_file,
+        )
+        return list((await self.session.scalars(stmt)).all())
+
+    async def mark_searched(
+        self, item_id: int, success: bool, next_retry_at: datetime | None = None
+    ) -> TrackedItem | None:
+        """Update item after search attempt."""
+        item = await self.get_by_id(item_id)
+        if item is None:
+            return None
+        item.search_count += 1
+        item.last_search_at = datetime.utcnow()
+        if not success:
+            item.failed_search_count += 1
+            item.next_retry_at = next_retry_at
+        else:
+            item.failed_search_count = 0
+            item.next_retry_at = None
+        await self.session.flush()
+        return item
+
+
+class AsyncSearchCycleRepository(AsyncBaseRepository[SearchCycle]):
+    """Async repository for search cycle records."""
+
+    model = SearchCycle
+
+    def _invalidate(self, app_id: int) -> None:
+        cache_invalidate(make_key(("SearchCycle", "latest", app_id)))
+        cache_invalidate(make_key(("SearchCycle", "active", app_id)))
+
+    async def get_by_app(self, app_id: int) -> list[SearchCycle]:
+        """Get all search cycles for an app, newest first."""
+        stmt = (
+            select(SearchCycle)
+            .where(SearchCycle.app_id == app_id)
+            .order_by(SearchCycle.cycle_number.desc())
+        )
+        return list((await self.session.scalars(stmt)).all())
+
+    async def get_latest_cycle(self, app_id: int) -> SearchCycle | None:
+        """Get the most recent search cycle for an app."""
+        return (await self.session.scalars(statements.LATEST_CYCLE, {"app_id": app_id})).first()
+
+    async def get_active_cycle(self, app_id: int) -> SearchCycle | None:
+        """Get the currently active (incomplete) cycle for an app."""
+        return (await self.session.scalars(statements.ACTIVE_CYCLE, {"app_id": app_id})).first()
+
+    async def create_cycle(self, app_id: int) -> SearchCycle:
+        """Create a new search cycle for an app (cycle number from the per-app counter)."""
+        result = await self.session.execute(statements.ALLOCATE_CYCLE_NUMBER, {"app_id": app_id})
+        cycle_number = result.scalar()
+        if cycle_number is None:
+            raise NotFoundError(f"ManagedApp {app_id} not found")
+        cycle = SearchCycle(
+            app_id=app_id,
+            cycle_number=cycle_number,
+            phase=CyclePhase.SYNCING,
+            started_at=datetime.utcnow(),
+        )
+        try:
+            validate_search_cycle(cycle)
+        except ValidationError:
+            raise
+        self.session.add(cycle)
+        await self.session.flush()
+        self._invalidate(app_id)
+        return cycle
+
+    async def update_phase(self, cycle_id: int, phase: CyclePhase) -> SearchCycle | None:
+        """Update cycle phase."""
+        cycle = await self.get_by_id(cycle_id)
+        if cycle:
+            cycle.phase = phase
+            try:
+                validate_search_cycle(cycle)
+            except ValidationError:
+                raise
+            await self.session.flush()
+            self._invalidate(cycle.app_id)
+        return cycle
+
+    async def update_cycle(self, cycle_id: int, changes: dict[str, Any]) -> SearchCycle | None:
+        """Apply several column changes (phase, counters, timestamps) in one flush."""
+        cycle = await self.get_by_id(cycle_id)
+        if cycle:
+            for name, value in changes.items():
+                setattr(cycle, name, value)
+            try:
+                validate_search_cycle(cycle)
+            except ValidationError:
+                raise
+            await self.session.flush()
+            self._invalidate(cycle.app_id)
+        return cycle
+
+    async def complete_cycle(self, cycle_id: int, next_cycle_at: datetime) -> SearchCycle | None:
+        """Mark cycle as completed."""
+        cycle = await self.get_by_id(cycle_id)
+        if cycle:
+            cycle.completed_at = datetime.utcnow()
+            cycle.next_cycle_at = next_cycle_at
+            try:
+                validate_search_cycle(cycle)
+            except ValidationError:
+                raise
+            await self.session.flush()
+            self._invalidate(cycle.app_id)
+        return cycle
+
+
+class AsyncProcessingLogRepository(AsyncBaseRepository[ProcessingLog]):
+    """Async repository for processing logs.
+
+    Every call runs the matching `ProcessingLogRepository` method on the
+    session's sync side (``run_sync``). That way async reads and writes follow
+    the same monthly-partition routing (see
+    `researcharr.storage.log_partitions`), keyset cursors and rollup
+    maintenance as sync ones.
+    """
+
+    model = ProcessingLog
+
+    async def _run(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        return await self.session.run_sync(
+            lambda session: getattr(ProcessingLogRepository(session), method)(*args, **kwargs)
+        )
+
+    async def get_by_id(self, id: int) -> ProcessingLog | None:
+        """Get processing log by ID."""
+        return await self._run("get_by_id", id)
+
+    async def get_all(self) -> list[ProcessingLog]:
+        """Get all processing logs."""
+        return await self._run("get_all")
+
+    async def get_by_app(
+        self, app_id: int, limit: int = 100, after: tuple[datetime, int] | None = None
+    ) -> list[ProcessingLog]:
+        """Get recent processing logs for an app, newest first.
+
+        ``after`` is the ``(created_at, id)`` keyset cursor of the last log
+        of the previous page.
+        """
+        return await self._run("get_by_app", app_id, limit, after)
+
+    async def get_recent(self, limit: int = 100) -> list[ProcessingLog]:
+        """Get recent logs across all apps."""
+        return await self._run("get_recent", limit)
+
+    async def get_by_tracked_item(self, tracked_item_id: int) -> list[ProcessingLog]:
+        """Get all logs for a specific tracked item."""
+        return await self._run("get_by_tracked_item", tracked_item_id)
+
+    async def get_by_event_type(
+        self, app_id: int, event_type: str, limit: int = 50
+    ) -> list[ProcessingLog]:
+        """Get logs by event type for an app."""
+        return await self._run("get_by_event_type", app_id, event_type, limit)
+
+    async def log_event(
+        self,
+        app_id: int,
+        event_type: str,
+        message: str,
+        success: bool = True,
+        details: str | None = None,
+        tracked_item_id: int | None = None,
+    ) -> ProcessingLog:
+        """Create a new log entry in this session (the newest partition when enabled)."""
+        return await self._run(
+            "log_event", app_id, event_type, message, success, details, tracked_item_id
+        )
+
+    async def cleanup_old_logs(self, days: int = 30) -> int:
+        """Delete logs older than specified days, dropping expired partitions."""
+        return await self._run("cleanup_old_logs", days)
+
+
+__all__ = [
+    "AsyncBaseRepository",
+    "AsyncGlobalSettingsRepository",
+    "AsyncManagedAppRepository",
+    "AsyncTrackedItemRepository",
+    "AsyncSearchCycleRepository",
+    "AsyncProcessingLogRepository",
+]
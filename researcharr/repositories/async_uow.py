@@ -0,0 +1,109 @@
+"""Async Unit of Work for coordinating repository operations on an event loop.
+
+The asyncio counterpart of `UnitOfWork`: it owns an ``AsyncSession`` from
+`researcharr.storage.async_database` (read-write by default, read-only pool
+with ``read_only=True``) and exposes the async repositories lazily. An
+external ``AsyncSession`` can be supplied for composition, in which case
+commit/rollback are left to the caller.
+
+Example:
+    async with AsyncUnitOfWork() as uow:
+        await uow.logs.log_event(app_id, "search", "queued")
+"""
+
+from __future__ import annotations
+
+from contextlib import AbstractAsyncContextManager
+from typing import TYPE_CHECKING
+
+from researcharr.repositories.async_repositories import (
+    AsyncGlobalSettingsRepository,
+    AsyncManagedAppRepository,
+    AsyncProcessingLogRepository,
+    AsyncSearchCycleRepository,
+    AsyncTrackedItemRepository,
+)
+from researcharr.storage.async_database import get_async_read_session, get_async_session
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class AsyncUnitOfWork(AbstractAsyncContextManager["AsyncUnitOfWork"]):
+    """Coordinates a transactional set of async repository operations."""
+
+    def __init__(self, session: AsyncSession | None = None, *, read_only: bool = False):
+        self._external_session = session
+        self.read_only = read_only
+        self._session: AsyncSession | None = None
+        self._ctx = None
+        self._apps: AsyncManagedAppRepository | None = None
+        self._items: AsyncTrackedItemRepository | None = None
+        self._logs: AsyncProcessingLogRepository | None = None
+        self._cycles: AsyncSearchCycleRepository | None = None
+        self._settings: AsyncGlobalSettingsRepository | None = None
+
+    async def __aenter__(self) -> AsyncUnitOfWork:
+        if self._external_session is not None:
+            self._session = self._external_session
+        else:
+            self._ctx = get_async_read_session() if self.read_only else get_async_session()
+            self._session = await self._ctx.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._ctx is not None:
+            try:
+                await self._ctx.__aexit__(exc_type, exc, tb)
+            finally:
+                self._ctx = None
+                self._session = None
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            raise RuntimeError(
+                "AsyncUnitOfWork is not active. Use 'async with AsyncUnitOfWork() as uow:'"
+            )
+        return self._session
+
+    @property
+    def apps(self) -> AsyncManagedAppRepository:
+        if self._apps is None:
+            self._apps = AsyncManagedAppRepository(self.session)
+        return self._apps
+
+    @property
+    def items(self) -> AsyncTrackedItemRepository:
+        if self._items is None:
+            self._items = AsyncTrackedItemRepository(self.session)
+        return self._items
+
+    @property
+    def logs(self) -> AsyncProcessingLogRepository:
+        if self._logs is None:
+            self._logs = AsyncProcessingLogRepository(self.session)
+        return self._logs
+
+    @property
+    def cycles(self) -> AsyncSearchCycleRepository:
+        if self._cycles is None:
+            self._cycles = AsyncSearchCycleRepository(self.session)
+        return self._cycles
+
+    @property
+    def settings(self) -> AsyncGlobalSettingsRepository:
+        if self._settings is None:
+            self._settings = AsyncGlobalSettingsRepository(self.session)
+        return self._settings
+
+    async def commit(self) -> None:
+        if self._session is not None and self._external_session is not None:
+            await self._session.commit()
+
+    async def rollback(self) -> None:
+        if self._session is not None and self._external_session is not None:
+            await self._session.rollback()
+
+
+__all__ = ["AsyncUnitOfWork"]
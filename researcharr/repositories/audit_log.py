@@ -0,0 +1,319 @@
+"""Group-commit writer for ProcessingLog audit events.
+
+`ProcessingLogRepository.log_event` inserts and flushes one row inside the
+caller's transaction, so every search step pays for an audit-log write.
+`AuditLogWriter` decouples the two: events are validated and enqueued in
+memory, and a background thread writes them in batches (``max_batch`` rows
+or ``flush_interval`` seconds, whichever comes first) with a single
+``executemany`` INSERT per batch in its own write transaction.
+
+The queue is bounded: when it is full, ``submit()`` blocks (backpressure)
+for up to ``block_timeout`` seconds and then drops the event, counting it
+in ``stats()["dropped"]``. ``synchronous=True`` (or
+``RESEARCHARR_AUDIT_LOG_SYNC=true``) writes each event immediately in the
+calling thread, which keeps tests deterministic. A synchronous write joins
+the caller's session (passed in, or the thread's open write session)
+rather than checking out the single write connection a second time.
+
+`ProcessingLogRepository.log_event` hands its events to the global writer
+whenever its session is bound to the application's write engine.
+
+Usage:
+    writer = get_audit_log_writer()
+    writer.submit(app_id, "search_started", "Searching 5 items")
+
+The global writer registers a lifecycle shutdown hook that drains the
+queue on shutdown (see `shutdown_audit_log_writer`).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from researcharr.repositories.exceptions import ValidationError
+from researcharr.repositories.processing_log import invalidate_app_aggregates
+from researcharr.storage import log_partitions, log_rollups
+from researcharr.storage.database import active_write_session, get_write_session
+from researcharr.storage.models import ProcessingLog
+from researcharr.validators import validate_processing_log
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH = 500
+DEFAULT_FLUSH_INTERVAL = 0.25  # seconds
+DEFAULT_MAX_QUEUE = 10000
+
+_TRUE_VALUES = ("true", "1", "yes", "on")
+_STOP = object()  # queue sentinel: wake the worker for a final drain
+
+
+class AuditLogWriter:
+    """Batches ProcessingLog inserts on a background thread."""
+
+    def __init__(
+        self,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        block_timeout: float | None = 5.0,
+        synchronous: bool = False,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            max_batch: Maximum rows per INSERT batch
+            flush_interval: Maximum seconds an event waits before being written
+            max_queue: Queue capacity before ``submit()`` applies backpressure
+            block_timeout: Seconds ``submit()`` blocks on a full queue before
+                           dropping the event (None blocks indefinitely)
+            synchronous: Write every event immediately in the calling thread
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be >= 1")
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.block_timeout = block_timeout
+        self.synchronous = synchronous
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._stats = {"submitted": 0, "written": 0, "dropped": 0, "failed": 0, "batches": 0}
+
+    # Producer side ---------------------------------------------------------
+    def submit(
+        self,
+        app_id: int,
+        event_type: str,
+        message: str,
+        success: bool = True,
+        details: str | None = None,
+        tracked_item_id: int | None = None,
+        session: Session | None = None,
+    ) -> bool:
+        """
+        Validate and enqueue an audit event.
+
+        In synchronous mode the event is written in ``session`` (default: the
+        write session open on this thread, else a new one) before returning.
+
+        Returns:
+            True if the event was accepted, False if it was dropped because
+            the queue stayed full for ``block_timeout`` seconds or the writer
+            is closed
+
+        Raises:
+            ValidationError: If the event is invalid
+        """
+        row = {
+            "app_id": app_id,
+            "tracked_item_id": tracked_item_id,
+            "event_type": event_type,
+            "message": message,
+            "details": details,
+            "success": success,
+            "created_at": datetime.utcnow(),
+        }
+        try:
+            validate_processing_log(SimpleNamespace(**row))  # type: ignore[arg-type]
+        except ValidationError:
+            raise
+
+        if self.synchronous:
+            self._count("submitted")
+            self._write([row], session or active_write_session())
+            return True
+        if self._stop.is_set():
+            self._count("dropped")
+            return False
+
+        self._ensure_started()
+        try:
+            self._queue.put(row, timeout=self.block_timeout)
+        except queue.Full:
+            self._count("dropped")
+            logger.warning("Audit log queue full; dropped %s event for app %s", event_type, app_id)
+            return False
+        self._count("submitted")
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every event submitted so far has been written.
+
+        Returns:
+            True if the queue drained within ``timeout``
+        """
+        if self.synchronous or self._thread is None:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def close(self, timeout: float | None = 10.0) -> None:
+        """Stop accepting events, write everything queued and stop the thread."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                pass  # the worker drains without waiting once stop is set
+            thread.join(timeout)
+            if thread.is_alive():
+                logger.warning(
+                    "Audit log writer did not drain within %ss (%d events pending)",
+                    timeout,
+                    self._queue.qsize(),
+                )
+            self._thread = None
+
+    def stats(self) -> dict[str, int]:
+        """Return counters plus the current queue depth."""
+        with self._lock:
+            snapshot = dict(self._stats)
+        snapshot["pending"] = self._queue.qsize()
+        return snapshot
+
+    # Consumer side ---------------------------------------------------------
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="audit-log-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return
+                continue
+            batch = [] if first is _STOP else [first]
+            taken = 1
+            stopping = first is _STOP
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    if stopping or remaining <= 0 or self._stop.is_set():
+                        item = self._queue.get_nowait()
+                    else:
+                        item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                taken += 1
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+            try:
+                if batch:
+                    self._write(batch)
+            finally:
+                for _ in range(taken):
+                    self._queue.task_done()
+            if stopping and self._queue.empty():
+                return
+
+    def _write(self, rows: list[dict[str, Any]], session: Session | None = None) -> None:
+        try:
+            if session is not None:
+                # Inside the caller's transaction; a savepoint keeps a bad
+                # row from aborting the caller's own work
+                with session.begin_nested():
+                    self._insert(session, rows)
+            else:
+                with get_write_session() as own:
+                    self._insert(own, rows)
+        except Exception:
+            if len(rows) > 1:
+                # Isolate the offending row (e.g. an app deleted meanwhile)
+                # instead of losing the whole batch.
+                for row in rows:
+                    self._write([row], session)
+                return
+            self._count("failed")
+            logger.exception("Failed to write audit log event for app %s", rows[0]["app_id"])
+            return
+        self._count("written", len(rows))
+        self._count("batches")
+        for app_id in {row["app_id"] for row in rows}:
+            invalidate_app_aggregates(app_id)
+
+    @staticmethod
+    def _insert(session: Session, rows: list[dict[str, Any]]) -> None:
+        if log_partitions.partitioning_enabled():
+            log_partitions.insert_rows(session.connection(), rows)
+        else:
+            session.execute(insert(ProcessingLog), rows)
+            log_rollups.record(session.connection(), rows)
+
+    def _count(self, key: str, n: int = 1) -> None:
+        with self._lock:
+            self._stats[key] += n
+
+
+# Global writer ---------------------------------------------------------------
+_writer: AuditLogWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_audit_log_writer() -> AuditLogWriter:
+    """
+    Return the process-wide writer, creating it on first use.
+
+    ``RESEARCHARR_AUDIT_LOG_SYNC=true`` selects synchronous mode. A
+    lifecycle shutdown hook is registered so queued events are written
+    before the process exits.
+    """
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                sync = os.getenv("RESEARCHARR_AUDIT_LOG_SYNC", "false").lower() in _TRUE_VALUES
+                _writer = AuditLogWriter(synchronous=sync)
+                try:
+                    from researcharr.core.lifecycle import add_shutdown_hook
+
+                    # Low priority: shutdown hooks run highest-first, so this
+                    # drains after the scheduler (10) has stopped producing.
+                    add_shutdown_hook("audit_log_flush", shutdown_audit_log_writer, priority=5)
+                except Exception:  # nosec B110 -- lifecycle is optional here
+                    pass
+    return _writer
+
+
+def shutdown_audit_log_writer(timeout: float | None = 10.0) -> None:
+    """Drain and stop the global writer if it was created."""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.close(timeout)
+
+
+__all__ = [
+    "AuditLogWriter",
+    "get_audit_log_writer",
+    "shutdown_audit_log_writer",
+]
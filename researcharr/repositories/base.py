@@ -1,17 +1,69 @@
 """Base repository interface.
 
-Adds common optional helpers for bulk operations and simple pagination.
+Adds common optional helpers for bulk operations and pagination.
 Concrete repositories may use these directly without overriding.
+
+Two pagination styles are offered:
+
+* `BaseRepository.paginate` - page numbers (``OFFSET``); cost grows with
+  the page number, kept for compatibility.
+* `BaseRepository.keyset` - keyset/cursor pagination: rows strictly after
+  the sort key of the previous page's last row (e.g.
+  ``after=(created_at, id)``). With an index on the sort key every page
+  is an index seek, so deep pages cost the same as the first.
+  `encode_cursor`/`decode_cursor` turn such keys into opaque strings for
+  APIs.
 """
 
+import base64
+import json
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, Generic, TypeVar
 
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
 
+from .exceptions import ValidationError
+
 T = TypeVar("T")
 
 
+def encode_cursor(key: Sequence[Any]) -> str:
+    """Encode a keyset sort key (ints, strings, datetimes) as an opaque cursor."""
+    values = [{"dt": v.isoformat()} if isinstance(v, datetime) else v for v in key]
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int | None = None) -> tuple[Any, ...]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor: Opaque cursor string
+        size: Expected number of key values (checked when given)
+
+    Returns:
+        The sort key as a tuple
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list):
+            raise ValueError("cursor is not a list")
+        key = tuple(datetime.fromisoformat(v["dt"]) if isinstance(v, dict) else v for v in values)
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValidationError(f"Invalid cursor: {cursor!r}") from e
+    if size is not None and len(key) != size:
+        raise ValidationError(f"Invalid cursor: expected {size} key values")
+    return key
+
+
 class BaseRepository(ABC, Generic[T]):
     """
     Abstract base repository providing common CRUD operations.
@@ -140,7 +192,38 @@ class BaseRepository(ABC, Generic[T]):
         offset = (page - 1) * page_size
         return (
             self.session.query(model_cls)  # type: ignore[arg-type]
+            .order_by(model_cls.id)
             .offset(offset)
             .limit(page_size)
             .all()
         )
+
+    def keyset(
+        self,
+        query,
+        order_by: Sequence[Any],
+        after: Sequence[Any] | None,
+        limit: int,
+        descending: bool = False,
+    ) -> list[T]:
+        """Return up to ``limit`` rows of ``query`` sorted after a key.
+
+        Args:
+            query: Filtered ``Query`` to page through.
+            order_by: Sort columns; must end with a unique column (the id)
+                so the order is total and stable.
+            after: Sort key of the last row of the previous page, or None
+                for the first page.
+            limit: Page size.
+            descending: Sort newest/highest first.
+        Returns:
+            List of entities for the requested page.
+        """
+        if after is not None:
+            if len(after) != len(order_by):
+                raise ValidationError(f"Cursor needs {len(order_by)} key values")
+            key = tuple_(*order_by)
+            bound = tuple_(*after)
+            query = query.filter(key < bound if descending else key > bound)
+        ordering = [col.desc() if descending else col.asc() for col in order_by]
+        return query.order_by(*ordering).limit(limit).all()
@@ -15,6 +15,7 @@ from typing import Protocol, runtime_checkable
 
 from sqlalchemy.orm import Session
 
+from researcharr.repositories.loading import LoadProfile
 from researcharr.storage.models import (
     AppType,
     CyclePhase,
@@ -45,7 +46,7 @@ class IGlobalSettingsRepository(Protocol):
 
 @runtime_checkable
 class IManagedAppRepository(Protocol):
-    def get_by_id(self, id: int) -> ManagedApp | None: ...
+    def get_by_id(self, id: int, load: LoadProfile = "bare") -> ManagedApp | None: ...
     def get_all(self) -> Sequence[ManagedApp]: ...
     def get_active_apps(self) -> Sequence[ManagedApp]: ...
     def get_enabled(self) -> Sequence[ManagedApp]: ...  # Alias for get_active_apps
@@ -58,13 +59,14 @@ class IManagedAppRepository(Protocol):
 
 @runtime_checkable
 class ITrackedItemRepository(Protocol):
-    def get_by_id(self, id: int) -> TrackedItem | None: ...
+    def get_by_id(self, id: int, load: LoadProfile = "bare") -> TrackedItem | None: ...
     def get_by_app(self, app_id: int) -> Sequence[TrackedItem]: ...
     def get_by_arr_id(self, app_id: int, arr_id: int) -> TrackedItem | None: ...
     def get_items_for_search(
         self, app_id: int, sort_strategy: SortStrategy, limit: int, include_retries: bool = True
     ) -> Sequence[TrackedItem]: ...
     def get_retry_queue_size(self, app_id: int) -> int: ...
+    def sync_batch(self, app_id: int, records: list[dict]) -> dict[str, int]: ...
     def mark_searched(
         self, item_id: int, success: bool, next_retry_at: datetime | None = None
     ) -> TrackedItem | None: ...
@@ -93,7 +95,9 @@ class IProcessingLogRepository(Protocol):
         tracked_item_id: int | None = None,
     ) -> ProcessingLog: ...
     def cleanup_old_logs(self, days: int = 30) -> int: ...
-    def get_by_app(self, app_id: int, limit: int = 100) -> Sequence[ProcessingLog]: ...
+    def get_by_app(
+        self, app_id: int, limit: int = 100, after: tuple[datetime, int] | None = None
+    ) -> Sequence[ProcessingLog]: ...
     def get_recent(
         self, limit: int = 100
     ) -> Sequence[ProcessingLog]: ...  # Get recent logs across all apps
@@ -0,0 +1,94 @@
+"""Per-call relationship loading profiles for repository lookups.
+
+Mapper relationships stay lazy; a caller that needs related data asks for
+it explicitly so a single lookup never drags in a whole collection:
+
+    bare              the row only; relationships load lazily on access
+    with_app          TrackedItem plus its ManagedApp in the same SELECT
+    with_items_count  ManagedApp plus ``items_count`` from a correlated
+                      COUNT subquery (no tracked items are materialised)
+
+Usage:
+    item = uow.items.get_by_id(item_id, load="with_app")
+    app = uow.apps.get_by_id(app_id, load="with_items_count")
+    app.items_count  # -> int
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, Literal
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import joinedload, with_expression
+
+from researcharr.repositories.exceptions import ValidationError
+from researcharr.storage.models import ManagedApp, TrackedItem
+
+LoadProfile = Literal["bare", "with_app", "with_items_count"]
+
+
+def items_count_subquery() -> Any:
+    """Correlated COUNT of an app's tracked items, for use in ManagedApp queries."""
+    return (
+        select(func.count(TrackedItem.id))
+        .where(TrackedItem.app_id == ManagedApp.id)
+        .correlate(ManagedApp)
+        .scalar_subquery()
+    )
+
+
+_PROFILES: dict[type, dict[str, Callable[[], list[Any]]]] = {
+    ManagedApp: {
+        "bare": list,
+        "with_items_count": lambda: [
+            with_expression(ManagedApp.items_count, items_count_subquery())
+        ],
+    },
+    TrackedItem: {
+        "bare": list,
+        "with_app": lambda: [joinedload(TrackedItem.app)],
+    },
+}
+
+
+def load_options(model: type, profile: str) -> list[Any]:
+    """
+    Return the loader options implementing ``profile`` for ``model``.
+
+    Args:
+        model: Mapped class being queried
+        profile: Loading profile name
+
+    Returns:
+        Loader options to pass to ``Query.options()`` / ``Select.options()``
+
+    Raises:
+        ValidationError: If the profile is unknown or does not apply to ``model``
+    """
+    builders = _PROFILES.get(model, {"bare": list})
+    if profile not in builders:
+        raise ValidationError(
+            f"Unsupported load profile {profile!r} for {model.__name__}; "
+            f"expected one of {sorted(builders)}"
+        )
+    return builders[profile]()
+
+
+def apply_profile(stmt: Any, model: type, profile: str) -> Any:
+    """
+    Apply a loading profile to a Query or Select.
+
+    Column expressions are only computed when an object is first loaded, so
+    profiles that add one also refresh rows already in the identity map.
+    """
+    options = load_options(model, profile)
+    if not options:
+        return stmt
+    stmt = stmt.options(*options)
+    if profile == "with_items_count":
+        stmt = stmt.execution_options(populate_existing=True)
+    return stmt
+
+
+__all__ = ["LoadProfile", "apply_profile", "items_count_subquery", "load_options"]
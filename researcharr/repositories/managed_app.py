@@ -5,7 +5,6 @@ from __future__ import annotations
 from copy import deepcopy
 
 from sqlalchemy.exc import InvalidRequestError
-from sqlalchemy.orm import joinedload
 
 from researcharr.cache import get as cache_get
 from researcharr.cache import invalidate as cache_invalidate
@@ -14,6 +13,7 @@ from researcharr.cache import (
 )
 from researcharr.cache import set as cache_set
 from researcharr.repositories.exceptions import ValidationError
+from researcharr.repositories.loading import LoadProfile, apply_profile
 from researcharr.storage.models import AppType, ManagedApp
 from researcharr.validators import validate_managed_app
 
@@ -23,18 +23,27 @@ from .base import BaseRepository
 class ManagedAppRepository(BaseRepository[ManagedApp]):
     """Repository for managing Sonarr/Radarr app connections."""
 
-    def get_by_id(self, id: int) -> ManagedApp | None:
-        """Get app by ID."""
+    def get_by_id(self, id: int, load: LoadProfile = "bare") -> ManagedApp | None:
+        """
+        Get app by ID.
+
+        Args:
+            id: App ID
+            load: Loading profile ("bare" or "with_items_count"); tracked
+                items are never loaded eagerly
+
+        Returns:
+            ManagedApp instance or None if not found
+        """
+        if load != "bare":
+            # Aggregates are live values; bypass the entity cache
+            query = apply_profile(self.session.query(ManagedApp), ManagedApp, load)
+            return query.filter(ManagedApp.id == id).first()
         key = make_key(("ManagedApp", "id", id))
         cached = cache_get(key)
         if cached is not None:
             return self._reattach_cached_entity(cached)
-        result = (
-            self.session.query(ManagedApp)
-            .options(joinedload(ManagedApp.tracked_items))
-            .filter(ManagedApp.id == id)
-            .first()
-        )
+        result = self.session.query(ManagedApp).filter(ManagedApp.id == id).first()
         if result is not None:
             cache_set(key, self._snapshot_entity(result), ttl=120)
         return result
@@ -91,9 +100,23 @@ class ManagedAppRepository(BaseRepository[ManagedApp]):
         cache_set(key, self._snapshot_collection(result), ttl=60)
         return result
 
-    def get_page(self, page: int, page_size: int) -> list[ManagedApp]:
-        """Return a page of managed apps (no eager relations)."""
-        return self.paginate(ManagedApp, page, page_size)
+    def get_page(
+        self, page: int = 1, page_size: int = 50, *, after: int | None = None
+    ) -> list[ManagedApp]:
+        """
+        Return a page of managed apps ordered by id (no eager relations).
+
+        Args:
+            page: 1-based page number (OFFSET paging; ignored when ``after`` is set)
+            page_size: Number of rows per page
+            after: Keyset cursor - id of the last row of the previous page
+
+        Returns:
+            List of ManagedApp instances
+        """
+        if after is None:
+            return self.paginate(ManagedApp, page, page_size)
+        return self.keyset(self.session.query(ManagedApp), [ManagedApp.id], (after,), page_size)
 
     def get_by_type(self, app_type: AppType) -> list[ManagedApp]:
         """
@@ -2,7 +2,7 @@
 
 from datetime import datetime, timedelta
 
-from sqlalchemy import func
+from sqlalchemy.orm import aliased
 
 from researcharr.cache import get as cache_get
 from researcharr.cache import invalidate as cache_invalidate
@@ -11,22 +11,76 @@ from researcharr.cache import (
 )
 from researcharr.cache import set as cache_set
 from researcharr.repositories.exceptions import ValidationError
+from researcharr.storage import log_partitions, log_rollups
 from researcharr.storage.models import ProcessingLog
 from researcharr.validators import validate_processing_log
 
 from .base import BaseRepository
 
+_AGGREGATES = ("counts", "success_rate")
+
+
+def invalidate_app_aggregates(app_id: int | None = None) -> None:
+    """Drop cached event counts / success rates for one app (or all apps)."""
+    for name in _AGGREGATES:
+        if app_id is None:
+            cache_invalidate(make_key(("ProcessingLog", name, "")))
+        else:
+            cache_invalidate(make_key(("ProcessingLog", name, app_id, "")))
+
 
 class ProcessingLogRepository(BaseRepository[ProcessingLog]):
-    """Repository for managing processing logs."""
+    """Repository for managing processing logs.
+
+    When monthly partitioning is enabled (see
+    `researcharr.storage.log_partitions`) writes go to the newest partition
+    and reads are routed across partitions, newest first.
+    """
+
+    # Partition routing -------------------------------------------------
+    def _partitioned(self) -> bool:
+        return log_partitions.partitioning_enabled()
+
+    def _all_logs(self):
+        """Entity covering every log row (base table or the UNION ALL view)."""
+        if not self._partitioned() or not log_partitions.list_partitions(self.session.connection()):
+            return ProcessingLog
+        view = log_partitions.partition_table(log_partitions.VIEW_NAME)
+        return aliased(ProcessingLog, view, adapt_on_names=True)
+
+    def _recent(
+        self, limit: int, criteria, after: tuple[datetime, int] | None = None
+    ) -> list[ProcessingLog]:
+        """Newest ``limit`` logs matching ``criteria(entity)`` across partitions.
+
+        ``after`` is a ``(created_at, id)`` keyset cursor: only logs older
+        than that key are returned. Partitions are read newest first; once
+        ``limit`` rows are collected, older partitions (whose rows are all
+        older than the last one kept) are skipped.
+        """
+
+        def page(entity) -> list[ProcessingLog]:
+            query = self.session.query(entity).filter(*criteria(entity))
+            return self.keyset(query, [entity.created_at, entity.id], after, limit, descending=True)
+
+        if not self._partitioned():
+            return page(ProcessingLog)
+        rows: list[ProcessingLog] = []
+        for table, upper in log_partitions.log_sources(self.session.connection()):
+            if len(rows) >= limit and rows[limit - 1].created_at >= upper:
+                break
+            rows.extend(page(aliased(ProcessingLog, table, adapt_on_names=True)))
+            rows.sort(key=lambda r: (r.created_at, r.id), reverse=True)
+        return rows[:limit]
 
     def get_by_id(self, id: int) -> ProcessingLog | None:
         """Get processing log by ID."""
-        return self.session.query(ProcessingLog).filter(ProcessingLog.id == id).first()
+        logs = self._all_logs()
+        return self.session.query(logs).filter(logs.id == id).first()
 
     def get_all(self) -> list[ProcessingLog]:
         """Get all processing logs."""
-        return self.session.query(ProcessingLog).all()
+        return self.session.query(self._all_logs()).all()
 
     def create(self, entity: ProcessingLog) -> ProcessingLog:
         """Create new processing log."""
@@ -49,25 +103,35 @@ class ProcessingLogRepository(BaseRepository[ProcessingLog]):
             return True
         return False
 
-    def get_by_app(self, app_id: int, limit: int = 100) -> list[ProcessingLog]:
+    def get_by_app(
+        self, app_id: int, limit: int = 100, after: tuple[datetime, int] | None = None
+    ) -> list[ProcessingLog]:
         """
         # basedpyright: reportAttributeAccessIssue=false
-        Get recent processing logs for a specific app.
+        Get recent processing logs for a specific app, newest first.
 
         Args:
             app_id: ManagedApp ID
             limit: Maximum number of logs to return
+            after: Keyset cursor - ``(created_at, id)`` of the last log of the
+                   previous page
 
         Returns:
             List of ProcessingLog instances
         """
-        return (
-            self.session.query(ProcessingLog)
-            .filter(ProcessingLog.app_id == app_id)
-            .order_by(ProcessingLog.created_at.desc())
-            .limit(limit)
-            .all()
-        )
+        return self._recent(limit, lambda e: [e.app_id == app_id], after)
+
+    def get_recent(self, limit: int = 100) -> list[ProcessingLog]:
+        """
+        Get the most recent processing logs across all apps.
+
+        Args:
+            limit: Maximum number of logs to return
+
+        Returns:
+            List of ProcessingLog instances, newest first
+        """
+        return self._recent(limit, lambda e: [])
 
     def get_by_tracked_item(self, tracked_item_id: int) -> list[ProcessingLog]:
         """
@@ -79,10 +143,11 @@ class ProcessingLogRepository(BaseRepository[ProcessingLog]):
         Returns:
             List of ProcessingLog instances
         """
+        logs = self._all_logs()
         return (
-            self.session.query(ProcessingLog)
-            .filter(ProcessingLog.tracked_item_id == tracked_item_id)
-            .order_by(ProcessingLog.created_at.desc())
+            self.session.query(logs)
+            .filter(logs.tracked_item_id == tracked_item_id)
+            .order_by(logs.created_at.desc())
             .all()
         )
 
@@ -100,13 +165,7 @@ class ProcessingLogRepository(BaseRepository[ProcessingLog]):
         Returns:
             List of ProcessingLog instances
         """
-        return (
-            self.session.query(ProcessingLog)
-            .filter(ProcessingLog.app_id == app_id, ProcessingLog.event_type == event_type)
-            .order_by(ProcessingLog.created_at.desc())
-            .limit(limit)
-            .all()
-        )
+        return self._recent(limit, lambda e: [e.app_id == app_id, e.event_type == event_type])
 
     def log_event(
         self,
@@ -120,6 +179,12 @@ class ProcessingLogRepository(BaseRepository[ProcessingLog]):
         """
         Create a new log entry.
 
+        When this repository's session is bound to the application's write
+        engine, the event goes to the group-commit `AuditLogWriter`. The
+        caller does not wait for the insert, and the returned log is not
+        persisted yet (``id`` is None). In the writer's synchronous mode, or
+        for a session on another engine, the row is written in this session.
+
         Args:
             app_id: ManagedApp ID
             event_type: Type of event
@@ -144,17 +209,43 @@ class ProcessingLogRepository(BaseRepository[ProcessingLog]):
             validate_processing_log(log)
         except ValidationError:
             raise
-        self.session.add(log)
-        self.session.flush()
+        writer = self._deferred_writer()
+        if writer is not None:
+            writer.submit(app_id, event_type, message, success, details, tracked_item_id)
+            return log
+        if self._partitioned():
+            row = {c.name: getattr(log, c.name) for c in ProcessingLog.__table__.columns}
+            row.pop("id")
+            log.id = log_partitions.insert_row(self.session.connection(), row)
+        else:
+            self.session.add(log)
+            self.session.flush()
         # Invalidate cached aggregates for this app
-        prefix = make_key(("ProcessingLog", "", app_id))
-        cache_invalidate(prefix)
+        invalidate_app_aggregates(app_id)
         return log
 
+    def _deferred_writer(self):
+        """The background audit writer, if events from this session can use it."""
+        from researcharr.repositories.audit_log import get_audit_log_writer
+        from researcharr.storage import database
+
+        try:
+            engine = database.get_engine()
+        except RuntimeError:
+            return None
+        if self.session.get_bind() is not engine:
+            return None
+        writer = get_audit_log_writer()
+        return None if writer.synchronous else writer
+
     def cleanup_old_logs(self, days: int = 30) -> int:
         """
         Delete logs older than specified days.
 
+        With partitioning enabled, whole monthly partitions that ended before
+        the cutoff are dropped; rows in the partially expired month are kept
+        until that month expires as a whole.
+
         Args:
             days: Number of days to keep
 
@@ -162,20 +253,36 @@ class ProcessingLogRepository(BaseRepository[ProcessingLog]):
             Number of logs deleted
         """
         cutoff_date = datetime.utcnow() - timedelta(days=days)
-        deleted = (
+        dropped = 0
+        if self._partitioned():
+            dropped = log_partitions.drop_partitions_before(self.session.connection(), cutoff_date)
+        deleted = dropped + (
             self.session.query(ProcessingLog)
             .filter(ProcessingLog.created_at < cutoff_date)
             .delete()
         )
         self.session.flush()
         if deleted:
-            prefix = make_key(("ProcessingLog", "", ""))
-            cache_invalidate(prefix)
+            # Bulk deletes bypass the rollup listeners: recount expired hours
+            log_rollups.rebuild(self.session.connection(), end=cutoff_date)
+            invalidate_app_aggregates()
         return deleted
 
+    def compact_rollups(self, hours: int = 2) -> None:
+        """
+        Recompute the hourly statistics rollups for the last ``hours`` hours.
+
+        Rollups are maintained at insert time; this repairs drift from
+        writes that bypass the repository (updates, manual SQL).
+        """
+        since = datetime.utcnow() - timedelta(hours=hours)
+        log_rollups.rebuild(self.session.connection(), start=since)
+        invalidate_app_aggregates()
+
     def get_event_counts(self, app_id: int, since: datetime | None = None) -> dict[str, int]:
         """Return counts of events by type for an app, optionally since a timestamp.
 
+        Read from the hourly rollups (see `researcharr.storage.log_rollups`).
         Cached with small TTL; since timestamp is bucketed to 60s to limit key churn.
         """
         bucket: int | str
@@ -188,20 +295,16 @@ class ProcessingLogRepository(BaseRepository[ProcessingLog]):
         cached = cache_get(key)
         if cached is not None:
             return cached
-        q = self.session.query(ProcessingLog.event_type, func.count(ProcessingLog.id)).filter(
-            ProcessingLog.app_id == app_id
-        )
-        if since is not None:
-            q = q.filter(ProcessingLog.created_at >= since)
-        rows = q.group_by(ProcessingLog.event_type).all()
-        result = {etype: int(count) for etype, count in rows}
+        totals = log_rollups.totals(self.session.connection(), app_id, since)
+        result = {etype: total for etype, (total, _) in totals.items()}
         cache_set(key, result, ttl=30)
         return result
 
     def get_success_rate(self, app_id: int, since: datetime | None = None) -> float:
         """Return fraction of successful events for an app (0.0-1.0).
 
-        Cached using same 60s bucket strategy as event counts.
+        Computed from the same single rollup query as the event counts and
+        cached using the same 60s bucket strategy.
         """
         bucket: int | str
         if since is not None:
@@ -212,20 +315,12 @@ class ProcessingLogRepository(BaseRepository[ProcessingLog]):
         cached = cache_get(key)
         if cached is not None:
             return cached
-        q_total = self.session.query(func.count(ProcessingLog.id)).filter(
-            ProcessingLog.app_id == app_id
-        )
-        q_success = self.session.query(func.count(ProcessingLog.id)).filter(
-            ProcessingLog.app_id == app_id, ProcessingLog.success.is_(True)
-        )
-        if since is not None:
-            q_total = q_total.filter(ProcessingLog.created_at >= since)
-            q_success = q_success.filter(ProcessingLog.created_at >= since)
-        total = int(q_total.scalar() or 0)
+        totals = log_rollups.totals(self.session.connection(), app_id, since)
+        total = sum(t for t, _ in totals.values())
         if total == 0:
             cache_set(key, 0.0, ttl=30)
             return 0.0
-        success = int(q_success.scalar() or 0)
+        success = sum(ok for _, ok in totals.values())
         rate = success / total
         cache_set(key, rate, ttl=30)
         return rate
@@ -0,0 +1,192 @@
+"""Lightweight read models for listing endpoints.
+
+Listing paths (API pages, dashboards, the activity feed) only serialise
+rows to JSON, so materialising ORM entities - identity map entries, change
+tracking state, lazy-load hooks - is wasted work. `ReadModelRepository`
+selects just the needed columns and builds frozen ``__slots__``
+dataclasses straight from the result tuples.
+
+Views are plain values: they are not attached to a session, cannot be
+modified or flushed, and stay usable after the session closes.
+
+Usage:
+    with UnitOfWork(read_only=True) as uow:
+        rows = uow.views.logs_by_app(app_id, limit=50)
+        payload = [row.to_dict() for row in rows]
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from datetime import datetime
+from enum import Enum
+from itertools import starmap
+from typing import Any, TypeVar
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+
+from researcharr.storage import log_partitions
+from researcharr.storage.models import ManagedApp, TrackedItem
+
+V = TypeVar("V")
+
+
+class _View:
+    """JSON helpers shared by the view dataclasses."""
+
+    __slots__ = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-ready dict (datetimes as ISO strings, enums as values)."""
+        data = {}
+        for name in self.__slots__:  # the dataclass fields, in order
+            value = getattr(self, name)
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            elif isinstance(value, Enum):
+                value = value.value
+            data[name] = value
+        return data
+
+
+@dataclass(frozen=True, slots=True)
+class ManagedAppView(_View):
+    """Listing projection of ManagedApp (never includes the API key)."""
+
+    id: int
+    app_type: Any
+    name: str
+    base_url: str
+    is_active: bool
+    created_at: datetime
+    last_sync_at: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class TrackedItemView(_View):
+    """Listing projection of TrackedItem."""
+
+    id: int
+    app_id: int
+    arr_id: int
+    title: str
+    year: int | None
+    monitored: bool
+    has_file: bool
+    custom_format_score: float
+    search_count: int
+    last_search_at: datetime | None
+    next_retry_at: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class ProcessingLogView(_View):
+    """Listing projection of ProcessingLog."""
+
+    id: int
+    app_id: int
+    tracked_item_id: int | None
+    event_type: str
+    message: str
+    success: bool
+    created_at: datetime
+
+
+def _columns(view: type, table) -> list[Any]:
+    return [table.c[f.name] for f in fields(view)]
+
+
+class ReadModelRepository:
+    """Column-projection queries returning view dataclasses."""
+
+    def __init__(self, session: Session):
+        """
+        Initialize with a database session.
+
+        Args:
+            session: SQLAlchemy session (typically a read-only one)
+        """
+        self.session = session
+
+    def _fetch(self, view: type[V], stmt) -> list[V]:
+        return list(starmap(view, self.session.execute(stmt).tuples()))
+
+    # Managed apps --------------------------------------------------------
+    def apps_page(self, limit: int = 50, after: int | None = None) -> list[ManagedAppView]:
+        """Return managed apps ordered by id, after the keyset cursor ``after``."""
+        table = ManagedApp.__table__
+        stmt = select(*_columns(ManagedAppView, table))
+        if after is not None:
+            stmt = stmt.where(table.c.id > after)
+        return self._fetch(ManagedAppView, stmt.order_by(table.c.id).limit(limit))
+
+    # Tracked items -------------------------------------------------------
+    def items_by_app(self, app_id: int) -> list[TrackedItemView]:
+        """Return every tracked item of an app ordered by id."""
+        table = TrackedItem.__table__
+        stmt = (
+            select(*_columns(TrackedItemView, table))
+            .where(table.c.app_id == app_id)
+            .order_by(table.c.id)
+        )
+        return self._fetch(TrackedItemView, stmt)
+
+    def all_items(self) -> list[TrackedItemView]:
+        """Return every tracked item ordered by id."""
+        table = TrackedItem.__table__
+        stmt = select(*_columns(TrackedItemView, table)).order_by(table.c.id)
+        return self._fetch(TrackedItemView, stmt)
+
+    def items_page(self, limit: int = 50, after: int | None = None) -> list[TrackedItemView]:
+        """Return tracked items ordered by id, after the keyset cursor ``after``."""
+        table = TrackedItem.__table__
+        stmt = select(*_columns(TrackedItemView, table))
+        if after is not None:
+            stmt = stmt.where(table.c.id > after)
+        return self._fetch(TrackedItemView, stmt.order_by(table.c.id).limit(limit))
+
+    # Processing logs -----------------------------------------------------
+    def logs_by_app(
+        self, app_id: int, limit: int = 100, after: tuple[datetime, int] | None = None
+    ) -> list[ProcessingLogView]:
+        """Return an app's logs newest first, older than the ``(created_at, id)`` cursor."""
+        return self._recent_logs(limit, after, app_id)
+
+    def recent_logs(self, limit: int = 100) -> list[ProcessingLogView]:
+        """Return the newest logs across all apps (the activity feed)."""
+        return self._recent_logs(limit, None, None)
+
+    def _recent_logs(
+        self, limit: int, after: tuple[datetime, int] | None, app_id: int | None
+    ) -> list[ProcessingLogView]:
+        def page(table) -> list[ProcessingLogView]:
+            key = (table.c.created_at, table.c.id)
+            stmt = select(*_columns(ProcessingLogView, table))
+            if app_id is not None:
+                stmt = stmt.where(table.c.app_id == app_id)
+            if after is not None:
+                stmt = stmt.where(tuple_(*key) < tuple_(*after))
+            return self._fetch(
+                ProcessingLogView, stmt.order_by(*(c.desc() for c in key)).limit(limit)
+            )
+
+        if not log_partitions.partitioning_enabled():
+            return page(log_partitions.base_table())
+        # Mirrors ProcessingLogRepository._recent: newest partition first,
+        # stop once older partitions cannot contribute.
+        rows: list[ProcessingLogView] = []
+        for table, upper in log_partitions.log_sources(self.session.connection()):
+            if len(rows) >= limit and rows[limit - 1].created_at >= upper:
+                break
+            rows.extend(page(table))
+            rows.sort(key=lambda r: (r.created_at, r.id), reverse=True)
+        return rows[:limit]
+
+
+__all__ = [
+    "ManagedAppView",
+    "TrackedItemView",
+    "ProcessingLogView",
+    "ReadModelRepository",
+]
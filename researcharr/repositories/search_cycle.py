@@ -10,7 +10,8 @@ from researcharr.cache import (
     make_key,
 )
 from researcharr.cache import set as cache_set
-from researcharr.repositories.exceptions import ValidationError
+from researcharr.repositories import statements
+from researcharr.repositories.exceptions import NotFoundError, ValidationError
 from researcharr.storage.models import CyclePhase, SearchCycle
 from researcharr.validators import validate_search_cycle
 
@@ -87,12 +88,7 @@ class SearchCycleRepository(BaseRepository[SearchCycle]):
         Returns:
             Latest SearchCycle or None
         """
-        return (
-            self.session.query(SearchCycle)
-            .filter(SearchCycle.app_id == app_id)
-            .order_by(SearchCycle.cycle_number.desc())
-            .first()
-        )
+        return self.session.scalars(statements.LATEST_CYCLE, {"app_id": app_id}).first()
 
     def get_active_cycle(self, app_id: int) -> SearchCycle | None:
         """
@@ -104,11 +100,7 @@ class SearchCycleRepository(BaseRepository[SearchCycle]):
         Returns:
             Active SearchCycle or None
         """
-        return (
-            self.session.query(SearchCycle)
-            .filter(SearchCycle.app_id == app_id, SearchCycle.completed_at.is_(None))
-            .first()
-        )
+        return self.session.scalars(statements.ACTIVE_CYCLE, {"app_id": app_id}).first()
 
     def create_cycle(self, app_id: int) -> SearchCycle:
         """
@@ -119,9 +111,17 @@ class SearchCycleRepository(BaseRepository[SearchCycle]):
 
         Returns:
             New SearchCycle instance
+
+        Raises:
+            NotFoundError: If the app does not exist
         """
-        latest = self.get_latest_cycle(app_id)
-        next_cycle_number = (latest.cycle_number + 1) if latest else 1
+        # Atomic per-app counter: safe with several workers, and no read of
+        # the (possibly cached) latest cycle
+        next_cycle_number = self.session.execute(
+            statements.ALLOCATE_CYCLE_NUMBER, {"app_id": app_id}
+        ).scalar()
+        if next_cycle_number is None:
+            raise NotFoundError(f"ManagedApp {app_id} not found")
 
         cycle = SearchCycle(
             app_id=app_id,
@@ -199,12 +199,7 @@ class SearchCycleRepository(BaseRepository[SearchCycle]):
             except Exception:  # nosec B110 -- intentional broad except for resilience
                 # If resolution fails, fall through to DB query
                 pass
-        result = (
-            self.session.query(SearchCycle)
-            .filter(SearchCycle.app_id == app_id)
-            .order_by(SearchCycle.cycle_number.desc())
-            .first()
-        )
+        result = self.session.scalars(statements.LATEST_CYCLE, {"app_id": app_id}).first()
         if result is not None:
             # store id only
             cache_set(key, result.id, ttl=30)
@@ -218,11 +213,7 @@ class SearchCycleRepository(BaseRepository[SearchCycle]):
                 return self.session.get(SearchCycle, int(cached))
             except Exception:  # nosec B110 -- intentional broad except for resilience
                 pass
-        result = (
-            self.session.query(SearchCycle)
-            .filter(SearchCycle.app_id == app_id, SearchCycle.completed_at.is_(None))
-            .first()
-        )
+        result = self.session.scalars(statements.ACTIVE_CYCLE, {"app_id": app_id}).first()
         if result is not None:
             cache_set(key, result.id, ttl=30)
         return result
@@ -0,0 +1,125 @@
+"""Prebuilt statements for the hot repository queries.
+
+The search loop calls these lookups for every app and item on every cycle.
+Building a ``session.query()`` per call costs more than running the query:
+the ORM constructs the statement, then derives its cache key before it can
+reuse the compiled SQL. These ``select()`` constructs are built once at
+import with ``bindparam`` placeholders, so each call only binds values and
+hits SQLAlchemy's compiled cache.
+
+Shared by the sync and async repositories. See
+``benchmarks/bench_statement_cache.py`` for per-call numbers.
+
+Usage:
+    stmt = statements.items_for_search(sort_strategy, include_retries=True)
+    session.scalars(stmt, {"app_id": 1, "now": now, "limit": 5}).all()
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import and_, bindparam, func, or_, select, update
+from sqlalchemy.sql import Select
+
+from researcharr.storage.models import ManagedApp, SearchCycle, SortStrategy, TrackedItem
+
+SEARCH_ORDER: dict[SortStrategy, Any] = {
+    SortStrategy.CUSTOM_FORMAT_SCORE_ASC: TrackedItem.custom_format_score.asc(),
+    SortStrategy.CUSTOM_FORMAT_SCORE_DESC: TrackedItem.custom_format_score.desc(),
+    SortStrategy.ALPHABETICAL_ASC: TrackedItem.title.asc(),
+    SortStrategy.ALPHABETICAL_DESC: TrackedItem.title.desc(),
+    # App-aware: TMDB for Radarr, TVDB for Sonarr
+    SortStrategy.EXTERNAL_ID_ASC: func.coalesce(TrackedItem.tmdb_id, TrackedItem.tvdb_id).asc(),
+    SortStrategy.EXTERNAL_ID_DESC: func.coalesce(TrackedItem.tmdb_id, TrackedItem.tvdb_id).desc(),
+    SortStrategy.RANDOM: func.random(),  # SQLite RANDOM()
+}
+
+# Parameters: app_id, arr_id
+ITEM_BY_ARR_ID = (
+    select(TrackedItem)
+    .where(TrackedItem.app_id == bindparam("app_id"), TrackedItem.arr_id == bindparam("arr_id"))
+    .limit(1)
+)
+
+# Parameters: app_id
+LATEST_CYCLE = (
+    select(SearchCycle)
+    .where(SearchCycle.app_id == bindparam("app_id"))
+    .order_by(SearchCycle.cycle_number.desc())
+    .limit(1)
+)
+
+# Parameters: app_id
+ACTIVE_CYCLE = (
+    select(SearchCycle)
+    .where(SearchCycle.app_id == bindparam("app_id"), SearchCycle.completed_at.is_(None))
+    .limit(1)
+)
+
+
+# Parameters: app_id. Returns the allocated cycle number; no row when the
+# app does not exist. The UPDATE takes the write lock, so concurrent
+# workers never receive the same number.
+_apps = ManagedApp.__table__
+ALLOCATE_CYCLE_NUMBER = (
+    update(_apps)
+    .where(_apps.c.id == bindparam("app_id"))
+    # Keep updated_at: it tracks app configuration edits, not cycle activity
+    .values(next_cycle_number=_apps.c.next_cycle_number + 1, updated_at=_apps.c.updated_at)
+    .returning(_apps.c.next_cycle_number - 1)
+)
+
+
+def _build_items_for_search(order: Any, include_retries: bool) -> Select:
+    stmt = select(TrackedItem).where(
+        TrackedItem.app_id == bindparam("app_id"),
+        TrackedItem.monitored,
+        ~TrackedItem.has_file,
+    )
+    if include_retries:
+        # Never searched, or due for a retry
+        stmt = stmt.where(
+            or_(
+                TrackedItem.last_search_at.is_(None),
+                and_(
+                    TrackedItem.next_retry_at.isnot(None),
+                    TrackedItem.next_retry_at <= bindparam("now"),
+                ),
+            )
+        )
+    else:
+        # Exclude items in the retry queue
+        stmt = stmt.where(TrackedItem.last_search_at.is_(None))
+    if order is not None:
+        stmt = stmt.order_by(order)
+    return stmt.limit(bindparam("limit"))
+
+
+_ITEMS_FOR_SEARCH: dict[tuple[SortStrategy | None, bool], Select] = {
+    (strategy, include_retries): _build_items_for_search(order, include_retries)
+    for strategy, order in [*SEARCH_ORDER.items(), (None, None)]
+    for include_retries in (True, False)
+}
+
+
+def items_for_search(sort_strategy: SortStrategy | str | None, include_retries: bool) -> Select:
+    """
+    Return the prebuilt search-candidate statement for a strategy.
+
+    Parameters: ``app_id``, ``limit`` and, with ``include_retries``, ``now``.
+    Unknown strategies fall back to database order.
+    """
+    key = (sort_strategy, include_retries)
+    stmt = _ITEMS_FOR_SEARCH.get(key)  # type: ignore[arg-type]
+    return stmt if stmt is not None else _ITEMS_FOR_SEARCH[(None, include_retries)]
+
+
+__all__ = [
+    "ACTIVE_CYCLE",
+    "ALLOCATE_CYCLE_NUMBER",
+    "ITEM_BY_ARR_ID",
+    "LATEST_CYCLE",
+    "SEARCH_ORDER",
+    "items_for_search",
+]
@@ -2,10 +2,9 @@
 
 from datetime import datetime
 
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import joinedload
-
+from researcharr.repositories import statements
 from researcharr.repositories.exceptions import ValidationError
+from researcharr.repositories.loading import LoadProfile, apply_profile
 from researcharr.storage.models import SortStrategy, TrackedItem
 from researcharr.validators import validate_tracked_item
 
@@ -15,14 +14,19 @@ from .base import BaseRepository
 class TrackedItemRepository(BaseRepository[TrackedItem]):
     """Repository for managing tracked media items."""
 
-    def get_by_id(self, id: int) -> TrackedItem | None:
-        """Get tracked item by ID."""
-        return (
-            self.session.query(TrackedItem)
-            .options(joinedload(TrackedItem.app))
-            .filter(TrackedItem.id == id)
-            .first()
-        )
+    def get_by_id(self, id: int, load: LoadProfile = "bare") -> TrackedItem | None:
+        """
+        Get tracked item by ID.
+
+        Args:
+            id: Item ID
+            load: Loading profile ("bare" or "with_app")
+
+        Returns:
+            TrackedItem instance or None if not found
+        """
+        query = apply_profile(self.session.query(TrackedItem), TrackedItem, load)
+        return query.filter(TrackedItem.id == id).first()
 
     def get_all(self) -> list[TrackedItem]:
         """Get all tracked items."""
@@ -70,9 +74,23 @@ class TrackedItemRepository(BaseRepository[TrackedItem]):
         """
         return self.session.query(TrackedItem).filter(TrackedItem.app_id == app_id).all()
 
-    def get_page(self, page: int, page_size: int) -> list[TrackedItem]:
-        """Return paginated tracked items (simple ordering by id)."""
-        return self.paginate(TrackedItem, page, page_size)
+    def get_page(
+        self, page: int = 1, page_size: int = 50, *, after: int | None = None
+    ) -> list[TrackedItem]:
+        """
+        Return a page of tracked items ordered by id.
+
+        Args:
+            page: 1-based page number (OFFSET paging; ignored when ``after`` is set)
+            page_size: Number of rows per page
+            after: Keyset cursor - id of the last row of the previous page
+
+        Returns:
+            List of TrackedItem instances
+        """
+        if after is None:
+            return self.paginate(TrackedItem, page, page_size)
+        return self.keyset(self.session.query(TrackedItem), [TrackedItem.id], (after,), page_size)
 
     def get_by_arr_id(self, app_id: int, arr_id: int) -> TrackedItem | None:
         """
@@ -85,11 +103,54 @@ class TrackedItemRepository(BaseRepository[TrackedItem]):
         Returns:
             TrackedItem instance or None
         """
-        return (
-            self.session.query(TrackedItem)
-            .filter(TrackedItem.app_id == app_id, TrackedItem.arr_id == arr_id)
-            .first()
-        )
+        params = {"app_id": app_id, "arr_id": arr_id}
+        return self.session.scalars(statements.ITEM_BY_ARR_ID, params).first()
+
+    def sync_batch(self, app_id: int, records: list[dict]) -> dict[str, int]:
+        """
+        Upsert a chunk of projected *arr records by ``arr_id``.
+
+        Existing rows for the chunk are loaded with a single ``IN`` query;
+        search/retry state is left untouched so a resync never resets the
+        retry queue.
+
+        Args:
+            app_id: ManagedApp ID
+            records: Dicts keyed by TrackedItem column names (see
+                ``researcharr.ingest.project_tracked_item``); ``arr_id`` required
+
+        Returns:
+            Dict with ``created`` and ``updated`` counts
+        """
+        if not records:
+            return {"created": 0, "updated": 0}
+        by_arr_id = {int(r["arr_id"]): r for r in records}
+        existing = {
+            item.arr_id: item
+            for item in self.session.query(TrackedItem).filter(
+                TrackedItem.app_id == app_id,
+                TrackedItem.arr_id.in_(list(by_arr_id)),
+            )
+        }
+        now = datetime.utcnow()
+        created = updated = 0
+        for arr_id, fields in by_arr_id.items():
+            item = existing.get(arr_id)
+            if item is None:
+                item = TrackedItem(app_id=app_id, **fields)
+                self.session.add(item)
+                created += 1
+            else:
+                for key, value in fields.items():
+                    setattr(item, key, value)
+                updated += 1
+            item.last_synced_at = now
+            try:
+                validate_tracked_item(item)
+            except ValidationError:
+                raise
+        self.session.flush()
+        return {"created": created, "updated": updated}
 
     def get_items_for_search(
         self,
@@ -110,53 +171,11 @@ class TrackedItemRepository(BaseRepository[TrackedItem]):
         Returns:
             List of TrackedItem instances ready for search
         """
-        query = self.session.query(TrackedItem).filter(
-            TrackedItem.app_id == app_id,
-            TrackedItem.monitored,
-            ~TrackedItem.has_file,
-        )
-
-        # Handle retry queue filtering
+        params: dict = {"app_id": app_id, "limit": limit}
         if include_retries:
-            # Include items never searched OR items ready for retry
-            query = query.filter(
-                or_(
-                    TrackedItem.last_search_at.is_(None),
-                    and_(
-                        TrackedItem.next_retry_at.isnot(None),
-                        TrackedItem.next_retry_at <= datetime.utcnow(),
-                    ),
-                )
-            )
-        else:
-            # Exclude items in retry queue
-            query = query.filter(TrackedItem.last_search_at.is_(None))
-
-        # Apply sort strategy
-        if sort_strategy == SortStrategy.CUSTOM_FORMAT_SCORE_ASC:
-            query = query.order_by(TrackedItem.custom_format_score.asc())
-        elif sort_strategy == SortStrategy.CUSTOM_FORMAT_SCORE_DESC:
-            query = query.order_by(TrackedItem.custom_format_score.desc())
-        elif sort_strategy == SortStrategy.ALPHABETICAL_ASC:
-            query = query.order_by(TrackedItem.title.asc())
-        elif sort_strategy == SortStrategy.ALPHABETICAL_DESC:
-            query = query.order_by(TrackedItem.title.desc())
-        elif sort_strategy == SortStrategy.EXTERNAL_ID_ASC:
-            # App-aware: prioritize TMDB for Radarr, TVDB for Sonarr
-            from sqlalchemy import func
-
-            query = query.order_by(func.coalesce(TrackedItem.tmdb_id, TrackedItem.tvdb_id).asc())
-        elif sort_strategy == SortStrategy.EXTERNAL_ID_DESC:
-            from sqlalchemy import func
-
-            query = query.order_by(func.coalesce(TrackedItem.tmdb_id, TrackedItem.tvdb_id).desc())
-        elif sort_strategy == SortStrategy.RANDOM:
-            # SQLite-specific random ordering
-            from sqlalchemy import func
-
-            query = query.order_by(func.random())
-
-        return query.limit(limit).all()
+            params["now"] = datetime.utcnow()
+        stmt = statements.items_for_search(sort_strategy, include_retries)
+        return list(self.session.scalars(stmt, params).all())
 
     def get_retry_queue_size(self, app_id: int) -> int:
         """
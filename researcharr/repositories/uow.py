@@ -5,6 +5,10 @@ Session by default (via `researcharr.storage.database.get_session()`)
 so that multiple repository operations can be performed atomically with
 centralized commit/rollback. An external Session can also be supplied
 for composition in higher-level transactions.
+
+Pass ``read_only=True`` for query-only work (dashboards, API listings):
+the session then comes from the read-only pool via
+`get_read_session()` and never queues behind a sync transaction.
 """
 
 from __future__ import annotations
@@ -16,16 +20,18 @@ from sqlalchemy.orm import Session
 from researcharr.repositories.global_settings import GlobalSettingsRepository
 from researcharr.repositories.managed_app import ManagedAppRepository
 from researcharr.repositories.processing_log import ProcessingLogRepository
+from researcharr.repositories.read_models import ReadModelRepository
 from researcharr.repositories.search_cycle import SearchCycleRepository
 from researcharr.repositories.tracked_item import TrackedItemRepository
-from researcharr.storage.database import get_session
+from researcharr.storage.database import get_read_session, get_session
 
 
 class UnitOfWork(AbstractContextManager["UnitOfWork"]):
     """Coordinates a transactional set of repository operations."""
 
-    def __init__(self, session: Session | None = None):
+    def __init__(self, session: Session | None = None, *, read_only: bool = False):
         self._external_session = session
+        self.read_only = read_only
         self._session: Session | None = None
         self._ctx = None
         # Lazy-initialized repositories bound to the active session
@@ -34,6 +40,7 @@ class UnitOfWork(AbstractContextManager["UnitOfWork"]):
         self._logs: ProcessingLogRepository | None = None
         self._cycles: SearchCycleRepository | None = None
         self._settings: GlobalSettingsRepository | None = None
+        self._views: ReadModelRepository | None = None
 
     # Context manager protocol
     def __enter__(self) -> UnitOfWork:
@@ -41,7 +48,7 @@ class UnitOfWork(AbstractContextManager["UnitOfWork"]):
             self._session = self._external_session
         else:
             # Acquire managed session context
-            self._ctx = get_session()
+            self._ctx = get_read_session() if self.read_only else get_session()
             self._session = self._ctx.__enter__()
         return self
 
@@ -95,6 +102,13 @@ class UnitOfWork(AbstractContextManager["UnitOfWork"]):
             self._settings = GlobalSettingsRepository(self.session)
         return self._settings
 
+    @property
+    def views(self) -> ReadModelRepository:
+        """Column-projection read models for listings (see `read_models`)."""
+        if self._views is None:
+            self._views = ReadModelRepository(self.session)
+        return self._views
+
     # Optional explicit commit for external sessions
     def commit(self) -> None:
         if self._session is not None and self._external_session is not None:
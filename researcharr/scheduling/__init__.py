@@ -3,6 +3,19 @@
 from __future__ import annotations
 
 from .backup_scheduler import BackupSchedulerService
+from .batch_search import BatchSearchDispatcher
+from .cycle_orchestrator import AppCycleSettings, CycleOrchestrator, CycleWriter
 from .database_scheduler import DatabaseSchedulerService
+from .retry_scheduler import RetryScheduler
+from .timing_wheel import TimingWheel
 
-__all__ = ["BackupSchedulerService", "DatabaseSchedulerService"]
+__all__ = [
+    "AppCycleSettings",
+    "BackupSchedulerService",
+    "BatchSearchDispatcher",
+    "CycleOrchestrator",
+    "CycleWriter",
+    "DatabaseSchedulerService",
+    "RetryScheduler",
+    "TimingWheel",
+]
@@ -0,0 +1,174 @@
+"""Batched search commands for Radarr and Sonarr.
+
+Searching one item at a time costs one ``POST /api/v3/command`` per item.
+Radarr's ``MoviesSearch`` command takes a list of movie IDs. The
+`BatchSearchDispatcher` therefore groups a cycle's items into commands of
+``batch_size`` IDs, records the command IDs the *arr returns, and polls
+all of them with a single ``GET /api/v3/command`` per round. A cycle of N
+items costs about N / ``batch_size`` submissions plus a few polls.
+
+Sonarr's ``SeriesSearch`` takes a single ``seriesId``, and tracked Sonarr
+items are series. Sonarr items are therefore submitted one command per
+series, but their completion is still polled together.
+
+A command that ends ``failed``, ``aborted``, ``cancelled`` or ``orphaned``
+fails every item in its batch, and so does a rejected submission. A
+command still queued or running when ``completion_timeout`` runs out
+counts as a success, because the *arr accepted the search and will finish
+it on its own.
+
+Example:
+    dispatcher = BatchSearchDispatcher(batch_size=50)
+    orchestrator = CycleOrchestrator(sync=fetch_library, batch_search=dispatcher)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from researcharr.core.async_http import get_async_http_client
+from researcharr.storage.models import AppType
+
+if TYPE_CHECKING:
+    from researcharr.scheduling.cycle_orchestrator import AppCycleSettings
+    from researcharr.storage.models import TrackedItem
+
+logger = logging.getLogger(__name__)
+
+FAILED_STATUSES = frozenset({"failed", "aborted", "cancelled", "orphaned"})
+DONE_STATUSES = FAILED_STATUSES | {"completed"}
+
+
+class BatchSearchDispatcher:
+    """Submits searches as ID-list commands and polls them to completion.
+
+    Args:
+        batch_size: Item IDs per ``MoviesSearch`` command
+        poll_interval: Seconds between ``GET /api/v3/command`` polls
+        completion_timeout: Seconds to wait for submitted commands to finish
+        http: Async client with ``get``/``post`` coroutines (the shared
+            `researcharr.core.async_http` client for the running loop if
+            omitted)
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = 50,
+        poll_interval: float = 5.0,
+        completion_timeout: float = 600.0,
+        http: Any = None,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.completion_timeout = completion_timeout
+        self._http = http
+        self.metrics = {"commands": 0, "polls": 0, "rejected": 0, "failed": 0}
+
+    @property
+    def http(self) -> Any:
+        if self._http is None:
+            return get_async_http_client()
+        return self._http
+
+    def commands_for(self, app: AppCycleSettings, arr_ids: Sequence[int]) -> list[dict[str, Any]]:
+        """Return the command bodies that search ``arr_ids`` on ``app``."""
+        if app.app_type == AppType.RADARR:
+            return [
+                {"name": "MoviesSearch", "movieIds": list(arr_ids[i : i + self.batch_size])}
+                for i in range(0, len(arr_ids), self.batch_size)
+            ]
+        if app.app_type == AppType.SONARR:
+            return [{"name": "SeriesSearch", "seriesId": arr_id} for arr_id in arr_ids]
+        raise ValueError(f"batched search is not supported for {app.app_type}")
+
+    async def _submit(self, app: AppCycleSettings, command: dict[str, Any]) -> int | None:
+        try:
+            r = await self.http.post(
+                f"{app.base_url}/api/v3/command",
+                params={"apikey": app.api_key},
+                json=command,
+            )
+            if r.status_code in (200, 201):
+                self.metrics["commands"] += 1
+                return int(r.json()["id"])
+            logger.warning(
+                "%s rejected %s command with status %s", app.name, command["name"], r.status_code
+            )
+        except Exception:
+            logger.exception("Submitting %s command to %s failed", command["name"], app.name)
+        self.metrics["rejected"] += 1
+        return None
+
+    async def _poll(self, app: AppCycleSettings, pending: set[int]) -> dict[int, str]:
+        """Wait until every command in ``pending`` is done; returns the final statuses."""
+        statuses: dict[int, str] = {}
+        deadline = time.monotonic() + self.completion_timeout
+        while pending:
+            delay = min(self.poll_interval, deadline - time.monotonic())
+            if delay <= 0:
+                logger.info(
+                    "%d search commands on %s still running after %ss",
+                    len(pending),
+                    app.name,
+                    self.completion_timeout,
+                )
+                break
+            await asyncio.sleep(delay)
+            try:
+                r = await self.http.get(
+                    f"{app.base_url}/api/v3/command", params={"apikey": app.api_key}
+                )
+                self.metrics["polls"] += 1
+                r.raise_for_status()
+                commands = r.json()
+            except Exception:
+                logger.warning("Polling commands on %s failed", app.name, exc_info=True)
+                continue
+            seen = set()
+            for command in commands:
+                command_id = command.get("id")
+                if command_id in pending:
+                    seen.add(command_id)
+                    status = str(command.get("status", "")).lower()
+                    if status in DONE_STATUSES:
+                        statuses[command_id] = status
+                        pending.discard(command_id)
+            # The *arr prunes finished commands from the list after a while
+            for command_id in pending - seen:
+                statuses[command_id] = "completed"
+            pending &= seen
+        return statuses
+
+    async def search(self, app: AppCycleSettings, items: Sequence[TrackedItem]) -> list[bool]:
+        """Search ``items`` on ``app``; returns one success flag per item, in order."""
+        if not items:
+            return []
+        commands = self.commands_for(app, [item.arr_id for item in items])
+        command_ids = await asyncio.gather(*(self._submit(app, c) for c in commands))
+        statuses = await self._poll(app, {cid for cid in command_ids if cid is not None})
+
+        ok_by_arr_id: dict[int, bool] = {}
+        for command, command_id in zip(commands, command_ids, strict=True):
+            ok = command_id is not None and statuses.get(command_id) not in FAILED_STATUSES
+            if command_id is not None and not ok:
+                self.metrics["failed"] += 1
+                logger.warning(
+                    "%s command %s on %s ended %s",
+                    command["name"],
+                    command_id,
+                    app.name,
+                    statuses[command_id],
+                )
+            for arr_id in command.get("movieIds") or [command.get("seriesId")]:
+                ok_by_arr_id[arr_id] = ok
+        return [ok_by_arr_id[item.arr_id] for item in items]
+
+
+__all__ = ["BatchSearchDispatcher"]
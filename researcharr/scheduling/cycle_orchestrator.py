@@ -0,0 +1,538 @@
+"""In-process search-cycle orchestrator.
+
+Runs search cycles for every active `ManagedApp` on the event loop, each app
+on its own schedule (the ``next_cycle_at`` of its latest cycle). A cycle
+moves through the `CyclePhase` phases:
+
+- SYNCING: ``sync(app)`` fetches the app's library; the returned records are
+  upserted with ``sync_batch``.
+- SEARCHING: the due items are pushed through the app's
+  `async_pipeline.Pipeline`, whose search stage runs ``search(app, item)``
+  with the app's concurrency limit. With a `BatchSearchDispatcher` the
+  items are instead submitted as ID-list search commands.
+- COOLDOWN: the cycle is completed with its ``next_cycle_at`` and the app's
+  task sleeps until then.
+
+Every app runs in its own task, and the sync and each search are bounded by
+timeouts, so a slow *arr instance only delays its own cycle. Phase
+transitions and search results are queued on a shared `CycleWriter` and
+written in one transaction per batch rather than one per event.
+
+Failed items are retried from a `RetryScheduler` timing wheel: when a retry
+falls due the item is pushed straight into its app's pipeline, so cycles do
+not rescan ``next_retry_at``.
+
+Requires the async storage layer (``init_async_db``).
+
+Example:
+    orchestrator = CycleOrchestrator(sync=fetch_library, search=send_search)
+    await orchestrator.start()
+    ...
+    await orchestrator.stop()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from researcharr.async_pipeline import Pipeline
+from researcharr.compat import UTC
+from researcharr.repositories.async_uow import AsyncUnitOfWork
+from researcharr.scheduling.retry_scheduler import RetryScheduler
+from researcharr.storage.models import (
+    AppType,
+    CyclePhase,
+    GlobalSettings,
+    ManagedApp,
+    SortStrategy,
+    TrackedItem,
+)
+
+if TYPE_CHECKING:
+    from researcharr.scheduling.batch_search import BatchSearchDispatcher
+
+logger = logging.getLogger(__name__)
+
+SyncFn = Callable[["AppCycleSettings"], Awaitable[Iterable[dict] | None]]
+SearchFn = Callable[["AppCycleSettings", TrackedItem], Awaitable[bool]]
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)  # naive UTC, like the models
+
+
+def _default(name: str) -> Any:
+    return GlobalSettings.__table__.c[name].default.arg
+
+
+@dataclass(frozen=True, slots=True)
+class AppCycleSettings:
+    """An app's connection details with its effective cycle settings."""
+
+    app_id: int
+    app_type: AppType
+    name: str
+    base_url: str
+    api_key: str
+    items_per_cycle: int
+    cycle_interval_minutes: int
+    sort_strategy: SortStrategy
+    retry_failed_items: bool
+    max_retries: int
+    retry_delay_minutes: int
+
+    @classmethod
+    def resolve(cls, app: ManagedApp, settings: GlobalSettings | None) -> AppCycleSettings:
+        """Apply the app's custom overrides (when enabled) over the global settings."""
+
+        def pick(name: str) -> Any:
+            if app.use_custom_settings:
+                value = getattr(app, f"custom_{name}")
+                if value is not None:
+                    return value
+            return getattr(settings, name) if settings is not None else _default(name)
+
+        return cls(
+            app_id=app.id,
+            app_type=app.app_type,
+            name=app.name,
+            base_url=app.base_url,
+            api_key=app.api_key,
+            items_per_cycle=pick("items_per_cycle"),
+            cycle_interval_minutes=pick("cycle_interval_minutes"),
+            sort_strategy=pick("sort_strategy"),
+            retry_failed_items=pick("retry_failed_items"),
+            max_retries=pick("max_retries"),
+            retry_delay_minutes=pick("retry_delay_minutes"),
+        )
+
+
+class CycleWriter:
+    """Buffers cycle updates and search results and writes them in batches.
+
+    Changes to the same cycle within a batch are merged, so a cycle that
+    moves SEARCHING -> COOLDOWN between flushes costs one UPDATE. A batch is
+    written when ``batch_size`` changes are pending or every
+    ``flush_interval`` seconds, whichever comes first.
+
+    A batch whose transaction fails is put back in front of newer changes
+    and retried on the next flush. It is only dropped after
+    ``max_attempts`` failed writes in a row, so a transient error (a locked
+    database) does not make items get searched again.
+    """
+
+    def __init__(
+        self, *, batch_size: int = 100, flush_interval: float = 1.0, max_attempts: int = 5
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self._cycles: dict[int, dict[str, Any]] = {}
+        self._searched: list[tuple[int, bool, datetime | None]] = []
+        self._failures = 0
+        self._wakeup = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self.metrics = {"batches": 0, "writes": 0, "failed_batches": 0, "dropped": 0}
+
+    @property
+    def pending(self) -> int:
+        return len(self._cycles) + len(self._searched)
+
+    def update_cycle(self, cycle_id: int, **changes: Any) -> None:
+        self._cycles.setdefault(cycle_id, {}).update(changes)
+        self._maybe_wake()
+
+    def searched(self, item_id: int, success: bool, next_retry_at: datetime | None) -> None:
+        self._searched.append((item_id, success, next_retry_at))
+        self._maybe_wake()
+
+    def _maybe_wake(self) -> None:
+        if self.pending >= self.batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """Write everything pending in one transaction; returns the change count."""
+        async with self._lock:
+            cycles, self._cycles = self._cycles, {}
+            searched, self._searched = self._searched, []
+            count = len(cycles) + len(searched)
+            if not count:
+                return 0
+            try:
+                async with AsyncUnitOfWork() as uow:
+                    for item_id, success, next_retry_at in searched:
+                        await uow.items.mark_searched(item_id, success, next_retry_at)
+                    for cycle_id, changes in cycles.items():
+                        await uow.cycles.update_cycle(cycle_id, changes)
+            except Exception:  # nosec B110 -- a bad batch must not stop the writer
+                self.metrics["failed_batches"] += 1
+                self._failures += 1
+                if self._failures >= self.max_attempts:
+                    self._failures = 0
+                    self.metrics["dropped"] += count
+                    logger.exception(
+                        "Dropping %d cycle updates after %d failed writes",
+                        count,
+                        self.max_attempts,
+                    )
+                else:
+                    self._requeue(cycles, searched)
+                    logger.warning(
+                        "Writing %d cycle updates failed (attempt %d of %d); retrying",
+                        count,
+                        self._failures,
+                        self.max_attempts,
+                        exc_info=True,
+                    )
+                return 0
+            self._failures = 0
+            self.metrics["batches"] += 1
+            self.metrics["writes"] += count
+            return count
+
+    def _requeue(
+        self,
+        cycles: dict[int, dict[str, Any]],
+        searched: list[tuple[int, bool, datetime | None]],
+    ) -> None:
+        """Put a failed batch back, older than anything queued since."""
+        for cycle_id, changes in cycles.items():
+            self._cycles[cycle_id] = {**changes, **self._cycles.get(cycle_id, {})}
+        self._searched[:0] = searched
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:  # noqa: UP041 -- not the builtin before Python 3.11
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for _ in range(self.max_attempts):
+            if not self.pending or await self.flush():
+                break
+
+
+class CycleOrchestrator:
+    """Schedules and runs search cycles for all active apps concurrently.
+
+    Args:
+        sync: ``async sync(app) -> records`` fetching the app's library as
+            ``sync_batch`` records (``None`` skips the upsert)
+        search: ``async search(app, item) -> bool`` triggering a search for
+            one item; ``False`` or an exception counts as a failure
+        batch_search: `BatchSearchDispatcher` submitting each cycle's items
+            as batched search commands; replaces ``search``
+        search_concurrency: Searches in flight per app
+        sync_timeout: Seconds before a sync is abandoned; the cycle then
+            searches the items already tracked
+        search_timeout: Seconds before a single search counts as failed
+        refresh_interval: Seconds between checks for added, removed or
+            deactivated apps
+        writer: Shared `CycleWriter` (one with default batching if omitted)
+        retry_tick: Resolution in seconds of the retry timing wheel; ``None``
+            disables it and cycles pick up due retries from the database
+    """
+
+    def __init__(
+        self,
+        sync: SyncFn,
+        search: SearchFn | None = None,
+        *,
+        batch_search: BatchSearchDispatcher | None = None,
+        search_concurrency: int = 1,
+        sync_timeout: float = 300.0,
+        search_timeout: float = 60.0,
+        refresh_interval: float = 60.0,
+        writer: CycleWriter | None = None,
+        retry_tick: float | None = 60.0,
+    ):
+        if search_concurrency < 1:
+            raise ValueError("search_concurrency must be >= 1")
+        if (search is None) == (batch_search is None):
+            raise ValueError("pass exactly one of search and batch_search")
+        self._sync = sync
+        self._search = search
+        self.batch_search = batch_search
+        self.search_concurrency = search_concurrency
+        self.sync_timeout = sync_timeout
+        self.search_timeout = search_timeout
+        self.refresh_interval = refresh_interval
+        self.writer = writer or CycleWriter()
+        self.retries = (
+            RetryScheduler(self.enqueue_retries, tick_seconds=retry_tick)
+            if retry_tick is not None
+            else None
+        )
+        self._tasks: dict[int, asyncio.Task] = {}
+        self._pipelines: dict[int, Pipeline] = {}
+        self._batch_tasks: set[asyncio.Task] = set()
+        self._refresh_task: asyncio.Task | None = None
+
+    # Lifecycle ---------------------------------------------------------
+    async def start(self) -> None:
+        """Start the writer, the retry wheel and one scheduling task per active app."""
+        if self._refresh_task is not None:
+            return
+        self.writer.start()
+        if self.retries is not None:
+            loaded = await self.retries.load()
+            logger.info("Loaded %d pending retries", loaded)
+            self.retries.start()
+        await self.refresh()
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """Cancel all app tasks and write any pending transitions."""
+        if self.retries is not None:
+            await self.retries.stop()
+        tasks = [*self._tasks.values(), *self._batch_tasks]
+        if self._refresh_task is not None:
+            tasks.append(self._refresh_task)
+            self._refresh_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._batch_tasks.clear()
+        for app_id in list(self._pipelines):
+            await self._pipelines.pop(app_id).shutdown(drain=False)
+        await self.writer.stop()
+
+    @property
+    def running_apps(self) -> list[int]:
+        return sorted(app_id for app_id, task in self._tasks.items() if not task.done())
+
+    async def refresh(self) -> None:
+        """Start tasks for new active apps and cancel those no longer active."""
+        async with AsyncUnitOfWork(read_only=True) as uow:
+            active = {app.id for app in await uow.apps.get_active_apps()}
+        for app_id in list(self._tasks):
+            if app_id not in active:
+                self._tasks.pop(app_id).cancel()
+        for app_id in list(self._pipelines):
+            if app_id not in active:
+                await self._pipelines.pop(app_id).shutdown(drain=False)
+        for app_id in active:
+            task = self._tasks.get(app_id)
+            if task is None or task.done():
+                self._tasks[app_id] = asyncio.create_task(
+                    self._run_app(app_id), name=f"search-cycles-{app_id}"
+                )
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception:  # nosec B110 -- keep scheduling on transient DB errors
+                logger.exception("Failed to refresh active apps")
+
+    # Scheduling --------------------------------------------------------
+    async def _run_app(self, app_id: int) -> None:
+        next_at = await self._resume(app_id)
+        while True:
+            delay = (next_at - _utcnow()).total_seconds()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                next_at = await self.run_cycle(app_id)
+            except Exception:
+                logger.exception("Search cycle failed for app %s", app_id)
+                next_at = _utcnow() + timedelta(seconds=self.refresh_interval)
+            if next_at is None:
+                return  # app removed or deactivated
+
+    async def _resume(self, app_id: int) -> datetime:
+        """Return when the app's next cycle is due, closing a cycle left open by a crash."""
+        async with AsyncUnitOfWork() as uow:
+            latest = await uow.cycles.get_latest_cycle(app_id)
+            now = _utcnow()
+            if latest is None:
+                return now
+            if latest.completed_at is None:
+                await uow.cycles.complete_cycle(latest.id, now)
+                return now
+            return latest.next_cycle_at or now
+
+    async def _load_app(self, app_id: int) -> AppCycleSettings | None:
+        async with AsyncUnitOfWork(read_only=True) as uow:
+            app = await uow.apps.get_by_id(app_id)
+            if app is None or not app.is_active:
+                return None
+            return AppCycleSettings.resolve(app, await uow.settings.get_by_id(1))
+
+    # Cycle phases ------------------------------------------------------
+    async def run_cycle(self, app_id: int) -> datetime | None:
+        """Run one full cycle for an app and return when the next one is due.
+
+        Returns ``None`` without starting a cycle if the app no longer
+        exists or is inactive.
+        """
+        app = await self._load_app(app_id)
+        if app is None:
+            return None
+        async with AsyncUnitOfWork() as uow:
+            cycle = await uow.cycles.create_cycle(app_id)
+            cycle_id = cycle.id
+
+        try:
+            await self._sync_phase(app)
+
+            self.writer.update_cycle(cycle_id, phase=CyclePhase.SEARCHING)
+            async with AsyncUnitOfWork(read_only=True) as uow:
+                items = await uow.items.get_items_for_search(
+                    app_id,
+                    app.sort_strategy,
+                    app.items_per_cycle,
+                    include_retries=app.retry_failed_items and self.retries is None,
+                )
+            succeeded, retrying = await self._search_phase(app, items)
+        except BaseException:
+            # Close the cycle so the next one does not start beside it
+            self.writer.update_cycle(cycle_id, completed_at=_utcnow())
+            raise
+
+        now = _utcnow()
+        next_at = now + timedelta(minutes=app.cycle_interval_minutes)
+        self.writer.update_cycle(
+            cycle_id,
+            phase=CyclePhase.COOLDOWN,
+            total_items=len(items),
+            items_searched=len(items),
+            items_succeeded=succeeded,
+            items_failed=len(items) - succeeded,
+            items_in_retry_queue=(
+                self.retries.pending(app_id) if self.retries is not None else retrying
+            ),
+            completed_at=now,
+            next_cycle_at=next_at,
+        )
+        return next_at
+
+    async def _sync_phase(self, app: AppCycleSettings) -> None:
+        try:
+            records = await asyncio.wait_for(self._sync(app), self.sync_timeout)
+            if records is None:
+                return
+            async with AsyncUnitOfWork() as uow:
+                await uow.items.sync_batch(app.app_id, list(records))
+                managed = await uow.apps.get_by_id(app.app_id)
+                if managed is not None:
+                    managed.last_sync_at = _utcnow()
+        except asyncio.TimeoutError:  # noqa: UP041 -- not the builtin before Python 3.11
+            logger.warning("Sync of %s timed out after %ss", app.name, self.sync_timeout)
+        except Exception:
+            logger.exception("Sync of %s failed; searching tracked items", app.name)
+
+    async def _pipeline(self, app_id: int) -> Pipeline:
+        """Return the app's search pipeline, starting it on first use."""
+        pipeline = self._pipelines.get(app_id)
+        if pipeline is None:
+            pipeline = self._pipelines[app_id] = Pipeline()
+            pipeline.add_stage(self._search_stage, concurrency=self.search_concurrency, max_queue=0)
+            await pipeline.start()
+        return pipeline
+
+    async def _search_stage(
+        self, job: tuple[AppCycleSettings, TrackedItem, asyncio.Future | None]
+    ) -> None:
+        app, item, result = job
+        try:
+            ok = bool(await asyncio.wait_for(self._search(app, item), self.search_timeout))
+        except asyncio.TimeoutError:  # noqa: UP041 -- not the builtin before Python 3.11
+            logger.warning("Search for %r on %s timed out", item.title, app.name)
+            ok = False
+        except Exception:
+            logger.exception("Search for %r on %s failed", item.title, app.name)
+            ok = False
+        retrying = self._record(app, item, ok)
+        if result is not None and not result.done():
+            result.set_result((ok, retrying))
+
+    def _record(self, app: AppCycleSettings, item: TrackedItem, ok: bool) -> bool:
+        """Queue a search result and schedule its retry; returns whether it will be retried."""
+        next_retry_at = None
+        if not ok and app.retry_failed_items and item.failed_search_count + 1 < app.max_retries:
+            next_retry_at = _utcnow() + timedelta(minutes=app.retry_delay_minutes)
+        self.writer.searched(item.id, ok, next_retry_at)
+        if self.retries is not None:
+            self.retries.schedule(item.id, app.app_id, next_retry_at)
+        return next_retry_at is not None
+
+    async def _search_batch(
+        self, app: AppCycleSettings, items: list[TrackedItem]
+    ) -> tuple[int, int]:
+        """Search the items with the batch dispatcher; returns (succeeded, retrying)."""
+        try:
+            results = await self.batch_search.search(app, items)
+        except Exception:
+            logger.exception("Batched search of %d items on %s failed", len(items), app.name)
+            results = [False] * len(items)
+        if len(results) != len(items):
+            logger.error(
+                "Batched search on %s returned %d results for %d items; counting all as failed",
+                app.name,
+                len(results),
+                len(items),
+            )
+            results = [False] * len(items)
+        retrying = [self._record(app, item, ok) for item, ok in zip(items, results, strict=True)]
+        return sum(results), sum(retrying)
+
+    async def _search_phase(
+        self, app: AppCycleSettings, items: list[TrackedItem]
+    ) -> tuple[int, int]:
+        """Search the items through the app's pipeline; returns (succeeded, retrying)."""
+        if not items:
+            return 0, 0
+        if self.batch_search is not None:
+            return await self._search_batch(app, items)
+        pipeline = await self._pipeline(app.app_id)
+        loop = asyncio.get_running_loop()
+        results = [loop.create_future() for _ in items]
+        for item, result in zip(items, results, strict=True):
+            await pipeline.push((app, item, result))
+        outcomes = await asyncio.gather(*results)
+        return sum(ok for ok, _ in outcomes), sum(retrying for _, retrying in outcomes)
+
+    async def enqueue_retries(self, app_id: int, item_ids: list[int]) -> None:
+        """Push due retries into the app's search pipeline (the `RetryScheduler` callback)."""
+        app = await self._load_app(app_id)
+        if app is None:
+            return
+        async with AsyncUnitOfWork(read_only=True) as uow:
+            items = await uow.items.get_retry_items(app_id, item_ids)
+        if not items:
+            return
+        if self.batch_search is not None:
+            # Polling can take minutes; do not hold up the retry wheel
+            task = asyncio.create_task(self._search_batch(app, items))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+            return
+        pipeline = await self._pipeline(app_id)
+        for item in items:
+            await pipeline.push((app, item, None))
+
+
+__all__ = ["AppCycleSettings", "CycleOrchestrator", "CycleWriter"]
@@ -32,6 +32,7 @@ class DatabaseSchedulerService:
         self._config = config or {}
         self._health_check_job_id = "database_health_check"
         self._integrity_check_job_id = "database_integrity_check"
+        self._rollup_compaction_job_id = "processing_log_rollup_compaction"
 
     def setup(self) -> None:
         """Set up scheduled database health check jobs based on configuration."""
@@ -49,6 +50,7 @@ class DatabaseSchedulerService:
         # Get monitoring intervals
         health_check_minutes = db_config.get("health_check_interval_minutes", 5)
         integrity_check_hours = db_config.get("integrity_check_interval_hours", 24)
+        rollup_compaction_minutes = db_config.get("rollup_compaction_interval_minutes", 60)
 
         try:
             # Import IntervalTrigger
@@ -74,6 +76,18 @@ class DatabaseSchedulerService:
             )
             logger.info(f"Scheduled database integrity checks every {integrity_check_hours} hours")
 
+            # Schedule processing-log rollup compaction (every N minutes)
+            self._scheduler.add_job(
+                func=self._run_rollup_compaction,
+                trigger=IntervalTrigger(minutes=rollup_compaction_minutes),
+                id=self._rollup_compaction_job_id,
+                name="Processing Log Rollup Compaction",
+                replace_existing=True,
+            )
+            logger.info(
+                f"Scheduled processing log rollup compaction every {rollup_compaction_minutes} minutes"
+            )
+
         except Exception as e:
             logger.exception(f"Failed to schedule database health check jobs: {e}")
 
@@ -113,6 +127,13 @@ class DatabaseSchedulerService:
                 elif alert.get("level") == "warning":
                     logger.warning(f"Database alert: {alert.get('message')}")
 
+            # Publish statement stats for `researcharr db stats`
+            from researcharr.storage import query_stats
+
+            collector = query_stats.get_collector()
+            if collector is not None:
+                collector.write_snapshot()
+
         except Exception as e:
             logger.exception(f"Scheduled database health check failed: {e}")
 
@@ -144,6 +165,21 @@ class DatabaseSchedulerService:
         except Exception as e:
             logger.exception(f"Scheduled database integrity check failed: {e}")
 
+    def _run_rollup_compaction(self) -> None:
+        """Recompute recent hourly processing-log rollups from the raw log."""
+        db_config = self._config.get("database", {}).get("monitoring", {})
+        window_hours = db_config.get("rollup_compaction_window_hours", 2)
+        logger.debug("Running scheduled processing log rollup compaction...")
+
+        try:
+            from researcharr.repositories.uow import UnitOfWork
+
+            with UnitOfWork() as uow:
+                uow.logs.compact_rollups(hours=window_hours)
+
+        except Exception as e:
+            logger.exception(f"Scheduled processing log rollup compaction failed: {e}")
+
     def remove_jobs(self) -> None:
         """Remove scheduled database health check jobs."""
         if self._scheduler is None:
@@ -163,6 +199,13 @@ class DatabaseSchedulerService:
         except Exception as e:
             logger.warning(f"Failed to remove integrity check job: {e}")
 
+        try:
+            if self._scheduler.get_job(self._rollup_compaction_job_id):
+                self._scheduler.remove_job(self._rollup_compaction_job_id)
+                logger.info("Removed processing log rollup compaction job")
+        except Exception as e:
+            logger.warning(f"Failed to remove rollup compaction job: {e}")
+
     def trigger_health_check_now(self) -> bool:
         """Trigger database health check immediately (outside of schedule).
 
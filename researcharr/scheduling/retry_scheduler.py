@@ -0,0 +1,131 @@
+"""Retry deadlines for failed tracked items, held in a timing wheel.
+
+Instead of every search cycle querying ``next_retry_at <= now``, the retry
+deadlines live in memory in a `TimingWheel`. The wheel is rebuilt from
+``tracked_items`` on startup and kept current as searches fail or succeed.
+Once per tick the due items are handed, grouped by app, to an ``on_due``
+callback. `CycleOrchestrator` uses this callback to push them straight into
+the app's search pipeline.
+
+Example:
+    retries = RetryScheduler(on_due=orchestrator.enqueue_retries)
+    await retries.load()
+    retries.start()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+
+from researcharr.compat import UTC
+from researcharr.repositories.async_uow import AsyncUnitOfWork
+from researcharr.scheduling.timing_wheel import TimingWheel
+
+logger = logging.getLogger(__name__)
+
+OnDue = Callable[[int, list[int]], Awaitable[None]]
+
+
+def _timestamp(when: datetime) -> float:
+    # Model datetimes are naive UTC
+    return when.replace(tzinfo=UTC).timestamp() if when.tzinfo is None else when.timestamp()
+
+
+class RetryScheduler:
+    """Fires tracked-item retries at their ``next_retry_at`` (tick resolution).
+
+    Args:
+        on_due: ``async on_due(app_id, item_ids)`` called for due retries
+        tick_seconds: Wheel resolution; retries fire at most one tick late
+        clock: Epoch-seconds clock (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        on_due: OnDue,
+        *,
+        tick_seconds: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._on_due = on_due
+        self._clock = clock
+        self._wheel: TimingWheel[int] = TimingWheel(tick_seconds, start=clock())
+        self._apps: dict[int, int] = {}
+        self._task: asyncio.Task | None = None
+
+    @property
+    def tick_seconds(self) -> float:
+        return self._wheel.tick
+
+    def pending(self, app_id: int | None = None) -> int:
+        """Number of scheduled retries, optionally for one app."""
+        if app_id is None:
+            return len(self._wheel)
+        return sum(1 for owner in self._apps.values() if owner == app_id)
+
+    async def load(self) -> int:
+        """Rebuild the wheel from the database; returns the number of retries loaded."""
+        async with AsyncUnitOfWork(read_only=True) as uow:
+            rows = await uow.items.get_retry_schedule()
+        for item_id, app_id, when in rows:
+            self.schedule(item_id, app_id, when)
+        return len(rows)
+
+    def schedule(self, item_id: int, app_id: int, when: datetime | None) -> None:
+        """Schedule (or move) an item's retry; ``None`` cancels it."""
+        if when is None:
+            self.cancel(item_id)
+            return
+        self._apps[item_id] = app_id
+        self._wheel.schedule(item_id, _timestamp(when))
+
+    def cancel(self, item_id: int) -> None:
+        self._apps.pop(item_id, None)
+        self._wheel.cancel(item_id)
+
+    def due(self) -> dict[int, list[int]]:
+        """Advance the wheel to now and return the due item ids grouped by app."""
+        grouped: dict[int, list[int]] = defaultdict(list)
+        for item_id in self._wheel.advance(self._clock()):
+            grouped[self._apps.pop(item_id)].append(item_id)
+        return dict(grouped)
+
+    async def run_due(self) -> int:
+        """Dispatch every due retry to ``on_due``; returns the number dispatched."""
+        dispatched = 0
+        for app_id, item_ids in self.due().items():
+            try:
+                await self._on_due(app_id, item_ids)
+            except Exception:  # nosec B110 -- one app's failure must not drop the others
+                logger.exception("Failed to dispatch %d retries for app %s", len(item_ids), app_id)
+                continue
+            dispatched += len(item_ids)
+        return dispatched
+
+    async def _run(self) -> None:
+        tick = self._wheel.tick
+        while True:
+            # Wake just after each tick boundary
+            await asyncio.sleep(tick - self._clock() % tick + 0.01)
+            await self.run_due()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+__all__ = ["RetryScheduler"]
@@ -0,0 +1,146 @@
+"""Hierarchical timing wheel.
+
+Holds many deadlines in O(1) per insert and cancel, and expires them by
+advancing a clock in fixed ticks instead of scanning or keeping a heap of
+everything. Level 0 has one slot per tick. Each higher level has one slot
+per full turn of the level below, and its slots are cascaded into the
+lower levels as the clock reaches them. Deadlines past the top level wait
+in an overflow heap until they fit.
+
+With the defaults (60-second tick, slots ``(60, 24, 64)``) the levels cover
+one hour, one day and 64 days at minute resolution.
+
+Deadlines are rounded up to the next tick, so a key never fires early.
+
+Example:
+    wheel = TimingWheel(tick=60.0, start=time.time())
+    wheel.schedule(item_id, time.time() + 300)
+    for item_id in wheel.advance(time.time()):
+        ...
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+from collections.abc import Hashable, Sequence
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class TimingWheel(Generic[K]):
+    """Hierarchical timing wheel of keyed deadlines (seconds on any clock).
+
+    Scheduling a key again replaces its deadline. Cancelled and replaced
+    entries stay in their slot and are dropped when the slot is reached.
+    """
+
+    def __init__(self, tick: float = 60.0, slots: Sequence[int] = (60, 24, 64), start: float = 0.0):
+        if tick <= 0:
+            raise ValueError("tick must be > 0")
+        if not slots or any(n < 1 for n in slots):
+            raise ValueError("slots must be a non-empty sequence of positive sizes")
+        self.tick = tick
+        self._slots = tuple(slots)
+        spans = []
+        span = 1
+        for n in self._slots:
+            spans.append(span)
+            span *= n
+        self._spans = tuple(spans)
+        self._levels: list[list[list[tuple[K, int]]]] = [
+            [[] for _ in range(n)] for n in self._slots
+        ]
+        self._overflow: list[tuple[int, int, K]] = []
+        self._seq = itertools.count()
+        self._due: list[tuple[K, int]] = []
+        self._deadlines: dict[K, int] = {}
+        self._now = math.floor(start / tick)
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._deadlines
+
+    def schedule(self, key: K, when: float) -> None:
+        """Fire ``key`` at the first tick at or after ``when``."""
+        tick = math.ceil(when / self.tick)
+        self._deadlines[key] = tick
+        self._place(key, tick)
+
+    def cancel(self, key: K) -> bool:
+        """Forget ``key``; returns False if it was not scheduled."""
+        return self._deadlines.pop(key, None) is not None
+
+    def deadline(self, key: K) -> float | None:
+        """Return the (tick-rounded) deadline of ``key``, if scheduled."""
+        tick = self._deadlines.get(key)
+        return None if tick is None else tick * self.tick
+
+    def advance(self, now: float) -> list[K]:
+        """Move the clock to ``now`` and return the keys that became due."""
+        target = math.floor(now / self.tick)
+        fired: list[K] = []
+        top = len(self._slots) - 1
+        while self._now < target:
+            if not self._deadlines:
+                self._clear()
+                self._now = target
+                break
+            self._now += 1
+            t = self._now
+            if t % self._spans[top] == 0:
+                self._admit_overflow()
+            # Cascade from the top down so entries settle in the lowest level
+            for level in range(top, 0, -1):
+                span = self._spans[level]
+                if t % span == 0:
+                    slots = self._levels[level]
+                    index = (t // span) % self._slots[level]
+                    bucket, slots[index] = slots[index], []
+                    for key, tick in bucket:
+                        if self._deadlines.get(key) == tick:
+                            self._place(key, tick)
+            slots = self._levels[0]
+            index = t % self._slots[0]
+            bucket, slots[index] = slots[index], []
+            self._collect(bucket, fired)
+        due, self._due = self._due, []
+        self._collect(due, fired)
+        return fired
+
+    def _place(self, key: K, tick: int) -> None:
+        if tick <= self._now:
+            self._due.append((key, tick))
+            return
+        for level, (span, size) in enumerate(zip(self._spans, self._slots, strict=True)):
+            if tick // span - self._now // span < size:
+                self._levels[level][(tick // span) % size].append((key, tick))
+                return
+        heapq.heappush(self._overflow, (tick, next(self._seq), key))
+
+    def _admit_overflow(self) -> None:
+        span, size = self._spans[-1], self._slots[-1]
+        while self._overflow and self._overflow[0][0] // span - self._now // span < size:
+            tick, _, key = heapq.heappop(self._overflow)
+            if self._deadlines.get(key) == tick:
+                self._place(key, tick)
+
+    def _collect(self, entries: list[tuple[K, int]], fired: list[K]) -> None:
+        for key, tick in entries:
+            if self._deadlines.get(key) == tick:
+                del self._deadlines[key]
+                fired.append(key)
+
+    def _clear(self) -> None:
+        for slots in self._levels:
+            for index in range(len(slots)):
+                slots[index] = []
+        self._overflow.clear()
+        self._due.clear()
+
+
+__all__ = ["TimingWheel"]
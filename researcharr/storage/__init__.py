@@ -1,8 +1,9 @@
 """Storage module for database models and session management."""
 # basedpyright: reportAttributeAccessIssue=false
 
+from . import log_rollups as log_rollups  # registers ProcessingLog rollup listeners
 from . import recovery as recovery  # re-export recovery helpers for tests
-from .database import get_session, init_db
+from .database import get_read_session, get_session, get_write_session, init_db
 from .models import (
     AppType,
     Base,
@@ -10,6 +11,7 @@ from .models import (
     GlobalSettings,
     ManagedApp,
     ProcessingLog,
+    ProcessingLogRollup,
     SearchCycle,
     SortStrategy,
     TrackedItem,
@@ -22,10 +24,14 @@ __all__ = [
     "TrackedItem",
     "SearchCycle",
     "ProcessingLog",
+    "ProcessingLogRollup",
     "SortStrategy",
     "CyclePhase",
     "AppType",
     "init_db",
     "get_session",
+    "get_read_session",
+    "get_write_session",
+    "log_rollups",
     "recovery",
 ]
@@ -0,0 +1,190 @@
+"""Async database session management (SQLAlchemy asyncio + aiosqlite).
+
+Mirrors `researcharr.storage.database` for code running on an event loop,
+such as `researcharr.async_pipeline` stages, so database access does not
+block the loop. The same PRAGMA tuning profile is applied to every
+connection and the pools are split the same way: a single-connection write
+engine and a read-only engine.
+
+Requires the optional ``aiosqlite`` package. The schema is owned by the
+sync ``init_db()`` (Alembic); ``create_tables=True`` is meant for tests.
+
+Example:
+    await init_async_db("/config/researcharr.db")
+    async with get_async_session() as session:
+        apps = (await session.scalars(select(ManagedApp))).all()
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Mapping
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from . import query_stats
+from .database import (
+    DEFAULT_WRITE_TIMEOUT,
+    _read_pool_size,
+    connection_profile,
+    install_pragma_listener,
+    resolve_sqlite_pragmas,
+    sqlite_url,
+)
+from .models import Base
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker[AsyncSession] | None = None
+_async_read_engine: AsyncEngine | None = None
+_async_read_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def _create_async_sqlite_engine(
+    database_path: Path,
+    pragmas: Mapping[str, Any],
+    read_only: bool = False,
+    **engine_kwargs: Any,
+) -> AsyncEngine:
+    try:
+        import aiosqlite  # noqa: F401
+    except ImportError as exc:
+        raise ImportError("aiosqlite is required for async storage") from exc
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(
+        sqlite_url(database_path, read_only=read_only, driver="aiosqlite"),
+        echo=False,
+        **engine_kwargs,
+    )
+    install_pragma_listener(engine.sync_engine, connection_profile(pragmas, read_only=read_only))
+    return engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Get the async write engine.
+
+    Raises:
+        RuntimeError: If the async database has not been initialized
+    """
+    if _async_engine is None:
+        raise RuntimeError("Async database not initialized. Call init_async_db() first.")
+    return _async_engine
+
+
+async def init_async_db(
+    database_path: str | Path,
+    sqlite_pragmas: Mapping[str, Any] | bool | None = None,
+    create_tables: bool = False,
+) -> None:
+    """
+    Initialize the async engines and session factories.
+
+    Args:
+        database_path: Path to the SQLite database file
+        sqlite_pragmas: Connection tuning overrides (see
+                        ``resolve_sqlite_pragmas``)
+        create_tables: Run ``create_all()`` first (tests only; production
+                       schemas are managed by ``init_db()``)
+    """
+    global _async_engine, _async_session_factory
+    global _async_read_engine, _async_read_session_factory
+
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    db_path = Path(database_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    await dispose_async_db()
+
+    pragmas = resolve_sqlite_pragmas(sqlite_pragmas)
+    _async_engine = _create_async_sqlite_engine(
+        db_path,
+        pragmas,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=DEFAULT_WRITE_TIMEOUT,
+    )
+    if create_tables:
+        async with _async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    _async_session_factory = async_sessionmaker(_async_engine, expire_on_commit=False)
+
+    _async_read_engine = _create_async_sqlite_engine(
+        db_path,
+        pragmas,
+        read_only=True,
+        pool_size=_read_pool_size(),
+        max_overflow=0,
+    )
+    _async_read_session_factory = async_sessionmaker(_async_read_engine, expire_on_commit=False)
+
+    # Report into the collector started by init_db(), if any
+    if query_stats.is_enabled():
+        query_stats.instrument(_async_engine)
+        query_stats.instrument(_async_read_engine)
+
+
+async def dispose_async_db() -> None:
+    """Close all pooled async connections and reset the module state."""
+    global _async_engine, _async_session_factory
+    global _async_read_engine, _async_read_session_factory
+
+    for engine in (_async_engine, _async_read_engine):
+        if engine is not None:
+            await engine.dispose()
+    _async_engine = _async_read_engine = None
+    _async_session_factory = _async_read_session_factory = None
+
+
+@asynccontextmanager
+async def get_async_session() -> AsyncGenerator[AsyncSession]:
+    """
+    Async context manager for read-write sessions.
+
+    Commits on success, rolls back on error and always closes.
+
+    Raises:
+        RuntimeError: If the async database has not been initialized
+    """
+    if _async_session_factory is None:
+        raise RuntimeError("Async database not initialized. Call init_async_db() first.")
+
+    session = _async_session_factory()
+    try:
+        yield session
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+@asynccontextmanager
+async def get_async_read_session() -> AsyncGenerator[AsyncSession]:
+    """
+    Async context manager for read-only sessions (never commits).
+
+    Raises:
+        RuntimeError: If the async database has not been initialized
+    """
+    if _async_read_session_factory is None:
+        raise RuntimeError("Async database not initialized. Call init_async_db() first.")
+
+    session = _async_read_session_factory()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+__all__ = [
+    "init_async_db",
+    "dispose_async_db",
+    "get_async_engine",
+    "get_async_session",
+    "get_async_read_session",
+]
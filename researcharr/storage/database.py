@@ -1,19 +1,195 @@
-"""Database session management and initialization."""
+"""Database session management and initialization.
 
+Writes go through a single pooled connection (see `init_db`), so a thread
+holding a write session blocks every other writer until it finishes. A
+nested ``get_session()`` on a thread that already has one open, such as a
+log write inside an open `UnitOfWork`, must not check out a second
+connection: it would wait on itself until the pool timeout. Nested calls
+therefore join the thread's open write session. They neither commit nor
+close it, and the outermost block owns the transaction.
+"""
+
+import logging
 import os
-from collections.abc import Generator
+import re
+import threading
+from collections.abc import Generator, Mapping
 from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
+from urllib.parse import quote
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from . import query_stats as _query_stats
 from .models import Base
 
-# Global session factory (initialized by init_db)
+logger = logging.getLogger(__name__)
+
+# Global session factories (initialized by init_db). ``_engine`` is the
+# single-connection write engine; ``_read_engine`` is a read-only pool.
 _session_factory: sessionmaker | None = None
 _engine: Engine | None = None
+_read_session_factory: sessionmaker | None = None
+_read_engine: Engine | None = None
+# The write session each thread has open, joined by nested get_session()
+_thread_write = threading.local()
+
+DEFAULT_READ_POOL_SIZE = 4
+# Seconds a writer waits for the single write connection before failing
+DEFAULT_WRITE_TIMEOUT = 30.0
+
+# Connection tuning applied to every new SQLite connection. WAL lets the web
+# UI and scheduler jobs read while a sync worker writes; NORMAL sync is safe
+# under WAL (only the last transactions can be lost on power failure).
+DEFAULT_SQLITE_PRAGMAS: dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,  # ms
+    "cache_size": -64000,  # negative = KiB, i.e. 64 MB
+    "mmap_size": 268435456,  # 256 MB
+    "temp_store": "MEMORY",
+    "foreign_keys": "ON",
+}
+
+_PRAGMA_VALUE_RE = re.compile(r"^-?\d+$|^[A-Za-z_]+$")
+_FALSE_VALUES = ("false", "0", "no", "off")
+
+
+def resolve_sqlite_pragmas(
+    overrides: Mapping[str, Any] | bool | None = None,
+) -> dict[str, Any]:
+    """
+    Build the PRAGMA profile applied to new SQLite connections.
+
+    Precedence (lowest to highest): ``DEFAULT_SQLITE_PRAGMAS``, ``overrides``
+    (typically the ``database.sqlite`` config section), then environment
+    variables ``RESEARCHARR_SQLITE_<PRAGMA>`` (e.g.
+    ``RESEARCHARR_SQLITE_CACHE_SIZE=-128000``). Tuning is disabled entirely by
+    ``overrides=False``, ``{"enabled": False}`` or
+    ``RESEARCHARR_SQLITE_TUNING=false``.
+
+    Args:
+        overrides: Mapping of pragma name to value, or a bool to toggle tuning
+
+    Returns:
+        Mapping of pragma name to value; empty when tuning is disabled
+
+    Raises:
+        ValueError: If a pragma name is unknown or a value is not a plain
+            integer or keyword
+    """
+    enabled = True
+    pragmas = dict(DEFAULT_SQLITE_PRAGMAS)
+    if isinstance(overrides, bool):
+        enabled = overrides
+    elif overrides:
+        for key, value in overrides.items():
+            if key == "enabled":
+                enabled = bool(value)
+            elif value is not None:
+                pragmas[key] = value
+
+    env_toggle = os.getenv("RESEARCHARR_SQLITE_TUNING")
+    if env_toggle is not None:
+        enabled = env_toggle.strip().lower() not in _FALSE_VALUES
+    if not enabled:
+        return {}
+
+    for key in DEFAULT_SQLITE_PRAGMAS:
+        env_value = os.getenv(f"RESEARCHARR_SQLITE_{key.upper()}")
+        if env_value:
+            pragmas[key] = env_value.strip()
+
+    for key, value in pragmas.items():
+        if key not in DEFAULT_SQLITE_PRAGMAS:
+            raise ValueError(f"Unsupported SQLite pragma: {key}")
+        if isinstance(value, bool):
+            pragmas[key] = "ON" if value else "OFF"
+        elif not _PRAGMA_VALUE_RE.match(str(value)):
+            raise ValueError(f"Invalid value for SQLite pragma {key}: {value!r}")
+    return pragmas
+
+
+def sqlite_url(database_path: str | Path, read_only: bool = False, driver: str = "") -> str:
+    """
+    Build a SQLAlchemy URL for a SQLite file.
+
+    Args:
+        database_path: Path to the SQLite database file
+        read_only: Produce a ``mode=ro`` URI
+        driver: Optional DBAPI suffix, e.g. ``"aiosqlite"``
+    """
+    scheme = f"sqlite+{driver}" if driver else "sqlite"
+    if read_only:
+        path = quote(Path(database_path).resolve().as_posix())
+        return f"{scheme}:///file:{path}?mode=ro&uri=true"
+    return f"{scheme}:///{database_path}"
+
+
+def connection_profile(
+    pragmas: Mapping[str, Any] | None, read_only: bool = False
+) -> dict[str, Any]:
+    """Adapt a resolved pragma profile for a read-only or read-write pool."""
+    profile = dict(pragmas or {})
+    if read_only:
+        # journal_mode is a property of the file, set by the writer
+        profile.pop("journal_mode", None)
+        profile["query_only"] = "ON"
+    return profile
+
+
+def install_pragma_listener(engine: Engine, profile: Mapping[str, Any]) -> None:
+    """
+    Apply ``profile`` to every new DBAPI connection of ``engine``.
+
+    For an ``AsyncEngine`` pass its ``sync_engine``.
+    """
+    if not profile:
+        return
+    profile = dict(profile)
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):  # noqa: ARG001
+        cursor = dbapi_connection.cursor()
+        try:
+            for key, value in profile.items():
+                cursor.execute(f"PRAGMA {key}={value}")  # nosec B608 -- validated
+        finally:
+            cursor.close()
+
+
+def create_sqlite_engine(
+    database_path: str | Path,
+    pragmas: Mapping[str, Any] | None = None,
+    read_only: bool = False,
+    **engine_kwargs: Any,
+) -> Engine:
+    """
+    Create a SQLite engine that applies ``pragmas`` on every new connection.
+
+    Args:
+        database_path: Path to the SQLite database file
+        pragmas: Resolved pragma profile (see ``resolve_sqlite_pragmas``);
+                 None or empty leaves SQLite defaults in place
+        read_only: Open connections with ``mode=ro`` and ``query_only`` so
+                   they can never take the write lock
+        **engine_kwargs: Extra arguments forwarded to ``create_engine``
+
+    Returns:
+        SQLAlchemy Engine instance
+    """
+    profile = connection_profile(pragmas, read_only=read_only)
+    engine = create_engine(
+        sqlite_url(database_path, read_only=read_only),
+        connect_args={"check_same_thread": False},  # Allow multi-threaded access
+        echo=False,  # Set to True for SQL query logging
+        **engine_kwargs,
+    )
+    install_pragma_listener(engine, profile)
+    return engine
 
 
 def get_engine() -> Engine:
@@ -32,27 +208,77 @@ def get_engine() -> Engine:
     return _engine
 
 
-def init_db(database_path: str | Path, use_migrations: bool = True) -> None:
+def get_read_engine() -> Engine:
+    """
+    Get the read-only database engine.
+
+    Returns:
+        SQLAlchemy Engine instance
+
+    Raises:
+        RuntimeError: If database has not been initialized
+    """
+    if _read_engine is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+    return _read_engine
+
+
+def _read_pool_size() -> int:
+    try:
+        return max(1, int(os.getenv("RESEARCHARR_DB_READ_POOL_SIZE", DEFAULT_READ_POOL_SIZE)))
+    except ValueError:
+        return DEFAULT_READ_POOL_SIZE
+
+
+def init_db(
+    database_path: str | Path,
+    use_migrations: bool = True,
+    sqlite_pragmas: Mapping[str, Any] | bool | None = None,
+    query_stats: Mapping[str, Any] | bool | None = None,
+) -> None:
     """
     Initialize the database connection and create tables.
 
+    Two engines are created: a write engine holding a single pooled
+    connection, so in-process writers queue on the pool instead of failing
+    on SQLite's file lock, and a read-only engine
+    (``RESEARCHARR_DB_READ_POOL_SIZE`` connections, default 4) whose
+    sessions never wait behind a write transaction in WAL mode.
+
     Args:
         database_path: Path to the SQLite database file
         use_migrations: If True, use Alembic migrations (default).
                        If False, use create_all() for tests.
+        sqlite_pragmas: Connection tuning overrides, usually the
+                       ``database.sqlite`` config section. See
+                       ``resolve_sqlite_pragmas``.
+        query_stats: Statement instrumentation settings, usually the
+                       ``database.query_stats`` config section. See
+                       ``query_stats.resolve_settings``.
     """
-    global _session_factory, _engine
+    global _session_factory, _engine, _read_session_factory, _read_engine
 
     # Convert to Path and ensure parent directory exists
     db_path = Path(database_path)
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Release pools from a previous initialization
+    for previous in (_engine, _read_engine):
+        if previous is not None:
+            previous.dispose()
+    _read_engine = _read_session_factory = None
+
     # Create engine with SQLite optimizations
-    _engine = create_engine(
-        f"sqlite:///{db_path}",
-        connect_args={"check_same_thread": False},  # Allow multi-threaded access
-        echo=False,  # Set to True for SQL query logging
+    pragmas = resolve_sqlite_pragmas(sqlite_pragmas)
+    _engine = create_sqlite_engine(
+        db_path,
+        pragmas,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=DEFAULT_WRITE_TIMEOUT,
     )
+    if pragmas:
+        logger.debug("SQLite tuning profile: %s", pragmas)
 
     # Check environment variable to override use_migrations
     env_use_migrations = os.getenv("RESEARCHARR_USE_MIGRATIONS", "true").lower()
@@ -82,14 +308,39 @@ def init_db(database_path: str | Path, use_migrations: bool = True) -> None:
         # Fast path for tests: direct table creation
         Base.metadata.create_all(_engine)
 
-    # Create session factory
+    # Create session factories
     _session_factory = sessionmaker(bind=_engine, expire_on_commit=False)
+    _read_engine = create_sqlite_engine(
+        db_path,
+        pragmas,
+        read_only=True,
+        pool_size=_read_pool_size(),
+        max_overflow=0,
+    )
+    _read_session_factory = sessionmaker(bind=_read_engine, expire_on_commit=False)
+
+    _query_stats.disable()
+    stats_settings = _query_stats.resolve_settings(query_stats)
+    if stats_settings["enabled"]:
+        _query_stats.enable(
+            _engine,
+            _read_engine,
+            slow_query_ms=stats_settings["slow_query_ms"],
+            slow_log_size=stats_settings["slow_log_size"],
+            snapshot_file=_query_stats.snapshot_path(db_path),
+        )
+        logger.info("SQL query instrumentation enabled: %s", stats_settings)
 
 
 @contextmanager
 def get_session() -> Generator[Session]:
     """
-    Context manager for database sessions.
+    Context manager for read-write database sessions.
+
+    Sessions share the single write connection, so keep them short; use
+    ``get_read_session()`` for queries that do not modify data. A call
+    nested inside another write session on the same thread yields that
+    session instead of waiting for the connection it already holds.
 
     Yields:
         SQLAlchemy Session object
@@ -104,7 +355,15 @@ def get_session() -> Generator[Session]:
     if _session_factory is None:
         raise RuntimeError("Database not initialized. Call init_db() first.")
 
+    outer = active_write_session()
+    if outer is not None:
+        # Nested on this thread: join the open transaction; the outer block
+        # commits or rolls back
+        yield outer
+        return
+
     session = _session_factory()
+    _thread_write.session = session
     try:
         yield session
         session.commit()
@@ -112,4 +371,45 @@ def get_session() -> Generator[Session]:
         session.rollback()
         raise
     finally:
+        _thread_write.session = None
+        session.close()
+
+
+def active_write_session() -> Session | None:
+    """Return the write session open on this thread, if any."""
+    return getattr(_thread_write, "session", None)
+
+
+# Explicit-intent alias; ``get_session()`` remains the default for callers
+# that may write.
+get_write_session = get_session
+
+
+@contextmanager
+def get_read_session() -> Generator[Session]:
+    """
+    Context manager for read-only database sessions.
+
+    The session is bound to the read-only pool: it never commits, and any
+    attempted write raises ``OperationalError``.
+
+    Yields:
+        SQLAlchemy Session object
+
+    Raises:
+        RuntimeError: If database has not been initialized
+
+    Example:
+        with get_read_session() as session:
+            apps = session.query(ManagedApp).all()
+    """
+    if _read_session_factory is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+
+    session = _read_session_factory()
+    try:
+        yield session
+    finally:
+        # close() returns the connection (rolled back by the pool) without
+        # expiring loaded objects, so results stay usable after the block
         session.close()
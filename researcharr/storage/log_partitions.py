@@ -0,0 +1,256 @@
+"""Monthly partitioning for the processing-log audit trail.
+
+With partitioning enabled (``RESEARCHARR_LOG_PARTITIONS=monthly``) new
+ProcessingLog rows are written to per-month tables named
+``processing_logs_YYYY_MM`` instead of the single ``processing_logs``
+table. This gives:
+
+* cheap retention: expiring a month is a ``DROP TABLE`` rather than a long
+  ``DELETE`` transaction that blocks syncs and leaves free pages behind;
+* partition pruning: "most recent N" queries read the newest partition
+  first and stop as soon as older partitions cannot contribute.
+
+Partitions are created lazily on first write in a month, with the same
+columns, foreign keys and an ``(app_id, created_at)`` index as the base
+table. They use AUTOINCREMENT and each new partition's sequence is seeded
+from the previous maximum, so ids stay unique and increasing across
+partitions. Rows are always appended to the newest partition (an event
+stamped just before midnight but flushed after a month rollover lands in
+the new month), so a partition only ever holds rows created before the end
+of its month.
+
+The legacy ``processing_logs`` table keeps the rows written before
+partitioning was enabled and is treated as the oldest partition. The view
+``processing_logs_all`` unions every partition for ad-hoc SQL and
+aggregates.
+
+ORM reads go through ``aliased(ProcessingLog, table, adapt_on_names=True)``,
+so callers still receive ``ProcessingLog`` instances. Those instances are
+read-only; logs are append-only.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Column, Index, MetaData, Table, func, insert, select, text
+from sqlalchemy.engine import Connection
+
+from .models import ManagedApp, ProcessingLog, TrackedItem
+
+BASE_TABLE = ProcessingLog.__tablename__
+VIEW_NAME = "processing_logs_all"
+_PARTITION_RE = re.compile(r"^processing_logs_(\d{4})_(\d{2})$")
+_ENABLED_VALUES = ("monthly", "true", "1", "yes", "on")
+
+# Private metadata: partition Table objects must not leak into Base.metadata
+# (create_all / Alembic autogenerate). Referenced tables are copied so the
+# partitions' foreign keys resolve when emitting CREATE TABLE.
+_metadata = MetaData()
+ManagedApp.__table__.to_metadata(_metadata)
+TrackedItem.__table__.to_metadata(_metadata)
+_tables: dict[str, Table] = {}
+_tables_lock = threading.Lock()
+_override: bool | None = None
+
+
+def partitioning_enabled() -> bool:
+    """Return True when processing logs are written to monthly partitions."""
+    if _override is not None:
+        return _override
+    return os.getenv("RESEARCHARR_LOG_PARTITIONS", "").strip().lower() in _ENABLED_VALUES
+
+
+def set_partitioning(enabled: bool | None) -> None:
+    """Force partitioning on/off; None restores the environment setting."""
+    global _override
+    _override = enabled
+
+
+def partition_name(moment: datetime) -> str:
+    """Return the partition table name for the month containing ``moment``."""
+    return f"{BASE_TABLE}_{moment.year:04d}_{moment.month:02d}"
+
+
+def partition_bounds(name: str) -> tuple[datetime, datetime]:
+    """Return ``[start, end)`` of the month covered by partition ``name``."""
+    match = _PARTITION_RE.match(name)
+    if match is None:
+        raise ValueError(f"Not a processing-log partition: {name}")
+    year, month = int(match.group(1)), int(match.group(2))
+    start = datetime(year, month, 1)
+    end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+    return start, end
+
+
+def _copy_columns() -> list[Column]:
+    return [column._copy() for column in ProcessingLog.__table__.columns]
+
+
+def partition_table(name: str) -> Table:
+    """Return the (cached) Table object for a partition name."""
+    with _tables_lock:
+        table = _tables.get(name)
+        if table is None:
+            if name == VIEW_NAME:
+                # Plain column copies: the view has no constraints
+                table = Table(
+                    name,
+                    _metadata,
+                    *(Column(c.name, c.type, primary_key=c.primary_key) for c in _copy_columns()),
+                )
+            else:
+                partition_bounds(name)  # validate
+                table = Table(name, _metadata, *_copy_columns(), sqlite_autoincrement=True)
+                Index(f"ix_{name}_app_created", table.c.app_id, table.c.created_at)
+                Index(f"ix_{name}_tracked_item", table.c.tracked_item_id)
+            _tables[name] = table
+        return table
+
+
+def base_table() -> Table:
+    """Return the legacy (unpartitioned) processing-log table."""
+    return ProcessingLog.__table__  # type: ignore[return-value]
+
+
+def all_logs_table(conn: Connection) -> Table:
+    """Return the table (or view) that covers every log row."""
+    if list_partitions(conn):
+        return partition_table(VIEW_NAME)
+    return base_table()
+
+
+def list_partitions(conn: Connection) -> list[str]:
+    """Return existing partition names, newest first."""
+    rows = conn.execute(
+        text("SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE :pattern"),
+        {"pattern": f"{BASE_TABLE}_%"},
+    ).scalars()
+    return sorted((n for n in rows if _PARTITION_RE.match(n)), reverse=True)
+
+
+def refresh_view(conn: Connection, partitions: Sequence[str] | None = None) -> None:
+    """(Re)create the ``processing_logs_all`` UNION ALL view."""
+    if partitions is None:
+        partitions = list_partitions(conn)
+    columns = ", ".join(c.name for c in ProcessingLog.__table__.columns)
+    selects = [f"SELECT {columns} FROM {name}" for name in (*partitions, BASE_TABLE)]  # nosec B608
+    conn.execute(text(f"DROP VIEW IF EXISTS {VIEW_NAME}"))
+    conn.execute(text(f"CREATE VIEW {VIEW_NAME} AS " + " UNION ALL ".join(selects)))
+
+
+def _max_log_id(conn: Connection, partitions: Iterable[str]) -> int:
+    best = conn.execute(select(func.max(base_table().c.id))).scalar() or 0
+    names = list(partitions)
+    if names:
+        params = {f"n{i}": n for i, n in enumerate(names)}
+        placeholders = ", ".join(f":{k}" for k in params)
+        seq = conn.execute(
+            text(f"SELECT MAX(seq) FROM sqlite_sequence WHERE name IN ({placeholders})"),  # nosec B608
+            params,
+        ).scalar()
+        best = max(best, seq or 0)
+    return int(best)
+
+
+def ensure_partition(conn: Connection, moment: datetime | None = None) -> Table:
+    """
+    Return the partition new rows stamped ``moment`` should be appended to.
+
+    That is the newest existing partition unless ``moment`` falls in a later
+    month, in which case that month's partition is created first.
+    """
+    moment = moment or datetime.utcnow()
+    wanted = partition_name(moment)
+    partitions = list_partitions(conn)
+    if partitions and partitions[0] >= wanted:
+        return partition_table(partitions[0])
+
+    table = partition_table(wanted)
+    next_id = _max_log_id(conn, partitions)
+    table.create(conn, checkfirst=True)
+    conn.execute(
+        text("INSERT INTO sqlite_sequence (name, seq) VALUES (:name, :seq)"),
+        {"name": wanted, "seq": next_id},
+    )
+    refresh_view(conn, [wanted, *partitions])
+    return table
+
+
+def insert_rows(conn: Connection, rows: Sequence[dict[str, Any]]) -> None:
+    """Append log rows (dicts keyed by column name) with one executemany."""
+    if not rows:
+        return
+    from . import log_rollups
+
+    newest = max((r.get("created_at") for r in rows if r.get("created_at")), default=None)
+    conn.execute(insert(ensure_partition(conn, newest)), list(rows))
+    log_rollups.record(conn, rows)
+
+
+def insert_row(conn: Connection, row: dict[str, Any]) -> int:
+    """Append a single log row and return its id."""
+    from . import log_rollups
+
+    result = conn.execute(insert(ensure_partition(conn, row.get("created_at"))).values(**row))
+    log_rollups.record(conn, [row])
+    return int(result.inserted_primary_key[0])
+
+
+def log_sources(conn: Connection) -> list[tuple[Table, datetime]]:
+    """
+    Return ``(table, upper_bound)`` pairs, newest first.
+
+    Every row in ``table`` has ``created_at < upper_bound``. The legacy
+    base table comes last; its rows predate the first partition, so it
+    shares the oldest partition's bound (or ``datetime.max`` when no
+    partition exists yet).
+    """
+    partitions = list_partitions(conn)
+    sources = [(partition_table(name), partition_bounds(name)[1]) for name in partitions]
+    base_bound = sources[-1][1] if sources else datetime.max
+    sources.append((base_table(), base_bound))
+    return sources
+
+
+def drop_partitions_before(conn: Connection, cutoff: datetime) -> int:
+    """
+    Drop every partition whose month ended on or before ``cutoff``.
+
+    Returns:
+        Number of rows removed with the dropped partitions
+    """
+    partitions = list_partitions(conn)
+    expired = [name for name in partitions if partition_bounds(name)[1] <= cutoff]
+    if not expired:
+        return 0
+    removed = 0
+    for name in expired:
+        removed += int(conn.execute(text(f"SELECT COUNT(*) FROM {name}")).scalar() or 0)  # nosec B608
+    refresh_view(conn, [name for name in partitions if name not in expired])
+    for name in expired:
+        conn.execute(text(f"DROP TABLE {name}"))
+    return removed
+
+
+__all__ = [
+    "VIEW_NAME",
+    "partitioning_enabled",
+    "set_partitioning",
+    "partition_name",
+    "partition_bounds",
+    "partition_table",
+    "all_logs_table",
+    "list_partitions",
+    "refresh_view",
+    "ensure_partition",
+    "insert_rows",
+    "insert_row",
+    "log_sources",
+    "drop_partitions_before",
+]
@@ -0,0 +1,189 @@
+"""Hourly rollups of processing-log statistics.
+
+Dashboard statistics (`ProcessingLogRepository.get_event_counts` and
+`get_success_rate`) used to ``COUNT ... GROUP BY`` over the raw log. The
+``processing_log_rollups`` table keeps per app x event_type x hour counts of
+total and successful events instead, so a statistic over any range reads
+O(hours in range) rollup rows plus, for a ``since`` that is not on an hour
+boundary, the raw rows of that first partial hour.
+
+Rollups are maintained in the same transaction as the log rows:
+
+* ORM inserts/deletes of ProcessingLog are counted by mapper listeners
+  registered when this module is imported (``researcharr.storage`` does so);
+* Core bulk inserts (partitions, the group-commit writer) call `record()`;
+* bulk deletes (retention) call `rebuild()` for the affected hours.
+
+`rebuild()` recomputes a range of hours from the raw log. It backs the
+periodic compaction job, which repairs drift from writes that bypass the
+paths above (e.g. updates to existing rows or manual SQL).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, event, func, insert, literal_column, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+
+from . import log_partitions
+from .models import ProcessingLog, ProcessingLogRollup
+
+_rollups = ProcessingLogRollup.__table__
+# Same textual format SQLAlchemy's SQLite DateTime type stores, so bucket
+# values compare correctly against bound datetime parameters.
+_HOUR_FORMAT = "%Y-%m-%d %H:00:00.000000"
+
+
+def hour_floor(moment: datetime) -> datetime:
+    """Truncate ``moment`` to the start of its hour."""
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def hour_ceil(moment: datetime) -> datetime:
+    """Round ``moment`` up to the next hour boundary (identity on a boundary)."""
+    floor = hour_floor(moment)
+    return floor if floor == moment else floor + timedelta(hours=1)
+
+
+def record(conn: Connection, rows: Iterable[Mapping[str, Any]], sign: int = 1) -> None:
+    """
+    Add (``sign=1``) or subtract (``sign=-1``) log rows from the rollups.
+
+    Rows are pre-aggregated per bucket so a batch costs one upsert per
+    distinct (app, event_type, hour).
+    """
+    buckets: dict[tuple[int, str, datetime], list[int]] = {}
+    for row in rows:
+        created = row.get("created_at") or datetime.utcnow()
+        key = (row["app_id"], row["event_type"], hour_floor(created))
+        counts = buckets.setdefault(key, [0, 0])
+        counts[0] += sign
+        if row.get("success", True):
+            counts[1] += sign
+    if not buckets:
+        return
+    stmt = sqlite_insert(_rollups)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[_rollups.c.app_id, _rollups.c.event_type, _rollups.c.hour],
+        set_={
+            "total": _rollups.c.total + stmt.excluded.total,
+            "succeeded": _rollups.c.succeeded + stmt.excluded.succeeded,
+        },
+    )
+    conn.execute(
+        stmt,
+        [
+            {"app_id": a, "event_type": e, "hour": h, "total": t, "succeeded": s}
+            for (a, e, h), (t, s) in buckets.items()
+        ],
+    )
+
+
+def rebuild(conn: Connection, start: datetime | None = None, end: datetime | None = None) -> None:
+    """
+    Recompute the rollups for every hour overlapping ``[start, end)``.
+
+    Either bound may be None for an open range; ``rebuild(conn)`` recomputes
+    everything (e.g. after a backfill).
+    """
+    logs = log_partitions.all_logs_table(conn)
+    lower = hour_floor(start) if start is not None else None
+    upper = hour_ceil(end) if end is not None else None
+
+    hour_bounds = []
+    log_bounds = []
+    if lower is not None:
+        hour_bounds.append(_rollups.c.hour >= lower)
+        log_bounds.append(logs.c.created_at >= lower)
+    if upper is not None:
+        hour_bounds.append(_rollups.c.hour < upper)
+        log_bounds.append(logs.c.created_at < upper)
+
+    conn.execute(delete(_rollups).where(*hour_bounds))
+    bucket = func.strftime(literal_column(f"'{_HOUR_FORMAT}'"), logs.c.created_at)
+    source = (
+        select(
+            logs.c.app_id,
+            logs.c.event_type,
+            bucket,
+            func.count(),
+            func.sum(logs.c.success),
+        )
+        .where(*log_bounds)
+        .group_by(logs.c.app_id, logs.c.event_type, bucket)
+    )
+    conn.execute(
+        insert(_rollups).from_select(["app_id", "event_type", "hour", "total", "succeeded"], source)
+    )
+
+
+def totals(
+    conn: Connection, app_id: int, since: datetime | None = None
+) -> dict[str, tuple[int, int]]:
+    """
+    Return ``{event_type: (total, succeeded)}`` for an app, optionally since a time.
+
+    Whole hours come from the rollups; when ``since`` falls inside an hour,
+    the rest of that hour is counted from the raw log.
+    """
+    result: dict[str, list[int]] = {}
+
+    def add(rows) -> None:
+        for event_type, total, succeeded in rows:
+            counts = result.setdefault(event_type, [0, 0])
+            counts[0] += int(total or 0)
+            counts[1] += int(succeeded or 0)
+
+    stmt = select(
+        _rollups.c.event_type, func.sum(_rollups.c.total), func.sum(_rollups.c.succeeded)
+    ).where(_rollups.c.app_id == app_id)
+    if since is not None:
+        head_end = hour_ceil(since)
+        stmt = stmt.where(_rollups.c.hour >= head_end)
+        if head_end != since:
+            logs = log_partitions.all_logs_table(conn)
+            add(
+                conn.execute(
+                    select(logs.c.event_type, func.count(), func.sum(logs.c.success))
+                    .where(
+                        logs.c.app_id == app_id,
+                        logs.c.created_at >= since,
+                        logs.c.created_at < head_end,
+                    )
+                    .group_by(logs.c.event_type)
+                )
+            )
+    add(conn.execute(stmt.group_by(_rollups.c.event_type)))
+    return {etype: (total, ok) for etype, (total, ok) in result.items() if total > 0}
+
+
+def _row(target: ProcessingLog) -> dict[str, Any]:
+    return {
+        "app_id": target.app_id,
+        "event_type": target.event_type,
+        "success": target.success,
+        "created_at": target.created_at,
+    }
+
+
+@event.listens_for(ProcessingLog, "after_insert")
+def _count_insert(mapper, connection, target) -> None:
+    record(connection, [_row(target)])
+
+
+@event.listens_for(ProcessingLog, "after_delete")
+def _count_delete(mapper, connection, target) -> None:
+    record(connection, [_row(target)], sign=-1)
+
+
+__all__ = [
+    "hour_floor",
+    "hour_ceil",
+    "record",
+    "rebuild",
+    "totals",
+]
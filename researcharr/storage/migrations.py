@@ -1,14 +1,42 @@
 """Database migration utilities."""
 
 import logging
+from collections.abc import Mapping
 from pathlib import Path
+from typing import Any
+
+import yaml
 
 from researcharr.storage.database import get_session, init_db
 
 logger = logging.getLogger(__name__)
 
 
-def migrate_database(database_path: str | Path, use_migrations: bool = True) -> None:
+def load_database_config(config_dir: str | Path) -> dict[str, Any]:
+    """
+    Read the ``database`` section of ``config_dir/config.yml``.
+
+    Pass its ``sqlite`` and ``query_stats`` entries to ``migrate_database``
+    so the documented settings take effect. Returns an empty dict when the file or
+    section is missing or unreadable.
+    """
+    path = Path(config_dir) / "config.yml"
+    try:
+        with open(path, encoding="utf-8") as fh:
+            data = yaml.safe_load(fh) or {}
+    except (OSError, yaml.YAMLError) as exc:
+        logger.debug("No database settings from %s: %s", path, exc)
+        return {}
+    section = data.get("database") if isinstance(data, dict) else None
+    return section if isinstance(section, dict) else {}
+
+
+def migrate_database(
+    database_path: str | Path,
+    use_migrations: bool = True,
+    sqlite_pragmas: Mapping[str, Any] | bool | None = None,
+    query_stats: Mapping[str, Any] | bool | None = None,
+) -> None:
     """
     # basedpyright: reportAttributeAccessIssue=false
     Initialize database and apply migrations.
@@ -16,9 +44,16 @@ def migrate_database(database_path: str | Path, use_migrations: bool = True) ->
     Args:
         database_path: Path to SQLite database file
         use_migrations: If True, use Alembic migrations. If False, use create_all().
+        sqlite_pragmas: Connection tuning overrides (``database.sqlite`` config)
+        query_stats: Statement instrumentation settings (``database.query_stats`` config)
     """
     logger.info(f"Initializing database at {database_path}")
-    init_db(database_path, use_migrations=use_migrations)
+    init_db(
+        database_path,
+        use_migrations=use_migrations,
+        sqlite_pragmas=sqlite_pragmas,
+        query_stats=query_stats,
+    )
 
     # Ensure GlobalSettings singleton exists without relying on any
     # cross-test cache state.
@@ -16,7 +16,7 @@ from sqlalchemy import (
 )
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import query_expression, relationship
 
 Base = declarative_base()
 
@@ -108,18 +108,28 @@ class ManagedApp(Base):
     custom_max_retries = Column(Integer, nullable=True)
     custom_retry_delay_minutes = Column(Integer, nullable=True)
 
+    # Cycle number the next SearchCycle receives; allocated atomically with
+    # UPDATE ... RETURNING (see SearchCycleRepository.create_cycle). Excluded
+    # from the mapper below so inserts use the server default and merging a
+    # stale ManagedApp can never write an old value back.
+    next_cycle_number = Column(Integer, nullable=False, server_default="1")
+
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     last_sync_at = Column(DateTime, nullable=True)
 
-    # Relationships
+    # Relationships (lazy; repositories opt into eager loads per call)
     tracked_items = relationship("TrackedItem", back_populates="app", cascade="all, delete-orphan")
     search_cycles = relationship("SearchCycle", back_populates="app", cascade="all, delete-orphan")
     processing_logs = relationship(
         "ProcessingLog", back_populates="app", cascade="all, delete-orphan"
     )
 
+    # Populated only by the "with_items_count" load profile; None otherwise
+    items_count = query_expression()
+
     __table_args__ = (UniqueConstraint("app_type", "base_url", name="_app_type_url_uc"),)
+    __mapper_args__ = {"exclude_properties": ["next_cycle_number"]}
 
 
 class TrackedItem(Base):
@@ -227,6 +237,23 @@ class ProcessingLog(Base):
     tracked_item = relationship("TrackedItem", back_populates="processing_logs")
 
 
+class ProcessingLogRollup(Base):
+    """
+    Hourly ProcessingLog counts per app and event type.
+    Maintained at insert time so dashboard statistics read one row per hour
+    instead of scanning the raw log (see storage.log_rollups).
+    """
+
+    __tablename__ = "processing_log_rollups"
+
+    app_id = Column(Integer, ForeignKey("managed_apps.id", ondelete="CASCADE"), primary_key=True)
+    event_type = Column(String(50), primary_key=True)
+    hour = Column(DateTime, primary_key=True)  # UTC, truncated to the hour
+
+    total = Column(Integer, nullable=False, default=0)
+    succeeded = Column(Integer, nullable=False, default=0)
+
+
 __all__ = [
     "Base",
     "AppType",
@@ -237,4 +264,5 @@ __all__ = [
     "TrackedItem",
     "SearchCycle",
     "ProcessingLog",
+    "ProcessingLogRollup",
 ]
@@ -0,0 +1,339 @@
+"""SQL statement instrumentation and slow-query log.
+
+When enabled (``RESEARCHARR_QUERY_STATS=true`` or the ``database.query_stats``
+config section) ``before_cursor_execute`` / ``after_cursor_execute`` listeners
+are attached to the storage engines and every statement is timed. Stats are
+grouped by fingerprint - the SQL text with literals replaced by ``?`` and
+``IN (?, ?, ...)`` lists collapsed - and report count, total/average/p95/max
+latency and rows. Statements slower than ``slow_query_ms`` are also kept in a
+ring buffer of the last ``slow_log_size`` entries.
+
+Rows are the DBAPI ``rowcount``: rows affected by INSERT/UPDATE/DELETE.
+SQLite does not report SELECT row counts before the rows are fetched, so
+those statements contribute 0.
+
+When disabled no listeners are registered at all, so the hot path is
+untouched. Bound parameters are never recorded (they may hold API keys).
+
+The running process exposes ``snapshot()`` on ``/metrics``; the scheduled
+database health check also writes it to ``<database>-query-stats.json`` so
+``researcharr db stats`` can show it from another process.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SLOW_QUERY_MS = 100.0
+DEFAULT_SLOW_LOG_SIZE = 100
+# Latency samples kept per fingerprint for the p95 estimate
+LATENCY_SAMPLES = 512
+# Statement text kept per slow-log entry
+MAX_STATEMENT_CHARS = 2000
+
+_ENABLED_VALUES = ("true", "1", "yes", "on")
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """Normalise a SQL statement so executions differing only in literals group together."""
+    text = _STRING_RE.sub("?", statement)
+    text = _NUMBER_RE.sub("?", text)
+    text = _IN_LIST_RE.sub("(?)", text)
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+class _StatementStats:
+    __slots__ = ("count", "total_ms", "max_ms", "rows", "samples")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.samples: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+
+class QueryStats:
+    """Thread-safe per-fingerprint statement statistics plus a slow-query ring buffer."""
+
+    def __init__(
+        self,
+        slow_query_ms: float = DEFAULT_SLOW_QUERY_MS,
+        slow_log_size: int = DEFAULT_SLOW_LOG_SIZE,
+        snapshot_file: str | Path | None = None,
+    ):
+        """
+        Initialize an empty collector.
+
+        Args:
+            slow_query_ms: Statements at or above this latency enter the slow log
+            slow_log_size: Number of slow-log entries kept (oldest dropped first)
+            snapshot_file: Where ``write_snapshot()`` persists the stats
+        """
+        self.slow_query_ms = float(slow_query_ms)
+        self.snapshot_file = Path(snapshot_file) if snapshot_file else None
+        self._lock = threading.Lock()
+        self._stats: dict[str, _StatementStats] = {}
+        self._slow: deque[dict[str, Any]] = deque(maxlen=max(1, int(slow_log_size)))
+
+    def record(self, statement: str, elapsed_ms: float, rows: int = 0) -> None:
+        """Record one execution of ``statement``."""
+        key = fingerprint(statement)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _StatementStats()
+            stats.count += 1
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.rows += max(rows, 0)
+            stats.samples.append(elapsed_ms)
+            if elapsed_ms >= self.slow_query_ms:
+                self._slow.append(
+                    {
+                        "timestamp": time.time(),
+                        "duration_ms": round(elapsed_ms, 3),
+                        "rows": max(rows, 0),
+                        "fingerprint": key,
+                        "statement": statement[:MAX_STATEMENT_CHARS],
+                    }
+                )
+        if elapsed_ms >= self.slow_query_ms:
+            logger.info("Slow query (%.1f ms): %s", elapsed_ms, key)
+
+    def snapshot(self, top: int | None = None) -> dict[str, Any]:
+        """
+        Return the collected stats as JSON-ready data.
+
+        Args:
+            top: Only include the ``top`` statements by total time
+
+        Returns:
+            Dict with ``statements`` (sorted by total time, descending) and
+            ``slow_queries`` (newest first)
+        """
+        with self._lock:
+            items = [
+                (key, s.count, s.total_ms, s.max_ms, s.rows, sorted(s.samples))
+                for key, s in self._stats.items()
+            ]
+            slow = list(reversed(self._slow))
+        statements = []
+        for key, count, total_ms, max_ms, rows, samples in items:
+            p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+            statements.append(
+                {
+                    "fingerprint": key,
+                    "count": count,
+                    "total_ms": round(total_ms, 3),
+                    "avg_ms": round(total_ms / count, 3),
+                    "p95_ms": round(p95, 3),
+                    "max_ms": round(max_ms, 3),
+                    "rows": rows,
+                }
+            )
+        statements.sort(key=lambda s: s["total_ms"], reverse=True)
+        if top is not None:
+            statements = statements[:top]
+        return {
+            "slow_query_ms": self.slow_query_ms,
+            "statements": statements,
+            "slow_queries": slow,
+        }
+
+    def reset(self) -> None:
+        """Discard all collected stats."""
+        with self._lock:
+            self._stats.clear()
+            self._slow.clear()
+
+    def write_snapshot(self) -> bool:
+        """Persist ``snapshot()`` to ``snapshot_file``; returns False if unset or on error."""
+        if self.snapshot_file is None:
+            return False
+        data = dict(self.snapshot(), generated_at=time.time())
+        tmp = self.snapshot_file.with_name(self.snapshot_file.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            tmp.replace(self.snapshot_file)
+        except OSError as e:
+            logger.warning(f"Failed to write query stats snapshot: {e}")
+            return False
+        return True
+
+
+_collector: QueryStats | None = None
+_engines: weakref.WeakSet[Engine] = weakref.WeakSet()
+_state_lock = threading.Lock()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+    conn.info.setdefault("query_stats_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+    starts = conn.info.get("query_stats_start")
+    collector = _collector
+    if not starts or collector is None:
+        return
+    elapsed_ms = (time.perf_counter() - starts.pop()) * 1000.0
+    collector.record(statement, elapsed_ms, getattr(cursor, "rowcount", 0) or 0)
+
+
+def _handle_error(context):
+    # A failed statement never reaches after_cursor_execute; drop its start
+    # time so the list does not grow on long-lived pooled connections
+    conn = context.connection
+    starts = conn.info.get("query_stats_start") if conn is not None else None
+    if starts:
+        starts.pop()
+
+
+def resolve_settings(overrides: Mapping[str, Any] | bool | None = None) -> dict[str, Any]:
+    """
+    Build query instrumentation settings.
+
+    Precedence (lowest to highest): defaults (disabled), ``overrides``
+    (typically the ``database.query_stats`` config section, or a bool), then
+    ``RESEARCHARR_QUERY_STATS``, ``RESEARCHARR_SLOW_QUERY_MS`` and
+    ``RESEARCHARR_SLOW_QUERY_LOG_SIZE``.
+
+    Returns:
+        Dict with ``enabled``, ``slow_query_ms`` and ``slow_log_size``
+    """
+    settings: dict[str, Any] = {
+        "enabled": False,
+        "slow_query_ms": DEFAULT_SLOW_QUERY_MS,
+        "slow_log_size": DEFAULT_SLOW_LOG_SIZE,
+    }
+    if isinstance(overrides, bool):
+        settings["enabled"] = overrides
+    elif overrides:
+        settings.update({k: v for k, v in overrides.items() if k in settings and v is not None})
+
+    env_toggle = os.getenv("RESEARCHARR_QUERY_STATS")
+    if env_toggle is not None:
+        settings["enabled"] = env_toggle.strip().lower() in _ENABLED_VALUES
+    for key, env_name, cast in (
+        ("slow_query_ms", "RESEARCHARR_SLOW_QUERY_MS", float),
+        ("slow_log_size", "RESEARCHARR_SLOW_QUERY_LOG_SIZE", int),
+    ):
+        env_value = os.getenv(env_name)
+        if env_value:
+            try:
+                settings[key] = cast(env_value)
+            except ValueError:
+                logger.warning(f"Ignoring invalid {env_name}={env_value!r}")
+    settings["enabled"] = bool(settings["enabled"])
+    return settings
+
+
+def snapshot_path(database_path: str | Path) -> Path:
+    """Return the stats snapshot file kept next to ``database_path``."""
+    path = Path(database_path)
+    return path.with_name(path.name + "-query-stats.json")
+
+
+def instrument(engine: Any) -> None:
+    """Attach the timing listeners to ``engine`` (an ``AsyncEngine`` is unwrapped)."""
+    engine = getattr(engine, "sync_engine", engine)
+    with _state_lock:
+        if engine in _engines:
+            return
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+        _engines.add(engine)
+
+
+def enable(
+    *engines: Any,
+    slow_query_ms: float = DEFAULT_SLOW_QUERY_MS,
+    slow_log_size: int = DEFAULT_SLOW_LOG_SIZE,
+    snapshot_file: str | Path | None = None,
+) -> QueryStats:
+    """
+    Start collecting stats for ``engines``, replacing any previous collector.
+
+    Returns:
+        The active QueryStats collector
+    """
+    global _collector
+    _collector = QueryStats(slow_query_ms, slow_log_size, snapshot_file)
+    for engine in engines:
+        instrument(engine)
+    return _collector
+
+
+def disable() -> None:
+    """Stop collecting and remove the listeners from every instrumented engine."""
+    global _collector
+    with _state_lock:
+        _collector = None
+        for engine in list(_engines):
+            event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+            event.remove(engine, "after_cursor_execute", _after_cursor_execute)
+            event.remove(engine, "handle_error", _handle_error)
+        _engines.clear()
+
+
+def is_enabled() -> bool:
+    """Return True while a collector is active."""
+    return _collector is not None
+
+
+def get_collector() -> QueryStats | None:
+    """Return the active collector, or None when instrumentation is disabled."""
+    return _collector
+
+
+def snapshot(top: int | None = None) -> dict[str, Any] | None:
+    """Return the active collector's snapshot, or None when disabled."""
+    collector = _collector
+    return collector.snapshot(top) if collector is not None else None
+
+
+def read_snapshot(path: str | Path) -> dict[str, Any] | None:
+    """Load a snapshot written by ``QueryStats.write_snapshot``; None if absent or invalid."""
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+__all__ = [
+    "DEFAULT_SLOW_LOG_SIZE",
+    "DEFAULT_SLOW_QUERY_MS",
+    "QueryStats",
+    "disable",
+    "enable",
+    "fingerprint",
+    "get_collector",
+    "instrument",
+    "is_enabled",
+    "read_snapshot",
+    "resolve_settings",
+    "snapshot",
+    "snapshot_path",
+]
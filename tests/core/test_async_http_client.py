@@ -0,0 +1,159 @@
+"""Tests for the asyncio HTTP client and the BasePlugin async hooks."""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from researcharr.core import async_http  # noqa: E402
+from researcharr.core.async_http import (  # noqa: E402
+    AsyncHttpClientService,
+    close_async_http_client,
+    get_async_http_client,
+)
+
+DELAY = 0.3
+
+
+@pytest.fixture
+def slow_server():
+    """Keep-alive server answering after DELAY seconds, tracking concurrency."""
+    state = {"active": 0, "peak": 0, "lock": threading.Lock()}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            with state["lock"]:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(DELAY)
+            with state["lock"]:
+                state["active"] -= 1
+            body = b'{"version": "4.0"}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", state
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_plugin_health_fan_out_takes_as_long_as_slowest(slow_server):
+    from plugins.media.example_radarr import Plugin as RadarrPlugin
+    from plugins.media.example_sonarr import Plugin as SonarrPlugin
+
+    url, state = slow_server
+    plugins = [
+        RadarrPlugin({"url": url, "api_key": "k"}),
+        SonarrPlugin({"url": url, "api_key": "k"}),
+        SonarrPlugin({"url": url, "api_key": "k2"}),
+        RadarrPlugin({"url": url, "api_key": "k2"}),
+    ]
+
+    from researcharr.core.container import get_container, reset_container
+    from researcharr.core.services import HttpClientService
+
+    # All four instances share one host here; let them all through at once
+    reset_container()
+    get_container().register_singleton(
+        "http_client_service", HttpClientService({"per_host_limit": 4})
+    )
+
+    async def body():
+        try:
+            return await asyncio.gather(*(p.async_health() for p in plugins))
+        finally:
+            await close_async_http_client()
+
+    try:
+        results = asyncio.run(body())
+    finally:
+        reset_container()
+    assert results == [{"status": "ok"}] * 4
+    # Serial checks would never have more than one request in flight
+    assert state["peak"] == 4
+
+
+def test_per_host_limit_caps_in_flight_requests(slow_server):
+    url, state = slow_server
+
+    async def body():
+        async with AsyncHttpClientService({"per_host_limit": 2}) as client:
+            responses = await asyncio.gather(*(client.get(f"{url}/api") for _ in range(6)))
+        return [r.json() for r in responses]
+
+    assert asyncio.run(body()) == [{"version": "4.0"}] * 6
+    assert state["peak"] == 2
+
+
+def test_shared_client_is_per_loop_and_follows_http_settings():
+    from researcharr.core.container import get_container, reset_container
+    from researcharr.core.services import HttpClientService
+
+    reset_container()
+    get_container().register_singleton(
+        "http_client_service", HttpClientService({"per_host_limit": 7, "read_timeout": 12})
+    )
+
+    async def body():
+        client = get_async_http_client()
+        assert get_async_http_client() is client
+        assert client.settings["per_host_limit"] == 7
+        assert client._client.timeout.read == 12
+        await close_async_http_client()
+        assert client.closed
+        assert get_async_http_client() is not client
+        await close_async_http_client()
+        return client
+
+    try:
+        first = asyncio.run(body())
+        assert asyncio.run(body()) is not first
+    finally:
+        reset_container()
+
+
+def test_base_plugin_async_hooks_default_to_worker_thread():
+    from plugins.base import BasePlugin
+
+    class Blocking(BasePlugin):
+        def sync(self):
+            return {"success": True, "thread": threading.current_thread().name}
+
+        def health(self):
+            time.sleep(0.05)
+            return {"status": "ok"}
+
+    async def body():
+        plugin = Blocking()
+        result = await plugin.async_sync()
+        start = time.perf_counter()
+        health = await asyncio.gather(*(plugin.async_health() for _ in range(4)))
+        return result, health, time.perf_counter() - start
+
+    result, health, elapsed = asyncio.run(body())
+    assert result["success"] and result["thread"] != threading.current_thread().name
+    assert health == [{"status": "ok"}] * 4
+    assert elapsed < 0.2
+
+
+def test_client_requires_httpx(monkeypatch):
+    monkeypatch.setattr(async_http, "httpx", None)
+    with pytest.raises(RuntimeError, match="httpx"):
+        AsyncHttpClientService()
@@ -0,0 +1,160 @@
+"""Tests for per-instance circuit breakers and hedged connectivity probes."""
+
+import logging
+import threading
+import time
+
+import pytest
+
+from researcharr.core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    CircuitState,
+)
+from researcharr.core.services import ConnectivityService
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_breaker_opens_on_failure_rate_and_recovers_via_half_open_probe():
+    clock = Clock()
+    breaker = CircuitBreaker("radarr:x", min_calls=3, open_seconds=30, clock=clock)
+    breaker.record_success()
+    breaker.record_failure("timeout")
+    assert breaker.state is CircuitState.CLOSED  # only 2 outcomes so far
+    breaker.record_failure("timeout")
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow()
+    assert breaker.snapshot()["retry_in"] == 30.0
+
+    clock.now += 30
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow() and not breaker.allow()  # a single probe
+    breaker.record_failure("still down")
+    # Re-opened for twice as long
+    assert breaker.state is CircuitState.OPEN and breaker.retry_in() == 60
+
+    clock.now += 60
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED and breaker.failure_rate == 0.0
+    assert breaker.snapshot()["consecutive_opens"] == 0
+
+
+def test_failure_rate_decays_with_half_life():
+    clock = Clock()
+    breaker = CircuitBreaker("x", half_life=60, min_calls=10, clock=clock)
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now += 120  # old failures now weigh 1/4 each
+    breaker.record_success()
+    assert breaker.failure_rate == pytest.approx(0.5 / 1.5)
+
+
+def test_call_fails_fast_while_open():
+    clock = Clock()
+    breaker = CircuitBreaker("sonarr:y", min_calls=1, clock=clock)
+    with pytest.raises(ConnectionError):
+        breaker.call(lambda: (_ for _ in ()).throw(ConnectionError("refused")))
+    calls = []
+    with pytest.raises(CircuitOpenError) as info:
+        breaker.call(calls.append, 1)
+    assert calls == [] and info.value.retry_in == 30
+    assert breaker.snapshot()["last_error"] == "refused"
+
+
+def test_breaker_rejects_bad_configuration():
+    with pytest.raises(ValueError):
+        CircuitBreaker("x", failure_threshold=0)
+    with pytest.raises(ValueError):
+        CircuitBreaker("x", half_life=0)
+
+
+class _Client:
+    def __init__(self, status=200, delays=(), error=None):
+        self.status = status
+        self.delays = list(delays)
+        self.error = error
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get(self, url):
+        with self._lock:
+            self.calls += 1
+            delay = self.delays.pop(0) if self.delays else 0
+        time.sleep(delay)
+        if self.error:
+            raise self.error
+
+        class R:
+            status_code = self.status
+
+        return R()
+
+
+def test_connectivity_fails_fast_for_known_down_instance():
+    logger = logging.getLogger("breaker.test")
+    breakers = CircuitBreakerRegistry({"min_calls": 2})
+    client = _Client(error=ConnectionError("refused"))
+    svc = ConnectivityService(client, breakers, hedge_after=None)
+
+    assert not svc.check_radarr_connection("http://down:7878", "k", logger)
+    assert not svc.check_radarr_connection("http://down:7878", "k", logger)
+    assert client.calls == 2
+    start = time.perf_counter()
+    assert not svc.check_radarr_connection("http://down:7878", "k", logger)
+    assert time.perf_counter() - start < 0.05 and client.calls == 2
+
+    status = breakers.snapshot()["radarr:http://down:7878"]
+    assert status["state"] == "open" and status["last_error"] == "refused"
+    # Other instances are unaffected
+    svc.http_client = _Client()
+    assert svc.check_sonarr_connection("http://up:8989", "k", logger)
+
+
+def test_client_errors_do_not_open_the_breaker():
+    logger = logging.getLogger("breaker.test")
+    breakers = CircuitBreakerRegistry({"min_calls": 1})
+    svc = ConnectivityService(_Client(status=401), breakers, hedge_after=None)
+    assert not svc.check_radarr_connection("http://r", "bad-key", logger)
+    assert breakers.get("radarr:http://r").state is CircuitState.CLOSED
+    svc.http_client = _Client(status=503)
+    assert not svc.check_radarr_connection("http://r", "k", logger)
+    assert breakers.get("radarr:http://r").state is CircuitState.OPEN
+
+
+def test_hedged_probe_returns_first_response():
+    logger = logging.getLogger("breaker.test")
+    client = _Client(delays=[1.0, 0.0])
+    svc = ConnectivityService(client, CircuitBreakerRegistry(), hedge_after=0.05)
+    start = time.perf_counter()
+    assert svc.check_sonarr_connection("http://stalled", "k", logger)
+    assert time.perf_counter() - start < 0.5
+    assert client.calls == 2
+
+
+def test_api_status_reports_breakers():
+    from researcharr.core.container import get_container, reset_container
+    from researcharr.factory import create_app
+
+    reset_container()
+    breakers = CircuitBreakerRegistry({"min_calls": 1})
+    get_container().register_singleton("circuit_breakers", breakers)
+    breakers.get("radarr:http://down").record_failure("refused")
+    try:
+        app = create_app()
+        app.config["TESTING"] = True
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess["logged_in"] = True
+        body = client.get("/api/status").get_json()
+        assert body["instances"]["radarr:http://down"]["state"] == "open"
+    finally:
+        reset_container()
@@ -0,0 +1,80 @@
+"""Tests for the cursor-paginated list endpoints of the core API."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+from flask import Flask
+from researcharr.core.services import StorageService
+from researcharr.storage.database import get_session, init_db
+from researcharr.storage.models import AppType, ManagedApp, ProcessingLog, TrackedItem
+
+HEADERS = {"X-API-Key": "secret"}
+
+
+@pytest.fixture
+def client(tmp_path):
+    init_db(tmp_path / "api.db", use_migrations=False)
+    with get_session() as session:
+        app_row = ManagedApp(app_type=AppType.RADARR, name="A", base_url="http://a", api_key="k")
+        session.add(app_row)
+        session.flush()
+        session.add_all(
+            TrackedItem(app_id=app_row.id, arr_id=i, title=f"Item {i}") for i in range(5)
+        )
+        session.add_all(
+            ProcessingLog(app_id=app_row.id, event_type="search", message=f"log {i}")
+            for i in range(5)
+        )
+
+    from researcharr.core.api import bp
+
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    app.config_data = {"general": {"api_key_hash": generate_password_hash("secret")}}  # type: ignore[attr-defined]
+    app.register_blueprint(bp, url_prefix="/api/v1")
+
+    container = MagicMock()
+    container.resolve.return_value = StorageService()
+    with patch("researcharr.core.api.get_container", return_value=container):
+        yield app.test_client()
+
+
+def _walk(client, url, limit):
+    seen, cursor = [], None
+    while True:
+        query = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        body = client.get(url, query_string=query, headers=HEADERS).get_json()
+        seen.extend(body["items"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return seen
+
+
+def test_items_walk_with_opaque_cursor(client):
+    items = _walk(client, "/api/v1/items", 2)
+    assert [i["arr_id"] for i in items] == list(range(5))
+
+
+def test_app_logs_newest_first(client):
+    logs = _walk(client, "/api/v1/apps/1/logs", 2)
+    assert [log["id"] for log in logs] == [5, 4, 3, 2, 1]
+    assert isinstance(logs[0]["created_at"], str)
+
+
+def test_apps_hide_api_key(client):
+    body = client.get("/api/v1/apps", headers=HEADERS).get_json()
+    assert body["next_cursor"] is None
+    assert body["items"][0]["app_type"] == "radarr"
+    assert "api_key" not in body["items"][0]
+
+
+def test_invalid_cursor_is_rejected(client):
+    resp = client.get("/api/v1/items?cursor=%%%", headers=HEADERS)
+    assert resp.status_code == 400
+    assert resp.get_json() == {"error": "invalid_cursor"}
+
+
+def test_listing_requires_auth(client):
+    assert client.get("/api/v1/items").status_code == 401
@@ -17,6 +17,7 @@ from researcharr.core.services import (
     ConnectivityService,
     DatabaseService,
     HealthService,
+    HttpClientService,
     LoggingService,
     MetricsService,
     check_radarr_connection,
@@ -241,7 +242,7 @@ class TestConnectivityService(unittest.TestCase):
                 result = self.connectivity_service.has_valid_url_and_key([instance])
                 self.assertFalse(result)
 
-    @patch("requests.get")
+    @patch.object(HttpClientService, "get")
     def test_check_radarr_connection_success(self, mock_get):
         """Test successful Radarr connection check."""
         # Mock successful response
@@ -258,7 +259,7 @@ class TestConnectivityService(unittest.TestCase):
         self.assertTrue(result)
         mock_get.assert_called_once_with("http://localhost:7878")
 
-    @patch("requests.get")
+    @patch.object(HttpClientService, "get")
     def test_check_radarr_connection_failure(self, mock_get):
         """Test failed Radarr connection check."""
         # Mock error response
@@ -272,7 +273,7 @@ class TestConnectivityService(unittest.TestCase):
 
         self.assertFalse(result)
 
-    @patch("requests.get")
+    @patch.object(HttpClientService, "get")
     def test_check_radarr_connection_exception(self, mock_get):
         """Test Radarr connection check with exception."""
         # Mock request exception
@@ -296,7 +297,7 @@ class TestConnectivityService(unittest.TestCase):
         )
         self.assertFalse(result)
 
-    @patch("requests.get")
+    @patch.object(HttpClientService, "get")
     def test_check_sonarr_connection_success(self, mock_get):
         """Test successful Sonarr connection check."""
         # Mock successful response
@@ -1,6 +1,10 @@
 """Tests for HttpClientService."""
 
-from unittest.mock import patch
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from researcharr.core.services import HttpClientService
 
@@ -101,3 +105,108 @@ def test_http_client_service_post_with_files():
 
         assert response.status_code == 201
         mock_requests.post.assert_called_once_with("https://example.com", files=files)
+
+
+# Pooled sessions against a local server -------------------------------------
+
+
+@pytest.fixture
+def stub_server():
+    """Keep-alive HTTP/1.1 server recording requests and client connections."""
+    seen = {"connections": set(), "requests": [], "status": []}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            seen["connections"].add(self.client_address)
+            seen["requests"].append((self.command, self.path, dict(self.headers)))
+            status = seen["status"].pop(0) if seen["status"] else 200
+            body = b'{"ok": true}'
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_POST = do_GET  # noqa: N815
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", seen
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_requests_reuse_keep_alive_connection(stub_server):
+    url, seen = stub_server
+    svc = HttpClientService()
+    try:
+        for _ in range(5):
+            assert svc.get(f"{url}/api/v3/system/status").json() == {"ok": True}
+        assert len(seen["connections"]) == 1
+        assert svc._requests.hosts == [url]
+        assert "gzip" in seen["requests"][0][2]["Accept-Encoding"]
+    finally:
+        svc.close()
+
+
+def test_default_timeout_applies_unless_overridden():
+    svc = HttpClientService({"connect_timeout": 1, "read_timeout": 2})
+    session = MagicMock()
+    with patch.object(svc._requests, "session_for", return_value=session):
+        svc.get("http://radarr:7878/api")
+        svc.post("http://radarr:7878/api", timeout=9)
+    assert session.request.call_args_list[0].kwargs["timeout"] == (1, 2)
+    assert session.request.call_args_list[1].kwargs["timeout"] == 9
+
+
+def test_sessions_are_per_host():
+    svc = HttpClientService()
+    a = svc._requests.session_for("http://Radarr:7878/api/v3/movie")
+    assert svc._requests.session_for("http://radarr:7878/other") is a
+    assert svc._requests.session_for("http://sonarr:8989/api") is not a
+    adapter = a.get_adapter("http://radarr:7878")
+    assert adapter._pool_maxsize == svc.settings["pool_maxsize"]
+    svc.close()
+    assert svc._requests.hosts == []
+
+
+def test_idempotent_requests_retry_on_unavailable(stub_server):
+    url, seen = stub_server
+    svc = HttpClientService({"retries": 2, "backoff_factor": 0})
+    try:
+        seen["status"][:] = [503, 200]
+        assert svc.get(f"{url}/flaky").status_code == 200
+        # POST is not idempotent: the 503 is returned as-is
+        seen["status"][:] = [503, 200]
+        assert svc.post(f"{url}/command").status_code == 503
+        assert [r[0] for r in seen["requests"]] == ["GET", "GET", "POST"]
+    finally:
+        svc.close()
+
+
+def test_shared_client_comes_from_container():
+    from researcharr.core.container import get_container, reset_container
+    from researcharr.core.services import ConnectivityService, get_http_client
+
+    reset_container()
+    container = get_container()
+    registered = HttpClientService()
+    container.register_singleton("http_client_service", registered)
+    try:
+        assert get_http_client() is registered
+        assert ConnectivityService().http_client is registered
+
+        from plugins.media.example_sonarr import Plugin
+
+        assert Plugin({}).http is registered
+    finally:
+        reset_container()
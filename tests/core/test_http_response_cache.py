@@ -0,0 +1,161 @@
+"""Tests for conditional requests and the on-disk HTTP response cache."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from researcharr.core.http_cache import HttpResponseCache
+from researcharr.core.services import HttpClientService
+
+
+@pytest.fixture
+def arr_server():
+    """Keep-alive server whose responses are driven by ``state``."""
+    state = {"body": b'[{"id": 1, "title": "A"}]', "etag": None, "requests": []}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            state["requests"].append((self.path, self.headers.get("If-None-Match")))
+            etag = state["etag"]
+            if etag and self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = state["body"]
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            if etag:
+                self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", state
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def client(tmp_path):
+    svc = HttpClientService({"cache": {"dir": str(tmp_path / "http-cache")}})
+    yield svc
+    svc.close()
+
+
+def test_etag_revalidation_answers_from_disk(arr_server, client):
+    url, state = arr_server
+    state["etag"] = '"v1"'
+
+    first = client.get_json(f"{url}/api/v3/movie", params={"apikey": "secret"})
+    assert first.changed and not first.revalidated
+    assert first.json() == [{"id": 1, "title": "A"}]
+
+    second = client.get_json(f"{url}/api/v3/movie", params={"apikey": "secret"})
+    assert second.status_code == 200 and second.revalidated and not second.changed
+    assert second.json() == first.json()
+    assert [inm for _, inm in state["requests"]] == [None, '"v1"']
+
+    # Upstream changed: new ETag, new body
+    state["etag"], state["body"] = '"v2"', b"[]"
+    third = client.get_json(f"{url}/api/v3/movie", params={"apikey": "secret"})
+    assert third.changed and third.json() == []
+    assert client.cache.metrics["revalidated"] == 1
+
+
+def test_identical_body_without_validators_is_unchanged(arr_server, client):
+    url, state = arr_server
+    assert client.get_json(f"{url}/api/v3/system/status").changed
+    again = client.get_json(f"{url}/api/v3/system/status")
+    assert not again.changed and not again.revalidated
+    # Not decoded unless asked for
+    assert again._data is again._UNSET
+    state["body"] = b'{"version": "5"}'
+    assert client.get_json(f"{url}/api/v3/system/status").changed
+
+
+def test_cache_survives_restart_and_keeps_api_keys_off_disk(arr_server, tmp_path):
+    url, state = arr_server
+    state["etag"] = '"v1"'
+    config = {"cache": {"dir": str(tmp_path / "c")}}
+    HttpClientService(config).get_json(f"{url}/api/v3/movie?apikey=topsecret")
+
+    names = [p.name for p in (tmp_path / "c").iterdir()]
+    assert len(names) == 2 and not any("topsecret" in n for n in names)
+    assert all(b"topsecret" not in p.read_bytes() for p in (tmp_path / "c").iterdir())
+
+    restarted = HttpClientService(config)
+    assert restarted.get_json(f"{url}/api/v3/movie?apikey=topsecret").revalidated
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = HttpResponseCache(tmp_path, max_bytes=400)
+    for name in ("a", "b", "c"):
+        assert cache.store(name, b"x" * 100, {"sha256": name})
+    cache.touch("a")
+    cache.store("d", b"y" * 100, {"sha256": "d"})
+    cache.store("e", b"z" * 100, {"sha256": "e"})
+    assert cache.size_bytes <= 400
+    assert cache.lookup("b") is None and cache.lookup("a") is not None
+    # Larger than a quarter of the budget: not cached
+    assert not cache.store("big", b"x" * 101, {})
+    assert len(HttpResponseCache(tmp_path, max_bytes=400)) == len(cache) == 4
+
+
+def test_errors_and_disabled_cache_pass_through(arr_server, tmp_path):
+    url, state = arr_server
+    disabled = HttpClientService({"cache": {"enabled": False}})
+    assert disabled.cache is None
+    assert disabled.get_json(f"{url}/api/v3/movie").changed
+
+    svc = HttpClientService({"cache": {"dir": str(tmp_path)}})
+    state["body"] = b"not json"
+    result = svc.get_json(f"{url}/x")
+    with pytest.raises(ValueError):
+        result.json()
+
+
+def test_radarr_library_if_changed_skips_unchanged_library(arr_server, client):
+    from unittest.mock import patch
+
+    from plugins.media.example_radarr import Plugin
+
+    url, state = arr_server
+    plugin = Plugin({"url": url, "api_key": "k"})
+    with patch.object(Plugin, "http", client):
+        rows = plugin.library_if_changed()
+        assert [r["arr_id"] for r in rows] == [1]
+        assert plugin.library_if_changed() is None
+        assert plugin.library_if_changed(force=True) == rows
+        state["body"] = b'[{"id": 1, "title": "A"}, {"id": 2, "title": "B"}]'
+        assert len(plugin.library_if_changed()) == 2
+
+
+def test_sonarr_library_if_changed_ignores_other_callers_of_the_url(arr_server, client):
+    from unittest.mock import patch
+
+    from plugins.media.example_sonarr import Plugin
+
+    url, state = arr_server
+    plugin = Plugin({"url": url, "api_key": "k"})
+    with patch.object(Plugin, "http", client):
+        assert [r["arr_id"] for r in plugin.library_if_changed()] == [1]
+        # The UI sync sees the change first and re-stores the URL's digest
+        state["body"] = b'[{"id": 1, "title": "A"}, {"id": 2, "title": "B"}]'
+        assert len(plugin.sync()["series"]) == 2
+        assert len(plugin.library_if_changed()) == 2
+        assert plugin.library_if_changed() is None
+        # A fresh instance (e.g. after a restart) reconciles despite the warm cache
+        assert len(Plugin({"url": url, "api_key": "k"}).library_if_changed()) == 2
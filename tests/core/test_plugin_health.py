@@ -0,0 +1,137 @@
+"""Tests for concurrent plugin health checks with a deadline and TTL cache."""
+
+import concurrent.futures
+import threading
+import time
+
+import pytest
+
+from researcharr.core.plugin_health import PluginHealthChecker
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class Registry:
+    """Instances sleep for ``config["delay"]`` before reporting their health."""
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def list_plugins(self):
+        return ["radarr", "sonarr"]
+
+    def create_instance(self, name, config):
+        registry = self
+
+        class Plugin:
+            def health(self):
+                with registry._lock:
+                    registry.calls += 1
+                time.sleep(config.get("delay", 0))
+                if config.get("boom"):
+                    raise ConnectionError("refused")
+                return {"status": "ok"}
+
+            def validate(self):
+                return {"success": bool(config.get("url"))}
+
+        return Plugin()
+
+
+def test_checks_run_in_parallel_and_stragglers_are_pending():
+    registry = Registry()
+    checker = PluginHealthChecker({"deadline": 0.3})
+    instances = {
+        "radarr": [{"name": f"r{i}", "delay": 0.1} for i in range(8)],
+        "sonarr": [{"name": "stuck", "delay": 1.0}, {"name": "down", "boom": True}],
+    }
+    start = time.perf_counter()
+    report = checker.check_all(registry, instances)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.6  # 8 x 0.1s sequentially would exceed the deadline
+    assert all(e["state"] == "done" for e in report["radarr"])
+    stuck, down = report["sonarr"]
+    assert stuck["state"] == "pending" and "0.3s" in stuck["error"]
+    assert down["state"] == "error" and down["error"] == "refused"
+
+    # The straggler keeps running once, and its result is served from the cache
+    report = checker.check_all(registry, instances, deadline=2.0)
+    assert report["sonarr"][0]["state"] == "done"
+    assert registry.calls == 10
+    checker.shutdown()
+
+
+def test_results_expire_and_config_changes_miss_the_cache():
+    registry = Registry()
+    clock = Clock()
+    checker = PluginHealthChecker({"cache_ttl": 10}, clock=clock)
+    instances = {"radarr": [{"url": "http://r"}, {"enabled": False}]}
+
+    first = checker.check_all(registry, instances)
+    assert [e["index"] for e in first["radarr"]] == [0]  # disabled instances are skipped
+    assert checker.check_all(registry, instances)["radarr"][0]["cached"]
+    assert registry.calls == 1
+
+    clock.now += 11
+    assert not checker.check_all(registry, instances)["radarr"][0]["cached"]
+    instances["radarr"][0]["url"] = "http://other"
+    assert not checker.check_all(registry, instances)["radarr"][0]["cached"]
+    assert registry.calls == 3
+
+    # Expired results are pruned once a later check stores its own
+    assert len(checker._cache) == 2
+    clock.now += 11
+    checker.check_all(registry, instances)
+    assert len(checker._cache) == 1
+    checker.shutdown()
+
+
+def test_check_raises_plugin_errors_and_timeouts():
+    registry = Registry()
+    checker = PluginHealthChecker()
+    assert checker.check(registry, "radarr", {"url": "u"}, "validate") == {"success": True}
+    with pytest.raises(ConnectionError):
+        checker.check(registry, "sonarr", {"boom": True})
+    with pytest.raises(concurrent.futures.TimeoutError):
+        checker.check(registry, "sonarr", {"delay": 0.5}, deadline=0.05)
+    with pytest.raises(ValueError):
+        checker.check(registry, "sonarr", {}, "sync")
+    checker.shutdown()
+
+
+def test_validate_route_times_out_instead_of_blocking(client, login, app):
+    from researcharr.core.container import get_container, reset_container
+
+    class Slow:
+        def validate(self):
+            time.sleep(0.5)
+            return True
+
+    class SlowRegistry:
+        def get(self, name):
+            return object()
+
+        def create_instance(self, name, config):
+            return Slow()
+
+    reset_container()
+    get_container().register_singleton(
+        "plugin_health_checker", PluginHealthChecker({"deadline": 0.05})
+    )
+    try:
+        login()
+        app.plugin_registry = SlowRegistry()
+        app.config_data["slow"] = [{"url": "http://x", "api_key": "k"}]
+        rv = client.post("/api/plugins/slow/validate/0")
+        assert rv.status_code == 504
+        assert rv.get_json()["error"] == "validate_timeout"
+    finally:
+        reset_container()
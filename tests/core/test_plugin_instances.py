@@ -0,0 +1,99 @@
+"""Tests for pooled, long-lived plugin instances."""
+
+import threading
+import time
+
+import pytest
+
+from researcharr.core.plugin_instances import PluginInstanceManager, acquire_instance
+
+
+class Plugin:
+    built = 0
+
+    def __init__(self, config):
+        type(self).built += 1
+        self.config = config
+        self.events = []
+        time.sleep(config.get("slow", 0))
+
+    def setup(self):
+        self.events.append("setup")
+        if self.config.get("broken"):
+            raise ConnectionError("cannot connect")
+
+    def teardown(self):
+        self.events.append("teardown")
+
+
+@pytest.fixture
+def pool():
+    Plugin.built = 0
+    manager = PluginInstanceManager(lambda name, config: Plugin(config), max_instances=2)
+    yield manager
+    manager.close()
+
+
+def test_same_config_reuses_instance_and_changes_rebuild(pool):
+    first = pool.get("radarr", {"url": "http://a", "api_key": "k"})
+    assert first.events == ["setup"]
+    assert pool.get("radarr", {"api_key": "k", "url": "http://a"}) is first
+    changed = pool.get("radarr", {"url": "http://b", "api_key": "k"})
+    assert changed is not first
+    assert pool.metrics["created"] == 2 and pool.metrics["reused"] == 1
+
+    assert pool.retain("radarr", [{"url": "http://b", "api_key": "k"}]) == 1
+    assert first.events == ["setup", "teardown"] and len(pool) == 1
+    pool.close()
+    assert changed.events == ["setup", "teardown"] and len(pool) == 0
+
+
+def test_least_recently_used_instances_are_torn_down(pool):
+    a = pool.get("sonarr", {"n": 1})
+    b = pool.get("sonarr", {"n": 2})
+    pool.get("sonarr", {"n": 1})
+    pool.get("sonarr", {"n": 3})
+    assert b.events[-1] == "teardown" and a.events == ["setup"]
+
+
+def test_concurrent_callers_build_once_and_failed_setup_is_not_pooled(pool):
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(pool.get("radarr", {"slow": 0.05})))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert Plugin.built == 1 and all(r is results[0] for r in results)
+
+    with pytest.raises(ConnectionError):
+        pool.get("radarr", {"broken": True})
+    with pytest.raises(ConnectionError):
+        pool.get("radarr", {"broken": True})
+    assert len(pool) == 1
+
+
+def test_registry_pools_instances_for_api_calls(client, login, app):
+    from researcharr.plugins.registry import PluginRegistry
+
+    class Counting:
+        created = 0
+
+        def __init__(self, config):
+            Counting.created += 1
+
+        def sync(self):
+            return {"success": True}
+
+    registry = PluginRegistry()
+    registry.register("counting", Counting)
+    assert acquire_instance(registry, "counting", {}) is registry.get_instance("counting", {})
+
+    login()
+    app.plugin_registry = registry
+    app.config_data["counting"] = [{"url": "http://x", "api_key": "k"}]
+    for _ in range(3):
+        assert client.post("/api/plugins/counting/sync/0").status_code == 200
+    assert Counting.created == 2  # one for {} above, one for the configured instance
@@ -0,0 +1,123 @@
+"""Tests for running plugin calls in sandbox worker processes."""
+
+import os
+import textwrap
+from unittest.mock import Mock
+
+import pytest
+
+from researcharr.core.container import get_container, reset_container
+from researcharr.core.plugin_instances import PluginInstanceManager, acquire_instance
+from researcharr.core.plugin_manifest import load_plugin_file
+from researcharr.core.plugin_sandbox import PluginCallError, PluginSandbox, SandboxedPlugin
+
+PLUGIN_SOURCE = textwrap.dedent(
+    """
+    import os
+    import time
+
+    PLUGIN_NAME = "probe"
+
+
+    class Plugin:
+        def __init__(self, config):
+            self.config = config
+            self.calls = 0
+
+        def setup(self):
+            print("noise on stdout must not break the protocol")
+
+        def sync(self):
+            self.calls += 1
+            time.sleep(self.config.get("sleep", 0))
+            if self.config.get("fail"):
+                raise ConnectionError("arr unreachable")
+            return {"pid": os.getpid(), "calls": self.calls, "items": [1, 2]}
+
+        def health(self):
+            return {"status": "ok", "pid": os.getpid()}
+
+        def validate(self):
+            return {"success": True, "pid": os.getpid()}
+    """
+)
+
+
+@pytest.fixture(scope="module")
+def plugin_cls(tmp_path_factory):
+    path = tmp_path_factory.mktemp("sandbox_plugins") / "probe.py"
+    path.write_text(PLUGIN_SOURCE)
+    return load_plugin_file(str(path), None)[1]
+
+
+@pytest.fixture(scope="module")
+def sandbox():
+    box = PluginSandbox({"enabled": True, "workers": 1, "max_calls": 3}, codec="json")
+    yield box
+    box.close()
+
+
+def test_calls_run_in_a_reused_worker_and_plugin_errors_come_back(sandbox, plugin_cls):
+    first = sandbox.call(plugin_cls, {}, "sync")
+    second = sandbox.call(plugin_cls, {}, "sync")
+    assert first["pid"] != os.getpid() and first["items"] == [1, 2]
+    # Same worker and same pooled instance inside it
+    assert (second["pid"], second["calls"]) == (first["pid"], 2)
+
+    with pytest.raises(PluginCallError, match="arr unreachable") as exc:
+        sandbox.call(plugin_cls, {"fail": True}, "sync")
+    assert exc.value.error_type == "ConnectionError"
+    with pytest.raises(ValueError):
+        sandbox.call(plugin_cls, {}, "validate")
+
+    # max_calls=3 was reached, so the next call gets a fresh worker
+    assert sandbox.call(plugin_cls, {}, "health")["pid"] != first["pid"]
+    assert sandbox.metrics["recycled"] >= 1
+
+
+def test_timeout_kills_worker_and_the_pool_recovers(plugin_cls):
+    box = PluginSandbox({"workers": 1}, codec="json")
+    try:
+        before = box.call(plugin_cls, {}, "health")["pid"]
+        with pytest.raises(TimeoutError):
+            box.call(plugin_cls, {"sleep": 30}, "sync", timeout=0.5)
+        assert box.metrics["timeouts"] == 1
+        with pytest.raises(ProcessLookupError):
+            os.kill(before, 0)
+        assert box.call(plugin_cls, {}, "health")["pid"] != before
+    finally:
+        box.close()
+
+
+def test_high_memory_worker_is_replaced(plugin_cls):
+    # Default codec: msgpack when installed
+    box = PluginSandbox({"workers": 1, "max_rss_mb": 16})
+    try:
+        first = box.call(plugin_cls, {}, "health")["pid"]
+        assert box.call(plugin_cls, {}, "health")["pid"] != first
+    finally:
+        box.close()
+
+
+def test_acquire_instance_wraps_only_when_sandbox_enabled(plugin_cls):
+    registry = Mock()
+    registry.instances = PluginInstanceManager(lambda name, config: plugin_cls(config))
+    sandbox = Mock(enabled=False)
+    get_container().register_singleton("plugin_sandbox", sandbox)
+    try:
+        local = acquire_instance(registry, "probe", {"url": "http://a"})
+        assert isinstance(local, plugin_cls)
+
+        sandbox.enabled = True
+        sandbox.wrap.side_effect = lambda instance, config: SandboxedPlugin(
+            sandbox, instance, config
+        )
+        proxy = acquire_instance(registry, "probe", {"url": "http://a"})
+        sandbox.call.return_value = {"status": "ok"}
+        assert proxy.health() == {"status": "ok"}
+        sandbox.call.assert_called_once_with(plugin_cls, {"url": "http://a"}, "health")
+        # Everything else stays on the local pooled instance
+        assert proxy.validate()["pid"] == os.getpid()
+        assert proxy.config is local.config
+    finally:
+        reset_container()
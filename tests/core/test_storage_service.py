@@ -116,7 +116,7 @@ class TestStorageService:
         result = service.get_tracked_item(1)
 
         assert result == mock_item
-        mock_uow.items.get_by_id.assert_called_once_with(1)
+        mock_uow.items.get_by_id.assert_called_once_with(1, load="with_app")
 
     @patch("researcharr.repositories.uow.UnitOfWork")
     def test_get_processing_logs(self, mock_uow_class):
@@ -125,13 +125,14 @@ class TestStorageService:
 
         mock_logs = [Mock(id=1), Mock(id=2)]
         mock_uow = Mock()
-        mock_uow.logs.get_recent.return_value = mock_logs
+        mock_uow.views.recent_logs.return_value = mock_logs
         mock_uow_class.return_value.__enter__.return_value = mock_uow
 
         result = service.get_processing_logs(limit=50)
 
         assert result == mock_logs
-        mock_uow.logs.get_recent.assert_called_once_with(limit=50)
+        mock_uow.views.recent_logs.assert_called_once_with(limit=50)
+        mock_uow_class.assert_called_once_with(read_only=True)
 
     @patch("researcharr.repositories.uow.UnitOfWork")
     def test_get_processing_logs_default_limit(self, mock_uow_class):
@@ -140,13 +141,13 @@ class TestStorageService:
 
         mock_logs = [Mock(id=1)]
         mock_uow = Mock()
-        mock_uow.logs.get_recent.return_value = mock_logs
+        mock_uow.views.recent_logs.return_value = mock_logs
         mock_uow_class.return_value.__enter__.return_value = mock_uow
 
         result = service.get_processing_logs()
 
         assert result == mock_logs
-        mock_uow.logs.get_recent.assert_called_once_with(limit=100)
+        mock_uow.views.recent_logs.assert_called_once_with(limit=100)
 
     @patch("researcharr.repositories.uow.UnitOfWork")
     def test_get_search_cycle(self, mock_uow_class):
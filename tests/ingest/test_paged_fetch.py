@@ -0,0 +1,126 @@
+"""Tests for paged, concurrent *arr fetching (Sonarr wanted endpoints)."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from researcharr.ingest import iter_pages, project_wanted_episode
+
+
+def _pager(total, page_size, delay=0.0, state=None):
+    state = state if state is not None else {}
+    state.update(active=0, peak=0, requested=[])
+    lock = threading.Lock()
+
+    def fetch(page):
+        with lock:
+            state["requested"].append(page)
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(delay)
+        with lock:
+            state["active"] -= 1
+        start = (page - 1) * page_size
+        records = list(range(start, min(start + page_size, total)))
+        return {"page": page, "pageSize": page_size, "totalRecords": total, "records": records}
+
+    return fetch, state
+
+
+def test_iter_pages_yields_every_page_in_order():
+    fetch, state = _pager(total=23, page_size=5)
+    pages = list(iter_pages(fetch, concurrency=3))
+    assert [len(p) for p in pages] == [5, 5, 5, 5, 3]
+    assert [r for p in pages for r in p] == list(range(23))
+    assert sorted(state["requested"]) == [1, 2, 3, 4, 5]
+
+
+def test_iter_pages_single_and_empty_results():
+    fetch, _ = _pager(total=3, page_size=5)
+    assert list(iter_pages(fetch)) == [[0, 1, 2]]
+    fetch, _ = _pager(total=0, page_size=5)
+    assert list(iter_pages(fetch)) == [[]]
+    with pytest.raises(ValueError):
+        next(iter_pages(fetch, concurrency=0))
+
+
+def test_iter_pages_bounds_in_flight_and_scales_with_concurrency():
+    fetch, state = _pager(total=90, page_size=10, delay=0.05)
+    start = time.perf_counter()
+    assert len(list(iter_pages(fetch, concurrency=4))) == 9
+    elapsed = time.perf_counter() - start
+    assert state["peak"] <= 4
+    # 1 + 8 pages; serial would be 9 * 50 ms
+    assert elapsed < 0.35
+
+
+def test_iter_pages_stops_prefetching_when_consumer_stops():
+    fetch, state = _pager(total=1000, page_size=10, delay=0.01)
+    pages = iter_pages(fetch, concurrency=2)
+    next(pages)
+    next(pages)
+    pages.close()
+    assert len(state["requested"]) <= 1 + 2 + 1
+
+
+def test_project_wanted_episode_maps_to_series():
+    row = project_wanted_episode(
+        {
+            "id": 901,
+            "seriesId": 7,
+            "hasFile": True,
+            "episodeFile": {"customFormatScore": 35},
+            "series": {"id": 7, "title": "Show", "year": 2019, "tvdbId": 123, "monitored": True},
+        }
+    )
+    assert row["arr_id"] == 7 and row["title"] == "Show" and row["tvdb_id"] == 123
+    # Cutoff-unmet episodes have a file, but the series must stay searchable
+    assert row["has_file"] is False and row["custom_format_score"] == 35.0
+    assert project_wanted_episode({"id": 1, "seriesId": 7}) is None
+
+
+def _episode(episode_id, series_id, has_file=False):
+    return {
+        "id": episode_id,
+        "seriesId": series_id,
+        "hasFile": has_file,
+        "series": {"id": series_id, "title": f"Series {series_id}", "tvdbId": series_id * 10},
+    }
+
+
+def test_sonarr_iter_wanted_pages_both_endpoints_and_dedupes_series():
+    from plugins.media.example_sonarr import Plugin
+    from researcharr.core.services import HttpClientService
+
+    wanted = {
+        "missing": [_episode(i, i % 4 + 1) for i in range(1, 8)],
+        "cutoff": [_episode(100, 2, True), _episode(101, 9, True)],
+    }
+
+    def fake_get(self, url, params=None, **kwargs):
+        kind = url.rsplit("/", 1)[-1]
+        page, size = params["page"], params["pageSize"]
+        response = MagicMock()
+        response.json.return_value = {
+            "page": page,
+            "pageSize": size,
+            "totalRecords": len(wanted[kind]),
+            "records": wanted[kind][(page - 1) * size : page * size],
+        }
+        return response
+
+    plugin = Plugin({"url": "http://sonarr", "api_key": "k", "page_size": 2})
+    with patch.object(HttpClientService, "get", autospec=True, side_effect=fake_get) as mock_get:
+        chunks = list(plugin.iter_wanted(chunk_size=3))
+
+    rows = [row for chunk in chunks for row in chunk]
+    assert [len(c) for c in chunks] == [3, 2]
+    assert [row["arr_id"] for row in rows] == [2, 3, 4, 1, 9]
+    # Series 9 only has a cutoff-unmet episode and must still be searched
+    assert not any(row["has_file"] for row in rows)
+    # 4 pages of missing + 1 page of cutoff
+    assert mock_get.call_count == 5
+    assert mock_get.call_args.kwargs["params"]["includeSeries"] == "true"
+    assert list(Plugin({}).iter_wanted()) == []
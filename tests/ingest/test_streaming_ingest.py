@@ -0,0 +1,195 @@
+"""Tests for streaming *arr library ingestion."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from researcharr import cache as _cache
+from researcharr.ingest import (
+    ingest_library,
+    iter_chunks,
+    iter_json_array,
+    project_tracked_item,
+    stream_library,
+)
+from researcharr.storage.database import get_session, init_db
+from researcharr.storage.models import AppType, ManagedApp, TrackedItem
+
+
+def _split(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class _StreamResponse:
+    def __init__(self, payload):
+        self._data = json.dumps(payload).encode("utf-8")
+
+    def iter_content(self, chunk_size=1):
+        return iter(_split(self._data, 7))
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 16, 4096])
+def test_iter_json_array_any_split(size):
+    payload = [
+        {"id": 1, "title": "Amélie", "nested": {"a": [1, 2, {"b": "]"}]}},
+        123,
+        "str,with]brackets",
+        None,
+        [1, [2]],
+        -4.5e3,
+    ]
+    data = json.dumps(payload).encode("utf-8")
+    assert list(iter_json_array(_split(data, size))) == payload
+
+
+def test_iter_json_array_empty_and_whitespace():
+    assert list(iter_json_array([b"  [ ", b" ]  "])) == []
+
+
+@pytest.mark.parametrize("doc", [b'{"a": 1}', b"[1, 2", b"[1 2]", b"[,1]", b""])
+def test_iter_json_array_rejects_malformed(doc):
+    with pytest.raises(ValueError):
+        list(iter_json_array(_split(doc, 2)))
+
+
+def test_iter_json_array_is_lazy():
+    def chunks():
+        yield b'[{"id": 1},'
+        raise AssertionError("read past the first element")
+
+    gen = iter_json_array(chunks())
+    assert next(gen) == {"id": 1}
+
+
+def test_project_radarr_record():
+    raw = {
+        "id": 7,
+        "title": "Movie",
+        "year": 2020,
+        "monitored": False,
+        "hasFile": True,
+        "tmdbId": 603,
+        "imdbId": "tt0133093",
+        "movieFile": {"customFormatScore": 35},
+        "images": [{"url": "x" * 1000}],
+    }
+    assert project_tracked_item(raw, AppType.RADARR) == {
+        "arr_id": 7,
+        "title": "Movie",
+        "year": 2020,
+        "monitored": False,
+        "has_file": True,
+        "tmdb_id": 603,
+        "tvdb_id": None,
+        "imdb_id": "tt0133093",
+        "custom_format_score": 35.0,
+    }
+
+
+def test_project_sonarr_record_uses_statistics():
+    raw = {
+        "id": 3,
+        "title": "Show",
+        "tvdbId": 81189,
+        "statistics": {"episodeFileCount": 10, "episodeCount": 12},
+    }
+    row = project_tracked_item(raw, "sonarr")
+    assert row["tvdb_id"] == 81189
+    assert row["has_file"] is False
+    assert row["custom_format_score"] == 0.0
+
+
+def test_project_skips_unusable_records():
+    assert project_tracked_item({"title": "No id"}, AppType.RADARR) is None
+    assert project_tracked_item({"id": 1}, AppType.RADARR) is None
+    assert project_tracked_item("nope", AppType.RADARR) is None  # type: ignore[arg-type]
+
+
+def test_iter_chunks():
+    assert list(iter_chunks(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    with pytest.raises(ValueError):
+        list(iter_chunks([], 0))
+
+
+def test_stream_library_chunks_projected_rows():
+    payload = [{"id": i, "title": f"M{i}", "hasFile": i % 2 == 0} for i in range(1, 8)]
+    payload.insert(3, {"title": "broken"})
+    chunks = list(stream_library(_StreamResponse(payload), AppType.RADARR, chunk_size=3))
+    assert [len(c) for c in chunks] == [3, 3, 1]
+    assert [r["arr_id"] for c in chunks for r in c] == list(range(1, 8))
+    assert set(chunks[0][0]) == {
+        "arr_id",
+        "title",
+        "year",
+        "monitored",
+        "has_file",
+        "tmdb_id",
+        "tvdb_id",
+        "imdb_id",
+        "custom_format_score",
+    }
+
+
+@pytest.fixture
+def storage_app(tmp_path):
+    _cache.clear_all()
+    init_db(tmp_path / "ingest.db", use_migrations=False)
+    with get_session() as session:
+        app = ManagedApp(
+            app_type=AppType.RADARR,
+            name="Radarr",
+            base_url="http://radarr:7878",
+            api_key="k",
+        )
+        session.add(app)
+        session.flush()
+        app_id = app.id
+    yield app_id
+    _cache.clear_all()
+
+
+def test_sync_batch_upserts_and_preserves_search_state(storage_app):
+    with get_session() as session:
+        session.add(
+            TrackedItem(
+                app_id=storage_app, arr_id=1, title="Old", monitored=True, failed_search_count=2
+            )
+        )
+
+    totals = ingest_library(
+        storage_app,
+        [
+            [{"arr_id": 1, "title": "New", "has_file": True}],
+            [],
+            [{"arr_id": 2, "title": "Two"}, {"arr_id": 3, "title": "Three"}],
+        ],
+    )
+    assert totals == {"created": 2, "updated": 1, "chunks": 2}
+
+    with get_session() as session:
+        rows = {i.arr_id: i for i in session.query(TrackedItem).all()}
+    assert rows[1].title == "New"
+    assert rows[1].has_file is True
+    assert rows[1].failed_search_count == 2
+    assert set(rows) == {1, 2, 3}
+
+
+def test_plugin_iter_library_streams_response():
+    from plugins.media.example_radarr import Plugin
+
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.iter_content.side_effect = _StreamResponse(
+        [{"id": 1, "title": "A"}, {"id": 2, "title": "B"}]
+    ).iter_content
+    plugin = Plugin({"url": "http://radarr", "api_key": "k"})
+
+    from researcharr.core.services import HttpClientService
+
+    with patch.object(HttpClientService, "get", return_value=response) as mock_get:
+        chunks = list(plugin.iter_library(chunk_size=1))
+
+    assert [c[0]["arr_id"] for c in chunks] == [1, 2]
+    assert mock_get.call_args.kwargs["stream"] is True
+    assert list(Plugin({}).iter_library()) == []
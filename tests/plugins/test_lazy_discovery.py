@@ -0,0 +1,127 @@
+"""Tests for manifest-based, lazy plugin discovery."""
+
+import json
+import os
+import sys
+import textwrap
+
+from researcharr.core.plugin_manifest import scan_plugins
+from researcharr.plugins.registry import PluginRegistry
+
+
+def write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write(textwrap.dedent(content))
+
+
+def _plugins(tmp_path):
+    write(
+        tmp_path / "media" / "movies.py",
+        """
+        import sys
+        sys.modules.setdefault("lazy_test_imports", []).append("movies")
+        PLUGIN_NAME = "movies"
+        class Plugin:
+            description = "Movies"
+            def __init__(self, config):
+                self.config = config
+        """,
+    )
+    write(
+        tmp_path / "notify.py",
+        """
+        import sys
+        sys.modules.setdefault("lazy_test_imports", []).append("notify")
+        PLUGIN_NAME = "notify"
+        CATEGORY = "notifications"
+        class Plugin:
+            def __init__(self, config):
+                self.config = config
+        """,
+    )
+    write(tmp_path / "helpers.py", "VALUE = 1\n")
+    write(tmp_path / "broken.py", "PLUGIN_NAME = 'broken'\nclass Plugin(:\n")
+
+
+def test_lazy_discovery_imports_plugins_on_first_use(tmp_path, monkeypatch):
+    _plugins(tmp_path)
+    monkeypatch.setitem(sys.modules, "lazy_test_imports", [])
+    reg = PluginRegistry()
+    reg.discover_local(str(tmp_path), lazy=True)
+
+    assert sorted(reg.list_plugins()) == ["movies", "notify"]
+    assert reg.describe("movies") == {
+        "category": "media",
+        "description": "Movies",
+        "docs_url": None,
+    }
+    assert reg.describe("notify")["category"] == "notifications"
+    assert reg.describe("missing") is None
+    assert sys.modules["lazy_test_imports"] == []
+
+    cls = reg.get("movies")
+    assert cls.category == "media" and cls.description == "Movies"
+    assert sys.modules["lazy_test_imports"] == ["movies"]
+    assert reg.get("movies") is cls
+    assert reg.describe("movies")["description"] == "Movies"
+    assert reg.create_instance("notify", {"a": 1}).config == {"a": 1}
+    assert reg.get("notify").category == "notifications"
+    assert sys.modules["lazy_test_imports"] == ["movies", "notify"]
+
+
+def test_manifest_is_reused_until_a_file_changes(tmp_path, monkeypatch):
+    plugins_dir = tmp_path / "plugins"
+    _plugins(plugins_dir)
+    manifest = tmp_path / "manifest.json"
+    specs = scan_plugins(str(plugins_dir), str(manifest))
+    assert {s.name: s.category for s in specs} == {"movies": None, "notify": "notifications"}
+    assert len(json.loads(manifest.read_text())["files"]) == 4
+
+    import researcharr.core.plugin_manifest as pm
+
+    parsed = []
+    original = pm.read_spec
+    monkeypatch.setattr(pm, "read_spec", lambda *a: parsed.append(a[0]) or original(*a))
+    assert scan_plugins(str(plugins_dir), str(manifest)) == specs
+    assert parsed == []
+
+    write(
+        plugins_dir / "notify.py",
+        "PLUGIN_NAME = 'notify2'\nclass Plugin:\n    pass\n",
+    )
+    names = {s.name for s in scan_plugins(str(plugins_dir), str(manifest))}
+    assert names == {"movies", "notify2"}
+    assert parsed == [str(plugins_dir / "notify.py")]
+
+
+def test_computed_plugin_names_are_imported_eagerly(tmp_path):
+    write(
+        tmp_path / "dynamic.py",
+        """
+        PLUGIN_NAME = "dyn" + "amic"
+        class Plugin:
+            def __init__(self, config):
+                self.config = config
+        """,
+    )
+    reg = PluginRegistry()
+    reg.discover_local(str(tmp_path), lazy=True)
+    assert reg.list_plugins() == ["dynamic"]
+    assert reg.get("dynamic").category == "plugins"
+
+
+def test_plugins_page_lists_lazy_plugins_without_importing_them(
+    tmp_path, monkeypatch, client, login
+):
+    _plugins(tmp_path)
+    monkeypatch.setitem(sys.modules, "lazy_test_imports", [])
+    reg = PluginRegistry()
+    reg.discover_local(str(tmp_path), lazy=True)
+    monkeypatch.setattr(client.application, "plugin_registry", reg)
+    login()
+
+    rv = client.get("/settings/plugins")
+    assert rv.status_code == 200
+    assert b"movies" in rv.data and b"Movies" in rv.data
+    assert sys.modules["lazy_test_imports"] == []
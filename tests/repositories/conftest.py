@@ -1,6 +1,10 @@
 """Shared fixtures for repository tests."""
 
+from contextlib import contextmanager
+
 import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 
 from researcharr import cache as _cache
 from researcharr.repositories import (
@@ -10,6 +14,7 @@ from researcharr.repositories import (
     SearchCycleRepository,
     TrackedItemRepository,
 )
+from researcharr.repositories.audit_log import shutdown_audit_log_writer
 from researcharr.storage.models import AppType, GlobalSettings, ManagedApp
 
 
@@ -21,6 +26,45 @@ def clear_repository_cache():
     _cache.clear_all()
 
 
+@pytest.fixture(autouse=True)
+def synchronous_audit_log(monkeypatch):
+    """Write log_event rows in the caller's session so tests can read them back."""
+    monkeypatch.setenv("RESEARCHARR_AUDIT_LOG_SYNC", "true")
+    shutdown_audit_log_writer()
+    yield
+    shutdown_audit_log_writer()
+
+
+@pytest.fixture
+def assert_query_count():
+    """Assert how many SQL statements a block executes.
+
+    Counts every statement sent to any engine (sync or async), so N+1
+    loading regressions show up as extra statements:
+
+        with assert_query_count(1) as statements:
+            repo.get_by_id(item_id, load="with_app").app.name
+    """
+
+    @contextmanager
+    def _assert(expected: int):
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(Engine, "before_cursor_execute", _record)
+        assert len(statements) == expected, (
+            f"expected {expected} queries, got {len(statements)}:\n" + "\n---\n".join(statements)
+        )
+
+    return _assert
+
+
 @pytest.fixture
 def settings_repo(db_session):
     """Create GlobalSettingsRepository."""
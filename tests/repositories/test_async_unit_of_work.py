@@ -0,0 +1,140 @@
+"""Tests for the async storage variant (AsyncUnitOfWork + async repositories)."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from researcharr.async_pipeline import Pipeline  # noqa: E402
+from researcharr.repositories.async_uow import AsyncUnitOfWork  # noqa: E402
+from researcharr.storage.async_database import (  # noqa: E402
+    dispose_async_db,
+    init_async_db,
+)
+from researcharr.storage.models import (  # noqa: E402
+    AppType,
+    CyclePhase,
+    ManagedApp,
+    SortStrategy,
+)
+
+
+def run_async(coro):
+    return asyncio.run(coro)
+
+
+def _with_db(tmp_path, body):
+    async def runner():
+        await init_async_db(tmp_path / "async.db", create_tables=True)
+        try:
+            async with AsyncUnitOfWork() as uow:
+                app = await uow.apps.create(
+                    ManagedApp(
+                        app_type=AppType.SONARR,
+                        name="Sonarr",
+                        base_url="http://sonarr:8989",
+                        api_key="k",
+                    )
+                )
+                app_id = app.id
+            return await body(app_id)
+        finally:
+            await dispose_async_db()
+
+    return run_async(runner())
+
+
+def test_async_uow_requires_init():
+    async def body():
+        async with AsyncUnitOfWork():
+            pass
+
+    with pytest.raises(RuntimeError):
+        run_async(body())
+
+
+def test_items_sync_batch_and_search(tmp_path):
+    async def body(app_id):
+        async with AsyncUnitOfWork() as uow:
+            result = await uow.items.sync_batch(
+                app_id,
+                [
+                    {"arr_id": 1, "title": "B", "custom_format_score": 5.0},
+                    {"arr_id": 2, "title": "A", "custom_format_score": 1.0},
+                    {"arr_id": 3, "title": "C", "has_file": True},
+                ],
+            )
+            assert result == {"created": 3, "updated": 0}
+
+        async with AsyncUnitOfWork(read_only=True) as uow:
+            found = await uow.items.get_items_for_search(
+                app_id, SortStrategy.ALPHABETICAL_ASC, limit=10
+            )
+            assert [i.title for i in found] == ["A", "B"]
+            item = await uow.items.get_by_arr_id(app_id, 1)
+            with_app = await uow.items.get_by_id(item.id, load="with_app")
+            assert with_app.app.name == "Sonarr"
+
+        async with AsyncUnitOfWork() as uow:
+            await uow.items.mark_searched(item.id, False, datetime.utcnow() - timedelta(minutes=1))
+            assert await uow.items.get_retry_queue_size(app_id) == 1
+
+    _with_db(tmp_path, body)
+
+
+def test_cycles_and_logs(tmp_path):
+    async def body(app_id):
+        async with AsyncUnitOfWork() as uow:
+            first = await uow.cycles.create_cycle(app_id)
+            await uow.cycles.complete_cycle(first.id, datetime.utcnow())
+            second = await uow.cycles.create_cycle(app_id)
+            await uow.cycles.update_phase(second.id, CyclePhase.SEARCHING)
+            await uow.logs.log_event(app_id, "search", "ok")
+            await uow.logs.log_event(app_id, "search", "failed", success=False)
+
+        async with AsyncUnitOfWork(read_only=True) as uow:
+            assert second.cycle_number == 2
+            active = await uow.cycles.get_active_cycle(app_id)
+            assert active.id == second.id
+            assert active.phase == CyclePhase.SEARCHING
+            logs = await uow.logs.get_by_event_type(app_id, "search")
+            assert len(logs) == 2
+
+        async with AsyncUnitOfWork() as uow:
+            assert await uow.logs.cleanup_old_logs(days=-1) == 2
+
+    _with_db(tmp_path, body)
+
+
+def test_rollback_on_error(tmp_path):
+    async def body(app_id):
+        with pytest.raises(ValueError):
+            async with AsyncUnitOfWork() as uow:
+                await uow.logs.log_event(app_id, "search", "dropped")
+                raise ValueError("boom")
+        async with AsyncUnitOfWork(read_only=True) as uow:
+            assert await uow.logs.get_by_app(app_id) == []
+
+    _with_db(tmp_path, body)
+
+
+def test_pipeline_stage_persists_without_thread_hop(tmp_path):
+    async def body(app_id):
+        async def persist(item):
+            async with AsyncUnitOfWork() as uow:
+                await uow.logs.log_event(app_id, "search", f"item {item}")
+            return item
+
+        p = Pipeline()
+        p.add_stage(persist, concurrency=4)
+        await p.start()
+        for i in range(20):
+            await p.push(i)
+        await p.shutdown()
+
+        async with AsyncUnitOfWork(read_only=True) as uow:
+            assert len(await uow.logs.get_by_app(app_id)) == 20
+
+    _with_db(tmp_path, body)
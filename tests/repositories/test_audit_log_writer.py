@@ -0,0 +1,151 @@
+"""Tests for the group-commit ProcessingLog writer."""
+
+import threading
+
+import pytest
+
+from researcharr import cache as _cache
+from researcharr.repositories import audit_log
+from researcharr.repositories.audit_log import AuditLogWriter
+from researcharr.repositories.exceptions import ValidationError
+from researcharr.repositories.uow import UnitOfWork
+from researcharr.storage.database import get_session, init_db
+from researcharr.storage.models import AppType, ManagedApp, ProcessingLog
+
+
+@pytest.fixture
+def app_id(tmp_path):
+    _cache.clear_all()
+    init_db(tmp_path / "audit.db", use_migrations=False)
+    with get_session() as session:
+        app = ManagedApp(app_type=AppType.RADARR, name="A", base_url="http://a", api_key="k")
+        session.add(app)
+        session.flush()
+        new_id = app.id
+    yield new_id
+    _cache.clear_all()
+
+
+def _count():
+    with get_session() as session:
+        return session.query(ProcessingLog).count()
+
+
+def test_synchronous_mode_writes_immediately(app_id):
+    writer = AuditLogWriter(synchronous=True)
+    assert writer.submit(app_id, "search", "hello")
+    assert _count() == 1
+    assert writer.stats()["batches"] == 1
+
+
+def test_rejects_invalid_event_at_submit(app_id):
+    writer = AuditLogWriter(synchronous=True)
+    with pytest.raises(ValidationError):
+        writer.submit(app_id, "", "no type")
+
+
+def test_background_thread_group_commits(app_id):
+    writer = AuditLogWriter(max_batch=50, flush_interval=0.05)
+    try:
+        for i in range(120):
+            assert writer.submit(app_id, "search", f"event {i}")
+        assert writer.flush(timeout=5)
+        stats = writer.stats()
+        assert stats["written"] == 120
+        assert stats["batches"] < 120
+        assert _count() == 120
+    finally:
+        writer.close()
+
+
+def test_flush_invalidates_app_cache(app_id):
+    key = _cache.make_key(("ProcessingLog", "counts", app_id, "all"))
+    _cache.set(key, {"stale": 1}, ttl=60)
+    writer = AuditLogWriter(flush_interval=0.01)
+    try:
+        writer.submit(app_id, "search", "x")
+        writer.flush(timeout=5)
+    finally:
+        writer.close()
+    assert _cache.get(key) is None
+
+
+def test_close_drains_pending_events(app_id):
+    writer = AuditLogWriter(max_batch=1000, flush_interval=10)
+    for i in range(30):
+        writer.submit(app_id, "search", f"e{i}")
+    writer.close(timeout=5)
+    assert _count() == 30
+    assert not writer.submit(app_id, "search", "after close")
+
+
+def test_full_queue_applies_backpressure_then_drops(app_id, monkeypatch):
+    writer = AuditLogWriter(max_queue=1, block_timeout=0.01, flush_interval=0.01)
+    gate = threading.Event()
+    writing = threading.Event()
+    original = writer._write
+
+    def slow_write(rows):
+        writing.set()
+        gate.wait(5)
+        original(rows)
+
+    monkeypatch.setattr(writer, "_write", slow_write)
+    try:
+        writer.submit(app_id, "search", "first")
+        assert writing.wait(5)  # worker is stuck writing; queue holds one more
+        accepted = [writer.submit(app_id, "search", f"e{i}") for i in range(3)]
+        assert accepted == [True, False, False]
+        assert writer.stats()["dropped"] == 2
+    finally:
+        gate.set()
+        writer.close()
+
+
+def test_bad_row_does_not_lose_batch(app_id):
+    writer = AuditLogWriter(synchronous=True)
+    writer._write(
+        [
+            {"app_id": app_id, "event_type": "e", "message": "ok", "success": True},
+            {"app_id": None, "event_type": "e", "message": "bad", "success": True},
+        ]
+    )
+    assert _count() == 1
+    assert writer.stats()["failed"] == 1
+
+
+def test_global_writer_honours_sync_env_and_shutdown(app_id, monkeypatch):
+    monkeypatch.setenv("RESEARCHARR_AUDIT_LOG_SYNC", "true")
+    audit_log.shutdown_audit_log_writer()
+    writer = audit_log.get_audit_log_writer()
+    try:
+        assert writer.synchronous
+        assert audit_log.get_audit_log_writer() is writer
+    finally:
+        audit_log.shutdown_audit_log_writer()
+    assert audit_log._writer is None
+
+
+def test_log_event_defers_to_background_writer(app_id, monkeypatch):
+    monkeypatch.delenv("RESEARCHARR_AUDIT_LOG_SYNC")
+    audit_log.shutdown_audit_log_writer()
+    try:
+        with UnitOfWork() as uow:
+            log = uow.logs.log_event(app_id, "search", "queued")
+            assert log.id is None  # written later, outside this transaction
+        assert audit_log.get_audit_log_writer().flush(timeout=5)
+        assert _count() == 1
+    finally:
+        audit_log.shutdown_audit_log_writer()
+
+
+def test_synchronous_log_event_reuses_the_open_session(app_id):
+    writer = AuditLogWriter(synchronous=True)
+    with UnitOfWork() as uow:
+        # No second checkout of the single write connection
+        assert writer.submit(app_id, "search", "inside uow")
+        assert writer.submit(app_id, "search", "explicit", session=uow.session)
+        log = uow.logs.log_event(app_id, "search", "via repository")
+        assert log.id is not None
+    assert _count() == 3
+    assert writer.stats()["failed"] == 0
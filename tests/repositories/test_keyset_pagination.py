@@ -0,0 +1,110 @@
+"""Tests for keyset (cursor) pagination in repositories."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from researcharr.compat import UTC
+from researcharr.repositories.base import decode_cursor, encode_cursor
+from researcharr.repositories.exceptions import ValidationError
+from researcharr.repositories.uow import UnitOfWork
+from researcharr.storage import log_partitions
+from researcharr.storage.database import get_session, init_db
+from researcharr.storage.models import AppType, ManagedApp, ProcessingLog, TrackedItem
+
+
+@pytest.fixture
+def app_id(tmp_path):
+    init_db(tmp_path / "keyset.db", use_migrations=False)
+    with get_session() as session:
+        app = ManagedApp(app_type=AppType.RADARR, name="A", base_url="http://a", api_key="k")
+        session.add(app)
+        session.flush()
+        session.add_all(
+            TrackedItem(app_id=app.id, arr_id=i, title=f"Item {i}") for i in range(1, 26)
+        )
+        new_id = app.id
+    return new_id
+
+
+def _base():
+    return datetime(2024, 1, 1, tzinfo=UTC).replace(tzinfo=None)
+
+
+def _add_logs(app_id, count):
+    base = _base()
+    with get_session() as session:
+        # Pairs share a timestamp so the id tie-breaker matters
+        session.add_all(
+            ProcessingLog(
+                app_id=app_id,
+                event_type="search",
+                message=f"log {i}",
+                created_at=base + timedelta(minutes=i // 2),
+            )
+            for i in range(count)
+        )
+
+
+def test_cursor_round_trip():
+    key = (_base(), 42)
+    cursor = encode_cursor(key)
+    assert "=" not in cursor
+    assert decode_cursor(cursor, 2) == key
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "bnVsbA", "WzFd"])
+def test_decode_rejects_malformed_cursor(cursor):
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor, 2)
+
+
+def test_tracked_item_pages_walk_every_row_once(app_id):
+    seen = []
+    after = None
+    with UnitOfWork(read_only=True) as uow:
+        while True:
+            page = uow.items.get_page(page_size=10, after=after)
+            if not page:
+                break
+            seen.extend(item.id for item in page)
+            after = page[-1].id
+    assert seen == sorted(seen)
+    assert len(seen) == len(set(seen)) == 25
+
+
+def test_offset_paging_is_ordered(app_id):
+    with UnitOfWork(read_only=True) as uow:
+        page2 = uow.items.get_page(page=2, page_size=10)
+        assert [item.arr_id for item in page2] == list(range(11, 21))
+        assert uow.items.get_page(page_size=10, after=page2[0].id - 1) == page2
+
+
+def test_managed_app_keyset_page(app_id):
+    with get_session() as session:
+        session.add(ManagedApp(app_type=AppType.SONARR, name="B", base_url="http://b", api_key="k"))
+    with UnitOfWork(read_only=True) as uow:
+        first = uow.apps.get_page(page_size=1)
+        rest = uow.apps.get_page(page_size=10, after=first[0].id)
+    assert [a.name for a in first + rest] == ["A", "B"]
+
+
+@pytest.mark.parametrize("partitioned", [False, True])
+def test_logs_page_newest_first_with_tie_breaker(app_id, partitioned):
+    log_partitions.set_partitioning(partitioned)
+    try:
+        _add_logs(app_id, 7)
+        seen = []
+        after = None
+        with UnitOfWork(read_only=True) as uow:
+            while page := uow.logs.get_by_app(app_id, limit=3, after=after):
+                seen.extend(log.message for log in page)
+                after = (page[-1].created_at, page[-1].id)
+    finally:
+        log_partitions.set_partitioning(None)
+    assert seen == [f"log {i}" for i in reversed(range(7))]
+
+
+def test_keyset_rejects_wrong_key_length(app_id):
+    with UnitOfWork(read_only=True) as uow, pytest.raises(ValidationError):
+        uow.logs.get_by_app(app_id, after=(_base(),))
@@ -0,0 +1,60 @@
+"""Tests for per-call repository loading profiles."""
+
+import pytest
+from sqlalchemy import inspect
+
+from researcharr.repositories.exceptions import ValidationError
+from researcharr.storage.models import TrackedItem
+
+
+@pytest.fixture
+def app_with_items(db_session, sample_radarr_app):
+    db_session.add_all(
+        TrackedItem(app_id=sample_radarr_app.id, arr_id=i, title=f"Movie {i}") for i in range(5)
+    )
+    db_session.commit()
+    db_session.expunge_all()  # start each test from an empty identity map
+    return sample_radarr_app
+
+
+def test_item_bare_loads_app_lazily(item_repo, app_with_items, assert_query_count):
+    with assert_query_count(2) as statements:
+        item = item_repo.get_by_id(1)
+        assert "app" in inspect(item).unloaded
+        assert item.app.name == "Test Radarr"
+    assert "managed_apps" not in statements[0]
+
+
+def test_item_with_app_uses_one_query(item_repo, app_with_items, assert_query_count):
+    with assert_query_count(1):
+        item = item_repo.get_by_id(1, load="with_app")
+        assert item.app.name == "Test Radarr"
+
+
+def test_app_bare_does_not_load_items(app_repo, app_with_items, assert_query_count):
+    with assert_query_count(1) as statements:
+        app = app_repo.get_by_id(app_with_items.id)
+    assert "tracked_items" not in statements[0]
+    assert "tracked_items" in inspect(app).unloaded
+    assert app.items_count is None
+
+
+def test_app_with_items_count_uses_correlated_subquery(
+    app_repo, app_with_items, db_session, assert_query_count
+):
+    with assert_query_count(1):
+        app = app_repo.get_by_id(app_with_items.id, load="with_items_count")
+        assert app.items_count == 5
+    assert "tracked_items" in inspect(app).unloaded
+
+    db_session.add(TrackedItem(app_id=app.id, arr_id=99, title="Late"))
+    db_session.flush()
+    # Already in the identity map: the count is still refreshed
+    assert app_repo.get_by_id(app.id, load="with_items_count").items_count == 6
+
+
+def test_unsupported_profile_rejected(app_repo, item_repo, app_with_items):
+    with pytest.raises(ValidationError):
+        item_repo.get_by_id(1, load="with_items_count")
+    with pytest.raises(ValidationError):
+        app_repo.get_by_id(app_with_items.id, load="with_app")
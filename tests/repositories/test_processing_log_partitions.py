@@ -0,0 +1,224 @@
+"""Tests for monthly processing-log partitions."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from researcharr import cache as _cache
+from researcharr.compat import UTC
+from researcharr.repositories.audit_log import AuditLogWriter
+from researcharr.repositories.uow import UnitOfWork
+from researcharr.storage import log_partitions
+from researcharr.storage.database import get_session, init_db
+from researcharr.storage.models import AppType, ManagedApp, ProcessingLog
+
+
+@pytest.fixture
+def app_id(tmp_path):
+    _cache.clear_all()
+    init_db(tmp_path / "partitions.db", use_migrations=False)
+    with get_session() as session:
+        app = ManagedApp(app_type=AppType.RADARR, name="A", base_url="http://a", api_key="k")
+        session.add(app)
+        session.flush()
+        new_id = app.id
+    log_partitions.set_partitioning(True)
+    yield new_id
+    log_partitions.set_partitioning(None)
+    _cache.clear_all()
+
+
+def _at(*parts):
+    """Naive UTC datetime, matching the model columns."""
+    return datetime(*parts, tzinfo=UTC).replace(tzinfo=None)
+
+
+def _log_at(app_id, moment, event_type="search", success=True):
+    with get_session() as session:
+        return log_partitions.insert_row(
+            session.connection(),
+            {
+                "app_id": app_id,
+                "event_type": event_type,
+                "message": moment.isoformat(),
+                "success": success,
+                "created_at": moment,
+            },
+        )
+
+
+def _partitions():
+    with get_session() as session:
+        return log_partitions.list_partitions(session.connection())
+
+
+def test_partition_naming_and_bounds():
+    name = log_partitions.partition_name(_at(2024, 12, 31, 23, 59))
+    assert name == "processing_logs_2024_12"
+    assert log_partitions.partition_bounds(name) == (_at(2024, 12, 1), _at(2025, 1, 1))
+    with pytest.raises(ValueError):
+        log_partitions.partition_bounds("processing_logs_all")
+
+
+def test_env_enables_partitioning(monkeypatch):
+    log_partitions.set_partitioning(None)
+    monkeypatch.setenv("RESEARCHARR_LOG_PARTITIONS", "monthly")
+    assert log_partitions.partitioning_enabled()
+    monkeypatch.setenv("RESEARCHARR_LOG_PARTITIONS", "off")
+    assert not log_partitions.partitioning_enabled()
+
+
+def test_log_event_writes_to_current_month_partition(app_id):
+    with UnitOfWork() as uow:
+        log = uow.logs.log_event(app_id, "search", "hello")
+    assert log.id is not None
+    assert _partitions() == [log_partitions.partition_name(datetime.utcnow())]
+    with get_session() as session:
+        assert session.query(ProcessingLog).count() == 0  # legacy table untouched
+        assert session.execute(text("SELECT COUNT(*) FROM processing_logs_all")).scalar() == 1
+
+
+def test_ids_increase_across_partitions(app_id):
+    with get_session() as session:
+        session.add(ProcessingLog(app_id=app_id, event_type="legacy", message="old"))
+    first = _log_at(app_id, _at(2024, 1, 15))
+    second = _log_at(app_id, _at(2024, 2, 15))
+    assert 1 < first < second
+    assert _partitions() == ["processing_logs_2024_02", "processing_logs_2024_01"]
+
+
+def test_late_rows_append_to_newest_partition(app_id):
+    _log_at(app_id, _at(2024, 2, 1))
+    _log_at(app_id, _at(2024, 1, 31, 23, 59))
+    assert _partitions() == ["processing_logs_2024_02"]
+
+
+def test_recent_reads_merge_partitions_newest_first(app_id):
+    with get_session() as session:
+        session.add(
+            ProcessingLog(
+                app_id=app_id,
+                event_type="search",
+                message="legacy",
+                created_at=_at(2023, 12, 1),
+            )
+        )
+    for month in (1, 2, 3):
+        for day in (5, 20):
+            _log_at(app_id, _at(2024, month, day), event_type="fail" if day == 5 else "search")
+
+    with UnitOfWork(read_only=True) as uow:
+        recent = uow.logs.get_by_app(app_id, limit=3)
+        assert [r.created_at for r in recent] == [
+            _at(2024, 3, 20),
+            _at(2024, 3, 5),
+            _at(2024, 2, 20),
+        ]
+        assert len(uow.logs.get_by_app(app_id, limit=100)) == 7
+        fails = uow.logs.get_by_event_type(app_id, "fail", limit=2)
+        assert [r.created_at.month for r in fails] == [3, 2]
+        assert uow.logs.get_recent(limit=1)[0].created_at == _at(2024, 3, 20)
+        assert len(uow.logs.get_all()) == 7
+        assert uow.logs.get_by_id(recent[0].id).message == recent[0].message
+
+
+def test_recent_read_prunes_older_partitions(app_id, monkeypatch):
+    for month in (1, 2, 3):
+        _log_at(app_id, _at(2024, month, 10))
+        _log_at(app_id, _at(2024, month, 20))
+    with UnitOfWork(read_only=True) as uow:
+        queried = []
+        original = uow.session.query
+
+        def tracking_query(*entities):
+            queried.append(entities)
+            return original(*entities)
+
+        monkeypatch.setattr(uow.session, "query", tracking_query)
+        uow.logs.get_by_app(app_id, limit=2)
+    assert len(queried) == 1  # March satisfied the limit; Jan/Feb skipped
+
+
+def test_aggregates_cover_all_partitions(app_id):
+    _log_at(app_id, _at(2024, 1, 10), success=False)
+    _log_at(app_id, _at(2024, 2, 10))
+    _log_at(app_id, _at(2024, 2, 11), event_type="grab")
+    with UnitOfWork(read_only=True) as uow:
+        assert uow.logs.get_event_counts(app_id) == {"search": 2, "grab": 1}
+        assert uow.logs.get_success_rate(app_id) == pytest.approx(2 / 3)
+
+
+def test_cleanup_drops_whole_expired_partitions(app_id):
+    now = datetime.utcnow()
+    with get_session() as session:
+        session.add(
+            ProcessingLog(
+                app_id=app_id,
+                event_type="search",
+                message="legacy",
+                created_at=now - timedelta(days=400),
+            )
+        )
+    _log_at(app_id, now - timedelta(days=200))
+    _log_at(app_id, now - timedelta(days=199))
+    _log_at(app_id, now)
+    with UnitOfWork() as uow:
+        assert uow.logs.cleanup_old_logs(days=30) == 3
+    assert _partitions() == [log_partitions.partition_name(now)]
+    with UnitOfWork(read_only=True) as uow:
+        assert len(uow.logs.get_all()) == 1
+
+
+def test_audit_writer_batches_into_partition(app_id):
+    writer = AuditLogWriter(synchronous=True)
+    writer.submit(app_id, "search", "queued")
+    assert _partitions() == [log_partitions.partition_name(datetime.utcnow())]
+    with UnitOfWork(read_only=True) as uow:
+        assert [log.message for log in uow.logs.get_recent()] == ["queued"]
+
+
+def test_async_repository_shares_partition_routing(app_id, tmp_path):
+    pytest.importorskip("aiosqlite")
+    import asyncio
+
+    from researcharr.repositories.async_uow import AsyncUnitOfWork
+    from researcharr.storage.async_database import dispose_async_db, init_async_db
+
+    now = datetime.utcnow()
+    last_month = now.replace(day=1, hour=0, minute=0) - timedelta(days=1)
+    _log_at(app_id, last_month)
+    with UnitOfWork() as uow:
+        uow.logs.log_event(app_id, "search", "sync")
+
+    async def body():
+        await init_async_db(tmp_path / "partitions.db")
+        try:
+            async with AsyncUnitOfWork() as uow:
+                written = await uow.logs.log_event(app_id, "grab", "async")
+            async with AsyncUnitOfWork(read_only=True) as uow:
+                recent = [log.message for log in await uow.logs.get_recent(10)]
+                by_app = await uow.logs.get_by_app(app_id, limit=2)
+                older = await uow.logs.get_by_app(
+                    app_id, after=(by_app[-1].created_at, by_app[-1].id)
+                )
+                grabs = await uow.logs.get_by_event_type(app_id, "grab")
+            async with AsyncUnitOfWork() as uow:
+                dropped = await uow.logs.cleanup_old_logs(days=0)
+            return written.id, recent, [log.message for log in older], grabs, dropped
+        finally:
+            await dispose_async_db()
+
+    written_id, recent, older, grabs, dropped = asyncio.run(body())
+    assert recent == ["async", "sync", last_month.isoformat()]
+    assert older == [last_month.isoformat()]
+    assert [log.id for log in grabs] == [written_id]
+
+    # Async rows land in the partition, never the legacy table
+    with UnitOfWork(read_only=True) as uow:
+        assert uow.logs.get_by_id(written_id).message == "async"
+        assert [log.message for log in uow.logs.get_recent(1)] == ["async"]
+        assert uow.session.query(ProcessingLog).count() == 0
+    # Async retention drops last month's partition as a whole
+    assert dropped == 1
+    assert _partitions() == [log_partitions.partition_name(now)]
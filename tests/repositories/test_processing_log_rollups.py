@@ -0,0 +1,167 @@
+"""Tests for hourly processing-log statistics rollups."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, text
+
+from researcharr import cache as _cache
+from researcharr.compat import UTC
+from researcharr.repositories.audit_log import AuditLogWriter
+from researcharr.repositories.uow import UnitOfWork
+from researcharr.storage import log_partitions, log_rollups
+from researcharr.storage.database import get_read_engine, get_session, init_db
+from researcharr.storage.models import AppType, ManagedApp, ProcessingLog, ProcessingLogRollup
+
+
+def _at(*parts):
+    """Naive UTC datetime, matching the model columns."""
+    return datetime(*parts, tzinfo=UTC).replace(tzinfo=None)
+
+
+@pytest.fixture
+def app_id(tmp_path):
+    _cache.clear_all()
+    init_db(tmp_path / "rollups.db", use_migrations=False)
+    with get_session() as session:
+        app = ManagedApp(app_type=AppType.RADARR, name="A", base_url="http://a", api_key="k")
+        session.add(app)
+        session.flush()
+        new_id = app.id
+    yield new_id
+    _cache.clear_all()
+
+
+def _add(app_id, moment, event_type="search", success=True):
+    with get_session() as session:
+        session.add(
+            ProcessingLog(
+                app_id=app_id,
+                event_type=event_type,
+                message="m",
+                success=success,
+                created_at=moment,
+            )
+        )
+
+
+def _rollups():
+    with get_session() as session:
+        return sorted(
+            (r.event_type, r.hour, r.total, r.succeeded)
+            for r in session.query(ProcessingLogRollup).all()
+        )
+
+
+def test_inserts_update_hourly_buckets(app_id):
+    _add(app_id, _at(2024, 1, 1, 10, 5))
+    _add(app_id, _at(2024, 1, 1, 10, 55), success=False)
+    _add(app_id, _at(2024, 1, 1, 11, 0))
+    with UnitOfWork() as uow:
+        uow.logs.log_event(app_id, "grab", "now")
+    hour = log_rollups.hour_floor(datetime.utcnow())
+    assert _rollups() == sorted(
+        [
+            ("search", _at(2024, 1, 1, 10), 2, 1),
+            ("search", _at(2024, 1, 1, 11), 1, 1),
+            ("grab", hour, 1, 1),
+        ]
+    )
+
+
+def test_orm_delete_decrements(app_id):
+    _add(app_id, _at(2024, 1, 1, 10, 5))
+    _add(app_id, _at(2024, 1, 1, 10, 6), event_type="grab")
+    with UnitOfWork() as uow:
+        log = uow.logs.get_by_event_type(app_id, "grab")[0]
+        uow.logs.delete(log.id)
+    with UnitOfWork(read_only=True) as uow:
+        assert uow.logs.get_event_counts(app_id) == {"search": 1}
+
+
+def test_statistics_read_rollups_not_raw_rows(app_id):
+    for minute in range(0, 60, 10):
+        _add(app_id, _at(2024, 1, 1, 10, minute), success=minute < 30)
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = get_read_engine()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with UnitOfWork(read_only=True) as uow:
+            assert uow.logs.get_event_counts(app_id) == {"search": 6}
+            assert uow.logs.get_success_rate(app_id) == pytest.approx(0.5)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    assert statements
+    assert all("processing_log_rollups" in s for s in statements)
+    assert not any("FROM processing_logs " in s for s in statements)
+
+
+def test_since_inside_an_hour_counts_head_from_raw_log(app_id):
+    _add(app_id, _at(2024, 1, 1, 10, 10))
+    _add(app_id, _at(2024, 1, 1, 10, 40), success=False)
+    _add(app_id, _at(2024, 1, 1, 11, 20))
+    with UnitOfWork(read_only=True) as uow:
+        assert uow.logs.get_event_counts(app_id, since=_at(2024, 1, 1, 10, 30)) == {"search": 2}
+        assert uow.logs.get_success_rate(app_id, since=_at(2024, 1, 1, 10, 30)) == 0.5
+        assert uow.logs.get_event_counts(app_id, since=_at(2024, 1, 1, 11)) == {"search": 1}
+
+
+def test_group_commit_writer_records_rollups(app_id):
+    writer = AuditLogWriter(synchronous=True)
+    writer._write(
+        [
+            {"app_id": app_id, "event_type": "e", "message": "a", "success": True},
+            {"app_id": app_id, "event_type": "e", "message": "b", "success": False},
+        ]
+    )
+    with UnitOfWork(read_only=True) as uow:
+        assert uow.logs.get_event_counts(app_id) == {"e": 2}
+        assert uow.logs.get_success_rate(app_id) == 0.5
+
+
+def test_partitioned_inserts_record_rollups(app_id):
+    log_partitions.set_partitioning(True)
+    try:
+        with UnitOfWork() as uow:
+            uow.logs.log_event(app_id, "search", "one")
+            uow.logs.log_event(app_id, "search", "two", success=False)
+        with UnitOfWork(read_only=True) as uow:
+            assert uow.logs.get_event_counts(app_id) == {"search": 2}
+    finally:
+        log_partitions.set_partitioning(None)
+
+
+def test_cleanup_recounts_expired_hours(app_id):
+    now = datetime.utcnow()
+    _add(app_id, now - timedelta(days=40))
+    _add(app_id, now - timedelta(days=1))
+    with UnitOfWork() as uow:
+        assert uow.logs.cleanup_old_logs(days=30) == 1
+    assert [total for _, _, total, _ in _rollups()] == [1]
+
+
+def test_compaction_repairs_drift(app_id):
+    now = datetime.utcnow()
+    _add(app_id, now)
+    with get_session() as session:
+        session.execute(text("UPDATE processing_logs SET success = 0"))
+    with UnitOfWork(read_only=True) as uow:
+        assert uow.logs.get_success_rate(app_id) == 1.0  # stale rollup
+    with UnitOfWork() as uow:
+        uow.logs.compact_rollups(hours=2)
+    with UnitOfWork(read_only=True) as uow:
+        assert uow.logs.get_success_rate(app_id) == 0.0
+
+
+def test_rebuild_matches_incremental_counts(app_id):
+    for hour in range(3):
+        for minute in (0, 30):
+            _add(app_id, _at(2024, 1, 1, hour, minute), success=minute == 0)
+    before = _rollups()
+    with get_session() as session:
+        log_rollups.rebuild(session.connection())
+    assert _rollups() == before
@@ -0,0 +1,75 @@
+"""Tests for column-projection read models."""
+
+import dataclasses
+
+import pytest
+
+from researcharr.repositories.read_models import ProcessingLogView, TrackedItemView
+from researcharr.repositories.uow import UnitOfWork
+from researcharr.storage import log_partitions
+from researcharr.storage.database import get_session, init_db
+from researcharr.storage.models import AppType, ManagedApp, ProcessingLog, TrackedItem
+
+
+@pytest.fixture
+def app_id(tmp_path):
+    init_db(tmp_path / "views.db", use_migrations=False)
+    with get_session() as session:
+        app = ManagedApp(app_type=AppType.SONARR, name="S", base_url="http://s", api_key="k")
+        session.add(app)
+        session.flush()
+        session.add_all(TrackedItem(app_id=app.id, arr_id=i, title=f"T{i}") for i in range(3))
+        session.add_all(
+            ProcessingLog(app_id=app.id, event_type="search", message=f"m{i}") for i in range(4)
+        )
+        new_id = app.id
+    return new_id
+
+
+def test_views_are_slotted_and_frozen(app_id):
+    with UnitOfWork(read_only=True) as uow:
+        item = uow.views.items_by_app(app_id)[0]
+    assert isinstance(item, TrackedItemView)
+    assert not hasattr(item, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        item.title = "changed"  # type: ignore[misc]
+
+
+def test_views_do_not_touch_identity_map(app_id):
+    with UnitOfWork(read_only=True) as uow:
+        rows = uow.views.all_items() + uow.views.recent_logs()
+        assert len(rows) == 7
+        assert len(uow.session.identity_map) == 0
+
+
+def test_views_match_orm_listings(app_id):
+    with UnitOfWork(read_only=True) as uow:
+        orm = uow.logs.get_by_app(app_id, limit=3)
+        views = uow.views.logs_by_app(app_id, limit=3)
+        assert [v.id for v in views] == [log.id for log in orm]
+        after = (views[-1].created_at, views[-1].id)
+        assert [v.id for v in uow.views.logs_by_app(app_id, after=after)] == [orm[-1].id - 1]
+        assert [i.arr_id for i in uow.views.items_page(limit=2, after=1)] == [1, 2]
+
+
+def test_to_dict_is_json_ready(app_id):
+    with UnitOfWork(read_only=True) as uow:
+        app = uow.views.apps_page()[0].to_dict()
+        log = uow.views.recent_logs(limit=1)[0]
+    assert app["app_type"] == "sonarr"
+    assert "api_key" not in app
+    assert isinstance(log, ProcessingLogView)
+    assert isinstance(log.to_dict()["created_at"], str)
+
+
+def test_partitioned_logs(app_id):
+    log_partitions.set_partitioning(True)
+    try:
+        with UnitOfWork() as uow:
+            newest = uow.logs.log_event(app_id, "grab", "partitioned")
+        with UnitOfWork(read_only=True) as uow:
+            views = uow.views.logs_by_app(app_id, limit=2)
+    finally:
+        log_partitions.set_partitioning(None)
+    assert views[0].id == newest.id
+    assert len(views) == 2
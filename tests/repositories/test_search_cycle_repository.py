@@ -1,8 +1,16 @@
 """Tests for SearchCycleRepository."""
 
+import threading
 from datetime import datetime, timedelta
 
-from researcharr.storage.models import CyclePhase
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from researcharr.repositories import SearchCycleRepository
+from researcharr.repositories.exceptions import NotFoundError
+from researcharr.storage.database import DEFAULT_SQLITE_PRAGMAS, create_sqlite_engine
+from researcharr.storage.models import CyclePhase, ManagedApp
 
 
 def test_create_cycle_first(cycle_repo, sample_radarr_app):
@@ -124,3 +132,72 @@ def test_update_cycle_stats(cycle_repo, sample_radarr_app, db_session):
     assert updated.items_searched == 5
     assert updated.items_succeeded == 3
     assert updated.items_failed == 2
+
+
+def test_create_cycle_allocates_from_counter(
+    cycle_repo, sample_radarr_app, db_session, assert_query_count
+):
+    """Cycle numbers come from one UPDATE ... RETURNING, not a read of the latest cycle."""
+    updated_at = sample_radarr_app.updated_at
+    with assert_query_count(2) as statements:
+        cycle = cycle_repo.create_cycle(sample_radarr_app.id)
+    assert statements[0].startswith("UPDATE managed_apps")
+    assert statements[1].startswith("INSERT INTO search_cycles")
+    assert cycle.cycle_number == 1
+    assert cycle_repo.create_cycle(sample_radarr_app.id).cycle_number == 2
+
+    counter = ManagedApp.__table__.c.next_cycle_number
+    assert db_session.execute(select(counter)).scalar() == 3
+    db_session.expire_all()
+    assert sample_radarr_app.updated_at == updated_at
+
+
+def test_create_cycle_unknown_app(cycle_repo):
+    """Test creating a cycle for a missing app."""
+    with pytest.raises(NotFoundError):
+        cycle_repo.create_cycle(999)
+
+
+def test_create_cycle_concurrent_workers(temp_db, sample_radarr_app):
+    """Workers with their own connections never receive the same cycle number."""
+    numbers: list[int] = []
+    errors: list[Exception] = []
+
+    def worker():
+        engine = create_sqlite_engine(temp_db, DEFAULT_SQLITE_PRAGMAS)
+        try:
+            for _ in range(5):
+                with Session(engine) as session, session.begin():
+                    cycle = SearchCycleRepository(session).create_cycle(sample_radarr_app.id)
+                    numbers.append(cycle.cycle_number)
+        except Exception as e:  # surfaced by the assertion below
+            errors.append(e)
+        finally:
+            engine.dispose()
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert sorted(numbers) == list(range(1, 21))
+
+
+def test_updating_a_stale_app_keeps_the_cycle_counter(
+    cycle_repo, app_repo, sample_radarr_app, db_session
+):
+    """Merging a detached app loaded before cycles were created must not rewind the counter."""
+    db_session.commit()
+    db_session.expunge(sample_radarr_app)  # e.g. an app handed out by StorageService
+
+    assert cycle_repo.create_cycle(sample_radarr_app.id).cycle_number == 1
+    assert cycle_repo.create_cycle(sample_radarr_app.id).cycle_number == 2
+    db_session.commit()
+
+    sample_radarr_app.name = "Renamed"
+    app_repo.update(sample_radarr_app)
+    db_session.commit()
+
+    assert cycle_repo.create_cycle(sample_radarr_app.id).cycle_number == 3
@@ -0,0 +1,56 @@
+"""Tests for the prebuilt hot-path repository statements."""
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from researcharr.repositories import statements
+from researcharr.storage.models import SortStrategy, TrackedItem
+
+
+@contextmanager
+def _cache_stats(engine):
+    stats = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        stats.append(context.cache_hit)
+
+    event.listen(engine, "after_cursor_execute", _record)
+    try:
+        yield stats
+    finally:
+        event.remove(engine, "after_cursor_execute", _record)
+
+
+def test_hot_queries_reuse_compiled_sql(item_repo, cycle_repo, sample_radarr_app, db_session):
+    """Repeat calls with different arguments hit the compiled cache."""
+    app_id = sample_radarr_app.id
+    db_session.add(TrackedItem(app_id=app_id, arr_id=1, title="A"))
+    db_session.flush()
+    calls = [
+        lambda n: item_repo.get_by_arr_id(app_id, n),
+        lambda n: item_repo.get_items_for_search(app_id, SortStrategy.ALPHABETICAL_ASC, n),
+        lambda n: cycle_repo.get_latest_cycle(app_id + n),
+        lambda n: cycle_repo.get_active_cycle(app_id + n),
+    ]
+    for call in calls:
+        call(1)  # warm
+    with _cache_stats(db_session.get_bind()) as stats:
+        for call in calls:
+            call(2)
+    assert len(stats) == len(calls)
+    assert all(s.name == "CACHE_HIT" for s in stats)
+
+
+def test_items_for_search_statement_lookup():
+    every = [
+        statements.items_for_search(strategy, retries)
+        for strategy in SortStrategy
+        for retries in (True, False)
+    ]
+    assert len({id(stmt) for stmt in every}) == len(SortStrategy) * 2
+    # Plain string values resolve like the enum; unknown strategies are unordered
+    assert statements.items_for_search("random", True) is statements.items_for_search(
+        SortStrategy.RANDOM, True
+    )
+    assert not statements.items_for_search("bogus", False)._order_by_clauses
@@ -0,0 +1,146 @@
+"""Tests for batched search command submission."""
+
+import asyncio
+import itertools
+from types import SimpleNamespace
+
+import pytest
+
+from researcharr.scheduling.batch_search import BatchSearchDispatcher
+from researcharr.storage.models import AppType
+
+
+class _Response:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self._body = body
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+
+class FakeArr:
+    """Command endpoint: commands finish after ``rounds`` polls, ending ``outcome``."""
+
+    def __init__(self, rounds=1, outcome=None):
+        self.rounds = rounds
+        self.outcome = outcome or {}
+        self.ids = itertools.count(100)
+        self.commands = {}
+        self.posts = []
+        self.polls = 0
+
+    async def post(self, url, params=None, json=None):
+        assert url.endswith("/api/v3/command") and params == {"apikey": "k"}
+        self.posts.append(json)
+        if json.get("movieIds") == [666]:
+            return _Response(400, {"message": "bad id"})
+        command_id = next(self.ids)
+        self.commands[command_id] = json
+        return _Response(201, {"id": command_id, "status": "queued"})
+
+    async def get(self, url, params=None):
+        self.polls += 1
+        done = self.polls >= self.rounds
+        return _Response(
+            200,
+            [
+                {
+                    "id": command_id,
+                    "status": self.outcome.get(command_id, "completed") if done else "started",
+                }
+                for command_id in self.commands
+            ],
+        )
+
+
+def _app(app_type=AppType.RADARR):
+    return SimpleNamespace(app_type=app_type, name="arr", base_url="http://arr", api_key="k")
+
+
+def _items(*arr_ids):
+    return [SimpleNamespace(arr_id=i) for i in arr_ids]
+
+
+def test_items_are_submitted_as_id_lists_and_polled_together():
+    arr = FakeArr(rounds=2, outcome={101: "failed"})
+    dispatcher = BatchSearchDispatcher(batch_size=4, poll_interval=0.001, http=arr)
+
+    results = asyncio.run(dispatcher.search(_app(), _items(*range(1, 11))))
+
+    assert [c["movieIds"] for c in arr.posts] == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]
+    assert arr.polls == 2  # one GET per round, not per command
+    assert results == [True] * 4 + [False] * 4 + [True] * 2
+    assert dispatcher.metrics == {"commands": 3, "polls": 2, "rejected": 0, "failed": 1}
+
+
+def test_rejected_batches_fail_and_pruned_commands_count_as_done():
+    arr = FakeArr()
+    arr.get = lambda url, params=None: asyncio.sleep(0, _Response(200, []))
+    dispatcher = BatchSearchDispatcher(batch_size=1, poll_interval=0.001, http=arr)
+    assert asyncio.run(dispatcher.search(_app(), _items(1, 666))) == [True, False]
+    assert dispatcher.metrics["rejected"] == 1
+
+
+def test_unfinished_commands_count_as_accepted_after_timeout():
+    arr = FakeArr(rounds=10**6)
+    dispatcher = BatchSearchDispatcher(poll_interval=0.01, completion_timeout=0.05, http=arr)
+    assert asyncio.run(dispatcher.search(_app(), _items(1, 2))) == [True, True]
+    assert 1 <= arr.polls <= 5
+
+
+def test_sonarr_items_search_per_series():
+    arr = FakeArr()
+    dispatcher = BatchSearchDispatcher(batch_size=50, poll_interval=0.001, http=arr)
+    assert asyncio.run(dispatcher.search(_app(AppType.SONARR), _items(7, 8))) == [True, True]
+    assert arr.posts == [
+        {"name": "SeriesSearch", "seriesId": 7},
+        {"name": "SeriesSearch", "seriesId": 8},
+    ]
+    assert arr.polls == 1
+    with pytest.raises(ValueError):
+        BatchSearchDispatcher(batch_size=0)
+
+
+def test_orchestrator_records_batch_results(tmp_path):
+    pytest.importorskip("aiosqlite")
+    from researcharr.repositories.async_uow import AsyncUnitOfWork
+    from researcharr.scheduling import CycleOrchestrator
+    from researcharr.storage.async_database import dispose_async_db, init_async_db
+    from researcharr.storage.models import GlobalSettings, ManagedApp
+
+    async def sync(app):
+        return [{"arr_id": i, "title": f"Movie {i}"} for i in range(1, 6)]
+
+    async def body():
+        await init_async_db(tmp_path / "batch.db", create_tables=True)
+        try:
+            async with AsyncUnitOfWork() as uow:
+                uow.session.add(GlobalSettings(id=1, items_per_cycle=5, max_retries=3))
+                app = await uow.apps.create(
+                    ManagedApp(
+                        app_type=AppType.RADARR, name="r", base_url="http://arr", api_key="k"
+                    )
+                )
+            arr = FakeArr(outcome={101: "aborted"})
+            dispatcher = BatchSearchDispatcher(batch_size=3, poll_interval=0.001, http=arr)
+            with pytest.raises(ValueError):
+                CycleOrchestrator(sync)
+            orchestrator = CycleOrchestrator(sync, batch_search=dispatcher, retry_tick=None)
+            await orchestrator.run_cycle(app.id)
+            await orchestrator.stop()
+
+            assert len(arr.posts) == 2 and arr.polls == 1
+            async with AsyncUnitOfWork(read_only=True) as uow:
+                (cycle,) = await uow.cycles.get_by_app(app.id)
+                failed = [i for i in await uow.items.get_by_app(app.id) if i.failed_search_count]
+            assert (cycle.items_succeeded, cycle.items_failed) == (3, 2)
+            assert cycle.items_in_retry_queue == 2 and len(failed) == 2
+        finally:
+            await dispose_async_db()
+
+    asyncio.run(body())
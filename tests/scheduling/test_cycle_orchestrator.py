@@ -0,0 +1,311 @@
+"""Tests for the in-process search-cycle orchestrator."""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import event  # noqa: E402
+
+from researcharr.repositories.async_repositories import AsyncSearchCycleRepository  # noqa: E402
+from researcharr.repositories.async_uow import AsyncUnitOfWork  # noqa: E402
+from researcharr.scheduling.cycle_orchestrator import (  # noqa: E402
+    AppCycleSettings,
+    CycleOrchestrator,
+    CycleWriter,
+)
+from researcharr.storage.async_database import (  # noqa: E402
+    dispose_async_db,
+    get_async_engine,
+    init_async_db,
+)
+from researcharr.storage.models import (  # noqa: E402
+    AppType,
+    CyclePhase,
+    GlobalSettings,
+    ManagedApp,
+    SearchCycle,
+    SortStrategy,
+)
+
+
+def _with_db(tmp_path, body, apps=("fast",)):
+    async def runner():
+        await init_async_db(tmp_path / "cycles.db", create_tables=True)
+        try:
+            async with AsyncUnitOfWork() as uow:
+                uow.session.add(GlobalSettings(id=1, items_per_cycle=3, max_retries=2))
+                ids = {}
+                for name in apps:
+                    app = await uow.apps.create(
+                        ManagedApp(
+                            app_type=AppType.RADARR,
+                            name=name,
+                            base_url=f"http://{name}:7878",
+                            api_key="k",
+                        )
+                    )
+                    ids[name] = app.id
+            return await body(ids)
+        finally:
+            await dispose_async_db()
+
+    return asyncio.run(runner())
+
+
+def _records(n):
+    return [{"arr_id": i, "title": f"Movie {i}", "custom_format_score": i} for i in range(1, n + 1)]
+
+
+async def _cycles(app_id):
+    async with AsyncUnitOfWork(read_only=True) as uow:
+        return await uow.cycles.get_by_app(app_id)
+
+
+def test_effective_settings_prefer_enabled_overrides():
+    app = ManagedApp(
+        id=1,
+        app_type=AppType.SONARR,
+        name="s",
+        base_url="http://s",
+        api_key="k",
+        use_custom_settings=True,
+        custom_items_per_cycle=9,
+    )
+    settings = GlobalSettings(
+        items_per_cycle=5,
+        cycle_interval_minutes=30,
+        sort_strategy=SortStrategy.RANDOM,
+        retry_failed_items=True,
+        max_retries=3,
+        retry_delay_minutes=10,
+    )
+    resolved = AppCycleSettings.resolve(app, settings)
+    assert resolved.items_per_cycle == 9
+    assert resolved.cycle_interval_minutes == 30
+    app.use_custom_settings = False
+    assert AppCycleSettings.resolve(app, settings).items_per_cycle == 5
+    # Without a settings row the column defaults apply
+    assert AppCycleSettings.resolve(app, None).cycle_interval_minutes == 60
+
+
+def test_run_cycle_syncs_searches_and_records_phases(tmp_path):
+    async def body(ids):
+        app_id = ids["fast"]
+
+        async def sync(app):
+            return _records(5)
+
+        async def search(app, item):
+            if item.arr_id == 1:
+                raise RuntimeError("indexer down")
+            return item.arr_id != 2
+
+        orchestrator = CycleOrchestrator(sync, search, search_concurrency=2)
+        next_at = await orchestrator.run_cycle(app_id)
+        assert next_at > datetime.utcnow() + timedelta(minutes=59)
+        # Nothing beyond the cycle row is written until the batch is flushed
+        assert (await _cycles(app_id))[0].phase == CyclePhase.SYNCING
+        assert await orchestrator.writer.flush() == 4  # 1 cycle + 3 searched items
+
+        (cycle,) = await _cycles(app_id)
+        assert cycle.phase == CyclePhase.COOLDOWN
+        assert cycle.completed_at is not None and cycle.next_cycle_at == next_at
+        assert (cycle.items_searched, cycle.items_succeeded, cycle.items_failed) == (3, 1, 2)
+        assert cycle.items_in_retry_queue == 2
+
+        async with AsyncUnitOfWork(read_only=True) as uow:
+            items = {i.arr_id: i for i in await uow.items.get_by_app(app_id)}
+            assert len(items) == 5
+            assert items[3].last_search_at is not None and items[3].next_retry_at is None
+            assert items[1].failed_search_count == 1 and items[1].next_retry_at is not None
+            assert items[4].last_search_at is None
+            assert (await uow.apps.get_by_id(app_id)).last_sync_at is not None
+        await orchestrator.stop()
+
+    _with_db(tmp_path, body)
+
+
+def test_writer_merges_changes_into_one_transaction(tmp_path):
+    async def body(ids):
+        async with AsyncUnitOfWork() as uow:
+            cycle = await uow.cycles.create_cycle(ids["fast"])
+        writer = CycleWriter(batch_size=1000)
+        writer.update_cycle(cycle.id, phase=CyclePhase.SEARCHING)
+        writer.update_cycle(cycle.id, phase=CyclePhase.COOLDOWN, items_searched=4)
+        assert writer.pending == 1
+
+        commits = []
+        engine = get_async_engine().sync_engine
+        listener = lambda conn: commits.append(conn)  # noqa: E731
+        event.listen(engine, "commit", listener)
+        try:
+            assert await writer.flush() == 1
+            assert await writer.flush() == 0
+        finally:
+            event.remove(engine, "commit", listener)
+        assert len(commits) == 1
+        (stored,) = await _cycles(ids["fast"])
+        assert stored.phase == CyclePhase.COOLDOWN and stored.items_searched == 4
+
+    _with_db(tmp_path, body)
+
+
+def test_writer_requeues_failed_batches_then_drops_them(tmp_path, monkeypatch):
+    async def body(ids):
+        async with AsyncUnitOfWork() as uow:
+            cycle = await uow.cycles.create_cycle(ids["fast"])
+        real_update = AsyncSearchCycleRepository.update_cycle
+        failures = [1]
+
+        async def flaky_update(self, cycle_id, changes):
+            if failures[0]:
+                failures[0] -= 1
+                raise RuntimeError("database is locked")
+            return await real_update(self, cycle_id, changes)
+
+        monkeypatch.setattr(AsyncSearchCycleRepository, "update_cycle", flaky_update)
+        writer = CycleWriter(max_attempts=2)
+        writer.update_cycle(cycle.id, phase=CyclePhase.SEARCHING, items_searched=1)
+        assert await writer.flush() == 0
+        # Newer changes win over the re-queued batch
+        writer.update_cycle(cycle.id, items_searched=2)
+        assert writer.pending == 1
+        assert await writer.flush() == 1
+        (stored,) = await _cycles(ids["fast"])
+        assert stored.phase == CyclePhase.SEARCHING and stored.items_searched == 2
+
+        failures[0] = 2
+        writer.update_cycle(cycle.id, items_searched=3)
+        assert await writer.flush() == 0 and writer.pending == 1
+        assert await writer.flush() == 0 and writer.pending == 0
+        assert writer.metrics["dropped"] == 1 and writer.metrics["failed_batches"] == 3
+
+    _with_db(tmp_path, body)
+
+
+def test_writer_survives_idle_flush_intervals():
+    async def body():
+        writer = CycleWriter(flush_interval=0.01)
+        writer.start()
+        await asyncio.sleep(0.05)
+        assert not writer._task.done()
+        await writer.stop()
+
+    asyncio.run(body())
+
+
+def test_batch_search_with_wrong_result_count_fails_every_item():
+    class ShortDispatcher:
+        async def search(self, app, items):
+            return [True]
+
+    async def sync(app):
+        return None
+
+    async def body():
+        orchestrator = CycleOrchestrator(sync, batch_search=ShortDispatcher(), retry_tick=None)
+        app = SimpleNamespace(name="arr", app_id=1, retry_failed_items=False)
+        items = [SimpleNamespace(id=i, failed_search_count=0) for i in (1, 2, 3)]
+        assert await orchestrator._search_batch(app, items) == (0, 0)
+        assert [ok for _, ok, _ in orchestrator.writer._searched] == [False] * 3
+
+    asyncio.run(body())
+
+
+def test_slow_app_does_not_delay_others(tmp_path):
+    async def body(ids):
+        slow_started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def sync(app):
+            return _records(2)
+
+        async def search(app, item):
+            if app.name == "slow":
+                slow_started.set()
+                await release.wait()
+            return True
+
+        writer = CycleWriter(flush_interval=0.05)
+        orchestrator = CycleOrchestrator(sync, search, writer=writer)
+        await orchestrator.start()
+        try:
+            assert orchestrator.running_apps == sorted(ids.values())
+            await asyncio.wait_for(slow_started.wait(), 5)
+            for _ in range(100):
+                fast = await _cycles(ids["fast"])
+                if fast and fast[0].completed_at is not None:
+                    break
+                await asyncio.sleep(0.05)
+            assert fast[0].phase == CyclePhase.COOLDOWN
+            (slow,) = await _cycles(ids["slow"])
+            assert slow.completed_at is None
+            # The fast app is now sleeping until its next_cycle_at
+            assert len(await _cycles(ids["fast"])) == 1
+        finally:
+            release.set()
+            await orchestrator.stop()
+        assert orchestrator.running_apps == []
+
+    _with_db(tmp_path, body, apps=("fast", "slow"))
+
+
+def test_schedule_resumes_from_next_cycle_at(tmp_path):
+    async def body(ids):
+        now = datetime.utcnow()
+        async with AsyncUnitOfWork() as uow:
+            for name, next_at in (("waiting", now + timedelta(hours=1)), ("due", now)):
+                cycle = await uow.cycles.create_cycle(ids[name])
+                await uow.cycles.complete_cycle(cycle.id, next_at)
+            # An open cycle left by a crash is closed and the app runs now
+            await uow.cycles.create_cycle(ids["crashed"])
+
+        searched = []
+
+        async def search(app, item):
+            return True
+
+        async def sync(app):
+            searched.append(app.name)
+
+        orchestrator = CycleOrchestrator(sync, search)
+        await orchestrator.start()
+        try:
+            for _ in range(100):
+                if len(searched) == 2:
+                    break
+                await asyncio.sleep(0.02)
+            await asyncio.sleep(0.05)
+        finally:
+            await orchestrator.stop()
+
+        assert sorted(searched) == ["crashed", "due"]
+        assert [c.cycle_number for c in await _cycles(ids["waiting"])] == [1]
+        crashed = await _cycles(ids["crashed"])
+        assert [c.cycle_number for c in crashed] == [2, 1]
+        assert all(c.completed_at is not None for c in crashed)
+
+    _with_db(tmp_path, body, apps=("waiting", "due", "crashed"))
+
+
+def test_deactivated_app_is_not_scheduled(tmp_path):
+    async def body(ids):
+        async with AsyncUnitOfWork() as uow:
+            app = await uow.apps.get_by_id(ids["fast"])
+            app.is_active = False
+
+        async def never(*args):
+            raise AssertionError("inactive app must not run")
+
+        orchestrator = CycleOrchestrator(never, never)
+        assert await orchestrator.run_cycle(ids["fast"]) is None
+        await orchestrator.refresh()
+        assert orchestrator.running_apps == []
+        async with AsyncUnitOfWork(read_only=True) as uow:
+            assert await uow.session.get(SearchCycle, 1) is None
+
+    _with_db(tmp_path, body)
@@ -36,12 +36,13 @@ def test_database_scheduler_setup_enabled():
     service = DatabaseSchedulerService(scheduler, config)
     service.setup()
 
-    # Should add both health check and integrity check jobs
-    assert scheduler.add_job.call_count == 2
+    # Should add health check, integrity check and rollup compaction jobs
+    assert scheduler.add_job.call_count == 3
     calls = scheduler.add_job.call_args_list
     job_names = [call[1]["name"] for call in calls]
     assert "Database Health Check" in job_names
     assert "Database Integrity Check" in job_names
+    assert "Processing Log Rollup Compaction" in job_names
 
 
 def test_database_scheduler_setup_disabled():
@@ -77,9 +78,9 @@ def test_database_scheduler_remove_jobs():
     service = DatabaseSchedulerService(scheduler)
     service.remove_jobs()
 
-    # Should attempt to remove both jobs
-    assert scheduler.get_job.call_count == 2
-    assert scheduler.remove_job.call_count == 2
+    # Should attempt to remove all three jobs
+    assert scheduler.get_job.call_count == 3
+    assert scheduler.remove_job.call_count == 3
 
 
 def test_database_scheduler_remove_jobs_not_found():
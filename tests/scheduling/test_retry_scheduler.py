@@ -0,0 +1,196 @@
+"""Tests for the timing wheel and the retry scheduler built on it."""
+
+import asyncio
+import math
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from researcharr.compat import UTC
+from researcharr.scheduling.timing_wheel import TimingWheel
+
+
+def test_wheel_fires_at_rounded_deadline_across_levels():
+    wheel = TimingWheel(tick=60.0, start=0.0)
+    deadlines = {"minute": 90.0, "hour": 3 * 3600.0, "day": 2 * 86400.0 + 30, "far": 90 * 86400.0}
+    for key, when in deadlines.items():
+        wheel.schedule(key, when)
+    assert len(wheel) == 4
+    assert wheel.deadline("minute") == 120.0  # rounded up to the next tick
+
+    fired = {}
+    for minute in range(1, 91 * 1440):
+        for key in wheel.advance(minute * 60.0):
+            fired[key] = minute * 60.0
+    assert fired == {key: math.ceil(when / 60.0) * 60.0 for key, when in deadlines.items()}
+    assert len(wheel) == 0
+
+
+def test_wheel_reschedule_cancel_and_overdue():
+    wheel = TimingWheel(tick=1.0, start=100.0)
+    wheel.schedule("a", 150.0)
+    wheel.schedule("a", 110.0)  # moved earlier; the old entry is ignored
+    wheel.schedule("b", 120.0)
+    assert wheel.cancel("b") and not wheel.cancel("b")
+    wheel.schedule("late", 50.0)
+    assert wheel.advance(100.0) == ["late"]
+    assert wheel.advance(109.0) == []
+    assert wheel.advance(110.0) == ["a"]
+    assert wheel.advance(200.0) == []
+    assert "a" not in wheel
+
+
+def test_wheel_matches_brute_force():
+    rng = random.Random(7)
+    wheel = TimingWheel(tick=1.0, slots=(4, 3, 2), start=0.0)
+    expected = {}
+    now = 0.0
+    for _ in range(2000):
+        if rng.random() < 0.5:
+            key, when = rng.randrange(40), now + rng.uniform(-2, 100)
+            wheel.schedule(key, when)
+            expected[key] = math.ceil(when)
+        if rng.random() < 0.1:
+            key = rng.randrange(40)
+            wheel.cancel(key)
+            expected.pop(key, None)
+        now += rng.choice([0, 0.5, 1, 1, 3, 9])
+        fired = wheel.advance(now)
+        due = {k for k, tick in expected.items() if tick <= math.floor(now)}
+        assert sorted(fired) == sorted(due)
+        for key in fired:
+            del expected[key]
+
+
+def test_wheel_rejects_bad_configuration():
+    with pytest.raises(ValueError):
+        TimingWheel(tick=0)
+    with pytest.raises(ValueError):
+        TimingWheel(slots=(60, 0))
+
+
+# RetryScheduler (needs the async storage layer) ----------------------------
+
+
+def _naive(ts):
+    return datetime.fromtimestamp(ts, UTC).replace(tzinfo=None)
+
+
+def test_retry_scheduler_loads_and_groups_due_items(tmp_path):
+    pytest.importorskip("aiosqlite")
+    from researcharr.repositories.async_uow import AsyncUnitOfWork
+    from researcharr.scheduling.retry_scheduler import RetryScheduler
+    from researcharr.storage.async_database import dispose_async_db, init_async_db
+    from researcharr.storage.models import AppType, ManagedApp, TrackedItem
+
+    clock = [1_000_020.0]  # on a minute boundary
+    dispatched = []
+
+    async def on_due(app_id, item_ids):
+        if app_id == 2:
+            raise RuntimeError("app gone")
+        dispatched.append((app_id, sorted(item_ids)))
+
+    async def body():
+        await init_async_db(tmp_path / "retries.db", create_tables=True)
+        try:
+            async with AsyncUnitOfWork() as uow:
+                for n in (1, 2):
+                    uow.session.add(
+                        ManagedApp(
+                            id=n,
+                            app_type=AppType.RADARR,
+                            name=f"r{n}",
+                            base_url=f"http://r{n}",
+                            api_key="k",
+                        )
+                    )
+                await uow.session.flush()
+                soon = _naive(clock[0] + 30)
+                uow.session.add_all(
+                    [
+                        TrackedItem(app_id=1, arr_id=1, title="a", next_retry_at=soon),
+                        TrackedItem(app_id=1, arr_id=2, title="b", next_retry_at=soon),
+                        TrackedItem(app_id=2, arr_id=3, title="c", next_retry_at=soon),
+                        # Not retried: already downloaded
+                        TrackedItem(
+                            app_id=1, arr_id=4, title="d", has_file=True, next_retry_at=soon
+                        ),
+                        TrackedItem(app_id=1, arr_id=5, title="e"),
+                    ]
+                )
+
+            scheduler = RetryScheduler(on_due, clock=lambda: clock[0])
+            assert await scheduler.load() == 3
+            assert scheduler.pending(1) == 2 and scheduler.pending() == 3
+
+            clock[0] += 59
+            assert await scheduler.run_due() == 0
+            clock[0] += 1
+            # App 2's callback fails; app 1 is still dispatched
+            assert await scheduler.run_due() == 2
+            assert dispatched == [(1, [1, 2])]
+            assert scheduler.pending() == 0
+
+            scheduler.schedule(1, 1, _naive(clock[0] + 30))
+            scheduler.schedule(1, 1, None)
+            assert scheduler.pending() == 0
+        finally:
+            await dispose_async_db()
+
+    asyncio.run(body())
+
+
+def test_orchestrator_pushes_due_retries_into_search_pipeline(tmp_path):
+    pytest.importorskip("aiosqlite")
+    from researcharr.repositories.async_uow import AsyncUnitOfWork
+    from researcharr.scheduling.cycle_orchestrator import CycleOrchestrator
+    from researcharr.storage.async_database import dispose_async_db, init_async_db
+    from researcharr.storage.models import AppType, GlobalSettings, ManagedApp
+
+    attempts = []
+
+    async def sync(app):
+        return [{"arr_id": 1, "title": "Flaky"}]
+
+    async def search(app, item):
+        attempts.append(item.arr_id)
+        return len(attempts) > 1
+
+    async def body():
+        await init_async_db(tmp_path / "retry-pipeline.db", create_tables=True)
+        try:
+            async with AsyncUnitOfWork() as uow:
+                uow.session.add(GlobalSettings(id=1, retry_delay_minutes=1))
+                app = await uow.apps.create(
+                    ManagedApp(app_type=AppType.SONARR, name="s", base_url="http://s", api_key="k")
+                )
+                app_id = app.id
+
+            orchestrator = CycleOrchestrator(sync, search)
+            await orchestrator.run_cycle(app_id)
+            assert attempts == [1] and orchestrator.retries.pending(app_id) == 1
+            await orchestrator.writer.flush()
+
+            # The wheel holds the deadline; fire it without waiting a minute
+            orchestrator.retries._clock = lambda: (
+                datetime.now(UTC) + timedelta(minutes=2)
+            ).timestamp()
+            assert await orchestrator.retries.run_due() == 1
+            for _ in range(50):
+                if len(attempts) == 2:
+                    break
+                await asyncio.sleep(0.01)
+            await orchestrator.stop()
+
+            assert attempts == [1, 1]
+            async with AsyncUnitOfWork(read_only=True) as uow:
+                (item,) = await uow.items.get_by_app(app_id)
+                assert item.search_count == 2 and item.next_retry_at is None
+                (cycle,) = await uow.cycles.get_by_app(app_id)
+                assert cycle.items_in_retry_queue == 1
+        finally:
+            await dispose_async_db()
+
+    asyncio.run(body())
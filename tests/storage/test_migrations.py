@@ -101,7 +101,7 @@ class TestAlembicMigrations:
         """Test that downgrade removes performance indexes."""
         db_path = tmp_path / "test.db"
         command.upgrade(alembic_config, "head")
-        command.downgrade(alembic_config, "-1")
+        command.downgrade(alembic_config, "001_perf_indexes")
 
         conn = sqlite3.connect(db_path)
         cursor = conn.cursor()
@@ -111,6 +111,66 @@ class TestAlembicMigrations:
 
         assert len(indexes) == 0, "Performance indexes should be removed"
 
+    def test_rollup_migration_backfills_existing_logs(
+        self, tmp_path: Path, alembic_config: Config
+    ) -> None:
+        """Test that the rollup migration aggregates pre-existing logs per hour."""
+        db_path = tmp_path / "test.db"
+        command.upgrade(alembic_config, "002_data_constraints")
+        conn = sqlite3.connect(db_path)  # foreign keys are off on a raw connection
+        conn.executemany(
+            "INSERT INTO processing_logs (app_id, event_type, message, success, created_at) "
+            "VALUES (1, 'search', 'm', ?, ?)",
+            [
+                (1, "2024-01-01 10:05:00.000000"),
+                (0, "2024-01-01 10:45:00.000000"),
+                (1, "2024-01-01 11:00:00.000000"),
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+        command.upgrade(alembic_config, "head")
+
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute(
+            "SELECT event_type, hour, total, succeeded FROM processing_log_rollups ORDER BY hour"
+        ).fetchall()
+        conn.close()
+        assert rows == [
+            ("search", "2024-01-01 10:00:00.000000", 2, 1),
+            ("search", "2024-01-01 11:00:00.000000", 1, 1),
+        ]
+
+    def test_cycle_counter_migration_seeds_from_existing_cycles(
+        self, tmp_path: Path, alembic_config: Config
+    ) -> None:
+        """Test that next_cycle_number continues after each app's latest cycle."""
+        db_path = tmp_path / "test.db"
+        command.upgrade(alembic_config, "003_log_rollups")
+        conn = sqlite3.connect(db_path)
+        conn.executemany(
+            "INSERT INTO managed_apps (id, app_type, name, base_url, api_key, is_active, "
+            "use_custom_settings, created_at, updated_at) "
+            "VALUES (?, 'RADARR', 'app', ?, 'key', 1, 0, '2024-01-01', '2024-01-01')",
+            [(1, "http://a"), (2, "http://b")],
+        )
+        conn.executemany(
+            "INSERT INTO search_cycles (app_id, cycle_number, phase, total_items, "
+            "items_searched, items_succeeded, items_failed, items_in_retry_queue, started_at) "
+            "VALUES (1, ?, 'COOLDOWN', 0, 0, 0, 0, 0, '2024-01-01')",
+            [(1,), (7,)],
+        )
+        conn.commit()
+        conn.close()
+
+        command.upgrade(alembic_config, "head")
+
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute("SELECT id, next_cycle_number FROM managed_apps ORDER BY id").fetchall()
+        conn.close()
+        assert rows == [(1, 8), (2, 1)]
+
     def test_init_db_with_migrations_disabled(self, tmp_path: Path) -> None:
         """Test init_db with use_migrations=False (fast path)."""
         db_path = tmp_path / "test.db"
@@ -0,0 +1,136 @@
+"""Tests for SQL statement instrumentation and the slow-query log."""
+
+import argparse
+
+import pytest
+from sqlalchemy import event, text
+
+from researcharr import cli
+from researcharr.monitoring.database_monitor import DatabaseHealthMonitor
+from researcharr.storage import query_stats
+from researcharr.storage.database import get_engine, get_read_engine, get_session, init_db
+from researcharr.storage.models import GlobalSettings
+
+
+@pytest.fixture(autouse=True)
+def _clean(monkeypatch):
+    for name in ("QUERY_STATS", "SLOW_QUERY_MS", "SLOW_QUERY_LOG_SIZE"):
+        monkeypatch.delenv(f"RESEARCHARR_{name}", raising=False)
+    yield
+    query_stats.disable()
+
+
+def _listening(engine):
+    return event.contains(engine, "after_cursor_execute", query_stats._after_cursor_execute)
+
+
+def test_fingerprint_normalises_literals():
+    a = query_stats.fingerprint("SELECT * FROM t WHERE id = 5 AND name = 'x'")
+    b = query_stats.fingerprint("SELECT *  FROM t\n WHERE id = 17 AND name = 'it''s'")
+    assert a == b == "SELECT * FROM t WHERE id = ? AND name = ?"
+    assert query_stats.fingerprint("SELECT a FROM t WHERE id IN (?, ?, ?)") == (
+        "SELECT a FROM t WHERE id IN (?)"
+    )
+    # Digits inside identifiers are kept
+    assert "processing_logs_2024_01" in query_stats.fingerprint(
+        "SELECT 1 FROM processing_logs_2024_01"
+    )
+
+
+def test_collector_aggregates_and_ring_buffers_slow_queries():
+    stats = query_stats.QueryStats(slow_query_ms=50, slow_log_size=2)
+    for ms in range(1, 101):
+        stats.record("SELECT 1", float(ms))
+    stats.record("UPDATE t SET a = 1", 5.0, rows=3)
+
+    snap = stats.snapshot()
+    top = snap["statements"][0]
+    assert top["fingerprint"] == "SELECT ?"
+    assert top["count"] == 100
+    assert top["total_ms"] == 5050.0
+    assert top["p95_ms"] == 96.0
+    assert top["max_ms"] == 100.0
+    assert snap["statements"][1]["rows"] == 3
+    # Only the two most recent slow statements are kept, newest first
+    assert [q["duration_ms"] for q in snap["slow_queries"]] == [100.0, 99.0]
+    assert stats.snapshot(top=1)["statements"] == [top]
+
+
+def test_disabled_by_default_registers_no_listeners(tmp_path):
+    init_db(tmp_path / "off.db", use_migrations=False)
+    assert not query_stats.is_enabled()
+    assert query_stats.snapshot() is None
+    assert not _listening(get_engine())
+    assert not _listening(get_read_engine())
+
+
+def test_init_db_instruments_engines(tmp_path):
+    init_db(tmp_path / "on.db", use_migrations=False, query_stats={"enabled": True})
+    assert _listening(get_engine()) and _listening(get_read_engine())
+
+    with get_session() as session:
+        session.add(GlobalSettings(id=1))
+        session.flush()
+        session.execute(text("SELECT COUNT(*) FROM global_settings")).scalar()
+
+    statements = {s["fingerprint"]: s for s in query_stats.snapshot()["statements"]}
+    insert = next(
+        s for key, s in statements.items() if key.startswith("INSERT INTO global_settings")
+    )
+    assert insert["count"] == 1 and insert["rows"] == 1
+    assert "SELECT COUNT(*) FROM global_settings" in statements
+
+    # Re-initialising with instrumentation off removes the listeners
+    engine = get_engine()
+    init_db(tmp_path / "on.db", use_migrations=False)
+    assert not _listening(engine) and not query_stats.is_enabled()
+
+
+def test_failed_statements_do_not_leak_start_times(tmp_path):
+    init_db(tmp_path / "err.db", use_migrations=False, query_stats=True)
+    with get_engine().connect() as conn:
+        for _ in range(3):
+            with pytest.raises(Exception, match="no such table"):
+                conn.execute(text("SELECT * FROM missing_table"))
+        assert conn.info.get("query_stats_start") == []
+        conn.execute(text("SELECT 1"))
+        assert conn.info["query_stats_start"] == []
+
+
+def test_query_stats_section_reaches_migrate_database(tmp_path):
+    from researcharr.storage.migrations import load_database_config, migrate_database
+
+    (tmp_path / "config.yml").write_text(
+        "database:\n  query_stats:\n    enabled: true\n    slow_query_ms: 7\n"
+    )
+    db_config = load_database_config(tmp_path)
+    migrate_database(
+        tmp_path / "cfg.db", use_migrations=False, query_stats=db_config.get("query_stats")
+    )
+    assert query_stats.is_enabled()
+    assert query_stats.get_collector().slow_query_ms == 7.0
+
+
+def test_environment_overrides_config(monkeypatch):
+    monkeypatch.setenv("RESEARCHARR_QUERY_STATS", "true")
+    monkeypatch.setenv("RESEARCHARR_SLOW_QUERY_MS", "12.5")
+    settings = query_stats.resolve_settings({"enabled": False, "slow_log_size": 7})
+    assert settings == {"enabled": True, "slow_query_ms": 12.5, "slow_log_size": 7}
+
+
+def test_snapshot_reaches_db_stats_cli(tmp_path, capsys):
+    db_path = tmp_path / "cli.db"
+    init_db(db_path, use_migrations=False, query_stats={"enabled": True, "slow_query_ms": 0})
+    with get_session() as session:
+        session.execute(text("SELECT 1")).scalar()
+    assert query_stats.get_collector().write_snapshot()
+    query_stats.disable()
+
+    stats = DatabaseHealthMonitor(db_path).get_statistics()
+    assert stats["queries"]["slow_queries"][0]["fingerprint"] == "SELECT ?"
+
+    args = argparse.Namespace(db_path=str(db_path), json=False, top=5)
+    assert cli.cmd_db_stats(args) == 0
+    out = capsys.readouterr().out
+    assert "Top Statements by Total Time" in out
+    assert "Slow Queries (>= 0ms" in out
@@ -0,0 +1,117 @@
+"""Tests for the split read-only / write session pools."""
+
+import threading
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+import researcharr.storage.database as dbmod
+from researcharr import cache as _cache
+from researcharr.repositories.uow import UnitOfWork
+from researcharr.storage.database import (
+    get_read_session,
+    get_session,
+    get_write_session,
+    init_db,
+)
+from researcharr.storage.models import AppType, GlobalSettings, ManagedApp
+
+
+@pytest.fixture
+def split_db(tmp_path):
+    _cache.clear_all()
+    init_db(tmp_path / "split.db", use_migrations=False)
+    with get_session() as session:
+        session.add(GlobalSettings(id=1))
+    yield
+    _cache.clear_all()
+
+
+def _app(name):
+    return ManagedApp(app_type=AppType.RADARR, name=name, base_url=f"http://{name}", api_key="k")
+
+
+def test_read_session_sees_committed_rows(split_db):
+    with get_write_session() as session:
+        session.add(_app("a"))
+    with get_read_session() as session:
+        assert [a.name for a in session.query(ManagedApp).all()] == ["a"]
+
+
+def test_read_session_rejects_writes(split_db):
+    with pytest.raises(OperationalError):
+        with get_read_session() as session:
+            session.add(_app("nope"))
+            session.flush()
+
+
+def test_read_does_not_wait_behind_open_write_transaction(split_db):
+    with get_write_session() as writer:
+        writer.add(_app("pending"))
+        writer.flush()  # holds the SQLite write lock until commit
+        with get_read_session() as reader:
+            assert reader.query(ManagedApp).count() == 0
+    with get_read_session() as reader:
+        assert reader.query(ManagedApp).count() == 1
+
+
+def test_writers_queue_on_single_connection(split_db):
+    assert dbmod.get_engine().pool.size() == 1
+    first_holding = threading.Event()
+    release = threading.Event()
+    order = []
+
+    def first():
+        with get_write_session() as session:
+            session.add(_app("first"))
+            session.flush()
+            first_holding.set()
+            release.wait(5)
+            order.append("first")
+
+    def second():
+        first_holding.wait(5)
+        with get_write_session() as session:
+            session.add(_app("second"))
+            session.flush()  # blocks until the write connection is free
+            order.append("second")
+
+    threads = [threading.Thread(target=first), threading.Thread(target=second)]
+    for t in threads:
+        t.start()
+    first_holding.wait(5)
+    release.set()
+    for t in threads:
+        t.join(10)
+    assert order == ["first", "second"]
+    with get_read_session() as session:
+        assert session.query(ManagedApp).count() == 2
+
+
+def test_unit_of_work_read_only_intent(split_db):
+    with UnitOfWork() as uow:
+        uow.apps.create(_app("rw"))
+    with UnitOfWork(read_only=True) as uow:
+        assert uow.session.get_bind() is dbmod.get_read_engine()
+        assert [a.name for a in uow.apps.get_all()] == ["rw"]
+
+
+def test_nested_write_session_joins_the_open_one(split_db):
+    with UnitOfWork() as uow:
+        uow.apps.create(_app("outer"))
+        with get_session() as nested:  # would otherwise wait on the pool
+            assert nested is uow.session
+            nested.add(_app("inner"))
+        assert dbmod.active_write_session() is uow.session
+    assert dbmod.active_write_session() is None
+    with get_read_session() as session:
+        assert session.query(ManagedApp).count() == 2
+
+    # The outer block owns the transaction: a failure undoes nested writes
+    with pytest.raises(RuntimeError):
+        with get_write_session():
+            with get_write_session() as nested:
+                nested.add(_app("undone"))
+            raise RuntimeError("boom")
+    with get_read_session() as session:
+        assert session.query(ManagedApp).count() == 2
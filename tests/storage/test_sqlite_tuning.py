@@ -0,0 +1,100 @@
+"""Tests for the SQLite connection tuning profile."""
+
+import pytest
+from sqlalchemy import text
+
+import researcharr.storage.database as dbmod
+from researcharr.storage.database import (
+    DEFAULT_SQLITE_PRAGMAS,
+    create_sqlite_engine,
+    init_db,
+    resolve_sqlite_pragmas,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_env(monkeypatch):
+    monkeypatch.delenv("RESEARCHARR_SQLITE_TUNING", raising=False)
+    for key in DEFAULT_SQLITE_PRAGMAS:
+        monkeypatch.delenv(f"RESEARCHARR_SQLITE_{key.upper()}", raising=False)
+
+
+def _pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_resolve_defaults():
+    assert resolve_sqlite_pragmas() == DEFAULT_SQLITE_PRAGMAS
+
+
+def test_resolve_config_then_env_precedence(monkeypatch):
+    monkeypatch.setenv("RESEARCHARR_SQLITE_BUSY_TIMEOUT", "250")
+    pragmas = resolve_sqlite_pragmas(
+        {"cache_size": -2000, "busy_timeout": 1000, "foreign_keys": False}
+    )
+    assert pragmas["cache_size"] == -2000
+    assert pragmas["busy_timeout"] == "250"
+    assert pragmas["foreign_keys"] == "OFF"
+
+
+@pytest.mark.parametrize("overrides", [False, {"enabled": False}])
+def test_resolve_disabled_by_config(overrides):
+    assert resolve_sqlite_pragmas(overrides) == {}
+
+
+def test_resolve_disabled_by_env(monkeypatch):
+    monkeypatch.setenv("RESEARCHARR_SQLITE_TUNING", "false")
+    assert resolve_sqlite_pragmas({"enabled": True}) == {}
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [{"page_size": 4096}, {"synchronous": "NORMAL; DROP TABLE x"}, {"cache_size": "1.5"}],
+)
+def test_resolve_rejects_unknown_or_unsafe(overrides):
+    with pytest.raises(ValueError):
+        resolve_sqlite_pragmas(overrides)
+
+
+def test_engine_applies_profile_on_connect(tmp_path):
+    engine = create_sqlite_engine(tmp_path / "tuned.db", resolve_sqlite_pragmas())
+    try:
+        assert _pragma(engine, "journal_mode") == "wal"
+        assert _pragma(engine, "synchronous") == 1  # NORMAL
+        assert _pragma(engine, "busy_timeout") == 5000
+        assert _pragma(engine, "cache_size") == -64000
+        assert _pragma(engine, "temp_store") == 2  # MEMORY
+        assert _pragma(engine, "foreign_keys") == 1
+    finally:
+        engine.dispose()
+
+
+def test_engine_without_profile_keeps_sqlite_defaults(tmp_path):
+    engine = create_sqlite_engine(tmp_path / "plain.db", {})
+    try:
+        assert _pragma(engine, "journal_mode") == "delete"
+        assert _pragma(engine, "foreign_keys") == 0
+    finally:
+        engine.dispose()
+
+
+def test_init_db_uses_config_section(tmp_path):
+    init_db(tmp_path / "cfg.db", use_migrations=False, sqlite_pragmas={"busy_timeout": 1234})
+    engine = dbmod.get_engine()
+    assert _pragma(engine, "busy_timeout") == 1234
+    assert _pragma(engine, "journal_mode") == "wal"
+
+
+def test_migrate_database_reads_sqlite_section_from_config_yml(tmp_path):
+    from researcharr.storage.migrations import load_database_config, migrate_database
+
+    (tmp_path / "config.yml").write_text("database:\n  sqlite:\n    busy_timeout: 4321\n")
+    db_config = load_database_config(tmp_path)
+    assert db_config == {"sqlite": {"busy_timeout": 4321}}
+    assert load_database_config(tmp_path / "missing") == {}
+
+    migrate_database(
+        tmp_path / "cfg.db", use_migrations=False, sqlite_pragmas=db_config.get("sqlite")
+    )
+    assert _pragma(dbmod.get_engine(), "busy_timeout") == 4321